@@ -1,18 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 import logging
 from typing import Any, Literal
 
 from langchain.tools import ToolRuntime, tool
 
 from bookiebot.agent.context import ConversationContext
-from bookiebot.reports.expense_breakdown import (
-    build_expense_breakdown_report,
-    expense_breakdown_client_payload,
-    parse_budget_month,
-)
+from bookiebot.reports.expense_breakdown import parse_budget_month
+from bookiebot.reports.report_cache import cached_expense_report
 import bookiebot.sheets.utils as su
 from bookiebot.sheets.routing import (
     DiscordUserConfig,
@@ -224,17 +221,16 @@ async def load_financial_report(
     except ValueError as exc:
         return {"error": str(exc)}
 
-    def build_report() -> Any:
+    def load_report() -> Any:
         with sheet_user_context(context.actor_key):
-            return build_expense_breakdown_report(
+            return cached_expense_report(
                 actor_key=context.actor_key,
                 owner_name=profile.name,
                 persons=list(profile.expense_persons),
                 month=selected_month,
             )
 
-    report = await asyncio.to_thread(build_report)
-    payload = expense_breakdown_client_payload(report)
+    payload = (await asyncio.to_thread(load_report)).fields
     safe_limit = max(1, min(int(limit), 50))
     result: dict[str, Any] = {
         "source": "expense_breakdown_report",
@@ -290,7 +286,7 @@ async def load_financial_report(
 
 
 def _financial_report_section(
-    payload: dict[str, Any],
+    payload: Mapping[str, Any],
     view: dict[str, Any],
     *,
     section: str,
@@ -111,6 +111,7 @@ class ReconciliationItem:
     ignored_at: str | None
     notes: str | None
     transaction: BankTransaction
+    scored_at: str | None = None
 
 
 @dataclass(frozen=True)
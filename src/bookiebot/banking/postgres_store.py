@@ -2,13 +2,26 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 import importlib
+import os
 from pathlib import Path
 import re
-from typing import Any, Iterator
+import secrets
+from typing import Any, AsyncIterator, Iterator
 
 from bookiebot.banking.crypto import TokenCipher
 from bookiebot.banking.models import BankStatus
-from bookiebot.banking.store import BankStore, BankStoreConnection
+from bookiebot.banking.store import (
+    BANK_INDEX_STATEMENTS,
+    RECONCILIATION_CANDIDATES_TABLE,
+    RECONCILIATION_WATERMARKS_TABLE,
+    BankStore,
+    BankStoreConnection,
+)
+
+
+PLAID_WEBHOOK_CHANNEL = "bookiebot_plaid_webhooks"
+# Tags this process's notifications so its listener can skip webhooks the local worker was already signalled for.
+_NOTIFY_SOURCE = f"{os.getpid()}-{secrets.token_hex(4)}"
 
 
 def _import_psycopg():
@@ -116,11 +129,13 @@ class PostgresBankStore(BankStore):
                     raw_json TEXT NOT NULL,
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
-                    removed_at TEXT
+                    removed_at TEXT,
+                    effective_date TEXT NOT NULL DEFAULT ''
                 )
                 """
             )
             conn.execute("ALTER TABLE bank_transactions ADD COLUMN IF NOT EXISTS pending_transaction_id TEXT")
+            self._ensure_transaction_effective_date_column(conn)
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS bank_sync_state (
@@ -129,10 +144,14 @@ class PostgresBankStore(BankStore):
                     last_sync_at TEXT,
                     last_success_at TEXT,
                     last_error TEXT,
-                    webhook_pending INTEGER NOT NULL DEFAULT 0
+                    webhook_pending INTEGER NOT NULL DEFAULT 0,
+                    webhook_url TEXT,
+                    accounts_refreshed_at TEXT
                 )
                 """
             )
+            conn.execute("ALTER TABLE bank_sync_state ADD COLUMN IF NOT EXISTS webhook_url TEXT")
+            conn.execute("ALTER TABLE bank_sync_state ADD COLUMN IF NOT EXISTS accounts_refreshed_at TEXT")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS bank_webhook_events (
@@ -164,10 +183,39 @@ class PostgresBankStore(BankStore):
                     last_seen_at TEXT NOT NULL,
                     resolved_at TEXT,
                     ignored_at TEXT,
-                    notes TEXT
+                    notes TEXT,
+                    scored_at TEXT
                 )
                 """
             )
+            conn.execute("ALTER TABLE bank_reconciliation_items ADD COLUMN IF NOT EXISTS scored_at TEXT")
+            self._ensure_reconciliation_matches_table(conn)
+            conn.execute(RECONCILIATION_WATERMARKS_TABLE)
+            conn.execute(RECONCILIATION_CANDIDATES_TABLE)
+            for statement in BANK_INDEX_STATEMENTS:
+                conn.execute(statement)
+
+    def _table_exists(self, conn: BankStoreConnection, table_name: str) -> bool:
+        row = conn.execute("SELECT to_regclass(?) AS table_name", (table_name,)).fetchone()
+        return row is not None and row["table_name"] is not None
+
+    def _ensure_transaction_effective_date_column(self, conn: BankStoreConnection) -> None:
+        existing = conn.execute(
+            """
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = 'bank_transactions'
+              AND column_name = 'effective_date'
+            """
+        ).fetchone()
+        if existing is not None:
+            return
+        conn.execute("ALTER TABLE bank_transactions ADD COLUMN IF NOT EXISTS effective_date TEXT NOT NULL DEFAULT ''")
+        conn.execute("UPDATE bank_transactions SET effective_date = COALESCE(date, authorized_date, '')")
+
+    def _notify_plaid_webhook(self, conn: BankStoreConnection, item_id: str | None) -> None:
+        conn.execute("SELECT pg_notify(?, ?)", (PLAID_WEBHOOK_CHANNEL, f"{_NOTIFY_SOURCE}:{item_id or ''}"))
 
     def status(self, configured: bool, plaid_env: str) -> BankStatus:
         status = super().status(configured, plaid_env)
@@ -181,3 +229,26 @@ class PostgresBankStore(BankStore):
             last_success_at=status.last_success_at,
             last_error=status.last_error,
         )
+
+
+async def listen_for_plaid_webhooks(database_url: str) -> AsyncIterator[str | None]:
+    """Yield Plaid item ids as other processes enqueue webhooks (Postgres LISTEN/NOTIFY)."""
+    psycopg, _dict_row = _import_psycopg()
+    conn = await psycopg.AsyncConnection.connect(database_url, autocommit=True)
+    try:
+        await conn.execute(f"LISTEN {PLAID_WEBHOOK_CHANNEL}")
+        async for notify in conn.notifies():
+            source, item_id = _parse_plaid_webhook_notification(notify.payload)
+            if source == _NOTIFY_SOURCE:
+                continue
+            yield item_id
+    finally:
+        await conn.close()
+
+
+def _parse_plaid_webhook_notification(payload: str | None) -> tuple[str | None, str | None]:
+    """Split a ``source:item_id`` notification; bare item ids come from processes that predate the tag."""
+    source, separator, item_id = (payload or "").partition(":")
+    if not separator:
+        return None, source or None
+    return source, item_id or None
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
+import hashlib
+import heapq
+import os
 import re
-from typing import Iterable
+from typing import AbstractSet, Iterable
 
 from bookiebot.banking.models import (
     BankTransaction,
@@ -55,6 +59,72 @@ SUBSCRIPTION_PATTERNS = (
 )
 
 
+PATTERN_CATEGORIES = ("transfer", "payroll", "interest", "subscription")
+
+_WHITESPACE = re.compile(r"\s+")
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+# Widest date window an action-log match can span; used to find transactions a changed row can affect.
+ACTION_MATCH_WINDOW_DAYS = 7
+
+# Cost of a transaction/row pair without a scored edge; leaving the row unmatched is always cheaper.
+_UNMATCHABLE = 1e9
+
+
+@dataclass(frozen=True)
+class ClassificationPatterns:
+    transfer: tuple[str, ...] = TRANSFER_PATTERNS
+    payroll: tuple[str, ...] = PAYROLL_PATTERNS
+    interest: tuple[str, ...] = INTEREST_PATTERNS
+    subscription: tuple[str, ...] = SUBSCRIPTION_PATTERNS
+
+    @classmethod
+    def for_owner(cls, owner_key: str | None) -> ClassificationPatterns:
+        """Default patterns plus any from ``<OWNER>_BANK_<CATEGORY>_PATTERNS`` (comma separated)."""
+        if not owner_key:
+            return cls()
+        defaults = cls()
+        configured = {}
+        for category in PATTERN_CATEGORIES:
+            raw = os.getenv(f"{owner_key.upper()}_BANK_{category.upper()}_PATTERNS", "")
+            extra = tuple(value.strip().lower() for value in raw.split(",") if value.strip())
+            configured[category] = tuple(dict.fromkeys((*getattr(defaults, category), *extra)))
+        return cls(**configured)
+
+
+class TransactionClassifier:
+    """All pattern tables compiled into one regex that reports every category present in a text.
+
+    Each category is an optional lookahead anchored at the start, so a single match call
+    gives the same answer as checking every pattern as a substring.
+    """
+
+    def __init__(self, patterns: ClassificationPatterns):
+        self.patterns = patterns
+        parts = []
+        for category in PATTERN_CATEGORIES:
+            alternatives = "|".join(re.escape(pattern) for pattern in getattr(patterns, category) if pattern)
+            if alternatives:
+                parts.append(f"(?:(?=.*?(?P<{category}>{alternatives})))?")
+        self._regex = re.compile("^" + "".join(parts), re.DOTALL)
+
+    def categories(self, text: str) -> frozenset[str]:
+        match = self._regex.match(text)
+        if match is None:
+            return frozenset()
+        return frozenset(category for category, value in match.groupdict().items() if value is not None)
+
+
+_CLASSIFIERS: dict[ClassificationPatterns, TransactionClassifier] = {}
+
+
+def classifier_for(patterns: ClassificationPatterns) -> TransactionClassifier:
+    classifier = _CLASSIFIERS.get(patterns)
+    if classifier is None:
+        classifier = _CLASSIFIERS[patterns] = TransactionClassifier(patterns)
+    return classifier
+
+
 @dataclass(frozen=True)
 class ActionLogMatch:
     action_id: str
@@ -94,6 +164,82 @@ class ScheduledPullCandidate:
     account: str = ""
 
 
+@dataclass(frozen=True)
+class IndexedAction:
+    position: int
+    logged: LoggedAction
+    action_type: str
+    amount: float
+    cents: int
+    date: date
+    ordinal: int
+    tokens: frozenset[str]
+
+    @property
+    def sheet_ref(self) -> str:
+        return f"{self.logged.action.worksheet}!row {self.logged.action.row}"
+
+
+class CandidateIndex:
+    """Action-log rows parsed once and bucketed by date ordinal and amount cents.
+
+    Build one per preview run and pass it to the matchers in place of the raw
+    action log; each transaction then only looks at the rows inside its window.
+    """
+
+    def __init__(self, entries: Iterable[IndexedAction] = ()):
+        self.entries: list[IndexedAction] = []
+        self._by_ordinal: dict[int, list[IndexedAction]] = {}
+        self._by_cents: dict[int, list[IndexedAction]] = {}
+        for entry in entries:
+            self.entries.append(entry)
+            self._by_ordinal.setdefault(entry.ordinal, []).append(entry)
+            self._by_cents.setdefault(entry.cents, []).append(entry)
+
+    @classmethod
+    def from_action_log(cls, action_log: Iterable[LoggedAction]) -> CandidateIndex:
+        entries = (_indexed_action(logged, position) for position, logged in enumerate(action_log))
+        return cls(entry for entry in entries if entry is not None)
+
+    @classmethod
+    def coerce(cls, action_log: Iterable[LoggedAction] | CandidateIndex) -> CandidateIndex:
+        if isinstance(action_log, CandidateIndex):
+            return action_log
+        return cls.from_action_log(action_log)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def fingerprints(self) -> dict[str, tuple[str, int]]:
+        """Digest and date ordinal of each row, covering every field the matchers score."""
+        fingerprints = {}
+        for entry in self.entries:
+            scored = (entry.action_type, entry.cents, entry.ordinal, sorted(entry.tokens), entry.sheet_ref)
+            digest = hashlib.sha1(repr(scored).encode("utf-8")).hexdigest()[:16]
+            fingerprints[entry.logged.id] = (digest, entry.ordinal)
+        return fingerprints
+
+    def in_date_window(self, earliest: int, latest: int) -> list[IndexedAction]:
+        """Entries dated between two ordinals (inclusive), in action-log order."""
+        if latest - earliest + 1 > len(self._by_ordinal):
+            return [entry for entry in self.entries if earliest <= entry.ordinal <= latest]
+        found = [
+            entry
+            for ordinal in range(earliest, latest + 1)
+            for entry in self._by_ordinal.get(ordinal, ())
+        ]
+        return sorted(found, key=lambda entry: entry.position)
+
+    def near_amount(self, cents: int, *, tolerance_cents: int = 2) -> list[IndexedAction]:
+        """Entries within a few cents of an amount, in action-log order."""
+        found = [
+            entry
+            for bucket in range(cents - tolerance_cents, cents + tolerance_cents + 1)
+            for entry in self._by_cents.get(bucket, ())
+        ]
+        return sorted(found, key=lambda entry: entry.position)
+
+
 @dataclass(frozen=True)
 class ReconciliationDecision:
     classification: ReconciliationClassification
@@ -104,22 +250,26 @@ class ReconciliationDecision:
     matched_sheet_ref: str | None = None
 
 
-def classify_transaction(transaction: BankTransaction) -> tuple[ReconciliationClassification, ReconciliationStatus, float, str]:
-    transaction_text = _normalized_transaction_text(transaction)
-
+def classify_transaction(
+    transaction: BankTransaction,
+    patterns: ClassificationPatterns | None = None,
+) -> tuple[ReconciliationClassification, ReconciliationStatus, float, str]:
     if transaction.pending:
         return "needs_review", "needs_review", 0.40, "pending transaction"
 
-    if _contains_any(transaction_text, TRANSFER_PATTERNS):
+    classifier = classifier_for(patterns or ClassificationPatterns.for_owner(transaction.owner_key))
+    categories = classifier.categories(_normalized_transaction_text(transaction))
+
+    if "transfer" in categories:
         return "transfer_or_payment", "matched", 0.95, "transfer/payment pattern"
 
-    if transaction.amount > 0 and _contains_any(transaction_text, SUBSCRIPTION_PATTERNS):
+    if transaction.amount > 0 and "subscription" in categories:
         return "subscription_or_bill", "needs_review", 0.75, "possible subscription or bill"
 
     if transaction.amount < 0:
-        if _contains_any(transaction_text, PAYROLL_PATTERNS):
+        if "payroll" in categories:
             return "income", "needs_review", 0.80, "possible income deposit"
-        if _contains_any(transaction_text, INTEREST_PATTERNS):
+        if "interest" in categories:
             return "income", "needs_review", 0.65, "interest income"
         return "refund_or_credit", "needs_review", 0.65, "inflow without payroll pattern"
 
@@ -131,12 +281,13 @@ def classify_transaction(transaction: BankTransaction) -> tuple[ReconciliationCl
 
 def reconcile_transaction(
     transaction: BankTransaction,
-    action_log: Iterable[LoggedAction] = (),
+    action_log: Iterable[LoggedAction] | CandidateIndex = (),
     scheduled_pulls: Iterable[ScheduledPullCandidate] = (),
     excluded_action_ids: set[str] | None = None,
     excluded_sheet_refs: set[str] | None = None,
+    patterns: ClassificationPatterns | None = None,
 ) -> ReconciliationDecision:
-    classification, status, confidence, notes = classify_transaction(transaction)
+    classification, status, confidence, notes = classify_transaction(transaction, patterns)
     match = match_action_log(
         transaction,
         action_log,
@@ -144,90 +295,152 @@ def reconcile_transaction(
         excluded_action_ids=excluded_action_ids,
     )
     if match:
-        return ReconciliationDecision(
-            classification=_matched_classification(classification, match.notes),
-            status="matched",
-            confidence=max(confidence, match.confidence),
-            notes=match.notes,
-            matched_action_log_id=match.action_id,
-            matched_sheet_ref=match.sheet_ref,
-        )
+        return _action_decision(classification, confidence, match)
     scheduled_match = match_scheduled_pull(
         transaction,
         scheduled_pulls,
         excluded_sheet_refs=excluded_sheet_refs,
     )
     if scheduled_match:
-        return ReconciliationDecision(
-            classification="subscription_or_bill",
-            status="matched",
-            confidence=max(confidence, scheduled_match.confidence),
-            notes=scheduled_match.notes,
-            matched_sheet_ref=scheduled_match.sheet_ref,
-        )
+        return _scheduled_decision(confidence, scheduled_match)
     return ReconciliationDecision(classification=classification, status=status, confidence=confidence, notes=notes)
 
 
+def reconcile_transactions(
+    transactions: list[BankTransaction],
+    action_log: Iterable[LoggedAction] | CandidateIndex = (),
+    scheduled_pulls: Iterable[ScheduledPullCandidate] = (),
+    excluded_action_ids: set[str] | None = None,
+    excluded_sheet_refs: set[str] | None = None,
+    patterns: ClassificationPatterns | None = None,
+) -> list[ReconciliationDecision]:
+    """Reconcile a batch, giving each action-log row or schedule to at most one transaction.
+
+    Edges come from the single-transaction scoring. The assignment maximizes the
+    total score across the batch, so an earlier transaction cannot take a row that
+    a later one needs. Any action-log match still outranks a schedule match.
+    """
+    index = CandidateIndex.coerce(action_log)
+    pulls = list(scheduled_pulls)
+    owner_patterns: dict[str, ClassificationPatterns] = {}
+    classified = []
+    for transaction in transactions:
+        if patterns is None and transaction.owner_key not in owner_patterns:
+            owner_patterns[transaction.owner_key] = ClassificationPatterns.for_owner(transaction.owner_key)
+        classified.append(classify_transaction(transaction, patterns or owner_patterns[transaction.owner_key]))
+    edges: list[dict[tuple[str, str], tuple[float, ActionLogMatch]]] = []
+    for transaction, (classification, *_rest) in zip(transactions, classified):
+        options: dict[tuple[str, str], tuple[float, ActionLogMatch]] = {}
+        for match in _action_log_matches(transaction, index, classification, excluded_action_ids=excluded_action_ids):
+            options.setdefault(("action", match.action_id), (1.0 + match.confidence, match))
+        for match in _scheduled_pull_matches(transaction, pulls, excluded_sheet_refs=excluded_sheet_refs):
+            options.setdefault(("sheet", match.sheet_ref), (match.confidence, match))
+        edges.append(options)
+
+    assigned: dict[int, ActionLogMatch] = {}
+    for rows in _connected_rows(edges):
+        assigned.update(_assign_rows(rows, edges))
+
+    decisions = []
+    for row, (classification, status, confidence, notes) in enumerate(classified):
+        match = assigned.get(row)
+        if match is None:
+            decisions.append(
+                ReconciliationDecision(classification=classification, status=status, confidence=confidence, notes=notes)
+            )
+        elif match.action_id:
+            decisions.append(_action_decision(classification, confidence, match))
+        else:
+            decisions.append(_scheduled_decision(confidence, match))
+    return decisions
+
+
 def match_action_log(
     transaction: BankTransaction,
-    action_log: Iterable[LoggedAction],
+    action_log: Iterable[LoggedAction] | CandidateIndex,
     classification: ReconciliationClassification | None = None,
     *,
     excluded_action_ids: set[str] | None = None,
 ) -> ActionLogMatch | None:
+    matches = _action_log_matches(transaction, action_log, classification, excluded_action_ids=excluded_action_ids)
+    return matches[0] if matches else None
+
+
+def _action_log_matches(
+    transaction: BankTransaction,
+    action_log: Iterable[LoggedAction] | CandidateIndex,
+    classification: ReconciliationClassification | None = None,
+    *,
+    excluded_action_ids: set[str] | None = None,
+) -> list[ActionLogMatch]:
     transaction_date = _transaction_date(transaction)
     if transaction_date is None:
-        return None
+        return []
 
+    index = CandidateIndex.coerce(action_log)
     compatible = _compatible_action_types(transaction, classification)
     excluded = excluded_action_ids or set()
+    bank_tokens = _transaction_tokens(transaction)
     candidates = []
-    for logged in action_log:
-        if logged.id in excluded:
-            continue
-        candidate = _action_candidate(logged)
-        if candidate is None or candidate["type"] not in compatible:
+    for entry in index.near_amount(_cents(abs(transaction.amount))):
+        if entry.logged.id in excluded or entry.action_type not in compatible:
             continue
-        if abs(candidate["amount"] - abs(transaction.amount)) > 0.01:
+        if abs(entry.amount - abs(transaction.amount)) > 0.01:
             continue
-        day_delta = abs((candidate["date"] - transaction_date).days)
-        if day_delta > 7:
+        day_delta = abs(entry.ordinal - transaction_date.toordinal())
+        if day_delta > ACTION_MATCH_WINDOW_DAYS:
             continue
         score = 0.86 - (day_delta * 0.05)
-        name_score = _name_score(transaction, candidate["text"])
-        if candidate["type"] == "income" and name_score <= 0:
+        name_score = _token_overlap_score(bank_tokens, entry.tokens)
+        if entry.action_type == "income" and name_score <= 0:
             continue
         score += name_score * 0.10
-        candidates.append((score, day_delta, candidate, logged))
+        candidates.append((score, day_delta, entry))
+
+    matches = []
+    for score, day_delta, entry in sorted(candidates, key=lambda item: (-item[0], item[1])):
+        notes = f"matched {entry.action_type} action"
+        if day_delta:
+            notes = f"{notes} within {day_delta}d"
+        matches.append(
+            ActionLogMatch(
+                action_id=entry.logged.id,
+                sheet_ref=entry.sheet_ref,
+                confidence=min(score, 0.98),
+                notes=notes,
+            )
+        )
+    return matches
 
-    if not candidates:
-        return None
 
-    score, day_delta, candidate, logged = sorted(candidates, key=lambda item: (-item[0], item[1]))[0]
-    action_type = candidate["type"]
-    notes = f"matched {action_type} action"
-    if day_delta:
-        notes = f"{notes} within {day_delta}d"
-    return ActionLogMatch(
-        action_id=logged.id,
-        sheet_ref=f"{logged.action.worksheet}!row {logged.action.row}",
-        confidence=min(score, 0.98),
-        notes=notes,
+def match_scheduled_pull(
+    transaction: BankTransaction,
+    scheduled_pulls: Iterable[ScheduledPullCandidate],
+    *,
+    window_days: int = 3,
+    excluded_sheet_refs: set[str] | None = None,
+) -> ActionLogMatch | None:
+    matches = _scheduled_pull_matches(
+        transaction,
+        scheduled_pulls,
+        window_days=window_days,
+        excluded_sheet_refs=excluded_sheet_refs,
     )
+    return matches[0] if matches else None
 
 
-def match_scheduled_pull(
+def _scheduled_pull_matches(
     transaction: BankTransaction,
     scheduled_pulls: Iterable[ScheduledPullCandidate],
     *,
     window_days: int = 3,
     excluded_sheet_refs: set[str] | None = None,
-) -> ActionLogMatch | None:
+) -> list[ActionLogMatch]:
     if transaction.pending or transaction.amount <= 0:
-        return None
+        return []
     transaction_date = _transaction_date(transaction)
     if transaction_date is None:
-        return None
+        return []
 
     excluded = excluded_sheet_refs or set()
     matches: list[tuple[float, int, ScheduledPullCandidate]] = []
@@ -247,19 +460,20 @@ def match_scheduled_pull(
             score -= 0.08
         matches.append((min(score, 0.98), day_delta, pull))
 
-    if not matches:
-        return None
-
-    score, day_delta, pull = sorted(matches, key=lambda item: (-item[0], item[1], item[2].name.lower()))[0]
-    notes = f"matched {pull.source_type} schedule"
-    if day_delta:
-        notes = f"{notes} within {day_delta}d"
-    return ActionLogMatch(
-        action_id="",
-        sheet_ref=pull.source_ref,
-        confidence=score,
-        notes=notes,
-    )
+    results = []
+    for score, day_delta, pull in sorted(matches, key=lambda item: (-item[0], item[1], item[2].name.lower())):
+        notes = f"matched {pull.source_type} schedule"
+        if day_delta:
+            notes = f"{notes} within {day_delta}d"
+        results.append(
+            ActionLogMatch(
+                action_id="",
+                sheet_ref=pull.source_ref,
+                confidence=score,
+                notes=notes,
+            )
+        )
+    return results
 
 
 def find_scheduled_pull_candidates(
@@ -312,7 +526,7 @@ def find_scheduled_pull_candidates(
 
 def find_action_log_candidates(
     transaction: BankTransaction,
-    action_log: Iterable[LoggedAction],
+    action_log: Iterable[LoggedAction] | CandidateIndex,
     *,
     classification: ReconciliationClassification | None = None,
     excluded_action_ids: set[str] | None = None,
@@ -323,21 +537,19 @@ def find_action_log_candidates(
     if transaction_date is None:
         return []
 
+    index = CandidateIndex.coerce(action_log)
     excluded = excluded_action_ids or set()
     compatible = _compatible_action_types(transaction, classification)
+    bank_tokens = _transaction_tokens(transaction)
+    ordinal = transaction_date.toordinal()
     candidates: list[ActionLogCandidate] = []
-    for logged in action_log:
-        if logged.id in excluded:
-            continue
-        candidate = _action_candidate(logged)
-        if candidate is None or candidate["type"] not in compatible:
-            continue
-        day_delta = abs((candidate["date"] - transaction_date).days)
-        if day_delta > window_days:
+    for entry in index.in_date_window(ordinal - window_days, ordinal + window_days):
+        if entry.logged.id in excluded or entry.action_type not in compatible:
             continue
+        day_delta = abs(entry.ordinal - ordinal)
 
-        name_score = _name_score(transaction, candidate["text"])
-        amount_delta = abs(candidate["amount"] - abs(transaction.amount))
+        name_score = _token_overlap_score(bank_tokens, entry.tokens)
+        amount_delta = abs(entry.amount - abs(transaction.amount))
         amount_tolerance = _candidate_amount_tolerance(abs(transaction.amount), name_score)
         if amount_delta > amount_tolerance:
             continue
@@ -345,12 +557,11 @@ def find_action_log_candidates(
         amount_score = max(0.0, 1 - (amount_delta / amount_tolerance))
         date_score = max(0.0, 1 - (day_delta / max(window_days, 1)))
         score = (amount_score * 0.55) + (date_score * 0.30) + (name_score * 0.15)
-        if candidate["type"] == "income" and name_score <= 0 and amount_delta > 0.01:
+        if entry.action_type == "income" and name_score <= 0 and amount_delta > 0.01:
             continue
         candidates.append(
             _action_log_candidate(
-                logged,
-                candidate,
+                entry,
                 confidence=min(score, 0.98),
                 notes=f"amount Δ ${amount_delta:.2f}, date Δ {day_delta}d",
             )
@@ -361,7 +572,7 @@ def find_action_log_candidates(
 
 def recent_action_log_candidates(
     transaction: BankTransaction,
-    action_log: Iterable[LoggedAction],
+    action_log: Iterable[LoggedAction] | CandidateIndex,
     *,
     excluded_action_ids: set[str] | None = None,
     days_back: int = 30,
@@ -371,30 +582,24 @@ def recent_action_log_candidates(
     if transaction_date is None:
         return []
 
+    index = CandidateIndex.coerce(action_log)
     excluded = excluded_action_ids or set()
     compatible = _compatible_action_types(transaction, None)
-    earliest = transaction_date.toordinal() - max(1, days_back)
-    latest = transaction_date.toordinal() + 1
+    bank_tokens = _transaction_tokens(transaction)
+    ordinal = transaction_date.toordinal()
     candidates: list[ActionLogCandidate] = []
-    for logged in action_log:
-        if logged.id in excluded:
-            continue
-        candidate = _action_candidate(logged)
-        if candidate is None or candidate["type"] not in compatible:
-            continue
-        ordinal = candidate["date"].toordinal()
-        if ordinal < earliest or ordinal > latest:
+    for entry in index.in_date_window(ordinal - max(1, days_back), ordinal + 1):
+        if entry.logged.id in excluded or entry.action_type not in compatible:
             continue
-        amount_delta = abs(candidate["amount"] - abs(transaction.amount))
-        day_delta = abs((candidate["date"] - transaction_date).days)
-        name_score = _name_score(transaction, candidate["text"])
+        amount_delta = abs(entry.amount - abs(transaction.amount))
+        day_delta = abs(entry.ordinal - ordinal)
+        name_score = _token_overlap_score(bank_tokens, entry.tokens)
         rough_score = max(0.0, 1 - min(amount_delta / max(abs(transaction.amount), 1), 1)) * 0.65
         rough_score += max(0.0, 1 - min(day_delta / max(days_back, 1), 1)) * 0.25
         rough_score += name_score * 0.10
         candidates.append(
             _action_log_candidate(
-                logged,
-                candidate,
+                entry,
                 confidence=min(rough_score, 0.95),
                 notes=f"recent fallback, amount Δ ${amount_delta:.2f}, date Δ {day_delta}d",
             )
@@ -405,77 +610,63 @@ def recent_action_log_candidates(
 
 def find_action_log_candidate_groups(
     transaction: BankTransaction,
-    action_log: Iterable[LoggedAction],
+    action_log: Iterable[LoggedAction] | CandidateIndex,
     *,
     classification: ReconciliationClassification | None = None,
     excluded_action_ids: set[str] | None = None,
     window_days: int = 7,
     max_group_size: int = 4,
+    max_candidates: int = 24,
     limit: int = 5,
 ) -> list[ActionLogCandidateGroup]:
     transaction_date = _transaction_date(transaction)
     if transaction_date is None:
         return []
 
+    index = CandidateIndex.coerce(action_log)
     excluded = excluded_action_ids or set()
     compatible = _compatible_action_types(transaction, classification)
+    bank_tokens = _transaction_tokens(transaction)
+    ordinal = transaction_date.toordinal()
     candidates: list[ActionLogCandidate] = []
-    for logged in action_log:
-        if logged.id in excluded:
+    for entry in index.in_date_window(ordinal - window_days, ordinal + window_days):
+        if entry.logged.id in excluded or entry.action_type not in compatible:
             continue
-        candidate = _action_candidate(logged)
-        if candidate is None or candidate["type"] not in compatible:
+        day_delta = abs(entry.ordinal - ordinal)
+        if entry.amount <= 0 or entry.amount >= abs(transaction.amount):
             continue
-        day_delta = abs((candidate["date"] - transaction_date).days)
-        if day_delta > window_days:
-            continue
-        amount = float(candidate["amount"])
-        if amount <= 0 or amount >= abs(transaction.amount):
-            continue
-        name_score = _name_score(transaction, candidate["text"])
+        name_score = _token_overlap_score(bank_tokens, entry.tokens)
         candidates.append(
             _action_log_candidate(
-                logged,
-                candidate,
+                entry,
                 confidence=max(0.2, min(0.95, 0.70 - (day_delta * 0.03) + (name_score * 0.10))),
                 notes=f"group candidate, date Δ {day_delta}d",
             )
         )
 
-    candidates = sorted(candidates, key=lambda item: (-item.confidence, item.date))[:24]
-    target_cents = round(abs(transaction.amount) * 100)
-    groups: list[ActionLogCandidateGroup] = []
-
-    def search(start: int, picked: list[ActionLogCandidate], total_cents: int) -> None:
-        if len(groups) >= limit:
-            return
-        if picked and abs(total_cents - target_cents) <= 1:
-            avg_confidence = sum(candidate.confidence for candidate in picked) / len(picked)
-            groups.append(
-                ActionLogCandidateGroup(
-                    group_id="+".join(candidate.action_id for candidate in picked),
-                    candidates=tuple(picked),
-                    total_amount=total_cents / 100,
-                    confidence=min(avg_confidence + 0.10, 0.99),
-                    notes=f"exact aggregate match across {len(picked)} rows",
-                )
-            )
-            return
-        if total_cents > target_cents + 1 or len(picked) >= max_group_size:
-            return
-        for index in range(start, len(candidates)):
-            candidate = candidates[index]
-            search(index + 1, [*picked, candidate], total_cents + round(candidate.amount * 100))
-
-    search(0, [], 0)
-    return sorted(groups, key=lambda group: (-group.confidence, len(group.candidates)))[:limit]
+    candidates = sorted(candidates, key=lambda item: (-item.confidence, item.date))[:max_candidates]
+    return [
+        ActionLogCandidateGroup(
+            group_id="+".join(candidate.action_id for candidate in picked),
+            candidates=picked,
+            total_amount=total_cents / 100,
+            confidence=confidence,
+            notes=f"exact aggregate match across {len(picked)} rows",
+        )
+        for confidence, total_cents, picked in _aggregate_matches(
+            candidates,
+            round(abs(transaction.amount) * 100),
+            max_group_size=max_group_size,
+            limit=limit,
+        )
+    ]
 
 
 def action_log_candidate_by_id(logged: LoggedAction) -> ActionLogCandidate | None:
-    candidate = _action_candidate(logged)
-    if candidate is None:
+    entry = _indexed_action(logged, 0)
+    if entry is None:
         return None
-    return _action_log_candidate(logged, candidate, confidence=1.0, notes="manually selected")
+    return _action_log_candidate(entry, confidence=1.0, notes="manually selected")
 
 
 def action_log_bank_transaction(logged: LoggedAction) -> dict | None:
@@ -498,35 +689,30 @@ def action_log_bank_transaction(logged: LoggedAction) -> dict | None:
 
 
 def _action_log_candidate(
-    logged: LoggedAction,
-    candidate: dict,
+    entry: IndexedAction,
     *,
     confidence: float,
     notes: str,
 ) -> ActionLogCandidate:
     return ActionLogCandidate(
-        action_id=logged.id,
-        sheet_ref=f"{logged.action.worksheet}!row {logged.action.row}",
-        action_type=str(candidate["type"]),
-        date=candidate["date"],
-        amount=float(candidate["amount"]),
-        label=_action_transaction_name(logged),
+        action_id=entry.logged.id,
+        sheet_ref=entry.sheet_ref,
+        action_type=entry.action_type,
+        date=entry.date,
+        amount=entry.amount,
+        label=_action_transaction_name(entry.logged),
         confidence=confidence,
         notes=notes,
     )
 
 
 def _normalized_transaction_text(transaction: BankTransaction) -> str:
-    parts = [
-        transaction.name,
-        transaction.merchant_name or "",
-    ]
-    text = " ".join(parts).lower()
-    return re.sub(r"\s+", " ", text).strip()
+    return _normalized_bank_text(transaction.name, transaction.merchant_name or "")
 
 
-def _contains_any(text: str, patterns: tuple[str, ...]) -> bool:
-    return any(pattern in text for pattern in patterns)
+@lru_cache(maxsize=4096)
+def _normalized_bank_text(name: str, merchant_name: str) -> str:
+    return _WHITESPACE.sub(" ", f"{name} {merchant_name}".lower()).strip()
 
 
 def _transaction_date(transaction: BankTransaction) -> date | None:
@@ -563,6 +749,202 @@ def _matched_classification(
     return classification
 
 
+def _aggregate_matches(
+    candidates: list[ActionLogCandidate],
+    target_cents: int,
+    *,
+    max_group_size: int,
+    limit: int,
+    tolerance_cents: int = 1,
+) -> list[tuple[float, int, tuple[ActionLogCandidate, ...]]]:
+    """Best-confidence groups of candidates whose amounts sum to the target within tolerance.
+
+    Candidates are searched in ascending cents so a branch stops as soon as the next
+    row overshoots, or the largest rows left cannot reach the target. Once ``limit``
+    groups are known, branches whose best possible confidence is below the worst kept
+    group are skipped. Groups keep the caller's candidate order.
+    """
+    if limit <= 0 or max_group_size <= 0:
+        return []
+    order = sorted(range(len(candidates)), key=lambda position: round(candidates[position].amount * 100))
+    cents = [round(candidates[position].amount * 100) for position in order]
+    confidences = [candidates[position].confidence for position in order]
+    count = len(order)
+    prefix = [0]
+    for amount in cents:
+        prefix.append(prefix[-1] + amount)
+    best_remaining = [0.0] * (count + 1)
+    for position in range(count - 1, -1, -1):
+        best_remaining[position] = max(confidences[position], best_remaining[position + 1])
+
+    found: list[tuple[float, int, tuple[int, ...]]] = []
+    kept: list[float] = []
+
+    def group_confidence(confidence_sum: float, size: int) -> float:
+        return min(confidence_sum / size + 0.10, 0.99)
+
+    def search(start: int, picked: tuple[int, ...], total_cents: int, confidence_sum: float) -> None:
+        need = target_cents - total_cents
+        if picked and abs(need) <= tolerance_cents:
+            confidence = group_confidence(confidence_sum, len(picked))
+            found.append((confidence, total_cents, picked))
+            heapq.heappush(kept, confidence)
+            if len(kept) > limit:
+                heapq.heappop(kept)
+            return
+        slots = max_group_size - len(picked)
+        if slots <= 0 or start >= count:
+            return
+        if len(kept) >= limit:
+            average = confidence_sum / len(picked) if picked else 0.0
+            if min(max(average, best_remaining[start]) + 0.10, 0.99) < kept[0]:
+                return
+        for position in range(start, count):
+            if cents[position] > need + tolerance_cents:
+                break
+            reach = min(slots, count - position)
+            if prefix[count] - prefix[count - reach] < need - tolerance_cents:
+                break
+            search(position + 1, (*picked, position), total_cents + cents[position], confidence_sum + confidences[position])
+
+    search(0, (), 0, 0.0)
+    ranked = []
+    for confidence, total_cents, picked in found:
+        positions = sorted(order[position] for position in picked)
+        ranked.append((confidence, total_cents, positions))
+    ranked.sort(key=lambda item: (-item[0], len(item[2]), item[2]))
+    return [
+        (confidence, total_cents, tuple(candidates[position] for position in positions))
+        for confidence, total_cents, positions in ranked[:limit]
+    ]
+
+
+def _action_decision(
+    classification: ReconciliationClassification,
+    confidence: float,
+    match: ActionLogMatch,
+) -> ReconciliationDecision:
+    return ReconciliationDecision(
+        classification=_matched_classification(classification, match.notes),
+        status="matched",
+        confidence=max(confidence, match.confidence),
+        notes=match.notes,
+        matched_action_log_id=match.action_id,
+        matched_sheet_ref=match.sheet_ref,
+    )
+
+
+def _scheduled_decision(confidence: float, match: ActionLogMatch) -> ReconciliationDecision:
+    return ReconciliationDecision(
+        classification="subscription_or_bill",
+        status="matched",
+        confidence=max(confidence, match.confidence),
+        notes=match.notes,
+        matched_sheet_ref=match.sheet_ref,
+    )
+
+
+def _connected_rows(edges: list[dict[tuple[str, str], tuple[float, ActionLogMatch]]]) -> list[list[int]]:
+    """Group transactions that compete for at least one shared action or schedule."""
+    parent = list(range(len(edges)))
+
+    def find(row: int) -> int:
+        while parent[row] != row:
+            parent[row] = parent[parent[row]]
+            row = parent[row]
+        return row
+
+    owners: dict[tuple[str, str], int] = {}
+    for row, options in enumerate(edges):
+        for key in options:
+            if key in owners:
+                left, right = find(owners[key]), find(row)
+                if left != right:
+                    parent[max(left, right)] = min(left, right)
+            else:
+                owners[key] = row
+
+    components: dict[int, list[int]] = {}
+    for row, options in enumerate(edges):
+        if options:
+            components.setdefault(find(row), []).append(row)
+    return list(components.values())
+
+
+def _assign_rows(
+    rows: list[int],
+    edges: list[dict[tuple[str, str], tuple[float, ActionLogMatch]]],
+) -> dict[int, ActionLogMatch]:
+    if len(rows) == 1:
+        options = edges[rows[0]]
+        best = max(options.values(), key=lambda option: option[0])
+        return {rows[0]: best[1]}
+
+    keys = list(dict.fromkeys(key for row in rows for key in edges[row]))
+    # One "leave unmatched" column per row keeps every assignment feasible.
+    width = len(keys) + len(rows)
+    cost = []
+    for row in rows:
+        options = edges[row]
+        line = [-options[key][0] if key in options else _UNMATCHABLE for key in keys]
+        line.extend([0.0] * len(rows))
+        cost.append(line)
+
+    assigned = {}
+    for position, column in enumerate(_min_cost_assignment(cost, width)):
+        if column < len(keys):
+            assigned[rows[position]] = edges[rows[position]][keys[column]][1]
+    return assigned
+
+
+def _min_cost_assignment(cost: list[list[float]], width: int) -> list[int]:
+    """Hungarian algorithm for a rows x width matrix with rows <= width; returns a column per row."""
+    height = len(cost)
+    row_potential = [0.0] * (height + 1)
+    column_potential = [0.0] * (width + 1)
+    column_row = [0] * (width + 1)
+    way = [0] * (width + 1)
+    for row in range(1, height + 1):
+        column_row[0] = row
+        current = 0
+        min_slack = [float("inf")] * (width + 1)
+        used = [False] * (width + 1)
+        while True:
+            used[current] = True
+            active_row = column_row[current]
+            delta = float("inf")
+            next_column = 0
+            for column in range(1, width + 1):
+                if used[column]:
+                    continue
+                slack = cost[active_row - 1][column - 1] - row_potential[active_row] - column_potential[column]
+                if slack < min_slack[column]:
+                    min_slack[column] = slack
+                    way[column] = current
+                if min_slack[column] < delta:
+                    delta = min_slack[column]
+                    next_column = column
+            for column in range(width + 1):
+                if used[column]:
+                    row_potential[column_row[column]] += delta
+                    column_potential[column] -= delta
+                else:
+                    min_slack[column] -= delta
+            current = next_column
+            if column_row[current] == 0:
+                break
+        while current:
+            previous = way[current]
+            column_row[current] = column_row[previous]
+            current = previous
+
+    assignment = [0] * height
+    for column in range(1, width + 1):
+        if column_row[column]:
+            assignment[column_row[column] - 1] = column - 1
+    return assignment
+
+
 def _action_candidate(logged: LoggedAction) -> dict | None:
     action = logged.action
     action_type = action.metadata.get("type", "")
@@ -588,6 +970,27 @@ def _action_candidate(logged: LoggedAction) -> dict | None:
     }
 
 
+def _indexed_action(logged: LoggedAction, position: int) -> IndexedAction | None:
+    candidate = _action_candidate(logged)
+    if candidate is None:
+        return None
+    amount = float(candidate["amount"])
+    return IndexedAction(
+        position=position,
+        logged=logged,
+        action_type=str(candidate["type"]),
+        amount=amount,
+        cents=_cents(amount),
+        date=candidate["date"],
+        ordinal=candidate["date"].toordinal(),
+        tokens=_action_tokens(candidate["text"]),
+    )
+
+
+def _cents(amount: float) -> int:
+    return round(amount * 100)
+
+
 def _action_transaction_name(logged: LoggedAction) -> str:
     action = logged.action
     action_type = action.metadata.get("type", "")
@@ -661,22 +1064,31 @@ def _parse_date(value: str) -> date | None:
 
 
 def _name_score(transaction: BankTransaction, action_text: str) -> float:
-    bank_text = _normalized_transaction_text(transaction)
-    action_normalized = re.sub(r"[^a-z0-9]+", " ", action_text.lower()).strip()
-    if not bank_text or not action_normalized:
-        return 0.0
-    bank_tokens = {token for token in re.split(r"\s+", bank_text) if len(token) >= 3}
-    action_tokens = {token for token in re.split(r"\s+", action_normalized) if len(token) >= 3}
-    return _token_overlap_score(bank_tokens, action_tokens)
+    return _token_overlap_score(_transaction_tokens(transaction), _action_tokens(action_text))
+
+
+def _transaction_tokens(transaction: BankTransaction) -> frozenset[str]:
+    return _bank_tokens(transaction.name, transaction.merchant_name or "")
+
+
+@lru_cache(maxsize=4096)
+def _bank_tokens(name: str, merchant_name: str) -> frozenset[str]:
+    return _long_tokens(_normalized_bank_text(name, merchant_name))
+
+
+def _action_tokens(action_text: str) -> frozenset[str]:
+    return _long_tokens(_NON_ALPHANUMERIC.sub(" ", action_text.lower()).strip())
+
+
+def _long_tokens(text: str) -> frozenset[str]:
+    return frozenset(token for token in _WHITESPACE.split(text) if len(token) >= 3)
 
 
 def _scheduled_name_score(transaction: BankTransaction, schedule_name: str) -> float:
-    bank_text = _normalize_schedule_text(_normalized_transaction_text(transaction))
-    schedule_text = _normalize_schedule_text(schedule_name)
-    if not bank_text or not schedule_text:
+    bank_tokens = _schedule_bank_tokens(transaction.name, transaction.merchant_name or "")
+    schedule_text, schedule_tokens = _schedule_text_tokens(schedule_name)
+    if not bank_tokens or not schedule_text:
         return 0.0
-    bank_tokens = {token for token in re.split(r"\s+", bank_text) if len(token) >= 3}
-    schedule_tokens = {token for token in re.split(r"\s+", schedule_text) if len(token) >= 3}
     token_score = _token_overlap_score(bank_tokens, schedule_tokens)
     if token_score > 0:
         return token_score
@@ -685,6 +1097,17 @@ def _scheduled_name_score(transaction: BankTransaction, schedule_name: str) -> f
     return 0.0
 
 
+@lru_cache(maxsize=4096)
+def _schedule_bank_tokens(name: str, merchant_name: str) -> frozenset[str]:
+    return _long_tokens(_normalize_schedule_text(_normalized_bank_text(name, merchant_name)))
+
+
+@lru_cache(maxsize=1024)
+def _schedule_text_tokens(schedule_name: str) -> tuple[str, frozenset[str]]:
+    schedule_text = _normalize_schedule_text(schedule_name)
+    return schedule_text, _long_tokens(schedule_text)
+
+
 def _normalize_schedule_text(value: str) -> str:
     text = value.lower()
     replacements = {
@@ -694,10 +1117,10 @@ def _normalize_schedule_text(value: str) -> str:
     }
     for old, new in replacements.items():
         text = text.replace(old, new)
-    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+    return _NON_ALPHANUMERIC.sub(" ", text).strip()
 
 
-def _token_overlap_score(left_tokens: set[str], right_tokens: set[str]) -> float:
+def _token_overlap_score(left_tokens: AbstractSet[str], right_tokens: AbstractSet[str]) -> float:
     if not left_tokens or not right_tokens:
         return 0.0
     overlap = left_tokens & right_tokens
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass
+import hashlib
 import logging
 import os
 import time
-from datetime import date as local_date, timedelta
+from datetime import date as local_date, datetime, timedelta, timezone
 from typing import Any
 from uuid import uuid4
 
@@ -22,8 +25,10 @@ from bookiebot.banking.models import (
 )
 from bookiebot.banking.plaid_client import PlaidClient
 from bookiebot.banking.reconciliation import (
+    ACTION_MATCH_WINDOW_DAYS,
     ActionLogCandidate,
     ActionLogCandidateGroup,
+    CandidateIndex,
     ScheduledPullCandidate,
     _candidate_amount_tolerance,
     _scheduled_name_score,
@@ -33,7 +38,7 @@ from bookiebot.banking.reconciliation import (
     find_action_log_candidate_groups,
     find_scheduled_pull_candidates,
     recent_action_log_candidates,
-    reconcile_transaction,
+    reconcile_transactions,
 )
 from bookiebot.sheets.bills import bill_amount_for_source_label, list_bill_schedules, next_bill_pull_date
 from bookiebot.sheets.routing import sheet_user_context
@@ -42,12 +47,22 @@ from bookiebot.sheets.subscriptions import (
     next_pull_date,
     parse_visible_subscription_schedules,
 )
-from bookiebot.banking.store import BankStore
+from bookiebot.banking.store import BankStore, reconciliation_match_pairs
 from bookiebot.sheets.undo import delete_recent_action, read_active_logged_actions, undo_logged_action, update_recent_action
 
 
 logger = logging.getLogger(__name__)
-_SCHEDULE_SOURCE_CACHE: dict[str, tuple[float, list[Any], list[tuple[Any, bool, float]]]] = {}
+_TRANSACTION_SYNC_WEBHOOK_CODES = frozenset(
+    {
+        "SYNC_UPDATES_AVAILABLE",
+        "DEFAULT_UPDATE",
+        "HISTORICAL_UPDATE",
+        "INITIAL_UPDATE",
+    }
+)
+_SCHEDULE_SOURCE_CACHE: dict[str, tuple[float, list[Any], list[tuple[Any, bool, float]], str]] = {}
+_PULL_CALENDAR_CACHE: dict[str, _PullCalendar] = {}
+_PULL_CALENDAR_PADDING_DAYS = 45
 
 
 def _schedule_cache_ttl_seconds() -> int:
@@ -58,6 +73,26 @@ def _schedule_cache_ttl_seconds() -> int:
         return 900
 
 
+def _account_refresh_seconds() -> int:
+    raw = os.getenv("BOOKIEBOT_BANK_ACCOUNT_REFRESH_SECONDS", "21600").strip()
+    try:
+        return max(int(raw), 60)
+    except ValueError:
+        return 21600
+
+
+def _refreshed_within(refreshed_at: str | None, seconds: int) -> bool:
+    if not refreshed_at:
+        return False
+    try:
+        refreshed = datetime.fromisoformat(refreshed_at)
+    except ValueError:
+        return False
+    if refreshed.tzinfo is None:
+        refreshed = refreshed.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - refreshed <= timedelta(seconds=seconds)
+
+
 def _reconciliation_max_age_days() -> int:
     raw = os.getenv("BOOKIEBOT_RECONCILIATION_MAX_AGE_DAYS", "60").strip()
     try:
@@ -123,15 +158,85 @@ def _schedule_sources_for_actor(actor_key: str) -> tuple[list[Any], list[tuple[A
                 amount = 0.0
             bills_with_amounts.append((bill, amount_entered, amount))
 
-    _SCHEDULE_SOURCE_CACHE[actor_key] = (now, list(subscriptions), list(bills_with_amounts))
+    revision = hashlib.sha1(repr((subscriptions, bills_with_amounts)).encode("utf-8")).hexdigest()[:16]
+    _SCHEDULE_SOURCE_CACHE[actor_key] = (now, list(subscriptions), list(bills_with_amounts), revision)
     return subscriptions, bills_with_amounts
 
 
+def _schedule_revision(actor_key: str | None) -> str | None:
+    """Content digest of the actor's subscription and bill schedules, loading them if needed."""
+    if not actor_key:
+        return None
+    _schedule_sources_for_actor(actor_key)
+    cached = _SCHEDULE_SOURCE_CACHE.get(actor_key)
+    return cached[3] if cached else None
+
+
+def _candidate_fingerprint(
+    item: ReconciliationItem,
+    action_log: CandidateIndex,
+    schedule_revision: str | None,
+    excluded_action_ids: set[str],
+) -> str:
+    """Digest of every input the detail-view candidate search reads for one item."""
+    transaction = item.transaction
+    state = (
+        item.status,
+        item.classification,
+        transaction.updated_at,
+        sorted(action_log.fingerprints().items()),
+        schedule_revision,
+        sorted(excluded_action_ids),
+    )
+    return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()[:16]
+
+
+def _candidate_to_dict(candidate: ActionLogCandidate) -> dict[str, Any]:
+    return {**asdict(candidate), "date": candidate.date.isoformat()}
+
+
+def _candidate_from_dict(payload: dict[str, Any]) -> ActionLogCandidate:
+    return ActionLogCandidate(**{**payload, "date": local_date.fromisoformat(payload["date"])})
+
+
+def _candidates_payload(candidates: list[ActionLogCandidate], groups: list[ActionLogCandidateGroup]) -> dict[str, Any]:
+    return {
+        "candidates": [_candidate_to_dict(candidate) for candidate in candidates],
+        "groups": [
+            {
+                "group_id": group.group_id,
+                "candidates": [_candidate_to_dict(candidate) for candidate in group.candidates],
+                "total_amount": group.total_amount,
+                "confidence": group.confidence,
+                "notes": group.notes,
+            }
+            for group in groups
+        ],
+    }
+
+
+def _candidates_from_payload(payload: dict[str, Any]) -> tuple[list[ActionLogCandidate], list[ActionLogCandidateGroup]]:
+    candidates = [_candidate_from_dict(candidate) for candidate in payload.get("candidates", [])]
+    groups = [
+        ActionLogCandidateGroup(
+            group_id=group["group_id"],
+            candidates=tuple(_candidate_from_dict(candidate) for candidate in group["candidates"]),
+            total_amount=group["total_amount"],
+            confidence=group["confidence"],
+            notes=group["notes"],
+        )
+        for group in payload.get("groups", [])
+    ]
+    return candidates, groups
+
+
 def clear_schedule_source_cache(actor_key: str | None = None) -> None:
     if actor_key is None:
         _SCHEDULE_SOURCE_CACHE.clear()
+        _PULL_CALENDAR_CACHE.clear()
     else:
         _SCHEDULE_SOURCE_CACHE.pop(actor_key, None)
+        _PULL_CALENDAR_CACHE.pop(actor_key, None)
 
 
 def _clean_debug_text(value: str | None) -> str:
@@ -209,36 +314,60 @@ def _scheduled_pull_debug_rows(transaction: BankTransaction, pulls: list[Schedul
     return rows
 
 
-def _scheduled_pulls_for_transactions(
-    transactions: list[BankTransaction],
-    *,
-    actor_key: str | None,
-    window_days: int = 7,
-) -> list[ScheduledPullCandidate]:
-    if not actor_key or not transactions:
-        return []
+@dataclass(frozen=True)
+class _PullCalendar:
+    """Expanded subscription and bill pulls for one schedule revision, sorted by date."""
 
-    transaction_dates = [_transaction_local_date(transaction) for transaction in transactions]
-    transaction_dates = [value for value in transaction_dates if value is not None]
-    if not transaction_dates:
-        return []
+    revision: str
+    start: local_date
+    end: local_date
+    ordinals: list[int]
+    pulls: list[ScheduledPullCandidate]
+    by_date: dict[int, list[ScheduledPullCandidate]]
 
-    transactions_by_date: dict[local_date, list[BankTransaction]] = {}
-    for transaction in transactions:
-        transaction_date = _transaction_local_date(transaction)
-        if transaction_date is not None:
-            transactions_by_date.setdefault(transaction_date, []).append(transaction)
-    unique_transaction_dates = tuple(sorted(transactions_by_date))
-    start_date = min(transaction_dates) - timedelta(days=window_days)
-    end_date = max(transaction_dates) + timedelta(days=window_days)
+    def covers(self, start: local_date, end: local_date) -> bool:
+        return self.start <= start and end <= self.end
+
+    def window(self, start: local_date, end: local_date) -> list[ScheduledPullCandidate]:
+        low = bisect_left(self.ordinals, start.toordinal())
+        high = bisect_right(self.ordinals, end.toordinal())
+        return self.pulls[low:high]
+
+
+def _pull_calendar_for_actor(actor_key: str, start: local_date, end: local_date) -> _PullCalendar:
     subscriptions, bills_with_amounts = _schedule_sources_for_actor(actor_key)
-    candidates: list[ScheduledPullCandidate] = []
+    revision = _SCHEDULE_SOURCE_CACHE[actor_key][3] if actor_key in _SCHEDULE_SOURCE_CACHE else ""
+    cached = _PULL_CALENDAR_CACHE.get(actor_key)
+    if cached and cached.revision == revision and cached.covers(start, end):
+        return cached
+    if cached and cached.revision == revision:
+        start = min(start, cached.start)
+        end = max(end, cached.end)
+    calendar = _build_pull_calendar(
+        revision,
+        subscriptions,
+        bills_with_amounts,
+        start - timedelta(days=_PULL_CALENDAR_PADDING_DAYS),
+        end + timedelta(days=_PULL_CALENDAR_PADDING_DAYS),
+    )
+    _PULL_CALENDAR_CACHE[actor_key] = calendar
+    return calendar
+
+
+def _build_pull_calendar(
+    revision: str,
+    subscriptions: list[Any],
+    bills_with_amounts: list[tuple[Any, bool, float]],
+    start: local_date,
+    end: local_date,
+) -> _PullCalendar:
+    pulls: list[ScheduledPullCandidate] = []
     for subscription in subscriptions:
         if subscription.amount <= 0:
             continue
-        expected = next_pull_date(subscription, start_date)
-        while expected is not None and expected <= end_date:
-            candidates.append(
+        expected = next_pull_date(subscription, start)
+        while expected is not None and expected <= end:
+            pulls.append(
                 ScheduledPullCandidate(
                     source_type="subscription",
                     name=subscription.name,
@@ -251,41 +380,126 @@ def _scheduled_pulls_for_transactions(
             expected = next_pull_date(subscription, expected + timedelta(days=1))
 
     for bill, amount_entered, amount in bills_with_amounts:
-        seen_pull_dates: set[local_date] = set()
-        expected = next_bill_pull_date(bill, start_date)
-        while expected is not None and expected <= end_date:
-            seen_pull_dates.add(expected)
-            candidates.append(
-                ScheduledPullCandidate(
-                    source_type="bill",
-                    name=bill.display_name,
-                    amount=amount if amount_entered and amount > 0 else 0.0,
-                    pull_date=expected,
-                    source_ref=bill.source_range or f"bill:{bill.bill_key}",
-                    account=bill.account,
-                )
-            )
+        expected = next_bill_pull_date(bill, start)
+        while expected is not None and expected <= end:
+            pulls.append(_bill_pull(bill, amount_entered, amount, expected))
             expected = next_bill_pull_date(bill, expected + timedelta(days=1))
-        for transaction_date in unique_transaction_dates:
-            if transaction_date in seen_pull_dates:
+
+    pulls.sort(key=lambda pull: pull.pull_date)
+    by_date: dict[int, list[ScheduledPullCandidate]] = {}
+    for pull in pulls:
+        by_date.setdefault(pull.pull_date.toordinal(), []).append(pull)
+    return _PullCalendar(
+        revision=revision,
+        start=start,
+        end=end,
+        ordinals=[pull.pull_date.toordinal() for pull in pulls],
+        pulls=pulls,
+        by_date=by_date,
+    )
+
+
+def _bill_pull(bill: Any, amount_entered: bool, amount: float, pull_date: local_date) -> ScheduledPullCandidate:
+    return ScheduledPullCandidate(
+        source_type="bill",
+        name=bill.display_name,
+        amount=amount if amount_entered and amount > 0 else 0.0,
+        pull_date=pull_date,
+        source_ref=bill.source_range or f"bill:{bill.bill_key}",
+        account=bill.account,
+    )
+
+
+def _scheduled_pulls_for_transactions(
+    transactions: list[BankTransaction],
+    *,
+    actor_key: str | None,
+    window_days: int = 7,
+) -> list[ScheduledPullCandidate]:
+    if not actor_key or not transactions:
+        return []
+
+    transactions_by_date: dict[local_date, list[BankTransaction]] = {}
+    for transaction in transactions:
+        transaction_date = _transaction_local_date(transaction)
+        if transaction_date is not None:
+            transactions_by_date.setdefault(transaction_date, []).append(transaction)
+    if not transactions_by_date:
+        return []
+
+    start_date = min(transactions_by_date) - timedelta(days=window_days)
+    end_date = max(transactions_by_date) + timedelta(days=window_days)
+    calendar = _pull_calendar_for_actor(actor_key, start_date, end_date)
+    candidates = list(calendar.window(start_date, end_date))
+
+    # Bills also get a pull on each transaction date they could plausibly match,
+    # since the sheet's pull day often drifts from the actual charge date.
+    _subscriptions, bills_with_amounts = _schedule_sources_for_actor(actor_key)
+    for bill, amount_entered, amount in bills_with_amounts:
+        source_ref = bill.source_range or f"bill:{bill.bill_key}"
+        for transaction_date in sorted(transactions_by_date):
+            scheduled = calendar.by_date.get(transaction_date.toordinal(), ())
+            if any(pull.source_type == "bill" and pull.source_ref == source_ref for pull in scheduled):
                 continue
-            date_transactions = transactions_by_date.get(transaction_date, [])
-            name_matches = any(_bill_name_matches_transaction(bill.display_name, transaction) for transaction in date_transactions)
+            name_matches = any(
+                _bill_name_matches_transaction(bill.display_name, transaction)
+                for transaction in transactions_by_date[transaction_date]
+            )
             if not ((amount_entered and amount > 0) or name_matches):
                 continue
-            candidates.append(
-                ScheduledPullCandidate(
-                    source_type="bill",
-                    name=bill.display_name,
-                    amount=amount if amount_entered and amount > 0 else 0.0,
-                    pull_date=transaction_date,
-                    source_ref=bill.source_range or f"bill:{bill.bill_key}",
-                    account=bill.account,
-                )
-            )
+            candidates.append(_bill_pull(bill, amount_entered, amount, transaction_date))
     return candidates
 
 
+def _transactions_to_rescore(
+    transactions: list[BankTransaction],
+    stored: dict[int, ReconciliationItem],
+    previous: dict[str, Any] | None,
+    current: dict[str, Any],
+) -> list[BankTransaction]:
+    """Transactions whose stored decision may be stale against the current inputs.
+
+    A transaction is re-scored when it has no scored item, when sync touched it
+    after scoring, or when an action-log row changed, appeared, disappeared, or
+    stopped being matched within the action match window of its date. Schedule
+    edits and freed schedule refs can affect any transaction, so they re-score all.
+    """
+    if previous is None or previous.get("schedule_revision") != current["schedule_revision"]:
+        return list(transactions)
+    if set(previous.get("excluded_sheet_refs", ())) - set(current["excluded_sheet_refs"]):
+        return list(transactions)
+
+    previous_actions = previous.get("actions", {})
+    current_actions = current["actions"]
+    changed_ids = {
+        action_id
+        for action_id in previous_actions.keys() | current_actions.keys()
+        if previous_actions.get(action_id) != current_actions.get(action_id)
+    }
+    changed_ids |= set(previous.get("excluded_action_ids", ())) - set(current["excluded_action_ids"])
+    changed_ordinals = sorted(
+        {
+            int(fingerprint[1])
+            for action_id in changed_ids
+            for fingerprint in (previous_actions.get(action_id), current_actions.get(action_id))
+            if fingerprint
+        }
+    )
+
+    rescore = []
+    for transaction in transactions:
+        item = stored.get(transaction.id)
+        transaction_date = _transaction_local_date(transaction)
+        if item is None or not item.scored_at or item.scored_at < transaction.updated_at or transaction_date is None:
+            rescore.append(transaction)
+            continue
+        ordinal = transaction_date.toordinal()
+        position = bisect_left(changed_ordinals, ordinal - ACTION_MATCH_WINDOW_DAYS)
+        if position < len(changed_ordinals) and changed_ordinals[position] <= ordinal + ACTION_MATCH_WINDOW_DAYS:
+            rescore.append(transaction)
+    return rescore
+
+
 def _transaction_local_date(transaction: BankTransaction) -> local_date | None:
     raw = transaction.date or transaction.authorized_date
     if not raw:
@@ -346,6 +560,7 @@ class BankingService:
         )
         accounts = await self._fetch_accounts_for_item(item)
         self.store.upsert_accounts(accounts)
+        self.store.mark_accounts_refreshed(item.id)
         return item
 
     async def seed_sandbox_owner(self, owner_key: str, institution_id: str = "ins_109508") -> tuple[LinkedBankItem, list[SyncResult]]:
@@ -368,14 +583,15 @@ class BankingService:
                 results = await self.sync_owner(owner_key)
         return item, results
 
-    async def sync_owner(self, owner_key: str) -> list[SyncResult]:
+    async def sync_owner(self, owner_key: str, *, refresh_accounts: bool = False) -> list[SyncResult]:
         self.store.initialize()
         results: list[SyncResult] = []
         for item in self.store.list_active_items(owner_key=owner_key):
-            results.append(await self.sync_item(item))
+            results.append(await self.sync_item(item, refresh_accounts=refresh_accounts))
         return results
 
-    async def sync_item(self, item: LinkedBankItem) -> SyncResult:
+    async def sync_item(self, item: LinkedBankItem, *, refresh_accounts: bool = False) -> SyncResult:
+        """Pull new transactions for one Item, skipping webhook/account calls that are still current."""
         access_token = self.store.get_access_token(item.id)
         cursor = self.store.get_cursor(item.id)
         total_added = 0
@@ -383,19 +599,18 @@ class BankingService:
         total_removed = 0
         has_more = True
         latest_cursor = cursor
+        account_count = 0
+        accounts_refreshed = False
 
         try:
-            if self.config.plaid_webhook_url:
-                try:
-                    await self.plaid.update_item_webhook(access_token, self.config.plaid_webhook_url)
-                except Exception:
-                    logger.warning(
-                        "Failed to update Plaid item webhook; continuing transaction sync",
-                        extra={"item_id": item.id},
-                        exc_info=True,
-                    )
-            accounts = await self._fetch_accounts_for_item(item, access_token=access_token)
-            self.store.upsert_accounts(accounts)
+            await self._ensure_item_webhook(item, access_token)
+            if refresh_accounts or not _refreshed_within(
+                self.store.accounts_refreshed_at(item.id),
+                _account_refresh_seconds(),
+            ):
+                account_count = await self._refresh_accounts(item, access_token)
+                accounts_refreshed = True
+            known_account_ids = self.store.provider_account_ids(item.id)
 
             while has_more:
                 response = await self.plaid.sync_transactions(access_token, cursor=latest_cursor)
@@ -405,6 +620,14 @@ class BankingService:
                 latest_cursor = response.get("next_cursor") or latest_cursor
                 has_more = bool(response.get("has_more"))
 
+                if not accounts_refreshed and any(
+                    txn.get("account_id") and str(txn.get("account_id")) not in known_account_ids
+                    for txn in [*added, *modified]
+                ):
+                    account_count = await self._refresh_accounts(item, access_token)
+                    accounts_refreshed = True
+                    known_account_ids = self.store.provider_account_ids(item.id)
+
                 self.store.upsert_transactions(added, item.owner_key)
                 self.store.upsert_transactions(modified, item.owner_key)
                 self.store.mark_transactions_removed(removed)
@@ -420,7 +643,7 @@ class BankingService:
                 added=total_added,
                 modified=total_modified,
                 removed=total_removed,
-                accounts=len(accounts),
+                accounts=account_count if accounts_refreshed else len(known_account_ids),
                 has_more=False,
             )
         except Exception as exc:
@@ -428,49 +651,66 @@ class BankingService:
             self.store.mark_sync_error(item.id, f"{type(exc).__name__}: {exc}")
             raise
 
+    async def _ensure_item_webhook(self, item: LinkedBankItem, access_token: str) -> None:
+        webhook_url = self.config.plaid_webhook_url
+        if not webhook_url or self.store.registered_webhook_url(item.id) == webhook_url:
+            return
+        try:
+            await self.plaid.update_item_webhook(access_token, webhook_url)
+        except Exception:
+            logger.warning(
+                "Failed to update Plaid item webhook; continuing transaction sync",
+                extra={"item_id": item.id},
+                exc_info=True,
+            )
+            return
+        self.store.mark_webhook_registered(item.id, webhook_url)
+
+    async def _refresh_accounts(self, item: LinkedBankItem, access_token: str) -> int:
+        accounts = await self._fetch_accounts_for_item(item, access_token=access_token)
+        self.store.upsert_accounts(accounts)
+        self.store.mark_accounts_refreshed(item.id)
+        return len(accounts)
+
     def receive_plaid_webhook(self, payload: dict[str, Any]):
         return self.store.enqueue_plaid_webhook(payload)
 
     async def process_plaid_webhook_inbox(self, limit: int = 25) -> dict[str, int]:
+        """Drain queued Plaid webhooks, running at most one transaction sync per Item."""
         self.store.initialize()
         processed = 0
         failed = 0
         skipped = 0
+        sync_event_ids: dict[str, list[int]] = {}
+        skipped_event_ids: dict[str | None, list[int]] = {}
         for event, payload in self.store.pending_plaid_webhook_events(limit=limit):
-            self.store.mark_plaid_webhook_processing(event.id)
             item_id = event.item_id or str(payload.get("item_id") or "").strip() or None
+            webhook_type = (event.webhook_type or "").upper()
+            webhook_code = (event.webhook_code or "").upper()
+            if item_id and webhook_type == "TRANSACTIONS" and webhook_code in _TRANSACTION_SYNC_WEBHOOK_CODES:
+                sync_event_ids.setdefault(item_id, []).append(event.id)
+            else:
+                skipped_event_ids.setdefault(item_id, []).append(event.id)
+
+        for item_id, event_ids in skipped_event_ids.items():
+            self.store.mark_plaid_webhooks_processed(event_ids, item_id)
+            skipped += len(event_ids)
+
+        for item_id, event_ids in sync_event_ids.items():
+            self.store.mark_plaid_webhooks_processing(event_ids)
             try:
-                webhook_type = (event.webhook_type or "").upper()
-                webhook_code = (event.webhook_code or "").upper()
-                if webhook_type != "TRANSACTIONS":
-                    skipped += 1
-                    self.store.mark_plaid_webhook_processed(event.id, item_id)
-                    continue
-                if webhook_code not in {
-                    "SYNC_UPDATES_AVAILABLE",
-                    "DEFAULT_UPDATE",
-                    "HISTORICAL_UPDATE",
-                    "INITIAL_UPDATE",
-                }:
-                    skipped += 1
-                    self.store.mark_plaid_webhook_processed(event.id, item_id)
-                    continue
-                if not item_id:
-                    skipped += 1
-                    self.store.mark_plaid_webhook_processed(event.id, item_id)
-                    continue
                 item = self.store.get_item_by_provider_item_id(item_id)
                 if item is None:
                     raise RuntimeError(f"Unknown Plaid item_id {item_id}")
                 await self.sync_item(item)
-                self.store.mark_plaid_webhook_processed(event.id, item_id)
-                processed += 1
+                self.store.mark_plaid_webhooks_processed(event_ids, item_id)
+                processed += len(event_ids)
             except Exception as exc:
-                failed += 1
-                self.store.mark_plaid_webhook_failed(event.id, f"{type(exc).__name__}: {exc}")
+                failed += len(event_ids)
+                self.store.mark_plaid_webhooks_failed(event_ids, f"{type(exc).__name__}: {exc}")
                 logger.warning(
-                    "Failed to process Plaid webhook event",
-                    extra={"event_id": event.id, "item_id": item_id, "exception": str(exc)},
+                    "Failed to process Plaid webhook events",
+                    extra={"event_ids": event_ids, "item_id": item_id, "exception": str(exc)},
                     exc_info=True,
                 )
         return {"processed": processed, "failed": failed, "skipped": skipped}
@@ -650,8 +890,14 @@ class BankingService:
         item = self.get_reconciliation_item(owner_key, reconciliation_id)
         if item is None:
             return None, [], []
-        action_log = read_active_logged_actions(actor_key)
+        action_log = CandidateIndex.from_action_log(read_active_logged_actions(actor_key))
         excluded = self.store.matched_action_log_ids(owner_key)
+        variant = f"{'fallback' if fallback else 'matches'}:{limit}"
+        fingerprint = _candidate_fingerprint(item, action_log, _schedule_revision(actor_key), excluded)
+        stored = self.store.reconciliation_candidates(item.id, variant, fingerprint)
+        if stored is not None:
+            return item, *_candidates_from_payload(stored)
+
         schedule_candidates = find_scheduled_pull_candidates(
             item.transaction,
             _scheduled_pulls_for_transactions([item.transaction], actor_key=actor_key),
@@ -687,6 +933,7 @@ class BankingService:
                 max_group_size=4,
                 limit=5,
             )
+        self.store.save_reconciliation_candidates(item.id, variant, fingerprint, _candidates_payload(candidates, groups))
         return item, candidates, groups
 
     def reconciliation_schedule_debug(
@@ -893,7 +1140,7 @@ class BankingService:
         if item.transaction.pending:
             return item, None, "pending_transaction"
 
-        excluded = self.store.matched_action_log_ids(owner_key)
+        excluded = self.store.matched_action_log_ids(owner_key, {action_id})
         if action_id in excluded and item.matched_action_log_id != action_id:
             return item, None, "already_matched"
 
@@ -1024,7 +1271,7 @@ class BankingService:
         if len(set(cleaned_ids)) != len(cleaned_ids):
             return item, [], "duplicate"
 
-        excluded = self.store.matched_action_log_ids(owner_key)
+        excluded = self.store.matched_action_log_ids(owner_key, set(cleaned_ids))
         already_matched = [action_id for action_id in cleaned_ids if action_id in excluded]
         if already_matched:
             return item, [], "already_matched"
@@ -1113,43 +1360,62 @@ class BankingService:
             force=force,
             start_date=start_date,
         )
-        action_log = read_active_logged_actions(actor_key) if actor_key else []
-        scheduled_pulls = _scheduled_pulls_for_transactions(transactions, actor_key=actor_key)
-        used_action_ids = set() if force else set(self.store.matched_action_log_ids(owner_key))
-        used_sheet_refs = set() if force else set(self.store.matched_sheet_refs(owner_key))
-        items = []
-        for transaction in transactions:
-            decision = reconcile_transaction(
-                transaction,
-                action_log,
-                scheduled_pulls,
-                excluded_action_ids=used_action_ids,
-                excluded_sheet_refs=used_sheet_refs,
+        action_log = CandidateIndex.from_action_log(read_active_logged_actions(actor_key) if actor_key else [])
+        excluded_action_ids = set() if force else set(self.store.matched_action_log_ids(owner_key))
+        excluded_sheet_refs = set() if force else set(self.store.matched_sheet_refs(owner_key))
+        stored: dict[int, ReconciliationItem] = {}
+        rescore = transactions
+        watermark: dict[str, Any] | None = None
+        if transactions and not force:
+            watermark = {
+                "actions": {action_id: list(value) for action_id, value in action_log.fingerprints().items()},
+                "excluded_action_ids": sorted(excluded_action_ids),
+                "excluded_sheet_refs": sorted(excluded_sheet_refs),
+                "schedule_revision": _schedule_revision(actor_key),
+            }
+            stored = self.store.reconciliation_items_for_transactions(
+                owner_key,
+                [transaction.id for transaction in transactions],
             )
-            items.append(
-                self.store.upsert_reconciliation_item(
-                    owner_key=owner_key,
-                    transaction=transaction,
-                    classification=decision.classification,
-                    status=decision.status,
-                    confidence=decision.confidence,
-                    notes=decision.notes,
-                    matched_action_log_id=decision.matched_action_log_id,
-                    matched_sheet_ref=decision.matched_sheet_ref,
-                )
+            rescore = _transactions_to_rescore(
+                transactions,
+                stored,
+                self.store.reconciliation_watermark(owner_key, actor_key),
+                watermark,
             )
-            if decision.matched_action_log_id:
-                used_action_ids.update(
-                    part.strip()
-                    for part in decision.matched_action_log_id.split("+")
-                    if part.strip()
-                )
-            if decision.matched_sheet_ref:
-                used_sheet_refs.update(
-                    part.strip()
-                    for part in decision.matched_sheet_ref.split(" + ")
-                    if part.strip()
-                )
+        scheduled_pulls = _scheduled_pulls_for_transactions(rescore, actor_key=actor_key)
+        decisions = reconcile_transactions(
+            rescore,
+            action_log,
+            scheduled_pulls,
+            excluded_action_ids=excluded_action_ids,
+            excluded_sheet_refs=excluded_sheet_refs,
+        )
+        scored = {}
+        for transaction, decision in zip(rescore, decisions):
+            scored[transaction.id] = self.store.upsert_reconciliation_item(
+                owner_key=owner_key,
+                transaction=transaction,
+                classification=decision.classification,
+                status=decision.status,
+                confidence=decision.confidence,
+                notes=decision.notes,
+                matched_action_log_id=decision.matched_action_log_id,
+                matched_sheet_ref=decision.matched_sheet_ref,
+            )
+        items = [scored.get(transaction.id) or stored[transaction.id] for transaction in transactions]
+        if watermark is not None:
+            for item in scored.values():
+                if item.status not in {"matched", "confirmed", "import_requested"}:
+                    continue
+                for action_id, sheet_ref in reconciliation_match_pairs(item.matched_action_log_id, item.matched_sheet_ref):
+                    if action_id:
+                        excluded_action_ids.add(action_id)
+                    if sheet_ref:
+                        excluded_sheet_refs.add(sheet_ref)
+            watermark["excluded_action_ids"] = sorted(excluded_action_ids)
+            watermark["excluded_sheet_refs"] = sorted(excluded_sheet_refs)
+            self.store.save_reconciliation_watermark(owner_key, actor_key, watermark)
         return ReconciliationPreview(
             owner_key=owner_key,
             items=items,
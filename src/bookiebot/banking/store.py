@@ -21,10 +21,103 @@ from bookiebot.banking.models import (
 )
 
 
+BANK_INDEX_STATEMENTS = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_items_owner_status
+    ON bank_items (owner_key, status)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_accounts_item
+    ON bank_accounts (item_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_accounts_owner
+    ON bank_accounts (owner_key)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_transactions_owner_effective_date
+    ON bank_transactions (owner_key, effective_date)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_transactions_account
+    ON bank_transactions (account_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_transactions_pending_link
+    ON bank_transactions (pending_transaction_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_reconciliation_items_owner_status
+    ON bank_reconciliation_items (owner_key, status)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_reconciliation_matches_reconciliation
+    ON bank_reconciliation_matches (reconciliation_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_reconciliation_matches_action
+    ON bank_reconciliation_matches (action_log_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_reconciliation_matches_sheet_ref
+    ON bank_reconciliation_matches (sheet_ref)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_webhook_events_status_received
+    ON bank_webhook_events (provider, status, received_at, id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_bank_webhook_events_item_status
+    ON bank_webhook_events (item_id, status)
+    """,
+)
+
+
+RECONCILIATION_MATCHES_TABLE = """
+CREATE TABLE IF NOT EXISTS bank_reconciliation_matches (
+    reconciliation_id INTEGER NOT NULL REFERENCES bank_reconciliation_items(id) ON DELETE CASCADE,
+    action_log_id TEXT,
+    sheet_ref TEXT
+)
+"""
+
+RECONCILIATION_WATERMARKS_TABLE = """
+CREATE TABLE IF NOT EXISTS bank_reconciliation_watermarks (
+    owner_key TEXT NOT NULL,
+    actor_key TEXT NOT NULL DEFAULT '',
+    state_json TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (owner_key, actor_key)
+)
+"""
+
+RECONCILIATION_CANDIDATES_TABLE = """
+CREATE TABLE IF NOT EXISTS bank_reconciliation_candidates (
+    reconciliation_id INTEGER NOT NULL REFERENCES bank_reconciliation_items(id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (reconciliation_id, variant)
+)
+"""
+
+MATCHED_RECONCILIATION_STATUSES = "('matched', 'confirmed', 'import_requested')"
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def transaction_effective_date(txn: dict[str, Any]) -> str:
+    """Plaid date used for ordering and windows: posted date, then authorized date."""
+    for key in ("date", "authorized_date"):
+        value = txn.get(key)
+        if value is not None:
+            return str(value)
+    return ""
+
+
 class BankStoreConnection(Protocol):
     def execute(self, sql: str, params: tuple[Any, ...] = (), /) -> Any:
         ...
@@ -103,7 +196,8 @@ class BankStore:
                     raw_json TEXT NOT NULL,
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
-                    removed_at TEXT
+                    removed_at TEXT,
+                    effective_date TEXT NOT NULL DEFAULT ''
                 );
 
                 CREATE TABLE IF NOT EXISTS bank_sync_state (
@@ -112,7 +206,9 @@ class BankStore:
                     last_sync_at TEXT,
                     last_success_at TEXT,
                     last_error TEXT,
-                    webhook_pending INTEGER NOT NULL DEFAULT 0
+                    webhook_pending INTEGER NOT NULL DEFAULT 0,
+                    webhook_url TEXT,
+                    accounts_refreshed_at TEXT
                 );
 
                 CREATE TABLE IF NOT EXISTS bank_webhook_events (
@@ -141,13 +237,22 @@ class BankStore:
                     last_seen_at TEXT NOT NULL,
                     resolved_at TEXT,
                     ignored_at TEXT,
-                    notes TEXT
+                    notes TEXT,
+                    scored_at TEXT
                 );
 
                 """
             )
             self._ensure_account_watch_column(conn)
             self._ensure_transaction_pending_link_column(conn)
+            self._ensure_sync_state_refresh_columns(conn)
+            self._ensure_transaction_effective_date_column(conn)
+            self._ensure_reconciliation_scored_column(conn)
+            self._ensure_reconciliation_matches_table(conn)
+            conn.execute(RECONCILIATION_WATERMARKS_TABLE)
+            conn.execute(RECONCILIATION_CANDIDATES_TABLE)
+            for statement in BANK_INDEX_STATEMENTS:
+                conn.execute(statement)
 
     def _ensure_account_watch_column(self, conn: BankStoreConnection) -> None:
         try:
@@ -163,6 +268,82 @@ class BankStore:
             if "duplicate column name" not in str(exc).lower():
                 raise
 
+    def _ensure_transaction_effective_date_column(self, conn: BankStoreConnection) -> None:
+        try:
+            conn.execute("ALTER TABLE bank_transactions ADD COLUMN effective_date TEXT NOT NULL DEFAULT ''")
+        except sqlite3.OperationalError as exc:
+            if "duplicate column name" not in str(exc).lower():
+                raise
+            return
+        conn.execute("UPDATE bank_transactions SET effective_date = COALESCE(date, authorized_date, '')")
+
+    def _ensure_reconciliation_scored_column(self, conn: BankStoreConnection) -> None:
+        try:
+            conn.execute("ALTER TABLE bank_reconciliation_items ADD COLUMN scored_at TEXT")
+        except sqlite3.OperationalError as exc:
+            if "duplicate column name" not in str(exc).lower():
+                raise
+
+    def _table_exists(self, conn: BankStoreConnection, table_name: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table_name,),
+        ).fetchone()
+        return row is not None
+
+    def _ensure_reconciliation_matches_table(self, conn: BankStoreConnection) -> None:
+        """Create the normalized match table and backfill it from the joined legacy columns."""
+        if self._table_exists(conn, "bank_reconciliation_matches"):
+            return
+        conn.execute(RECONCILIATION_MATCHES_TABLE)
+        rows = conn.execute(
+            """
+            SELECT id, matched_action_log_id, matched_sheet_ref
+            FROM bank_reconciliation_items
+            WHERE matched_action_log_id IS NOT NULL
+               OR matched_sheet_ref IS NOT NULL
+            """
+        ).fetchall()
+        match_rows = [
+            (int(row["id"]), action_log_id, sheet_ref)
+            for row in rows
+            for action_log_id, sheet_ref in reconciliation_match_pairs(
+                row["matched_action_log_id"],
+                row["matched_sheet_ref"],
+            )
+        ]
+        if match_rows:
+            conn.executemany(
+                "INSERT INTO bank_reconciliation_matches (reconciliation_id, action_log_id, sheet_ref) VALUES (?, ?, ?)",
+                match_rows,
+            )
+
+    def _replace_reconciliation_matches(self, conn: BankStoreConnection, reconciliation_id: int) -> None:
+        conn.execute(
+            "DELETE FROM bank_reconciliation_matches WHERE reconciliation_id = ?",
+            (int(reconciliation_id),),
+        )
+        row = conn.execute(
+            "SELECT matched_action_log_id, matched_sheet_ref FROM bank_reconciliation_items WHERE id = ?",
+            (int(reconciliation_id),),
+        ).fetchone()
+        if row is None:
+            return
+        pairs = reconciliation_match_pairs(row["matched_action_log_id"], row["matched_sheet_ref"])
+        if pairs:
+            conn.executemany(
+                "INSERT INTO bank_reconciliation_matches (reconciliation_id, action_log_id, sheet_ref) VALUES (?, ?, ?)",
+                [(int(reconciliation_id), action_log_id, sheet_ref) for action_log_id, sheet_ref in pairs],
+            )
+
+    def _ensure_sync_state_refresh_columns(self, conn: BankStoreConnection) -> None:
+        for column in ("webhook_url TEXT", "accounts_refreshed_at TEXT"):
+            try:
+                conn.execute(f"ALTER TABLE bank_sync_state ADD COLUMN {column}")
+            except sqlite3.OperationalError as exc:
+                if "duplicate column name" not in str(exc).lower():
+                    raise
+
     def upsert_item(
         self,
         *,
@@ -305,6 +486,24 @@ class BankStore:
                         tuple(transaction_ids),
                     ).fetchone()["count"]
                 )
+                conn.execute(
+                    f"""
+                    DELETE FROM bank_reconciliation_matches
+                    WHERE reconciliation_id IN (
+                        SELECT id FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})
+                    )
+                    """,
+                    tuple(transaction_ids),
+                )
+                conn.execute(
+                    f"""
+                    DELETE FROM bank_reconciliation_candidates
+                    WHERE reconciliation_id IN (
+                        SELECT id FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})
+                    )
+                    """,
+                    tuple(transaction_ids),
+                )
                 conn.execute(
                     f"DELETE FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})",
                     tuple(transaction_ids),
@@ -345,8 +544,8 @@ class BankStore:
                 SELECT id
                 FROM bank_transactions
                 WHERE owner_key = ?
-                  AND COALESCE(date, authorized_date, '') != ''
-                  AND COALESCE(date, authorized_date, '') < ?
+                  AND effective_date != ''
+                  AND effective_date < ?
                 """,
                 (owner_key, cutoff_date),
             ).fetchall()
@@ -365,6 +564,24 @@ class BankStore:
                         tuple(transaction_ids),
                     ).fetchone()["count"]
                 )
+                conn.execute(
+                    f"""
+                    DELETE FROM bank_reconciliation_matches
+                    WHERE reconciliation_id IN (
+                        SELECT id FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})
+                    )
+                    """,
+                    tuple(transaction_ids),
+                )
+                conn.execute(
+                    f"""
+                    DELETE FROM bank_reconciliation_candidates
+                    WHERE reconciliation_id IN (
+                        SELECT id FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})
+                    )
+                    """,
+                    tuple(transaction_ids),
+                )
                 conn.execute(
                     f"DELETE FROM bank_reconciliation_items WHERE bank_transaction_id IN ({placeholders})",
                     tuple(transaction_ids),
@@ -431,6 +648,59 @@ class BankStore:
                 (item_db_id, now, error[:1000]),
             )
 
+    def registered_webhook_url(self, item_db_id: int) -> str | None:
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT webhook_url FROM bank_sync_state WHERE item_id = ?",
+                (item_db_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row["webhook_url"]
+
+    def mark_webhook_registered(self, item_db_id: int, webhook_url: str) -> None:
+        with self.connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO bank_sync_state (item_id, webhook_url)
+                VALUES (?, ?)
+                ON CONFLICT(item_id) DO UPDATE SET
+                    webhook_url = excluded.webhook_url
+                """,
+                (item_db_id, webhook_url),
+            )
+
+    def accounts_refreshed_at(self, item_db_id: int) -> str | None:
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT accounts_refreshed_at FROM bank_sync_state WHERE item_id = ?",
+                (item_db_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row["accounts_refreshed_at"]
+
+    def mark_accounts_refreshed(self, item_db_id: int) -> None:
+        now = utc_now_iso()
+        with self.connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO bank_sync_state (item_id, accounts_refreshed_at)
+                VALUES (?, ?)
+                ON CONFLICT(item_id) DO UPDATE SET
+                    accounts_refreshed_at = excluded.accounts_refreshed_at
+                """,
+                (item_db_id, now),
+            )
+
+    def provider_account_ids(self, item_db_id: int) -> set[str]:
+        with self.connect() as conn:
+            rows = conn.execute(
+                "SELECT provider_account_id FROM bank_accounts WHERE item_id = ?",
+                (item_db_id,),
+            ).fetchall()
+        return {str(row["provider_account_id"]) for row in rows}
+
     def reset_sync_cursors(self, owner_key: str) -> int:
         """Clear Plaid transaction cursors for an owner so the next sync backfills cached rows."""
         now = utc_now_iso()
@@ -551,9 +821,9 @@ class BankStore:
                     INSERT INTO bank_transactions (
                         provider_transaction_id, account_id, owner_key, date, authorized_date,
                         name, merchant_name, amount, pending, category, payment_channel, pending_transaction_id,
-                        raw_json, created_at, updated_at, removed_at
+                        raw_json, created_at, updated_at, removed_at, effective_date
                     )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
                     ON CONFLICT(provider_transaction_id) DO UPDATE SET
                         account_id = excluded.account_id,
                         owner_key = excluded.owner_key,
@@ -568,7 +838,8 @@ class BankStore:
                         pending_transaction_id = excluded.pending_transaction_id,
                         raw_json = excluded.raw_json,
                         updated_at = excluded.updated_at,
-                        removed_at = NULL
+                        removed_at = NULL,
+                        effective_date = excluded.effective_date
                     """,
                     (
                         txn["transaction_id"],
@@ -586,10 +857,68 @@ class BankStore:
                         json.dumps(txn, sort_keys=True),
                         now,
                         now,
+                        transaction_effective_date(txn),
                     ),
                 )
+            self._carry_over_pending_reconciliation(
+                conn,
+                [str(txn["transaction_id"]) for txn in transactions],
+                now=now,
+            )
         return len(transactions)
 
+    def _carry_over_pending_reconciliation(
+        self,
+        conn: BankStoreConnection,
+        provider_transaction_ids: list[str],
+        *,
+        now: str,
+    ) -> int:
+        """Move reconciliation items (and their matches) from pending rows onto the posted rows replacing them.
+
+        Covers both arrival orders inside a batch: a posted row naming a stored pending row, and a
+        pending row whose posted twin is already stored. Open items are re-scored on the next preview;
+        user decisions carry over as-is.
+        """
+        ids = sorted(set(provider_transaction_ids))
+        if not ids:
+            return 0
+        placeholders = ",".join("?" for _ in ids)
+        rows = conn.execute(
+            f"""
+            SELECT r.id AS reconciliation_id, posted.id AS posted_id
+            FROM bank_transactions posted
+            JOIN bank_transactions prior ON prior.provider_transaction_id = posted.pending_transaction_id
+            JOIN bank_reconciliation_items r ON r.bank_transaction_id = prior.id
+            LEFT JOIN bank_reconciliation_items existing ON existing.bank_transaction_id = posted.id
+            WHERE posted.pending = 0
+              AND prior.pending = 1
+              AND existing.id IS NULL
+              AND (posted.provider_transaction_id IN ({placeholders}) OR posted.pending_transaction_id IN ({placeholders}))
+            """,
+            (*ids, *ids),
+        ).fetchall()
+        if not rows:
+            return 0
+        conn.executemany(
+            """
+            UPDATE bank_reconciliation_items
+            SET bank_transaction_id = ?,
+                last_seen_at = ?,
+                scored_at = CASE
+                    WHEN status IN ('needs_review', 'pending_user', 'conflict') THEN NULL
+                    ELSE scored_at
+                END,
+                notes = CASE
+                    WHEN notes IS NULL OR notes = '' THEN 'carried over from pending transaction'
+                    ELSE notes || '; carried over from pending transaction'
+                END
+            WHERE id = ?
+            """,
+            [(int(row["posted_id"]), now, int(row["reconciliation_id"])) for row in rows],
+        )
+        return len(rows)
+
     def mark_transactions_removed(self, removed: list[dict[str, Any] | str]) -> int:
         now = utc_now_iso()
         ids = [
@@ -622,6 +951,7 @@ class BankStore:
                 """,
                 (item_id, webhook_type, webhook_code, json.dumps(payload, sort_keys=True), now),
             )
+            self._notify_plaid_webhook(conn, item_id)
             if item_id:
                 conn.execute(
                     """
@@ -649,6 +979,9 @@ class BankStore:
             raise RuntimeError("Failed to load stored Plaid webhook event")
         return _plaid_webhook_event_from_row(row)
 
+    def _notify_plaid_webhook(self, conn: BankStoreConnection, item_id: str | None) -> None:
+        """Hook for stores that can wake webhook workers in other processes."""
+
     def pending_plaid_webhook_events(self, limit: int = 25) -> list[tuple[PlaidWebhookEvent, dict[str, Any]]]:
         safe_limit = max(1, min(int(limit), 100))
         self.initialize()
@@ -671,66 +1004,84 @@ class BankStore:
         return events
 
     def mark_plaid_webhook_processing(self, event_id: int) -> None:
+        self.mark_plaid_webhooks_processing([event_id])
+
+    def mark_plaid_webhooks_processing(self, event_ids: list[int]) -> None:
+        ids = [int(event_id) for event_id in event_ids]
+        if not ids:
+            return
+        placeholders = ",".join("?" for _ in ids)
         self.initialize()
         with self.connect() as conn:
             conn.execute(
-                """
+                f"""
                 UPDATE bank_webhook_events
                 SET status = 'processing',
                     error = NULL
-                WHERE id = ?
+                WHERE id IN ({placeholders})
                 """,
-                (int(event_id),),
+                tuple(ids),
             )
 
     def mark_plaid_webhook_processed(self, event_id: int, item_id: str | None = None) -> None:
+        self.mark_plaid_webhooks_processed([event_id], item_id)
+
+    def mark_plaid_webhooks_processed(self, event_ids: list[int], item_id: str | None = None) -> None:
+        """Mark a group of webhook events processed and clear the Item's pending flag when none remain."""
+        ids = [int(event_id) for event_id in event_ids]
+        if not ids:
+            return
         now = utc_now_iso()
+        placeholders = ",".join("?" for _ in ids)
         self.initialize()
         with self.connect() as conn:
             conn.execute(
-                """
+                f"""
                 UPDATE bank_webhook_events
                 SET status = 'processed',
                     processed_at = ?,
                     error = NULL
-                WHERE id = ?
+                WHERE id IN ({placeholders})
                 """,
-                (now, int(event_id)),
+                (now, *ids),
             )
             if item_id:
-                remaining = conn.execute(
+                conn.execute(
                     """
-                    SELECT COUNT(*) AS count
-                    FROM bank_webhook_events
-                    WHERE provider = 'plaid'
-                      AND item_id = ?
-                      AND status IN ('pending', 'failed', 'processing')
-                    """,
-                    (item_id,),
-                ).fetchone()
-                if remaining is not None and int(remaining["count"]) == 0:
-                    conn.execute(
-                        """
-                        UPDATE bank_sync_state
-                        SET webhook_pending = 0
-                        WHERE item_id IN (
-                            SELECT id FROM bank_items WHERE item_id = ?
-                        )
-                        """,
-                        (item_id,),
+                    UPDATE bank_sync_state
+                    SET webhook_pending = 0
+                    WHERE item_id IN (
+                        SELECT id FROM bank_items WHERE item_id = ?
+                    )
+                      AND NOT EXISTS (
+                        SELECT 1
+                        FROM bank_webhook_events
+                        WHERE provider = 'plaid'
+                          AND item_id = ?
+                          AND status IN ('pending', 'failed', 'processing')
                     )
+                    """,
+                    (item_id, item_id),
+                )
 
     def mark_plaid_webhook_failed(self, event_id: int, error: str) -> None:
+        self.mark_plaid_webhooks_failed([event_id], error)
+
+    def mark_plaid_webhooks_failed(self, event_ids: list[int], error: str) -> None:
+        ids = [int(event_id) for event_id in event_ids]
+        if not ids:
+            return
+        placeholders = ",".join("?" for _ in ids)
         self.initialize()
         with self.connect() as conn:
             conn.execute(
-                """
+                f"""
                 UPDATE bank_webhook_events
                 SET status = 'failed',
                     error = ?
-                WHERE id = ?
+                WHERE id IN ({placeholders})
                 """,
-                (error[:1000], int(event_id)),
+                (error[:1000], *ids),
             )
 
     def recent_transactions(
@@ -744,7 +1095,7 @@ class BankStore:
         date_filter = ""
         params: tuple[Any, ...]
         if start_date:
-            date_filter = " AND COALESCE(t.date, t.authorized_date, '') >= ?"
+            date_filter = " AND t.effective_date >= ?"
             params = (owner_key, start_date, safe_limit)
         else:
             params = (owner_key, safe_limit)
@@ -775,7 +1126,7 @@ class BankStore:
                   AND t.removed_at IS NULL
                   {date_filter}
                   AND (t.account_id IS NULL OR COALESCE(a.watched, 1) = 1)
-                ORDER BY COALESCE(t.date, t.authorized_date, '') DESC, t.updated_at DESC, t.id DESC
+                ORDER BY t.effective_date DESC, t.updated_at DESC, t.id DESC
                 LIMIT ?
                 """,
                 params,
@@ -812,7 +1163,7 @@ class BankStore:
         date_filter = ""
         params: tuple[Any, ...]
         if start_date:
-            date_filter = " AND COALESCE(t.date, t.authorized_date, '') >= ?"
+            date_filter = " AND t.effective_date >= ?"
             params = (owner_key, start_date)
         else:
             params = (owner_key,)
@@ -871,7 +1222,7 @@ class BankStore:
         date_filter = ""
         params: tuple[Any, ...]
         if start_date:
-            date_filter = " AND COALESCE(t.date, t.authorized_date, '') >= ?"
+            date_filter = " AND t.effective_date >= ?"
             params = (owner_key, start_date, safe_limit)
         else:
             params = (owner_key, safe_limit)
@@ -908,13 +1259,128 @@ class BankStore:
                     r.id IS NULL
                     OR r.status IN ('needs_review', 'pending_user', 'conflict')
                   )
-                ORDER BY COALESCE(t.date, t.authorized_date, '') DESC, t.updated_at DESC, t.id DESC
+                ORDER BY t.effective_date DESC, t.updated_at DESC, t.id DESC
                 LIMIT ?
                 """,
                 params,
             ).fetchall()
         return [_bank_transaction_from_row(row) for row in rows]
 
+    def reconciliation_items_for_transactions(
+        self,
+        owner_key: str,
+        transaction_ids: list[int],
+    ) -> dict[int, ReconciliationItem]:
+        ids = sorted({int(transaction_id) for transaction_id in transaction_ids})
+        if not ids:
+            return {}
+        self.initialize()
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT
+                    r.*,
+                    t.provider_transaction_id,
+                    t.date,
+                    t.authorized_date,
+                    t.name,
+                    t.merchant_name,
+                    t.amount,
+                    t.pending,
+                    t.payment_channel,
+                    t.pending_transaction_id,
+                    t.updated_at,
+                    a.name AS account_name,
+                    a.mask AS account_mask,
+                    a.type AS account_type,
+                    a.subtype AS account_subtype
+                FROM bank_reconciliation_items r
+                JOIN bank_transactions t ON t.id = r.bank_transaction_id
+                LEFT JOIN bank_accounts a ON a.id = t.account_id
+                WHERE r.owner_key = ?
+                  AND r.bank_transaction_id IN ({','.join('?' for _ in ids)})
+                """,
+                (owner_key, *ids),
+            ).fetchall()
+        items = [_reconciliation_item_from_row(row) for row in rows]
+        return {item.bank_transaction_id: item for item in items}
+
+    def reconciliation_watermark(self, owner_key: str, actor_key: str | None) -> dict[str, Any] | None:
+        self.initialize()
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT state_json FROM bank_reconciliation_watermarks WHERE owner_key = ? AND actor_key = ?",
+                (owner_key, actor_key or ""),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            state = json.loads(row["state_json"])
+        except json.JSONDecodeError:
+            return None
+        return state if isinstance(state, dict) else None
+
+    def save_reconciliation_watermark(self, owner_key: str, actor_key: str | None, state: dict[str, Any]) -> None:
+        now = utc_now_iso()
+        with self.connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO bank_reconciliation_watermarks (owner_key, actor_key, state_json, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(owner_key, actor_key) DO UPDATE SET
+                    state_json = excluded.state_json,
+                    updated_at = excluded.updated_at
+                """,
+                (owner_key, actor_key or "", json.dumps(state, separators=(",", ":"), sort_keys=True), now),
+            )
+
+    def reconciliation_candidates(self, reconciliation_id: int, variant: str, fingerprint: str) -> dict[str, Any] | None:
+        """Stored detail-view candidates for an item, or None when missing or built from other inputs."""
+        self.initialize()
+        with self.connect() as conn:
+            row = conn.execute(
+                """
+                SELECT fingerprint, payload_json
+                FROM bank_reconciliation_candidates
+                WHERE reconciliation_id = ? AND variant = ?
+                """,
+                (int(reconciliation_id), variant),
+            ).fetchone()
+        if row is None or row["fingerprint"] != fingerprint:
+            return None
+        try:
+            payload = json.loads(row["payload_json"])
+        except json.JSONDecodeError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def save_reconciliation_candidates(
+        self,
+        reconciliation_id: int,
+        variant: str,
+        fingerprint: str,
+        payload: dict[str, Any],
+    ) -> None:
+        now = utc_now_iso()
+        with self.connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO bank_reconciliation_candidates (reconciliation_id, variant, fingerprint, payload_json, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(reconciliation_id, variant) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    payload_json = excluded.payload_json,
+                    updated_at = excluded.updated_at
+                """,
+                (int(reconciliation_id), variant, fingerprint, json.dumps(payload, separators=(",", ":")), now),
+            )
+
+    def _clear_reconciliation_candidates(self, conn: BankStoreConnection, reconciliation_id: int) -> None:
+        conn.execute(
+            "DELETE FROM bank_reconciliation_candidates WHERE reconciliation_id = ?",
+            (int(reconciliation_id),),
+        )
+
     def upsert_reconciliation_item(
         self,
         *,
@@ -934,9 +1400,9 @@ class BankStore:
                 INSERT INTO bank_reconciliation_items (
                     owner_key, bank_transaction_id, classification, status,
                     matched_action_log_id, matched_sheet_ref, confidence,
-                    first_seen_at, last_seen_at, notes
+                    first_seen_at, last_seen_at, notes, scored_at
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(bank_transaction_id) DO UPDATE SET
                     classification = excluded.classification,
                     status = CASE
@@ -948,7 +1414,8 @@ class BankStore:
                     matched_sheet_ref = excluded.matched_sheet_ref,
                     confidence = excluded.confidence,
                     last_seen_at = excluded.last_seen_at,
-                    notes = excluded.notes
+                    notes = excluded.notes,
+                    scored_at = excluded.scored_at
                 """,
                 (
                     owner_key,
@@ -961,8 +1428,15 @@ class BankStore:
                     now,
                     now,
                     notes,
+                    now,
                 ),
             )
+            stored = conn.execute(
+                "SELECT id FROM bank_reconciliation_items WHERE bank_transaction_id = ?",
+                (transaction.id,),
+            ).fetchone()
+            if stored is not None:
+                self._replace_reconciliation_matches(conn, int(stored["id"]))
             row = conn.execute(
                 """
                 SELECT
@@ -1009,7 +1483,7 @@ class BankStore:
         date_filter = ""
         params: tuple[Any, ...]
         if cutoff_date:
-            date_filter = " AND COALESCE(t.date, t.authorized_date, '') >= ?"
+            date_filter = " AND t.effective_date >= ?"
             params = (owner_key, cutoff_date, safe_limit)
         else:
             params = (owner_key, safe_limit)
@@ -1042,7 +1516,7 @@ class BankStore:
                   AND (t.account_id IS NULL OR COALESCE(a.watched, 1) = 1)
                   AND r.status IN ('needs_review', 'pending_user', 'conflict')
                   {date_filter}
-                ORDER BY COALESCE(t.date, t.authorized_date, '') DESC, r.id DESC
+                ORDER BY t.effective_date DESC, r.id DESC
                 LIMIT ?
                 """,
                 params,
@@ -1066,7 +1540,7 @@ class BankStore:
         date_filter = ""
         params: tuple[Any, ...]
         if cutoff_date:
-            date_filter = " AND COALESCE(t.date, t.authorized_date, '') >= ?"
+            date_filter = " AND t.effective_date >= ?"
             params = (owner_key, cutoff_date, safe_limit)
         else:
             params = (owner_key, safe_limit)
@@ -1099,7 +1573,7 @@ class BankStore:
                   AND (t.account_id IS NULL OR COALESCE(a.watched, 1) = 1)
                   AND r.status = 'matched'
                   {date_filter}
-                ORDER BY COALESCE(t.date, t.authorized_date, '') DESC, r.last_seen_at DESC, r.id DESC
+                ORDER BY t.effective_date DESC, r.last_seen_at DESC, r.id DESC
                 LIMIT ?
                 """,
                 params,
@@ -1189,6 +1663,7 @@ class BankStore:
                 """,
                 (now, now, int(reconciliation_id), owner_key),
             )
+            self._clear_reconciliation_candidates(conn, int(reconciliation_id))
             updated = conn.execute(
                 """
                 SELECT
@@ -1248,45 +1723,37 @@ class BankStore:
             ).fetchone()
         return _reconciliation_item_from_row(row) if row else None
 
-    def matched_action_log_ids(self, owner_key: str) -> set[str]:
+    def matched_action_log_ids(self, owner_key: str, action_ids: set[str] | None = None) -> set[str]:
+        """Action-log ids already claimed by a match; pass action_ids to check membership only."""
+        return self._matched_reconciliation_values(owner_key, "action_log_id", action_ids)
+
+    def matched_sheet_refs(self, owner_key: str, sheet_refs: set[str] | None = None) -> set[str]:
+        return self._matched_reconciliation_values(owner_key, "sheet_ref", sheet_refs)
+
+    def _matched_reconciliation_values(self, owner_key: str, column: str, values: set[str] | None) -> set[str]:
+        value_filter = ""
+        params: tuple[Any, ...] = (owner_key,)
+        if values is not None:
+            cleaned = sorted({str(value).strip() for value in values if str(value).strip()})
+            if not cleaned:
+                return set()
+            value_filter = f" AND m.{column} IN ({','.join('?' for _ in cleaned)})"
+            params = (owner_key, *cleaned)
         self.initialize()
         with self.connect() as conn:
             rows = conn.execute(
-                """
-                SELECT matched_action_log_id
-                FROM bank_reconciliation_items
-                WHERE owner_key = ?
-                  AND matched_action_log_id IS NOT NULL
-                  AND matched_action_log_id != ''
-                  AND status IN ('matched', 'confirmed', 'import_requested')
+                f"""
+                SELECT DISTINCT m.{column} AS value
+                FROM bank_reconciliation_matches m
+                JOIN bank_reconciliation_items r ON r.id = m.reconciliation_id
+                WHERE r.owner_key = ?
+                  AND r.status IN {MATCHED_RECONCILIATION_STATUSES}
+                  AND m.{column} IS NOT NULL
+                  {value_filter}
                 """,
-                (owner_key,),
+                params,
             ).fetchall()
-        matched_ids: set[str] = set()
-        for row in rows:
-            raw_id = str(row["matched_action_log_id"])
-            matched_ids.update(part.strip() for part in raw_id.split("+") if part.strip())
-        return matched_ids
-
-    def matched_sheet_refs(self, owner_key: str) -> set[str]:
-        self.initialize()
-        with self.connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT matched_sheet_ref
-                FROM bank_reconciliation_items
-                WHERE owner_key = ?
-                  AND matched_sheet_ref IS NOT NULL
-                  AND matched_sheet_ref != ''
-                  AND status IN ('matched', 'confirmed', 'import_requested')
-                """,
-                (owner_key,),
-            ).fetchall()
-        matched_refs: set[str] = set()
-        for row in rows:
-            raw_ref = str(row["matched_sheet_ref"])
-            matched_refs.update(part.strip() for part in raw_ref.split(" + ") if part.strip())
-        return matched_refs
+        return {str(row["value"]) for row in rows}
 
     def confirm_reconciliation_item(
         self,
@@ -1317,6 +1784,8 @@ class BankStore:
                 """,
                 (now, now, matched_action_log_id, matched_sheet_ref, notes, notes, int(reconciliation_id), owner_key),
             )
+            self._replace_reconciliation_matches(conn, int(reconciliation_id))
+            self._clear_reconciliation_candidates(conn, int(reconciliation_id))
         return self.get_reconciliation_item(owner_key, reconciliation_id)
 
     def reopen_reconciliation_item(
@@ -1351,6 +1820,7 @@ class BankStore:
                     resolved_at = NULL,
                     ignored_at = NULL,
                     last_seen_at = ?,
+                    scored_at = NULL,
                     notes = CASE
                         WHEN notes IS NULL OR notes = '' THEN ?
                         ELSE notes || '; ' || ?
@@ -1360,6 +1830,11 @@ class BankStore:
                 """,
                 (now, notes, notes, int(reconciliation_id), owner_key),
             )
+            conn.execute(
+                "DELETE FROM bank_reconciliation_matches WHERE reconciliation_id = ?",
+                (int(reconciliation_id),),
+            )
+            self._clear_reconciliation_candidates(conn, int(reconciliation_id))
         return self.get_reconciliation_item(owner_key, reconciliation_id)
 
     def reopen_reconciliation_items_for_action_ids(
@@ -1372,33 +1847,30 @@ class BankStore:
         ids = {str(action_id).strip() for action_id in action_ids if str(action_id).strip()}
         if not ids:
             return []
+        ordered_ids = sorted(ids)
+        placeholders = ",".join("?" for _ in ordered_ids)
         self.initialize()
         with self.connect() as conn:
             rows = conn.execute(
-                """
-                SELECT r.id, r.matched_action_log_id
-                FROM bank_reconciliation_items r
+                f"""
+                SELECT DISTINCT r.id
+                FROM bank_reconciliation_matches m
+                JOIN bank_reconciliation_items r ON r.id = m.reconciliation_id
                 JOIN bank_transactions t ON t.id = r.bank_transaction_id
-                WHERE r.owner_key = ?
+                WHERE m.action_log_id IN ({placeholders})
+                  AND r.owner_key = ?
                   AND t.removed_at IS NULL
-                  AND r.matched_action_log_id IS NOT NULL
-                  AND r.matched_action_log_id != ''
-                  AND r.status IN ('matched', 'confirmed', 'import_requested')
+                  AND r.status IN {MATCHED_RECONCILIATION_STATUSES}
+                ORDER BY r.id
                 """,
-                (owner_key,),
+                (*ordered_ids, owner_key),
             ).fetchall()
 
         reopened: list[ReconciliationItem] = []
         for row in rows:
-            matched_ids = {
-                part.strip()
-                for part in str(row["matched_action_log_id"]).split("+")
-                if part.strip()
-            }
-            if matched_ids & ids:
-                item = self.reopen_reconciliation_item(owner_key, int(row["id"]), notes=notes)
-                if item is not None:
-                    reopened.append(item)
+            item = self.reopen_reconciliation_item(owner_key, int(row["id"]), notes=notes)
+            if item is not None:
+                reopened.append(item)
         return reopened
 
     def status(self, configured: bool, plaid_env: str) -> BankStatus:
@@ -1433,6 +1905,22 @@ class BankStore:
         )
 
 
+def reconciliation_match_pairs(
+    matched_action_log_id: str | None,
+    matched_sheet_ref: str | None,
+) -> list[tuple[str | None, str | None]]:
+    """Split joined group match columns into (action_log_id, sheet_ref) rows."""
+    action_ids = [part.strip() for part in (matched_action_log_id or "").split("+") if part.strip()]
+    sheet_refs = [part.strip() for part in (matched_sheet_ref or "").split(" + ") if part.strip()]
+    return [
+        (
+            action_ids[index] if index < len(action_ids) else None,
+            sheet_refs[index] if index < len(sheet_refs) else None,
+        )
+        for index in range(max(len(action_ids), len(sheet_refs)))
+    ]
+
+
 def _linked_item_from_row(row: sqlite3.Row) -> LinkedBankItem:
     return LinkedBankItem(
         id=int(row["id"]),
@@ -1517,6 +2005,7 @@ def _reconciliation_item_from_row(row: sqlite3.Row) -> ReconciliationItem:
         ignored_at=row["ignored_at"],
         notes=row["notes"],
         transaction=transaction,
+        scored_at=row["scored_at"],
     )
 
 
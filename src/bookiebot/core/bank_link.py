@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -18,6 +19,21 @@ class BankLinkTokenError(ValueError):
     pass
 
 
+_PLAID_WEBHOOK_SIGNALS: asyncio.Queue[str | None] | None = None
+
+
+def plaid_webhook_signals() -> asyncio.Queue[str | None]:
+    """In-process queue of Plaid item ids whose webhooks are waiting in the inbox."""
+    global _PLAID_WEBHOOK_SIGNALS
+    if _PLAID_WEBHOOK_SIGNALS is None:
+        _PLAID_WEBHOOK_SIGNALS = asyncio.Queue()
+    return _PLAID_WEBHOOK_SIGNALS
+
+
+def signal_plaid_webhook(item_id: str | None) -> None:
+    plaid_webhook_signals().put_nowait(item_id)
+
+
 def _signing_secret() -> str:
     return os.getenv("BANK_LINK_SIGNING_SECRET", "").strip() or os.getenv("BANK_TOKEN_ENCRYPTION_KEY", "").strip()
 
@@ -162,6 +178,7 @@ async def _bank_plaid_webhook(request: web.Request) -> web.Response:
         body = await _request_json(request)
         service = build_banking_service()
         event = service.receive_plaid_webhook(body)
+        signal_plaid_webhook(event.item_id)
         return web.json_response({"ok": True, "event_id": event.id})
     except Exception as exc:
         return _json_error(f"{type(exc).__name__}: {exc}", status=500)
@@ -15,6 +15,7 @@ from bookiebot.banking.formatting import format_reconciliation_match_report_chun
 from bookiebot.banking.models import ReconciliationPreview, ReconciliationReportMatch
 from bookiebot.banking.service import build_banking_service
 from bookiebot.core.bank_reconciliation_flow import send_next_bank_reconciliation_item
+from bookiebot.core.digest_fanout import prepare_digests
 from bookiebot.sheets.routing import (
     APPLE_SHORTCUT_RELAY_USER_ID,
     get_discord_user_config,
@@ -218,14 +219,17 @@ async def send_due_bank_reconciliation_digest(client: Any, today: date | None =
 
     current = today or current_time.date()
     sent = 0
-    for actor_key, mention in _notification_users():
-        digest = await asyncio.to_thread(
-            prepare_bank_reconciliation_digest_messages,
+    async for prepared in prepare_digests(
+        "bank_reconciliation_digest",
+        _notification_users(),
+        lambda actor_key, mention: prepare_bank_reconciliation_digest_messages(
             actor_key,
             mention,
             current,
             mark_sent=False,
-        )
+        ),
+    ):
+        actor_key, mention, digest = prepared.actor_key, prepared.mention, prepared.result
         if not digest:
             continue
         delivered = await _send_user_dm(
@@ -562,7 +562,10 @@ def register_commands(tree: app_commands.CommandTree):
         try:
             owner = get_user_config(interaction.user.id)
             service = build_banking_service()
-            results = await asyncio.wait_for(service.sync_owner(owner.budget_owner_key), timeout=45)
+            results = await asyncio.wait_for(
+                service.sync_owner(owner.budget_owner_key, refresh_accounts=True),
+                timeout=45,
+            )
         except asyncio.TimeoutError:
             await _send_bank_command_error(
                 interaction,
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_PREPARE_SLOTS: threading.BoundedSemaphore | None = None
+_PREPARE_SLOTS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PreparedDigest(Generic[T]):
+    actor_key: str
+    mention: str
+    result: T | None
+    wait_seconds: float
+    prepare_seconds: float
+    failed: bool = False
+
+
+def _prepare_concurrency() -> int:
+    raw = os.getenv("BOOKIEBOT_DIGEST_PREPARE_CONCURRENCY", "3").strip()
+    try:
+        return min(max(int(raw), 1), 16)
+    except ValueError:
+        return 3
+
+
+def _prepare_slots() -> threading.BoundedSemaphore:
+    """Process-wide cap on digest prepares hitting Sheets and the bank store at once."""
+    global _PREPARE_SLOTS
+    with _PREPARE_SLOTS_LOCK:
+        if _PREPARE_SLOTS is None:
+            _PREPARE_SLOTS = threading.BoundedSemaphore(_prepare_concurrency())
+        return _PREPARE_SLOTS
+
+
+def _timed_prepare(
+    job: str,
+    actor_key: str,
+    mention: str,
+    prepare: Callable[[str, str], T],
+) -> PreparedDigest[T]:
+    queued_at = time.perf_counter()
+    with _prepare_slots():
+        started_at = time.perf_counter()
+        try:
+            result: T | None = prepare(actor_key, mention)
+            failed = False
+        except Exception:
+            logger.exception("Failed to prepare digest", extra={"job": job, "actor_key": actor_key})
+            result = None
+            failed = True
+        finished_at = time.perf_counter()
+    prepared = PreparedDigest(
+        actor_key=actor_key,
+        mention=mention,
+        result=result,
+        wait_seconds=started_at - queued_at,
+        prepare_seconds=finished_at - started_at,
+        failed=failed,
+    )
+    logger.info(
+        "Prepared digest",
+        extra={
+            "job": job,
+            "actor_key": actor_key,
+            "wait_ms": round(prepared.wait_seconds * 1000, 1),
+            "prepare_ms": round(prepared.prepare_seconds * 1000, 1),
+            "failed": failed,
+        },
+    )
+    return prepared
+
+
+async def prepare_digests(
+    job: str,
+    users: list[tuple[str, str]],
+    prepare: Callable[[str, str], T],
+) -> AsyncIterator[PreparedDigest[T]]:
+    """Prepare every user's digest concurrently and yield each one as soon as it is ready.
+
+    A slow or failing user only delays their own delivery; failures are logged and yielded
+    with ``failed=True`` so the caller can skip them.
+    """
+    tasks = [
+        asyncio.ensure_future(asyncio.to_thread(_timed_prepare, job, actor_key, mention, prepare))
+        for actor_key, mention in users
+    ]
+    try:
+        for next_prepared in asyncio.as_completed(tasks):
+            yield await next_prepared
+    finally:
+        for task in tasks:
+            task.cancel()
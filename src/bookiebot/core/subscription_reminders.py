@@ -9,6 +9,7 @@ import os
 from collections.abc import Awaitable, Callable
 from typing import Any, cast
 
+from bookiebot.core.digest_fanout import prepare_digests
 from bookiebot.sheets.routing import (
     APPLE_SHORTCUT_RELAY_USER_ID,
     get_discord_user_config,
@@ -400,12 +401,23 @@ async def send_due_subscription_reminders(client: Any, today: date | None = None
 
     sent = 0
     current = today or current_time.date()
-    for actor_key, mention in _notification_users():
-        if today is None and not _reminder_is_eligible(current_time, actor_key):
-            continue
-        if today is None and _LAST_REMINDER_EVALUATION_DATE.get(actor_key) == current:
+    due_users = [
+        (actor_key, mention)
+        for actor_key, mention in _notification_users()
+        if today is not None
+        or (
+            _reminder_is_eligible(current_time, actor_key)
+            and _LAST_REMINDER_EVALUATION_DATE.get(actor_key) != current
+        )
+    ]
+    async for ready in prepare_digests(
+        "subscription_reminders",
+        due_users,
+        lambda actor_key, mention: _prepare_due_reminder_messages(actor_key, mention, current),
+    ):
+        actor_key, mention, prepared = ready.actor_key, ready.mention, ready.result
+        if prepared is None:
             continue
-        prepared = await asyncio.to_thread(_prepare_due_reminder_messages, actor_key, mention, current)
         delivered = True
         for message in prepared.messages:
             if not await _send_user_dm(client, actor_key, message):
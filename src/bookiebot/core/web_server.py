@@ -7,41 +7,141 @@ from typing import Any
 
 from aiohttp import web
 
-from bookiebot.core.bank_link import create_bank_link_app
+from bookiebot.banking.config import load_banking_config
+from bookiebot.core.bank_link import create_bank_link_app, plaid_webhook_signals, signal_plaid_webhook
 from bookiebot.banking.service import build_banking_service
-from bookiebot.reports.web import register_report_routes
+from bookiebot.reports.snapshot_index import prune_report_snapshots
+from bookiebot.reports.web import compression_middleware, register_report_routes, reports_dir
 
 logger = logging.getLogger(__name__)
 
 _WEB_SERVER_TASK: asyncio.Task | None = None
 _PLAID_WEBHOOK_WORKER_TASK: asyncio.Task | None = None
+_PLAID_WEBHOOK_LISTENER_TASK: asyncio.Task | None = None
+_REPORT_PRUNER_TASK: asyncio.Task | None = None
+_WEBHOOK_DRAIN_LIMIT = 25
 
 
 def _webhook_poll_interval_seconds() -> int:
-    raw = os.getenv("BOOKIEBOT_PLAID_WEBHOOK_POLL_SECONDS", "30").strip()
+    raw = os.getenv("BOOKIEBOT_PLAID_WEBHOOK_POLL_SECONDS", "300").strip()
     try:
         return max(5, int(raw))
     except ValueError:
-        return 30
+        return 300
+
+
+def _webhook_debounce_seconds() -> float:
+    raw = os.getenv("BOOKIEBOT_PLAID_WEBHOOK_DEBOUNCE_SECONDS", "2").strip()
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return 2.0
+
+
+async def _wait_for_plaid_webhook_signals(signals: asyncio.Queue[str | None]) -> set[str]:
+    """Block until a webhook arrives (or the fallback poll is due), then debounce the burst."""
+    item_ids: set[str] = set()
+    try:
+        item_id = await asyncio.wait_for(signals.get(), timeout=_webhook_poll_interval_seconds())
+    except asyncio.TimeoutError:
+        return item_ids
+    if item_id:
+        item_ids.add(item_id)
+    debounce = _webhook_debounce_seconds()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + debounce
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            item_id = await asyncio.wait_for(signals.get(), timeout=remaining)
+        except asyncio.TimeoutError:
+            break
+        if item_id:
+            item_ids.add(item_id)
+    while not signals.empty():
+        item_id = signals.get_nowait()
+        if item_id:
+            item_ids.add(item_id)
+    return item_ids
 
 
 async def run_plaid_webhook_worker() -> None:
+    signals = plaid_webhook_signals()
+    service = None
     while True:
+        backlog = False
         try:
-            service = build_banking_service()
-            result = await service.process_plaid_webhook_inbox(limit=25)
+            if service is None:
+                service = build_banking_service()
+            result = await service.process_plaid_webhook_inbox(limit=_WEBHOOK_DRAIN_LIMIT)
             if result["processed"] or result["failed"] or result["skipped"]:
                 logger.info("Processed Plaid webhook inbox", extra=result)
+            backlog = _webhook_backlog_remaining(result)
         except asyncio.CancelledError:
             raise
         except Exception:
+            service = None
             logger.exception("Plaid webhook inbox worker failed")
-        await asyncio.sleep(_webhook_poll_interval_seconds())
+        if backlog:
+            await asyncio.sleep(0)
+            continue
+        item_ids = await _wait_for_plaid_webhook_signals(signals)
+        if item_ids:
+            logger.debug("Plaid webhook signal received", extra={"item_ids": sorted(item_ids)})
+
+
+def _webhook_backlog_remaining(result: dict[str, int]) -> bool:
+    """A full batch that made progress may have left events behind; drain again instead of waiting.
+
+    Failed events are retried by every drain, so a batch of nothing but failures waits for the next wake.
+    """
+    handled = result["processed"] + result["skipped"]
+    return handled > 0 and handled + result["failed"] >= _WEBHOOK_DRAIN_LIMIT
+
+
+def _report_prune_interval_seconds() -> float:
+    raw = os.getenv("BOOKIEBOT_REPORT_PRUNE_INTERVAL_SECONDS", "3600").strip()
+    try:
+        return max(60.0, float(raw))
+    except ValueError:
+        return 3600.0
+
+
+async def run_report_snapshot_pruner() -> None:
+    """Apply the report snapshot retention policy off the request path, once at startup and then periodically."""
+    while True:
+        try:
+            pruned = await asyncio.to_thread(prune_report_snapshots, reports_dir())
+            if pruned:
+                logger.info("Pruned expense report snapshots", extra={"count": len(pruned)})
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Expense report snapshot pruning failed")
+        await asyncio.sleep(_report_prune_interval_seconds())
+
+
+async def run_plaid_webhook_listener(database_url: str) -> None:
+    """Forward Postgres webhook notifications from other processes into the local worker queue."""
+    from bookiebot.banking.postgres_store import listen_for_plaid_webhooks
+
+    while True:
+        try:
+            async for item_id in listen_for_plaid_webhooks(database_url):
+                signal_plaid_webhook(item_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Plaid webhook listener failed; reconnecting")
+        await asyncio.sleep(_webhook_poll_interval_seconds() / 10)
 
 
 async def run_web_server() -> None:
-    global _PLAID_WEBHOOK_WORKER_TASK
+    global _PLAID_WEBHOOK_WORKER_TASK, _PLAID_WEBHOOK_LISTENER_TASK, _REPORT_PRUNER_TASK
     app = create_bank_link_app()
+    app.middlewares.append(compression_middleware)
     register_report_routes(app)
     runner = web.AppRunner(app)
     await runner.setup()
@@ -50,12 +150,21 @@ async def run_web_server() -> None:
     await site.start()
     if _PLAID_WEBHOOK_WORKER_TASK is None or _PLAID_WEBHOOK_WORKER_TASK.done():
         _PLAID_WEBHOOK_WORKER_TASK = asyncio.create_task(run_plaid_webhook_worker())
+    database_url = load_banking_config().database_url
+    if database_url and (_PLAID_WEBHOOK_LISTENER_TASK is None or _PLAID_WEBHOOK_LISTENER_TASK.done()):
+        _PLAID_WEBHOOK_LISTENER_TASK = asyncio.create_task(run_plaid_webhook_listener(database_url))
+    if _REPORT_PRUNER_TASK is None or _REPORT_PRUNER_TASK.done():
+        _REPORT_PRUNER_TASK = asyncio.create_task(run_report_snapshot_pruner())
     logger.info("BookieBot web server started", extra={"port": port})
     try:
         await asyncio.Event().wait()
     finally:
         if _PLAID_WEBHOOK_WORKER_TASK is not None:
             _PLAID_WEBHOOK_WORKER_TASK.cancel()
+        if _PLAID_WEBHOOK_LISTENER_TASK is not None:
+            _PLAID_WEBHOOK_LISTENER_TASK.cancel()
+        if _REPORT_PRUNER_TASK is not None:
+            _REPORT_PRUNER_TASK.cancel()
         await runner.cleanup()
 
 
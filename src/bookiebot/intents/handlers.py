@@ -20,10 +20,10 @@ from bookiebot.charts import (
     figure_to_discord_file,
 )
 from bookiebot.reports.expense_breakdown import (
-    build_expense_breakdown_report,
     month_from_entities_or_message,
     write_expense_breakdown_report,
 )
+from bookiebot.reports.report_cache import cached_expense_report
 from datetime import datetime
 from collections.abc import Awaitable, Callable
 from typing import Any, AsyncContextManager, cast
@@ -1360,12 +1360,13 @@ async def query_expense_breakdown_handler(entities, message):
 
     actor_key = _message_actor_key(message)
     try:
-        report = build_expense_breakdown_report(
+        cached_report = cached_expense_report(
             actor_key=actor_key or "",
             owner_name=owner_name,
             persons=persons,
             month=report_month,
         )
+        report = cached_report.report
         report_page = write_expense_breakdown_report(report)
     except SheetRoutingError as exc:
         await message.channel.send(f"❌ Could not calculate expense breakdown.\n\n{exc}")
@@ -63,4 +63,4 @@ In order to be iterable, non-array objects must have a [Symbol.iterator]() metho
 `)}}):null}function CH({active:e,payload:t}){const r=(t??[]).reduce((n,i)=>(i.value===null||i.value===void 0||n.some(s=>s.name===i.name&&s.value===i.value&&s.color===i.color)||n.push(i),n),[]);return!e||!r.length?null:A.jsx("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:r.map((n,i)=>A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:n.color}}),A.jsx("span",{children:n.name}),A.jsx("strong",{children:jH(Number(n.value||0))})]},`${n.name}-${n.value}-${i}`))})}function jH(e){return new Intl.NumberFormat("en-US",{style:"currency",currency:"USD"}).format(e)}function IH({content:e,dismissDelay:t,animatePosition:r,active:n,payload:i,label:o,...s}){const u=g.useContext(QE),f=g.useContext(Iv),[d,h]=g.useState("visible"),v=g.useMemo(()=>_H(o,i),[o,i]),m=g.useRef(null),b=g.useRef(null),S=g.useRef(null),w=g.useRef(null),P=g.useRef(null),E=g.useRef(null),j=g.useRef(f),O=g.useRef(null),C=O.current===null||u>O.current,T=!!(n&&Array.isArray(i)&&i.length&&C);T&&(O.current=null,S.current={...s,active:!0,payload:i,label:o});const I=S.current;return g.useLayoutEffect(()=>{T&&(w.current!==null&&window.clearTimeout(w.current),P.current!==null&&window.clearTimeout(P.current),h("visible"),w.current=window.setTimeout(()=>{h("dismissing")},t),P.current=window.setTimeout(()=>{h("hidden")},t+ek))},[t,T,u,v]),g.useLayoutEffect(()=>{if(j.current!==f){if(j.current=f,O.current=u,w.current!==null&&(window.clearTimeout(w.current),w.current=null),P.current!==null&&(window.clearTimeout(P.current),P.current=null),!S.current){h("hidden");return}h("dismissing"),P.current=window.setTimeout(()=>{h("hidden"),P.current=null},ek)}},[f,u]),g.useLayoutEffect(()=>{const R=m.current?.parentElement,N=R instanceof HTMLDivElement?R:b.current;if(!N)return;b.current!==N&&(E.current!==null&&(window.cancelAnimationFrame(E.current),E.current=null),b.current=N);const K=N.style.transform.trim();if(!!(K&&K!=="none"))N.setAttribute(JE,K),r&&!N.hasAttribute(_v)&&E.current===null&&(E.current=window.requestAnimationFrame(()=>{E.current=null,b.current===N&&N.setAttribute(_v,"true")}));else{const Y=N.getAttribute(JE);Y&&(N.style.transform=Y)}r||N.removeAttribute(_v),N.style.visibility=d==="hidden"||!I?"hidden":"visible"}),g.useEffect(()=>()=>{w.current!==null&&window.clearTimeout(w.current),P.current!==null&&window.clearTimeout(P.current),E.current!==null&&window.cancelAnimationFrame(E.current)},[]),!I||d==="hidden"?null:A.jsx("div",{ref:m,className:dn("bb-chart-tooltip-frame",d==="dismissing"&&"bb-chart-tooltip-frame-dismissing"),children:g.cloneElement(e,I)})}function _H(e,t){const r=Array.isArray(t)?t.map(n=>{if(!n||typeof n!="object")return String(n??"");const i=n,o=i.payload&&typeof i.payload=="object"?i.payload:{};return[i.dataKey,i.name,i.value,i.color,o.label,o.day,o.amount].map(s=>String(s??"")).join(":")}).join("|"):"";return`${String(e??"")}:${r}`}function to({isAnimationActive:e=!0,animationDuration:t=180,animationEasing:r="ease-out",content:n,dismissDelay:i=5e3,wrapperStyle:o,...s}){const u=g.isValidElement(n)?A.jsx(IH,{content:n,dismissDelay:i,animatePosition:e!==!1}):n;return A.jsx(VF,{...s,content:u,isAnimationActive:!1,animationDuration:t,animationEasing:r,wrapperStyle:{outline:"none",transition:"opacity 140ms ease-out, visibility 140ms ease-out",...o}})}function Mn(e,t,{checkForDefaultPrevented:r=!0}={}){return function(i){if(e?.(i),r===!1||!i.defaultPrevented)return t?.(i)}}function Tv(e,t=[]){let r=[];function n(o,s){const u=g.createContext(s);u.displayName=o+"Context";const f=r.length;r=[...r,s];const d=v=>{const{scope:m,children:b,...S}=v,w=m?.[e]?.[f]||u,P=g.useMemo(()=>S,Object.values(S));return A.jsx(w.Provider,{value:P,children:b})};d.displayName=o+"Provider";function h(v,m){const b=m?.[e]?.[f]||u,S=g.useContext(b);if(S)return S;if(s!==void 0)return s;throw new Error(`\`${v}\` must be used within \`${o}\``)}return[d,h]}const i=()=>{const o=r.map(s=>g.createContext(s));return function(u){const f=u?.[e]||o;return g.useMemo(()=>({[`__scope${e}`]:{...u,[e]:f}}),[u,f])}};return i.scopeName=e,[n,TH(i,...t)]}function TH(...e){const t=e[0];if(e.length===1)return t;const r=()=>{const n=e.map(i=>({useScope:i(),scopeName:i.scopeName}));return function(o){const s=n.reduce((u,{useScope:f,scopeName:d})=>{const v=f(o)[`__scope${d}`];return{...u,...v}},{});return g.useMemo(()=>({[`__scope${t.scopeName}`]:s}),[s])}};return r.scopeName=t.scopeName,r}function tk(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function NH(...e){return t=>{let r=!1;const n=e.map(i=>{const o=tk(i,t);return!r&&typeof o=="function"&&(r=!0),o});if(r)return()=>{for(let i=0;i<n.length;i++){const o=n[i];typeof o=="function"?o():tk(e[i],null)}}}}function Ec(...e){return g.useCallback(NH(...e),e)}function Nv(e){const t=g.forwardRef((r,n)=>{let{children:i,...o}=r,s=null,u=!1;const f=[];rk(i)&&typeof kc=="function"&&(i=kc(i._payload)),g.Children.forEach(i,m=>{if(LH(m)){u=!0;const b=m;let S="child"in b.props?b.props.child:b.props.children;rk(S)&&typeof kc=="function"&&(S=kc(S._payload)),s=DH(b,S),f.push(s?.props?.children)}else f.push(m)}),s?s=g.cloneElement(s,void 0,f):!u&&g.Children.count(i)===1&&g.isValidElement(i)&&(s=i);const d=s?$H(s):void 0,h=Ec(n,d);if(!s){if(i||i===0)throw new Error(u?WH(e):FH(e));return i}const v=RH(o,s.props??{});return s.type!==g.Fragment&&(v.ref=n?h:d),g.cloneElement(s,v)});return t.displayName=`${e}.Slot`,t}var MH=Symbol.for("radix.slottable"),DH=(e,t)=>{if("child"in e.props){const r=e.props.child;return g.isValidElement(r)?g.cloneElement(r,void 0,e.props.children(r.props.children)):null}return g.isValidElement(t)?t:null};function RH(e,t){const r={...t};for(const n in t){const i=e[n],o=t[n];/^on[A-Z]/.test(n)?i&&o?r[n]=(...u)=>{const f=o(...u);return i(...u),f}:i&&(r[n]=i):n==="style"?r[n]={...i,...o}:n==="className"&&(r[n]=[i,o].filter(Boolean).join(" "))}return{...e,...r}}function $H(e){let t=Object.getOwnPropertyDescriptor(e.props,"ref")?.get,r=t&&"isReactWarning"in t&&t.isReactWarning;return r?e.ref:(t=Object.getOwnPropertyDescriptor(e,"ref")?.get,r=t&&"isReactWarning"in t&&t.isReactWarning,r?e.props.ref:e.props.ref||e.ref)}function LH(e){return g.isValidElement(e)&&typeof e.type=="function"&&"__radixId"in e.type&&e.type.__radixId===MH}var zH=Symbol.for("react.lazy");function rk(e){return e!=null&&typeof e=="object"&&"$$typeof"in e&&e.$$typeof===zH&&"_payload"in e&&BH(e._payload)}function BH(e){return typeof e=="object"&&e!==null&&"then"in e}var FH=e=>`${e} failed to slot onto its children. Expected a single React element child or \`Slottable\`.`,WH=e=>`${e} failed to slot onto its \`Slottable\`. Expected \`Slottable\` to receive a single React element child.`,kc=ws[" use ".trim().toString()];function UH(e){const t=e+"CollectionProvider",[r,n]=Tv(t),[i,o]=r(t,{collectionRef:{current:null},itemMap:new Map}),s=w=>{const{scope:P,children:E}=w,j=g.useRef(null),O=g.useRef(new Map).current;return A.jsx(i,{scope:P,itemMap:O,collectionRef:j,children:E})};s.displayName=t;const u=e+"CollectionSlot",f=Nv(u),d=g.forwardRef((w,P)=>{const{scope:E,children:j}=w,O=o(u,E),C=Ec(P,O.collectionRef);return A.jsx(f,{ref:C,children:j})});d.displayName=u;const h=e+"CollectionItemSlot",v="data-radix-collection-item",m=Nv(h),b=g.forwardRef((w,P)=>{const{scope:E,children:j,...O}=w,C=g.useRef(null),T=Ec(P,C),I=o(h,E);return g.useEffect(()=>(I.itemMap.set(C,{ref:C,...O}),()=>{I.itemMap.delete(C)})),A.jsx(m,{[v]:"",ref:T,children:j})});b.displayName=h;function S(w){const P=o(e+"CollectionConsumer",w);return g.useCallback(()=>{const j=P.collectionRef.current;if(!j)return[];const O=Array.from(j.querySelectorAll(`[${v}]`));return Array.from(P.itemMap.values()).sort((I,R)=>O.indexOf(I.ref.current)-O.indexOf(R.ref.current))},[P.collectionRef,P.itemMap])}return[{Provider:s,Slot:d,ItemSlot:b},S,n]}var Oc=globalThis?.document?g.useLayoutEffect:()=>{},KH=ws[" useId ".trim().toString()]||(()=>{}),VH=0;function nk(e){const[t,r]=g.useState(KH());return Oc(()=>{r(n=>n??String(VH++))},[e]),t?`radix-${t}`:""}var HH=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],ro=HH.reduce((e,t)=>{const r=Nv(`Primitive.${t}`),n=g.forwardRef((i,o)=>{const{asChild:s,...u}=i,f=s?r:t;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),A.jsx(f,{...u,ref:o})});return n.displayName=`Primitive.${t}`,{...e,[t]:n}},{});function YH(e){const t=g.useRef(e);return g.useEffect(()=>{t.current=e}),g.useMemo(()=>((...r)=>t.current?.(...r)),[])}var GH=ws[" useInsertionEffect ".trim().toString()]||Oc;function ik({prop:e,defaultProp:t,onChange:r=()=>{},caller:n}){const[i,o,s]=XH({defaultProp:t,onChange:r}),u=e!==void 0,f=u?e:i;{const h=g.useRef(e!==void 0);g.useEffect(()=>{const v=h.current;v!==u&&console.warn(`${n} is changing from ${v?"controlled":"uncontrolled"} to ${u?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),h.current=u},[u,n])}const d=g.useCallback(h=>{if(u){const v=qH(h)?h(e):h;v!==e&&s.current?.(v)}else o(h)},[u,e,o,s]);return[f,d]}function XH({defaultProp:e,onChange:t}){const[r,n]=g.useState(e),i=g.useRef(r),o=g.useRef(t);return GH(()=>{o.current=t},[t]),g.useEffect(()=>{i.current!==r&&(o.current?.(r),i.current=r)},[r,i]),[r,n,o]}function qH(e){return typeof e=="function"}var ZH=g.createContext(void 0);function ak(e){const t=g.useContext(ZH);return e||t||"ltr"}var Mv="rovingFocusGroup.onEntryFocus",QH={bubbles:!1,cancelable:!0},Il="RovingFocusGroup",[Dv,ok,JH]=UH(Il),[e9,lk]=Tv(Il,[JH]),[t9,r9]=e9(Il),sk=g.forwardRef((e,t)=>A.jsx(Dv.Provider,{scope:e.__scopeRovingFocusGroup,children:A.jsx(Dv.Slot,{scope:e.__scopeRovingFocusGroup,children:A.jsx(n9,{...e,ref:t})})}));sk.displayName=Il;var n9=g.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:r,orientation:n,loop:i=!1,dir:o,currentTabStopId:s,defaultCurrentTabStopId:u,onCurrentTabStopIdChange:f,onEntryFocus:d,preventScrollOnEntryFocus:h=!1,...v}=e,m=g.useRef(null),b=Ec(t,m),S=ak(o),[w,P]=ik({prop:s,defaultProp:u??null,onChange:f,caller:Il}),[E,j]=g.useState(!1),O=YH(d),C=ok(r),T=g.useRef(!1),[I,R]=g.useState(0);return g.useEffect(()=>{const N=m.current;if(N)return N.addEventListener(Mv,O),()=>N.removeEventListener(Mv,O)},[O]),A.jsx(t9,{scope:r,orientation:n,dir:S,loop:i,currentTabStopId:w,onItemFocus:g.useCallback(N=>P(N),[P]),onItemShiftTab:g.useCallback(()=>j(!0),[]),onFocusableItemAdd:g.useCallback(()=>R(N=>N+1),[]),onFocusableItemRemove:g.useCallback(()=>R(N=>N-1),[]),children:A.jsx(ro.div,{tabIndex:E||I===0?-1:0,"data-orientation":n,...v,ref:b,style:{outline:"none",...e.style},onMouseDown:Mn(e.onMouseDown,()=>{T.current=!0}),onFocus:Mn(e.onFocus,N=>{const K=!T.current;if(N.target===N.currentTarget&&K&&!E){const G=new CustomEvent(Mv,QH);if(N.currentTarget.dispatchEvent(G),!G.defaultPrevented){const Y=C().filter(ne=>ne.focusable),V=Y.find(ne=>ne.active),oe=Y.find(ne=>ne.id===w),fe=[V,oe,...Y].filter(Boolean).map(ne=>ne.ref.current);fk(fe,h)}}T.current=!1}),onBlur:Mn(e.onBlur,()=>j(!1))})})}),uk="RovingFocusGroupItem",ck=g.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:r,focusable:n=!0,active:i=!1,tabStopId:o,children:s,...u}=e,f=nk(),d=o||f,h=r9(uk,r),v=h.currentTabStopId===d,m=ok(r),{onFocusableItemAdd:b,onFocusableItemRemove:S,currentTabStopId:w}=h;return g.useEffect(()=>{if(n)return b(),()=>S()},[n,b,S]),A.jsx(Dv.ItemSlot,{scope:r,id:d,focusable:n,active:i,children:A.jsx(ro.span,{tabIndex:v?0:-1,"data-orientation":h.orientation,...u,ref:t,onMouseDown:Mn(e.onMouseDown,P=>{n?h.onItemFocus(d):P.preventDefault()}),onFocus:Mn(e.onFocus,()=>h.onItemFocus(d)),onKeyDown:Mn(e.onKeyDown,P=>{if(P.key==="Tab"&&P.shiftKey){h.onItemShiftTab();return}if(P.target!==P.currentTarget)return;const E=o9(P,h.orientation,h.dir);if(E!==void 0){if(P.metaKey||P.ctrlKey||P.altKey||P.shiftKey)return;P.preventDefault();let O=m().filter(C=>C.focusable).map(C=>C.ref.current);if(E==="last")O.reverse();else if(E==="prev"||E==="next"){E==="prev"&&O.reverse();const C=O.indexOf(P.currentTarget);O=h.loop?l9(O,C+1):O.slice(C+1)}setTimeout(()=>fk(O))}}),children:typeof s=="function"?s({isCurrentTabStop:v,hasTabStop:w!=null}):s})})});ck.displayName=uk;var i9={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function a9(e,t){return t!=="rtl"?e:e==="ArrowLeft"?"ArrowRight":e==="ArrowRight"?"ArrowLeft":e}function o9(e,t,r){const n=a9(e.key,r);if(!(t==="vertical"&&["ArrowLeft","ArrowRight"].includes(n))&&!(t==="horizontal"&&["ArrowUp","ArrowDown"].includes(n)))return i9[n]}function fk(e,t=!1){const r=document.activeElement;for(const n of e)if(n===r||(n.focus({preventScroll:t}),document.activeElement!==r))return}function l9(e,t){return e.map((r,n)=>e[(t+n)%e.length])}var s9=sk,u9=ck;function c9(e,t){return g.useReducer((r,n)=>t[r][n]??r,e)}var dk=e=>{const{present:t,children:r}=e,n=f9(t),i=typeof r=="function"?r({present:n.isPresent}):g.Children.only(r),o=d9(n.ref,h9(i));return typeof r=="function"||n.isPresent?g.cloneElement(i,{ref:o}):null};dk.displayName="Presence";function f9(e){const[t,r]=g.useState(),n=g.useRef(null),i=g.useRef(e),o=g.useRef("none"),s=e?"mounted":"unmounted",[u,f]=c9(s,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return g.useEffect(()=>{const d=Cc(n.current);o.current=u==="mounted"?d:"none"},[u]),Oc(()=>{const d=n.current,h=i.current;if(h!==e){const m=o.current,b=Cc(d);e?f("MOUNT"):b==="none"||d?.display==="none"?f("UNMOUNT"):f(h&&m!==b?"ANIMATION_OUT":"UNMOUNT"),i.current=e}},[e,f]),Oc(()=>{if(t){let d;const h=t.ownerDocument.defaultView??window,v=b=>{const w=Cc(n.current).includes(CSS.escape(b.animationName));if(b.target===t&&w&&(f("ANIMATION_END"),!i.current)){const P=t.style.animationFillMode;t.style.animationFillMode="forwards",d=h.setTimeout(()=>{t.style.animationFillMode==="forwards"&&(t.style.animationFillMode=P)})}},m=b=>{b.target===t&&(o.current=Cc(n.current))};return t.addEventListener("animationstart",m),t.addEventListener("animationcancel",v),t.addEventListener("animationend",v),()=>{h.clearTimeout(d),t.removeEventListener("animationstart",m),t.removeEventListener("animationcancel",v),t.removeEventListener("animationend",v)}}else f("ANIMATION_END")},[t,f]),{isPresent:["mounted","unmountSuspended"].includes(u),ref:g.useCallback(d=>{n.current=d?getComputedStyle(d):null,r(d)},[])}}function hk(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function d9(...e){const t=g.useRef(e);return t.current=e,g.useCallback(r=>{const n=t.current;let i=!1;const o=n.map(s=>{const u=hk(s,r);return!i&&typeof u=="function"&&(i=!0),u});if(i)return()=>{for(let s=0;s<o.length;s++){const u=o[s];typeof u=="function"?u():hk(n[s],null)}}},[])}function Cc(e){return e?.animationName||"none"}function h9(e){let t=Object.getOwnPropertyDescriptor(e.props,"ref")?.get,r=t&&"isReactWarning"in t&&t.isReactWarning;return r?e.ref:(t=Object.getOwnPropertyDescriptor(e,"ref")?.get,r=t&&"isReactWarning"in t&&t.isReactWarning,r?e.props.ref:e.props.ref||e.ref)}var jc="Tabs",[p9]=Tv(jc,[lk]),pk=lk(),[v9,Rv]=p9(jc),vk=g.forwardRef((e,t)=>{const{__scopeTabs:r,value:n,onValueChange:i,defaultValue:o,orientation:s="horizontal",dir:u,activationMode:f="automatic",...d}=e,h=ak(u),[v,m]=ik({prop:n,onChange:i,defaultProp:o??"",caller:jc});return A.jsx(v9,{scope:r,baseId:nk(),value:v,onValueChange:m,orientation:s,dir:h,activationMode:f,children:A.jsx(ro.div,{dir:h,"data-orientation":s,...d,ref:t})})});vk.displayName=jc;var mk="TabsList",yk=g.forwardRef((e,t)=>{const{__scopeTabs:r,loop:n=!0,...i}=e,o=Rv(mk,r),s=pk(r);return A.jsx(s9,{asChild:!0,...s,orientation:o.orientation,dir:o.dir,loop:n,children:A.jsx(ro.div,{role:"tablist","aria-orientation":o.orientation,...i,ref:t})})});yk.displayName=mk;var gk="TabsTrigger",bk=g.forwardRef((e,t)=>{const{__scopeTabs:r,value:n,disabled:i=!1,...o}=e,s=Rv(gk,r),u=pk(r),f=Sk(s.baseId,n),d=Ak(s.baseId,n),h=n===s.value;return A.jsx(u9,{asChild:!0,...u,focusable:!i,active:h,children:A.jsx(ro.button,{type:"button",role:"tab","aria-selected":h,"aria-controls":d,"data-state":h?"active":"inactive","data-disabled":i?"":void 0,disabled:i,id:f,...o,ref:t,onMouseDown:Mn(e.onMouseDown,v=>{!i&&v.button===0&&v.ctrlKey===!1?s.onValueChange(n):v.preventDefault()}),onKeyDown:Mn(e.onKeyDown,v=>{[" ","Enter"].includes(v.key)&&s.onValueChange(n)}),onFocus:Mn(e.onFocus,()=>{const v=s.activationMode!=="manual";!h&&!i&&v&&s.onValueChange(n)})})})});bk.displayName=gk;var xk="TabsContent",wk=g.forwardRef((e,t)=>{const{__scopeTabs:r,value:n,forceMount:i,children:o,...s}=e,u=Rv(xk,r),f=Sk(u.baseId,n),d=Ak(u.baseId,n),h=n===u.value,v=g.useRef(h);return g.useEffect(()=>{const m=requestAnimationFrame(()=>v.current=!1);return()=>cancelAnimationFrame(m)},[]),A.jsx(dk,{present:i||h,children:({present:m})=>A.jsx(ro.div,{"data-state":h?"active":"inactive","data-orientation":u.orientation,role:"tabpanel","aria-labelledby":f,hidden:!m,id:d,tabIndex:0,...s,ref:t,style:{...e.style,animationDuration:v.current?"0s":void 0},children:m&&o})})});wk.displayName=xk;function Sk(e,t){return`${e}-trigger-${t}`}function Ak(e,t){return`${e}-content-${t}`}var m9=vk,Pk=yk,Ek=bk,kk=wk;const y9=m9,Ok=g.forwardRef(({className:e,...t},r)=>A.jsx(Pk,{ref:r,className:dn("bb-tabs-list",e),"data-slot":"tabs-list",...t}));Ok.displayName=Pk.displayName;const $v=g.forwardRef(({className:e,...t},r)=>A.jsx(Ek,{ref:r,className:dn("bb-tabs-trigger",e),"data-slot":"tabs-trigger",...t}));$v.displayName=Ek.displayName;const Lv=g.forwardRef(({className:e,...t},r)=>A.jsx(kk,{ref:r,className:dn("bb-tabs-content",e),"data-slot":"tabs-content",...t}));Lv.displayName=kk.displayName;const g9=new Intl.NumberFormat("en-US",{style:"currency",currency:"USD"});function xe(e){return e==null?"N/A":g9.format(e)}function b9(e){return`${e.toFixed(1)}%`}function x9(e){const t=e.match(/^([A-Z][a-z]{2,})\s+(\d{1,2}),?\s+(?:\d{4}\s+)?(\d{1,2}:\d{2}\s+[AP]M)(?:\s+[A-Z]+)?$/);return t?`${t[1]} ${t[2]} ${t[3]}`:e.replace(/\s+[A-Z]{2,5}$/,"")}const Ck="bookiebot-expense-report-theme";function w9(){return typeof window<"u"&&window.matchMedia("(prefers-color-scheme: dark)").matches?"dark":"light"}function S9(){if(typeof window>"u")return null;try{const e=window.localStorage.getItem(Ck);return e==="dark"||e==="light"?e:null}catch{return null}}function A9(){const e=S9();return{theme:e??w9(),hasOverride:e!==null}}function P9(e){typeof document>"u"||(document.documentElement.dataset.theme=e,document.documentElement.style.colorScheme=e)}function E9(e){if(!(typeof window>"u"))try{window.localStorage.setItem(Ck,e)}catch{}}function k9(){const[{theme:e,hasOverride:t},r]=g.useState(A9);return g.useEffect(()=>{P9(e)},[e]),g.useEffect(()=>{if(typeof window>"u"||t)return;const i=window.matchMedia("(prefers-color-scheme: dark)"),o=()=>{r({theme:i.matches?"dark":"light",hasOverride:!1})};return o(),i.addEventListener?(i.addEventListener("change",o),()=>i.removeEventListener("change",o)):(i.addListener(o),()=>i.removeListener(o))},[t]),{theme:e,toggleTheme:()=>{r(i=>{const o=i.theme==="dark"?"light":"dark";return E9(o),{theme:o,hasOverride:!0}})}}}function _l(e){const[t,r]=g.useState(()=>typeof window>"u"?!1:window.matchMedia(e).matches);return g.useEffect(()=>{if(typeof window>"u")return;const n=window.matchMedia(e),i=()=>r(n.matches);return i(),n.addEventListener?(n.addEventListener("change",i),()=>n.removeEventListener("change",i)):(n.addListener(i),()=>n.removeListener(i))},[e]),t}const O9=16,C9=[{value:"all",label:"All"},{value:"needs",label:"Needs"},{value:"wants",label:"Wants"},{value:"savings",label:"Savings"}],j9=[{value:"all",label:"All"},{value:"needs",label:"Needs"},{value:"wants",label:"Wants"}],jk=new Set(["rent","bills_utilities","static_bills_subscriptions_needs","need_expenses","grocery","gas"]),Ik=new Set(["subscriptions_wants","food","shopping"]),I9=new Set(["Food","Shopping"]),_9="#166534",T9="#0f766e",no="#2563eb",io="#7c3aed",zv=[2,2,2,2],_k="hsl(var(--muted-foreground))",N9="hsl(var(--foreground))",Ic=["#dc2626","#ef4444","#f97316","#f59e0b","#eab308","#06b6d4","#38bdf8","#60a5fa","#3b82f6","#2563eb"],Bv="#0891b2";function M9(e,t){const r=t?e.modeViews?.projected:e.modeViews?.current;if(r)return r;const n=t?D9(e):e.breakdown,i=t?e.incomeProjection.projectedAmount:e.incomeProjection.currentAmount,o=R9(e,t),s=t?ao(n):e.metrics.totalExpenses,u=$9(e),f=t?Tk(i):u,d=L9(n,o.amount,e.categorySpending),h=z9(f,d),v=B9(h);return{metrics:{totalExpenses:s,monthlyIncome:i,incomeAfterExpenses:Ce(v),amountSaved:o.amount,savingsIdeal:o.ideal,savingsMinimum:o.minimum},categoryBalances:h,categoryBudgets:f,categorySpending:d,breakdown:n,burnRate:t?H9(e.burnRate,h):e.burnRate,calendarEvents:e.calendarEvents,utilityHistory:e.utilityHistory}}function D9(e){const t=K9(e),r=V9(e),i=(e.budgetBreakdown?.length?e.budgetBreakdown:e.breakdown).map(s=>{let u=s.amount;return s.key==="static_bills_subscriptions_needs"?u=t.needs||u:s.key==="subscriptions_wants"?u=t.wants||u:s.key==="rent"?u=r.rent||u:s.key==="bills_utilities"&&(u=r.billsUtilities||u),{...s,amount:Ce(u)}}),o=ao(i);return i.map(s=>({...s,percentage:o?Ce(s.amount/o*100):0}))}function R9(e,t){const r=e.savingsProjection;return{amount:r.currentAmount,ideal:t?r.projectedIdeal:r.currentIdeal,minimum:t?r.projectedMinimum:r.currentMinimum}}function $9(e){return e.categoryBudgets?e.categoryBudgets:Tk(e.incomeProjection.currentAmount)}function Tk(e){const t=Ce(e*.5),r=Ce(e*.2),n=Ce(e-t-r);return{needs:t,wants:n,savings:r}}function L9(e,t,r){const n=e.filter(o=>jk.has(o.key)).reduce((o,s)=>o+s.amount,0),i=e.filter(o=>Ik.has(o.key)).reduce((o,s)=>o+s.amount,0);return{needs:Ce(n>0?n:r?.needs??0),wants:Ce(i>0?i:r?.wants??0),savings:Ce(t)}}function z9(e,t){return U9({needs:Ce(e.needs-t.needs),wants:Ce(e.wants-t.wants),savings:Ce(e.savings-t.savings)})}function B9(e){return Ce(Object.values(e.remaining).reduce((t,r)=>t+r,0))}function F9(e){return Ce(Object.values(e).reduce((t,r)=>t+r,0))}const W9=[["needs",["wants","savings"]],["wants",["savings","needs"]],["savings",["wants","needs"]]];function U9(e){const t={needs:Ce(e.needs),wants:Ce(e.wants),savings:Ce(e.savings)},r={...t},n=[];W9.forEach(([o,s])=>{let u=Math.max(-r[o],0);s.forEach(f=>{if(u<=0)return;const d=Ce(Math.min(u,Math.max(r[f],0)));d<=0||(r[f]=Ce(r[f]-d),r[o]=Ce(r[o]+d),u=Ce(u-d),n.push({from:f,to:o,amount:d}))})});const i={needs:Ce(Math.max(-t.needs,0)),wants:Ce(Math.max(-t.wants,0)),savings:Ce(Math.max(-t.savings,0))};return{raw:t,remaining:r,deficits:i,transfers:n,totalOverspend:Ce(Object.values(r).reduce((o,s)=>o+Math.max(-s,0),0))}}function K9(e){const t=i=>i.reduce((o,s)=>o+s.amount,0),r=e.subscriptionsNeeds.filter(i=>tO(i,e.year,e.month)!==null),n=e.subscriptionsWants.filter(i=>tO(i,e.year,e.month)!==null);return{needs:Ce(t(r)),wants:Ce(t(n))}}function V9(e){const t=Ce(e.utilityHistory.reduce((n,i)=>n+i.currentAmount,0)),r=e.calendarEvents.filter(n=>n.kind==="bill"&&n.group==="rent").reduce((n,i)=>n+i.amount,0);return{rent:Ce(r),billsUtilities:t}}function H9(e,t){if(!e)return null;const r=Ce(e.spent),n=Ce(r+t.remaining.wants),i=e.daysInMonth,o=e.elapsedDays,s=Ce(i?n*(o/i):0),u=Ce(i?n/i:0),f=Ce(o?r/o:0),d=Ce(f-u),h=Ce(r-s),v=o===0?"not_started":h>0?"over":"under",m=e.series.map(b=>{const S=Ce(i?n*(b.day/i):0),w=b.actualSpend;return{...b,expectedSpend:S,variance:w==null?null:Ce(w-S)}});return{...e,budget:n,spent:r,remaining:Ce(n-r),expectedSpend:s,allowedDailyAverage:u,actualDailyAverage:f,dailyDifference:d,totalDifference:h,status:v,series:m}}function KX(e){return e}function Ce(e){return Math.round((Number.isFinite(e)?e:0)*100)/100}function Tl(e,t,r){return Math.min(r,Math.max(t,e))}function Y9(){g.useLayoutEffect(()=>{const e=document.documentElement,t=()=>{e.style.setProperty("--bb-viewport-scrollbar-width",`${Math.max(window.innerWidth-e.clientWidth,0)}px`)};return t(),window.addEventListener("resize",t),()=>{window.removeEventListener("resize",t),e.style.removeProperty("--bb-viewport-scrollbar-width")}},[])}function G9({report:e}){const{theme:t,toggleTheme:r}=k9();Y9();const n=_l("(min-width: 861px)"),[i,o]=g.useState(!1),[s,u]=g.useState("all"),[f,d]=g.useState("all"),[h,v]=g.useState("all"),[m,b]=g.useState(null),S=g.useRef(null),w=g.useRef(null),[P,E]=g.useState(!1),[j,O]=g.useState(0),[C,T]=g.useState(0),I=()=>{O(ae=>ae+1)},R=ae=>{ae!==s&&(I(),u(ae))},N=ae=>{ae!==f&&(I(),d(ae))},K=ae=>{ae!==h&&(I(),v(ae))},G=()=>{I(),o(ae=>!ae)},Y=M9(e,i),V=Object.fromEntries(Y.breakdown.map(ae=>[ae.label,ae.color])),oe=sG(e.dailyEntries,h),re=hG(Y.calendarEvents,h,i),fe=uG(oe,re,e.month),ne=cG(oe,re),ie=fG(oe,re),H=ao(Y.breakdown),ee=e.burnRate?"burn-rate":"category",z=[{id:"category",title:"Category Mix",content:A.jsx(dY,{data:Y.breakdown,categoryBalances:Y.categoryBalances,categoryBudgets:Y.categoryBudgets,amountSaved:Y.metrics.amountSaved,filter:s,onFilterChange:R,projected:i,collapseKey:C})},...Y.burnRate?[{id:"burn-rate",title:"Burn Rate",content:A.jsx(nY,{burnRate:Y.burnRate,categoryBalances:Y.categoryBalances,collapseKey:C})}]:[],{id:"calendar",title:"Calendar",content:A.jsx(yG,{year:e.year,month:e.month,monthLabel:e.monthLabel,elapsedDays:e.elapsedDays,events:Y.calendarEvents,filter:f,onFilterChange:N,projected:i,needs:e.subscriptionsNeeds,wants:e.subscriptionsWants,collapseKey:C})},{id:"bills",title:"Bills & Utilities",content:A.jsx(PG,{items:Y.utilityHistory,events:Y.calendarEvents,year:e.year,month:e.month,projected:i,collapseKey:C})}],D=Math.max(0,z.findIndex(ae=>ae.id===ee)),[U,ue]=g.useState(D);g.useEffect(()=>{ue(ae=>Math.min(ae,z.length-1))},[z.length]),g.useEffect(()=>()=>{w.current!==null&&window.clearTimeout(w.current)},[]);const Ae=()=>{w.current!==null&&window.clearTimeout(w.current),E(!0),w.current=window.setTimeout(()=>{E(!1),w.current=null},320)},me=ae=>{const ce=Tl(ae,0,z.length-1);ce!==U&&(T(Ue=>Ue+1),O(Ue=>Ue+1),Ae(),ue(ce))},ge=ae=>{me(U+ae)},Ie=ae=>{if(q9(ae.target))return;const ce=ae.touches[0];ce&&(S.current={startX:ce.clientX,startY:ce.clientY,deltaX:0,deltaY:0,dragging:!1})},Te=ae=>{const ce=ae.touches[0],Ue=S.current;if(!ce||Ue===null)return;const Nt=ce.clientX-Ue.startX,ar=ce.clientY-Ue.startY,ea=Math.abs(Nt)>18&&Math.abs(Nt)>Math.abs(ar)*1.35,Br={...Ue,deltaX:Nt,deltaY:ar,dragging:Ue.dragging||ea};S.current=Br,Br.dragging&&b(Br)},X=ae=>{const ce=S.current;if(S.current=null,ce===null)return;const Ue=ae.changedTouches[0]?.clientX,Nt=ae.changedTouches[0]?.clientY;if(b(null),Ue===void 0)return;const ar=Ue-ce.startX,ea=Nt===void 0?ce.deltaY:Nt-ce.startY,Br=Math.min(120,Math.max(68,window.innerWidth*.22));Math.abs(ar)<Br||Math.abs(ar)<Math.abs(ea)*1.35||ar<0&&U>=z.length-1||ar>0&&U<=0||ge(ar<0?1:-1)},Pe=()=>{S.current=null,b(null)},Ee=U===0&&(m?.deltaX??0)>0||U===z.length-1&&(m?.deltaX??0)<0?.25:1,Z=m?.dragging?Tl(m.deltaX*Ee,-220,220):0,Ge=`translate3d(calc(${-U*100}% - ${U*O9}px + ${Z}px), 0, 0)`;return A.jsxs("div",{className:"bb-page",children:[A.jsxs("header",{className:"bb-page-header",children:[A.jsxs("div",{className:"bb-header-copy",children:[A.jsxs("div",{className:"bb-header-title-row",children:[A.jsx("h1",{children:"Expense Breakdown"}),A.jsx(Ov,{variant:"outline",children:x9(e.generatedAt)})]}),A.jsxs("p",{children:[e.monthLabel," budget report for ",e.ownerName,"."]})]}),A.jsxs("div",{className:"bb-header-actions",children:[A.jsx(tY,{active:i,onToggle:G}),A.jsx(rY,{theme:t,onToggle:r})]})]}),A.jsx(kH,{revision:j,children:A.jsxs("main",{className:"bb-main","data-bb-tooltip-dismiss-revision":j,children:[A.jsxs("section",{className:"bb-metrics-grid","aria-label":"Budget metrics",children:[A.jsx(Fv,{label:"Income",value:Y.metrics.monthlyIncome,description:i?"Projected month":"Logged income"}),A.jsx(Fv,{label:"Spent",value:H}),A.jsx(Fv,{label:"Left",value:Y.metrics.incomeAfterExpenses,description:"Budget remaining",accent:!0}),A.jsx(fY,{value:Y.metrics.amountSaved,minimum:Y.metrics.savingsMinimum,ideal:Y.metrics.savingsIdeal})]}),A.jsx("section",{className:"bb-chart-carousel-band",role:"region","aria-roledescription":"carousel","aria-label":"Budget charts",children:A.jsx("div",{className:"bb-chart-carousel","data-dragging":m?.dragging?"true":"false","data-tooltip-cooldown":P?"true":"false",onTouchStart:Ie,onTouchMove:Te,onTouchEnd:X,onTouchCancel:Pe,children:A.jsx("div",{className:m?.dragging?"bb-chart-carousel-track bb-chart-carousel-track-dragging":"bb-chart-carousel-track",style:{transform:Ge},children:z.map((ae,ce)=>A.jsx("div",{className:"bb-chart-carousel-slide","aria-hidden":ce!==U,children:A.jsx(Ja,{children:ae.content})},ae.id))})})}),A.jsx(Z9,{panels:z,activeIndex:U,onSelect:me,onPrevious:()=>ge(-1),onNext:()=>ge(1),canPrevious:U>0,canNext:U<z.length-1}),A.jsxs(jl,{children:[A.jsx(Cv,{children:A.jsxs("div",{className:"bb-card-title-row bb-inline-toggle-row",children:[A.jsx(jv,{children:"Daily Spending"}),A.jsx(J9,{filter:h,onFilterChange:K})]})}),A.jsxs(Ja,{className:"bb-daily-spending-content",children:[A.jsx($Y,{data:ne,total:ie,elapsedDays:e.elapsedDays,filter:h,defaultDetailsOpen:n}),A.jsx(oG,{entries:fe,categoryColors:V})]})]}),A.jsx(X9,{items:e.sharedReimbursements??[]}),A.jsx(tG,{topEntries:e.topEntries,merchantOccurrences:e.merchantOccurrences,onViewChange:I})]})})]})}function X9({items:e}){if(!e.length)return null;const t=e.reduce((o,s)=>o+s.grossAmount,0),r=e.reduce((o,s)=>o+s.personalShare,0),n=e.reduce((o,s)=>o+s.outstandingAmount,0),i=e.reduce((o,s)=>o+s.receivedAmount,0);return A.jsxs(jl,{children:[A.jsx(Cv,{children:A.jsx(jv,{children:"Shared Reimbursements"})}),A.jsxs(Ja,{className:"bb-reimbursement-content",children:[A.jsxs("div",{className:"bb-reimbursement-summary","aria-label":"Shared reimbursement summary",children:[A.jsxs("div",{children:[A.jsx("span",{children:"Gross paid"}),A.jsx("strong",{children:xe(t)})]}),A.jsxs("div",{children:[A.jsx("span",{children:"Your share"}),A.jsx("strong",{children:xe(r)})]}),A.jsxs("div",{children:[A.jsx("span",{children:"Outstanding"}),A.jsx("strong",{children:xe(n)})]}),A.jsxs("div",{children:[A.jsx("span",{children:"Received"}),A.jsx("strong",{children:xe(i)})]})]}),A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{className:"bb-reimbursement-table",children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Expense"}),A.jsx("th",{children:"Gross"}),A.jsx("th",{children:"Your share"}),A.jsx("th",{children:"Partner share"}),A.jsx("th",{children:"Status"})]})}),A.jsx("tbody",{children:e.map(o=>A.jsxs("tr",{children:[A.jsxs("td",{children:[A.jsx("strong",{children:o.item}),A.jsx("span",{children:[o.location,o.date,o.splitMethod,o.responsiblePerson?`Expense: ${o.responsiblePerson}`:""].filter(Boolean).join(" · ")})]}),A.jsx("td",{children:xe(o.grossAmount)}),A.jsx("td",{children:xe(o.personalShare)}),A.jsx("td",{children:xe(o.partnerShare)}),A.jsx("td",{children:o.status==="reimbursed"?"Received":`${xe(o.outstandingAmount)} due`})]},o.id))})]})})]})]})}function q9(e){return e instanceof Element&&!!e.closest("button, a, input, select, textarea, summary, [role='button'], [role='tab']")}function Z9({panels:e,activeIndex:t,onSelect:r,onPrevious:n,onNext:i,canPrevious:o,canNext:s}){return A.jsxs("div",{className:"bb-chart-carousel-nav",children:[A.jsx("button",{type:"button",className:"bb-chart-carousel-button","aria-label":"Previous chart",onClick:n,disabled:!o,children:"<"}),A.jsx(eY,{panels:e,activeIndex:t,onSelect:r}),A.jsx("button",{type:"button",className:"bb-chart-carousel-button","aria-label":"Next chart",onClick:i,disabled:!s,children:">"})]})}function Q9({filter:e,onFilterChange:t}){return A.jsx("div",{className:"bb-tabs-list bb-category-mix-filter",role:"tablist","aria-label":"Category mix filter","data-bb-tooltip-dismiss-trigger":"category-mix",children:C9.map(r=>A.jsx("button",{type:"button",className:"bb-tabs-trigger","data-state":e===r.value?"active":"inactive",role:"tab","aria-selected":e===r.value,onClick:()=>t(r.value),children:r.label},r.value))})}function J9({filter:e,onFilterChange:t}){return A.jsx("div",{className:"bb-tabs-list bb-daily-spending-filter",role:"tablist","aria-label":"Daily spending filter","data-bb-tooltip-dismiss-trigger":"daily-spending",children:j9.map(r=>A.jsx("button",{type:"button",className:"bb-tabs-trigger","data-state":e===r.value?"active":"inactive",role:"tab","aria-selected":e===r.value,onClick:()=>t(r.value),children:r.label},r.value))})}function eY({panels:e,activeIndex:t,onSelect:r}){return A.jsx("div",{className:"bb-chart-carousel-indicators","aria-label":"Budget chart position",children:e.map((n,i)=>A.jsx("button",{type:"button",className:"bb-chart-carousel-dot","data-state":i===t?"active":"inactive","aria-label":`Show ${n.title}`,onClick:()=>r(i)},n.id))})}function tY({active:e,onToggle:t}){return A.jsx("button",{type:"button",className:"bb-metric-toggle","aria-pressed":e,"aria-label":"Toggle projected month view",title:"Toggle projected month view","data-bb-tooltip-dismiss-trigger":"projection",onClick:t,children:"Projected"})}function rY({theme:e,onToggle:t}){const r=e==="dark";return A.jsx("button",{type:"button",className:"bb-theme-toggle","aria-pressed":r,"aria-label":`Turn dark mode ${r?"off":"on"}`,onClick:t,children:A.jsx("span",{className:"bb-theme-toggle-icon","aria-hidden":"true",children:r?A.jsx("svg",{viewBox:"0 0 24 24",focusable:"false",children:A.jsx("path",{className:"bb-theme-toggle-moon",d:"M20.6 14.1A8.3 8.3 0 0 1 9.9 3.4a8.7 8.7 0 1 0 10.7 10.7Z"})}):A.jsxs("svg",{viewBox:"0 0 24 24",focusable:"false",children:[A.jsx("circle",{cx:"12",cy:"12",r:"4"}),A.jsx("path",{d:"M12 2v2M12 20v2M4.9 4.9l1.4 1.4M17.7 17.7l1.4 1.4M2 12h2M20 12h2M4.9 19.1l1.4-1.4M17.7 6.3l1.4-1.4"})]})})})}function nY({burnRate:e,categoryBalances:t,collapseKey:r}){const n=e.status==="over",i=e.status==="not_started",o=i?"Not started":n?"Over pace":"Available today",s=i?"No elapsed days":xe(Math.abs(e.totalDifference)),u=iY(e),f=e.series,d=oY(f),h=i?"hsl(var(--chart-1))":"url(#burn-rate-variance-gradient)",v=lY(f),m=Dk("wants",t,e.spent);return A.jsxs("div",{className:"bb-chart-stack bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-burn-rate-summary bb-chart-page-header",children:[A.jsxs("div",{className:"bb-burn-rate-primary",children:[A.jsxs("div",{children:[A.jsxs("div",{className:"bb-title-with-accessory",children:[A.jsx("div",{className:"bb-chart-kicker",children:o}),A.jsx(aY,{})]}),A.jsx("div",{className:n?"bb-burn-rate-value bb-negative":"bb-burn-rate-value bb-positive",children:s}),A.jsxs("div",{className:"bb-burn-rate-note",children:[e.elapsedDays," of ",e.daysInMonth," days counted"]})]}),A.jsx("div",{className:"bb-burn-rate-actions",children:A.jsx("div",{className:n?"bb-burn-rate-pill bb-burn-rate-pill-danger":"bb-burn-rate-pill",children:u})})]}),m?A.jsx(Rk,{pressure:m}):null]}),A.jsx(eo,{config:{variance:{label:"Variance",color:h}},className:"bb-chart-box bb-chart-box-wide bb-chart-page-body",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(EE,{data:f,margin:{top:20,right:22,left:0,bottom:8},children:[A.jsx("defs",{children:A.jsx("linearGradient",{id:"burn-rate-variance-gradient",x1:"0",y1:"0",x2:"0",y2:"1",children:d.map((b,S)=>A.jsx("stop",{offset:b.offset,stopColor:b.color},`${b.offset}-${S}`))})}),A.jsx(Ya,{vertical:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{dataKey:"label",tickLine:!1,axisLine:!1,interval:"preserveStartEnd"}),A.jsx(qa,{domain:v,tickFormatter:b=>`$${b}`,tickLine:!1,axisLine:!1,width:58}),A.jsx(gP,{y:0,stroke:"hsl(var(--foreground))",strokeOpacity:.45,strokeWidth:1.5}),A.jsx(to,{content:A.jsx(uY,{})}),A.jsx(ov,{type:"monotone",dataKey:"variance",name:"Variance",stroke:h,strokeWidth:3,strokeLinecap:"round",strokeLinejoin:"round",dot:!1,activeDot:sY,connectNulls:!1,isAnimationActive:!0,animationBegin:0,animationDuration:900,animationEasing:"ease-out"})]})})}),A.jsx("div",{className:"bb-chart-page-footer",children:A.jsx(Hv,{summary:"Details",collapseKey:r,children:A.jsx(Vk,{rows:[["Limit",xe(e.budget)],["Spent",xe(e.spent)],["Left",xe(e.remaining)],["Allowed/day",xe(e.allowedDailyAverage)],["Actual/day",xe(e.actualDailyAverage)]]})})})]})}function iY(e){return e.status==="not_started"?"No daily pace yet":e.dailyDifference>0?`Overspending ${xe(Math.abs(e.dailyDifference))}/day`:e.dailyDifference<0?`Saving ${xe(Math.abs(e.dailyDifference))}/day`:"On pace"}function aY(){return A.jsxs("button",{type:"button",className:"bb-burn-rate-info","aria-label":"What burn rate means",children:[A.jsx("span",{"aria-hidden":"true",children:"i"}),A.jsx("span",{className:"bb-burn-rate-info-tooltip",role:"tooltip",children:"Tracks Food + Shopping + Wants subscriptions against your Wants limit after cross-category coverage. Available today is what you can spend now and stay on pace."})]})}function ao(e){return e.reduce((t,r)=>t+r.amount,0)}function oY(e){const t=e.map(o=>o.variance).filter(o=>o!=null);if(!t.length)return[{offset:"0%",color:"hsl(var(--chart-1))"},{offset:"100%",color:"hsl(var(--chart-1))"}];const r=Math.min(...t),n=Math.max(...t);if(n<=0)return[{offset:"0%",color:"hsl(var(--success))"},{offset:"100%",color:"hsl(var(--success))"}];if(r>=0)return[{offset:"0%",color:"hsl(var(--destructive))"},{offset:"100%",color:"hsl(var(--destructive))"}];const i=`${n/(n-r)*100}%`;return[{offset:"0%",color:"hsl(var(--destructive))"},{offset:i,color:"hsl(var(--destructive))"},{offset:i,color:"hsl(var(--success))"},{offset:"100%",color:"hsl(var(--success))"}]}function lY(e){const t=e.map(s=>s.variance).filter(s=>s!=null);t.push(0);const r=Math.min(...t),n=Math.max(...t),i=Math.max(n-r,1),o=Math.max(i*.08,5);return[Math.floor((r-o)/5)*5,Math.ceil((n+o)/5)*5]}function Nk(e){return e>0?"hsl(var(--destructive))":e<0?"hsl(var(--success))":"hsl(var(--foreground))"}function sY(e){const{cx:t,cy:r,payload:n}=e;return t===void 0||r===void 0||n?.variance===null||n?.variance===void 0?null:A.jsx("circle",{className:"bb-burn-rate-active-dot",cx:t,cy:r,r:5,fill:Nk(n.variance),stroke:"hsl(var(--card))",strokeWidth:2})}function uY({active:e,payload:t}){const r=t?.find(s=>s.payload?.variance!==null&&s.payload?.variance!==void 0)?.payload;if(!e||!r||r.variance===null)return null;const i=r.variance>0?"Over pace":"Under pace",o=Nk(r.variance);return A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsxs("div",{className:"bb-chart-tooltip-title",children:["Day ",r.label]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:o}}),A.jsx("span",{children:i}),A.jsx("strong",{children:xe(r.variance)})]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Day spent"}),A.jsx("strong",{children:xe(r.dailySpend)})]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Total Spent"}),A.jsx("strong",{children:xe(r.actualSpend)})]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Limit"}),A.jsx("strong",{children:xe(r.expectedSpend)})]})]})}function Fv({label:e,value:t,description:r,accent:n=!1,control:i}){const o=n&&t!==null&&t!==void 0&&t>=0,s=t!=null&&t<0;return A.jsx(jl,{children:A.jsxs(Ja,{className:"bb-metric-card",children:[A.jsxs("div",{className:"bb-metric-head",children:[A.jsx("div",{className:"bb-metric-label",children:e}),i]}),A.jsx("div",{className:s?"bb-metric-value bb-negative":o?"bb-metric-value bb-positive":"bb-metric-value",children:xe(t)}),r?A.jsx("div",{className:"bb-metric-note",children:r}):null]})})}function cY(e,t){return e==null||t===null||t===void 0||t<=0?!1:e>=t*.9}function fY({value:e,minimum:t,ideal:r}){const n=r>0?Tl(e/r*100,0,100):0,i=r>0?Tl(t/r*100,0,100):0,o=e<=0?"empty":e<t?"low":cY(e,r)?"ideal":"minimum";return A.jsx(jl,{className:"bb-savings-metric-card",children:A.jsxs(Ja,{className:"bb-metric-card",children:[A.jsx("div",{className:"bb-metric-label",children:"Saved"}),A.jsx("div",{className:`bb-metric-value bb-savings-value bb-savings-value-${o}`,children:xe(e)}),A.jsxs("div",{className:`bb-savings-progress bb-savings-progress-${o}`,role:"img","aria-label":`${xe(e)} saved; minimum ${xe(t)}; ideal ${xe(r)}`,children:[A.jsxs("div",{className:"bb-savings-progress-track",children:[A.jsx("span",{className:"bb-savings-progress-fill",style:{width:`${n}%`}}),i>0&&i<100?A.jsx("span",{className:"bb-savings-progress-minimum-marker",style:{left:`${i}%`}}):null]}),A.jsxs("div",{className:"bb-savings-progress-labels",children:[A.jsxs("span",{children:["Minimum ",xe(t)]}),A.jsxs("span",{children:["Ideal ",xe(r)]})]})]})]})})}const dY=g.memo(function({data:t,categoryBalances:r,categoryBudgets:n,amountSaved:i,filter:o,onFilterChange:s,projected:u,collapseKey:f}){const d=gY(r,o),h=xY(r,o),v=bY(t,d,o,i,h),[m,b]=wY(),S=SY(v,b),w=ao(v.filter(O=>O.key!=="left")),P=Dk(o,r,w),E=o==="all"?F9(n):n[o],j=E>0?w/E*100:0;return A.jsxs("div",{className:"bb-chart-stack bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-chart-page-header bb-category-mix-summary",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-chart-kicker",children:o==="savings"?"Saved":"Spent"}),A.jsx("div",{className:"bb-chart-total",children:xe(w)}),A.jsx("div",{className:"bb-chart-mode-note",children:u?"Projected":"Current"}),E>0?A.jsxs("div",{className:"bb-chart-budget-note",children:[xe(E)," budget • ",j.toFixed(2),"% used"]}):null]}),A.jsxs("div",{className:"bb-chart-page-header-actions",children:[A.jsx(Q9,{filter:o,onFilterChange:s}),P?A.jsx(Rk,{pressure:P}):null]})]}),A.jsx("div",{className:"bb-chart-layout bb-category-chart-layout bb-chart-page-body",children:A.jsx(eo,{config:KG(v),className:"bb-chart-box bb-category-chart-box",children:A.jsx(hY,{hostRef:m,layout:S,filter:o,children:A.jsx(pY,{data:v,layout:S})})})}),A.jsx("div",{className:"bb-chart-page-footer",children:A.jsx(Hk,{summary:"Categories",title:"Category details",collapseKey:f,children:A.jsx("div",{className:"bb-legend-list",children:v.map(O=>A.jsxs("div",{className:"bb-legend-row",children:[A.jsx("span",{className:"bb-swatch",style:{backgroundColor:O.color}}),A.jsx("span",{children:O.label}),A.jsxs("strong",{children:[xe(O.amount)," ",A.jsx("span",{children:b9(O.percentage)})]})]},O.key))})})})]})},mY);function hY({hostRef:e,layout:t,filter:r,children:n}){const i=IY(t,r);return A.jsx("div",{ref:e,className:"bb-category-pie-host","data-bb-pie-fit-padding":t.containerPadding,"data-bb-pie-layout-motion":i.phase,"data-bb-pie-layout-motion-revision":i.revision,"data-bb-pie-layout-travel-x":i.travelX,"data-bb-pie-layout-travel-y":i.travelY,"data-bb-pie-motion-isolated":"true","data-bb-pie-animation-synchronized":"true",style:{"--bb-pie-layout-offset-x":`${i.offsetX}px`,"--bb-pie-layout-offset-y":`${i.offsetY}px`},children:n})}const pY=g.memo(function({data:t,layout:r}){return A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(TV,{margin:r.margin,children:[A.jsx(to,{content:A.jsx(CH,{})}),A.jsx(eP,{data:t,dataKey:"amount",nameKey:"label",cx:r.cx,cy:r.cy,innerRadius:r.innerRadius,outerRadius:r.outerRadius,startAngle:_c,endAngle:Uv,paddingAngle:Kv,animationBegin:0,animationDuration:520,animationEasing:"ease-out",label:r.showLabels?n=>NY(n,r):!1,labelLine:r.showLabels?n=>MY(n,r):!1,children:t.map(n=>A.jsx(Ua,{fill:n.color},n.key))})]})})},vY);function vY(e,t){return Mk(e.data,t.data)&&_Y(e.layout,t.layout)}function mY(e,t){return e.amountSaved===t.amountSaved&&e.categoryBudgets.needs===t.categoryBudgets.needs&&e.categoryBudgets.wants===t.categoryBudgets.wants&&e.categoryBudgets.savings===t.categoryBudgets.savings&&yY(e.categoryBalances,t.categoryBalances)&&e.filter===t.filter&&e.projected===t.projected&&e.collapseKey===t.collapseKey&&Mk(e.data,t.data)}function yY(e,t){return e.raw.needs===t.raw.needs&&e.raw.wants===t.raw.wants&&e.raw.savings===t.raw.savings&&e.remaining.needs===t.remaining.needs&&e.remaining.wants===t.remaining.wants&&e.remaining.savings===t.remaining.savings&&e.totalOverspend===t.totalOverspend&&e.transfers.length===t.transfers.length&&e.transfers.every((r,n)=>{const i=t.transfers[n];return r.from===i.from&&r.to===i.to&&r.amount===i.amount})}function Mk(e,t){return e.length!==t.length?!1:e.every((r,n)=>{const i=t[n];return r.key===i.key&&r.label===i.label&&r.amount===i.amount&&r.percentage===i.percentage&&r.color===i.color})}function gY(e,t){return t!=="all"?e.remaining[t]:Ce(Object.values(e.remaining).reduce((r,n)=>r+n,0))}const Nl={needs:"Needs",wants:"Wants",savings:"Savings"};function Dk(e,t,r){let n=null;if(e==="all"&&t.totalOverspend>0&&(n={label:"Budget overspend",amount:t.totalOverspend,note:"Needs, Wants, and Savings funds are fully depleted",tone:"danger"}),e!=="all"){const i=t.deficits[e],o=t.transfers.filter(u=>u.to===e),s=Math.max(-t.remaining[e],0);if(i>0){const u=o.map(d=>`${xe(d.amount)} from ${Nl[d.from]}`).join(" + "),f=s>0?`${xe(s)} remains beyond the total budget`:"";n={label:e==="savings"?"Over saving":`${Nl[e]} overspend`,amount:i,note:u?`Covered by ${u}${f?`; ${f}`:""}`:f||"No other category funds were needed",tone:"danger"}}else{const u=t.transfers.filter(d=>d.from===e),f=Ce(u.reduce((d,h)=>d+h.amount,0));if(f>0){const d=[...new Set(u.map(h=>Nl[h.to]))];n={label:d.length===1?`${d[0]} overspend impact`:"Category overspend impact",amount:f,note:`${xe(f)} moved from ${Nl[e]} to cover ${d.join(" + ")} overspend`,tone:"impact"}}}}return n?{...n,fillPercent:Tl(n.amount/Math.max(r,n.amount)*100,8,100)}:null}function Rk({pressure:e}){return A.jsxs("div",{className:`bb-category-pressure bb-category-pressure-${e.tone}`,"data-bb-category-balance-alert":e.tone,children:[A.jsxs("div",{className:"bb-category-pressure-head",children:[A.jsx("span",{children:e.label}),A.jsx("strong",{children:xe(e.amount)})]}),A.jsx("div",{className:"bb-category-pressure-track",role:"img","aria-label":`${e.label}: ${xe(e.amount)}`,children:A.jsx("span",{style:{width:`${e.fillPercent}%`}})}),A.jsx("div",{className:"bb-category-pressure-note",children:e.note})]})}function bY(e,t,r,n,i=[]){let o=e.filter(d=>r==="needs"?jk.has(d.key):r==="wants"?Ik.has(d.key):r==="all"&&d.key!=="savings");r==="savings"&&(o=n>0?[{key:"savings",label:"Saved",amount:Ce(n),percentage:0,color:T9}]:[]),o=[...o,...i];const s=Math.max(Ce(t),0),u=s>0?[{key:"left",label:"Income left",amount:s,percentage:0,color:_9},...o]:o,f=ao(u);return u.map(d=>({...d,percentage:f?Ce(d.amount/f*100):0}))}function xY(e,t){return t==="all"?[]:e.transfers.filter(r=>r.from===t).map(r=>({key:`coverage-${r.from}-${r.to}`,label:`${Nl[r.to]} overspend coverage`,amount:r.amount,percentage:0,color:r.to==="needs"?"#f97316":r.to==="wants"?"#ec4899":"#22c55e"}))}function wY(){const e=g.useRef(null),[t,r]=g.useState({width:0,height:0});return g.useEffect(()=>{const n=e.current;if(!n)return;const i=()=>{const s=n.getBoundingClientRect();r(u=>{const f={width:Math.max(0,Math.round(s.width*10)/10),height:Math.max(0,Math.round(s.height*10)/10)};return u.width===f.width&&u.height===f.height?u:f})};i();const o=new ResizeObserver(i);return o.observe(n),()=>o.disconnect()},[]),[e,t]}function SY(e,t){const r=_l("(max-width: 520px)"),n=_l("(max-width: 860px)");let i;return r?i={fallbackWidth:360,fallbackHeight:330,minOuterRadius:72,maxOuterRadius:122,innerRadiusRatio:72/122,labelOffset:20,labelGap:Wv,containerPadding:12,compactLabel:!1,showLabels:!1}:n?i={fallbackWidth:760,fallbackHeight:390,minOuterRadius:96,maxOuterRadius:150,innerRadiusRatio:86/150,labelOffset:26,labelGap:Wv,containerPadding:14,compactLabel:!1,showLabels:!0}:i={fallbackWidth:1100,fallbackHeight:460,minOuterRadius:120,maxOuterRadius:220,innerRadiusRatio:122/220,labelOffset:42,labelGap:Wv,containerPadding:16,compactLabel:!1,showLabels:!0},EY(e,t,i)}function $k(e){return`${Math.min(e??0,8)*10+35}ms`}function Lk(e,t){return e?.color??t??"hsl(var(--foreground))"}const Wv=10,zk=8,AY=18,PY=4,Bk=54,_c=0,Uv=360,Kv=1,Fk=new Map;let oo;function EY(e,t,r){const n=t.width||r.fallbackWidth,i=t.height||r.fallbackHeight,o=Math.max(1,n-r.containerPadding*2),s=Math.max(1,i-r.containerPadding*2),u=Math.min(r.minOuterRadius,r.maxOuterRadius,o/2,s/2);let f=Math.min(Bk,u),d=r.maxOuterRadius;for(let P=0;P<24;P+=1){const E=(f+d)/2,j=Wk(e,E,r);j.maxX-j.minX<=o&&j.maxY-j.minY<=s?f=E:d=E}const h=Math.max(Bk,Math.min(r.maxOuterRadius,f)),v=Wk(e,h,r),m=v.maxX-v.minX,b=v.maxY-v.minY,S=r.containerPadding+(o-m)/2-v.minX,w=r.containerPadding+(s-b)/2-v.minY;return{...r,cx:S,cy:w,innerRadius:h*r.innerRadiusRatio,outerRadius:h,labelDeltas:kY(e,h,r),margin:{top:0,right:0,bottom:0,left:0}}}function Wk(e,t,r){const n={minX:-t,maxX:t,minY:-t,maxY:t};if(!r.showLabels)return n;for(const i of Uk(e,t,r)){const o=i.cos*(t+r.labelOffset)+i.delta.x,s=i.sin*(t+r.labelOffset)+i.delta.y,u=i.cos>=0,f=o+(u?r.labelGap:-r.labelGap),d=u?f:f-i.labelWidth,h=u?f+i.labelWidth:f;n.minX=Math.min(n.minX,o,d),n.maxX=Math.max(n.maxX,o,h),n.minY=Math.min(n.minY,s-zk),n.maxY=Math.max(n.maxY,s+zk)}return n}function Uk(e,t,r){const n=ao(e),i=e.filter(d=>d.amount!==0).length,o=Math.sign(Uv-_c)||1,s=Math.abs(Uv-_c)-i*Kv;let u=_c;const f=e.map((d,h)=>{h>0&&d.amount!==0&&(u+=o*Kv);const v=n?s*d.amount/n:0,m=u+o*v/2;u+=o*v;const b=-m*Math.PI/180;return{key:d.key,cos:Math.cos(b),sin:Math.sin(b),labelWidth:OY(d,r.compactLabel),delta:{x:0,y:0}}});for(const d of[-1,1]){const h=f.filter(m=>(m.cos>=0?1:-1)===d).sort((m,b)=>m.sin-b.sin);let v=Number.NEGATIVE_INFINITY;for(const m of h){const b=m.sin*(t+r.labelOffset),S=Math.max(b,v+AY);m.delta.y=S-b,v=S}if(h.length){const m=h.reduce((b,S)=>b+S.delta.y,0)/h.length;for(const b of h)b.delta.y-=m}}return f}function kY(e,t,r){return Object.fromEntries(Uk(e,t,r).map(n=>[n.key,n.delta]))}function OY(e,t){const r=t?`${e.label}
 ${xe(e.amount)}`:`${e.label} ${xe(e.amount)}`,n=Fk.get(r);if(n!==void 0)return n;oo===void 0&&(oo=typeof document>"u"?null:document.createElement("canvas").getContext("2d"),oo&&(oo.font="650 12px Inter, ui-sans-serif, system-ui, sans-serif"));const i=oo?oo.measureText(r.replace(`
 `," ")).width:r.replace(`
-`," ").length*7,o=Math.ceil(i+PY);return Fk.set(r,o),o}const CY=520,jY=80;function IY(e,t){const r=g.useRef(null),n=g.useRef(0),[i,o]=g.useState({phase:"idle",offsetX:0,offsetY:0,travelX:0,travelY:0,revision:0});return g.useLayoutEffect(()=>{const s=r.current;if(r.current={filter:t,cx:e.cx,cy:e.cy},!s)return;const u=s.cx-e.cx,f=s.cy-e.cy;if(Math.abs(u)<.1&&Math.abs(f)<.1){o(b=>b.phase==="idle"?b:{...b,phase:"idle",offsetX:0,offsetY:0});return}n.current+=1;const d=n.current;o({phase:"primed",offsetX:u,offsetY:f,travelX:u,travelY:f,revision:d});let h=0,v=0,m=0;return h=window.requestAnimationFrame(()=>{v=window.requestAnimationFrame(()=>{o({phase:"active",offsetX:0,offsetY:0,travelX:u,travelY:f,revision:d}),m=window.setTimeout(()=>{o(b=>b.revision===d?{phase:"idle",offsetX:0,offsetY:0,travelX:u,travelY:f,revision:d}:b)},CY+jY)})}),()=>{window.cancelAnimationFrame(h),window.cancelAnimationFrame(v),window.clearTimeout(m)}},[t]),g.useLayoutEffect(()=>{r.current?.filter===t&&(r.current={filter:t,cx:e.cx,cy:e.cy})},[t,e.cx,e.cy]),i}function _Y(e,t){const r=Object.keys(e.labelDeltas),n=Object.keys(t.labelDeltas);return e.fallbackWidth===t.fallbackWidth&&e.fallbackHeight===t.fallbackHeight&&e.minOuterRadius===t.minOuterRadius&&e.maxOuterRadius===t.maxOuterRadius&&e.innerRadiusRatio===t.innerRadiusRatio&&e.labelOffset===t.labelOffset&&e.labelGap===t.labelGap&&e.containerPadding===t.containerPadding&&e.compactLabel===t.compactLabel&&e.showLabels===t.showLabels&&e.cx===t.cx&&e.cy===t.cy&&e.innerRadius===t.innerRadius&&e.outerRadius===t.outerRadius&&e.margin.top===t.margin.top&&e.margin.right===t.margin.right&&e.margin.bottom===t.margin.bottom&&e.margin.left===t.margin.left&&r.length===n.length&&r.every(i=>e.labelDeltas[i]?.x===t.labelDeltas[i]?.x&&e.labelDeltas[i]?.y===t.labelDeltas[i]?.y)}function TY(e,t,r){const n=typeof e=="number"?e:typeof e=="string"&&e.trim()?Number(e):Number.NaN;return Number.isFinite(n)?t==="start"?n+r:t==="end"?n-r:e:e}function NY(e,t){const{name:r,value:n,payload:i,fill:o,index:s}=e,u=DY(e,t),f=i?.label??r??"",d=i?.amount??Number(n??0),h=TY(u.x,u.textAnchor,t.labelGap),v=xe(d);return A.jsx("text",{x:h,y:u.y,textAnchor:u.textAnchor,dominantBaseline:"central",className:"bb-pie-metric-label",style:{animationDelay:$k(s),fill:Lk(i,o)},children:t.compactLabel?A.jsxs(A.Fragment,{children:[A.jsx("tspan",{x:h,dy:"-0.35em",children:f}),A.jsx("tspan",{x:h,dy:"1.25em",children:v})]}):`${f} ${v}`})}function MY(e,t){const{payload:r,stroke:n,index:i}=e,o=RY(e,t);return o?A.jsx("path",{className:"bb-pie-metric-label-line",d:`M${o.start.x},${o.start.y}L${o.end.x},${o.end.y}`,fill:"none",pathLength:1,stroke:Lk(r,n),strokeLinecap:"round",strokeWidth:1.5,style:{animationDelay:$k(i)}}):A.jsx("path",{className:"bb-pie-metric-label-line",d:"",fill:"none",opacity:0})}function DY(e,t){const{x:r,y:n,textAnchor:i}=e,o=Kk(e,t),s=Vv(e,t.outerRadius+t.labelOffset);return s?{x:s.x+o.x,y:s.y+o.y,textAnchor:s.x>s.cx?"start":"end"}:{x:r,y:n,textAnchor:i}}function RY(e,t){const r=Kk(e,t),n=Vv(e,t.outerRadius),i=Vv(e,t.outerRadius+t.labelOffset);if(n&&i)return{start:n,end:{...i,x:i.x+r.x,y:i.y+r.y}};const{points:o}=e,[s,u]=o??[];return s?.x===void 0||s?.y===void 0||u?.x===void 0||u?.y===void 0?null:{start:s,end:u}}function Kk(e,t){const{payload:r}=e;return r?t.labelDeltas[r.key]??{x:0,y:0}:{x:0,y:0}}function Vv(e,t){const{cx:r,cy:n,midAngle:i}=e;if(r===void 0||n===void 0||i===void 0)return null;const o=-i*Math.PI/180;return{cx:r,x:r+Math.cos(o)*t,y:n+Math.sin(o)*t}}function $Y({data:e,total:t,elapsedDays:r,filter:n,defaultDetailsOpen:i}){const o=e.reduce((v,m)=>!v||m.amount>v.amount?m:v,null),s=r?t/r:0,u=LY(e),f=BY(e,u),d=n==="all",h=n==="needs"?no:n==="wants"?io:"hsl(var(--chart-1))";return A.jsxs("div",{className:"bb-chart-layout",children:[A.jsx(eo,{config:d?{chartNeedsAmount:{label:"Needs",color:no},chartWantsAmount:{label:"Wants",color:io}}:{chartAmount:{label:"Amount",color:h}},className:"bb-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:f,margin:{top:12,right:16,left:0,bottom:0},children:[A.jsx(Ya,{className:"bb-daily-spending-grid",vertical:!1,stroke:_k,strokeDasharray:"3 3"}),A.jsx(Xa,{dataKey:"label",tick:{className:"bb-daily-spending-x-axis-label",fill:N9},tickLine:!1,axisLine:!1}),A.jsx(qa,{domain:u.domain,ticks:u.ticks,scale:u.compressed?"linear":"sqrt",tick:{fill:_k},tickFormatter:v=>UY(Number(v),u),tickLine:!1,axisLine:!1,width:58}),A.jsx(to,{content:A.jsx(GY,{filter:n}),cursor:{fill:YY(n)}}),d?A.jsxs(A.Fragment,{children:[A.jsx(Ga,{dataKey:"chartNeedsAmount",name:"Needs",stackId:"daily",fill:no,radius:zv}),A.jsx(Ga,{dataKey:"chartWantsAmount",name:"Wants",stackId:"daily",fill:io,radius:zv})]}):A.jsx(Ga,{dataKey:"chartAmount",name:"Daily spending",fill:h,radius:zv})]})})}),A.jsxs("div",{className:"bb-chart-side",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-chart-kicker",children:"Total Spent"}),A.jsx("div",{className:"bb-chart-total",children:xe(t)})]}),A.jsx(Hv,{summary:"Details",defaultOpen:i,children:A.jsx(Vk,{rows:[["Tracked days",String(e.length)],["Avg/day",xe(s)],["Days counted",String(r)],["Highest day",o?`${o.label} - ${xe(o.amount)}`:"N/A"]]})})]})]})}function LY(e){const t=e.map(f=>f.amount).filter(f=>f>0).sort((f,d)=>d-f),r=t[0]??0,n=t[1]??0,i=KY(e);if(!(r>=500&&n>0&&r>=n*2.5))return{compressed:!1,breakAt:0,peak:r,visualMax:i[1],domain:i,ticks:VY(i)};const s=zY(n),u=s*1.1;return{compressed:!0,breakAt:s,peak:r,visualMax:u,domain:[0,u*1.04],ticks:[0,s*.25,s*.5,s*.75,s,u]}}function zY(e){const t=e>=1e3?100:e>=250?50:e>=100?25:e>=50?10:5;return Math.max(t,Math.ceil(e/t)*t)}function BY(e,t){return e.map(r=>{const n=FY(r.amount,t),i=r.amount>0?n/r.amount:0;return{...r,chartAmount:n,chartNeedsAmount:r.needsAmount*i,chartWantsAmount:r.wantsAmount*i}})}function FY(e,t){if(!t.compressed||e<=t.breakAt||t.peak<=t.breakAt)return e;const r=(e-t.breakAt)/(t.peak-t.breakAt);return t.breakAt+r*(t.visualMax-t.breakAt)}function WY(e,t){if(!t.compressed||e<=t.breakAt||t.visualMax<=t.breakAt)return e;const r=(e-t.breakAt)/(t.visualMax-t.breakAt);return t.breakAt+r*(t.peak-t.breakAt)}function UY(e,t){const r=WY(e,t);if(r>=1e3){const n=r%1e3===0?0:1;return`$${(r/1e3).toFixed(n)}k`}return`$${Math.round(r)}`}function KY(e){const t=Math.max(0,...e.map(n=>n.amount));if(t<=0)return[0,1];const r=t*1.06;return[0,Math.max(1,Math.ceil(r/10)*10)]}function VY([,e]){if(e<=0)return[0];if(e<=160){const r=e<=60?10:20;return HY(r,e)}const t=[0,25,50,75,100];for(let r=200;r<e;r+=100)t.push(r);return t.filter(r=>r<e)}function HY(e,t){const r=[];for(let n=0;n<t;n+=e)r.push(n);return r}function YY(e){return e==="needs"?"rgb(37 99 235 / 0.14)":e==="wants"?"rgb(124 58 237 / 0.14)":"hsl(var(--foreground) / 0.08)"}function GY({active:e,payload:t,filter:r}){const n=(t??[]).find(o=>o.payload)?.payload;if(!e||!n)return null;const i=r==="all"?[{label:"Needs",amount:n.needsAmount,color:no},{label:"Wants",amount:n.wantsAmount,color:io}].filter(o=>o.amount>0):[{label:r==="needs"?"Needs":"Wants",amount:n.amount,color:r==="needs"?no:io}];return A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsxs("div",{className:"bb-chart-tooltip-title",children:["Day ",n.label]}),i.map((o,s)=>A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:o.color}}),A.jsx("span",{children:o.label}),A.jsx("strong",{children:xe(o.amount)})]},`${o.label}-${o.amount}-${s}`)),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Total"}),A.jsx("strong",{children:xe(n.amount)})]})]})}function XY({entries:e}){const t=!_l("(max-width: 640px)"),r=e.slice(0,10),n=r.map((i,o)=>({label:Ml(i),amount:i.amount,color:ZY(o,r.length)}));return A.jsx(eo,{config:{amount:{label:"Amount",color:"hsl(var(--chart-2))"}},className:"bb-insight-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:n,layout:"vertical",margin:{top:12,right:22,left:t?20:0,bottom:12},children:[A.jsx(Ya,{horizontal:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{type:"number",tickFormatter:i=>`$${i}`,tickLine:!1,axisLine:!1}),A.jsx(qa,{dataKey:"label",type:"category",width:t?148:0,tick:t,tickFormatter:i=>QY(i,22),tickLine:!1,axisLine:!1}),A.jsx(to,{content:A.jsx(qY,{}),cursor:{fill:"hsl(var(--foreground) / 0.08)"}}),A.jsx(Ga,{dataKey:"amount",name:"Expense amount",fill:"hsl(var(--chart-2))",radius:[0,6,6,0],children:n.map((i,o)=>A.jsx(Ua,{fill:i.color},`${i.label}-${o}`))})]})})})}function qY({active:e,payload:t}){const r=t?.find(n=>n.payload)?.payload;return!e||!r?null:A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:r.label}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:r.color}}),A.jsx("span",{children:"Expense amount"}),A.jsx("strong",{children:xe(r.amount)})]})]})}function ZY(e,t){if(t<=1)return Ic[0];const r=Math.round(e/(t-1)*(Ic.length-1));return Ic[Math.min(Math.max(r,0),Ic.length-1)]}function QY(e,t){const r=String(e??"");return r.length<=t?r:`${r.slice(0,Math.max(t-3,0))}...`}function JY({data:e}){const t=!_l("(max-width: 640px)"),r=e.slice(0,10);return A.jsx(eo,{config:{count:{label:"Occurrences",color:Bv}},className:"bb-insight-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:r,layout:"vertical",margin:{top:12,right:22,left:t?20:0,bottom:12},children:[A.jsx(Ya,{horizontal:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{type:"number",tickFormatter:n=>String(n),tickLine:!1,axisLine:!1,allowDecimals:!1}),A.jsx(qa,{dataKey:"label",type:"category",width:t?148:0,tick:t,tickLine:!1,axisLine:!1}),A.jsx(to,{content:A.jsx(eG,{}),cursor:{fill:"rgb(8 145 178 / 0.14)"}}),A.jsx(Ga,{dataKey:"count",name:"Occurrences",fill:Bv,radius:[0,6,6,0]})]})})})}function eG({active:e,payload:t}){const r=t?.find(n=>n.payload)?.payload;return!e||!r?null:A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:r.label}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:Bv}}),A.jsx("span",{children:"Occurrences"}),A.jsx("strong",{children:r.count})]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Total"}),A.jsx("strong",{children:xe(r.amount)})]})]})}function tG({topEntries:e,merchantOccurrences:t,onViewChange:r}){const[n,i]=g.useState("largest"),o=e.filter(u=>u.category.trim().toLowerCase()!=="rent"&&Ml(u).trim().toLowerCase()!=="rent").sort((u,f)=>f.amount-u.amount||f.date.localeCompare(u.date)||Ml(u).localeCompare(Ml(f))),s=u=>{const f=u;f!==n&&(r(),i(f))};return A.jsx(jl,{children:A.jsxs(y9,{value:n,onValueChange:s,className:"bb-card-tabs",children:[A.jsx(Cv,{children:A.jsxs("div",{className:"bb-card-title-row bb-inline-toggle-row",children:[A.jsx(jv,{children:"Expense Highlights"}),A.jsxs(Ok,{"data-bb-tooltip-dismiss-trigger":"expense-highlights",children:[A.jsx($v,{value:"largest",children:"Largest"}),A.jsx($v,{value:"merchants",children:"Most Frequent"})]})]})}),A.jsxs(Ja,{className:"bb-expense-insights-content",children:[A.jsx(Lv,{value:"largest",children:A.jsxs("div",{className:"bb-insight-panel",children:[A.jsx(XY,{entries:o}),A.jsx(Gk,{total:o.length,children:A.jsx(nG,{entries:o})})]})}),A.jsx(Lv,{value:"merchants",children:A.jsxs("div",{className:"bb-insight-panel",children:[A.jsx(JY,{data:t}),A.jsx(Gk,{total:t.length,children:A.jsx(aG,{rows:t})})]})})]})]})})}function Vk({rows:e}){return A.jsx("div",{className:"bb-stat-list",children:e.map(([t,r])=>A.jsxs("div",{className:"bb-stat-row",children:[A.jsx("span",{children:t}),A.jsx("strong",{children:r})]},t))})}function Hv({summary:e,children:t,collapseKey:r=0,defaultOpen:n=!1}){const[i,o]=g.useState(n);return g.useEffect(()=>{o(n)},[r,n]),A.jsxs("div",{className:"bb-details-panel","data-state":i?"open":"closed",children:[A.jsx("button",{type:"button",className:"bb-details-toggle","aria-expanded":i,onClick:()=>o(s=>!s),children:e}),A.jsx("div",{className:"bb-details-content","aria-hidden":!i,children:A.jsx("div",{className:"bb-details-content-inner",children:t})})]})}function rG(e){g.useLayoutEffect(()=>{if(!e)return;const t=document.body,r=document.documentElement,n=window.scrollY,i={bodyPosition:t.style.position,bodyTop:t.style.top,bodyWidth:t.style.width,bodyOverflow:t.style.overflow,bodyPaddingRight:t.style.paddingRight,rootOverflow:r.style.overflow},o=Math.max(window.innerWidth-r.clientWidth,0);return t.style.position="fixed",t.style.top=`-${n}px`,t.style.width="100%",t.style.overflow="hidden",t.style.paddingRight=o>0?`${o}px`:i.bodyPaddingRight,r.style.overflow="hidden",()=>{t.style.position=i.bodyPosition,t.style.top=i.bodyTop,t.style.width=i.bodyWidth,t.style.overflow=i.bodyOverflow,t.style.paddingRight=i.bodyPaddingRight,r.style.overflow=i.rootOverflow,r.style.setProperty("--bb-viewport-scrollbar-width",`${Math.max(window.innerWidth-r.clientWidth,0)}px`),window.scrollTo(0,n)}},[e])}function Hk({summary:e,title:t,children:r,collapseKey:n=0}){const[i,o]=g.useState(!1),s=g.useRef(null);rG(i),g.useEffect(()=>{o(!1)},[n]),g.useEffect(()=>{const d=s.current;d&&(i&&!d.open?d.showModal():!i&&d.open&&d.close())},[i]);const u=()=>o(!1),f=typeof document>"u"?null:Hf.createPortal(A.jsx("dialog",{ref:s,className:"bb-details-dialog","aria-label":t,onCancel:u,onClose:u,onTouchStart:d=>d.stopPropagation(),onTouchMove:d=>d.stopPropagation(),onTouchEnd:d=>d.stopPropagation(),onTouchCancel:d=>d.stopPropagation(),onClick:d=>{d.target===d.currentTarget&&u()},children:A.jsxs("div",{className:"bb-details-dialog-surface",children:[A.jsxs("div",{className:"bb-details-dialog-header",children:[A.jsx("strong",{children:t}),A.jsx("button",{type:"button",className:"bb-details-dialog-close","aria-label":`Close ${t}`,onClick:u,children:A.jsx("span",{"aria-hidden":"true",children:"×"})})]}),A.jsx("div",{className:"bb-details-dialog-body",children:r})]})}),document.body);return A.jsxs("div",{className:"bb-modal-details",children:[A.jsx("button",{type:"button",className:"bb-details-toggle","aria-haspopup":"dialog","aria-expanded":i,onClick:()=>o(!0),children:e}),f]})}function Yk({expanded:e,total:t,onToggle:r}){return A.jsx("button",{type:"button",className:"bb-expand-toggle","aria-expanded":e,onClick:r,children:e?"Collapse":`View all ${t}`})}function Gk({children:e,total:t}){const[r,n]=g.useState(!1);return A.jsxs("div",{className:"bb-hidden-list-panel",children:[A.jsx("div",{className:"bb-details-content","data-state":r?"open":"closed","aria-hidden":!r,children:A.jsx("div",{className:"bb-details-content-inner",children:e})}),A.jsx(Yk,{expanded:r,total:t,onToggle:()=>n(i=>!i)})]})}function Ml(e){return e.item||e.location||"Transaction"}function nG({entries:e}){return e.length?A.jsx(iG,{entries:e}):A.jsx("div",{className:"bb-empty",children:"No shared expense entries found."})}function iG({entries:e,hideHeader:t=!1}){return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[t?null:A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Item"}),A.jsx("th",{children:"Category"}),A.jsx("th",{children:"Amount"})]})}),A.jsx("tbody",{children:e.map((r,n)=>A.jsxs("tr",{children:[A.jsx("td",{children:Ml(r)}),A.jsx("td",{children:r.category}),A.jsx("td",{className:"bb-amount",children:xe(r.amount)})]},`${r.date}-${r.category}-${r.amount}-${n}`))})]})})}function aG({rows:e}){return e.length?A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Location"}),A.jsx("th",{children:"Count"}),A.jsx("th",{children:"Total"})]})}),A.jsx("tbody",{children:e.map(t=>A.jsxs("tr",{children:[A.jsx("td",{children:t.label}),A.jsx("td",{children:t.count}),A.jsx("td",{className:"bb-amount",children:xe(t.amount)})]},t.label))})]})}):A.jsx("div",{className:"bb-empty",children:"No merchant activity found."})}function oG({entries:e,categoryColors:t}){if(!e.length)return A.jsx("div",{className:"bb-empty",children:"No shared expense entries found."});const r=new Map;for(const n of e){const i=n.date?n.date.split("/")[1]||n.date:"No date";r.set(i,[...r.get(i)||[],n])}return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Day"}),A.jsx("th",{children:"Total"}),A.jsx("th",{children:"Transactions"})]})}),A.jsx("tbody",{children:Array.from(r.entries()).sort(lG).map(([n,i])=>{const o=i.reduce((s,u)=>s+u.amount,0);return A.jsxs("tr",{children:[A.jsx("td",{children:n}),A.jsx("td",{className:"bb-amount",children:xe(o)}),A.jsx("td",{children:A.jsx("div",{className:"bb-transaction-list",children:i.map((s,u)=>A.jsxs("div",{children:[A.jsx("strong",{className:"bb-transaction-category",style:{color:s.categoryColor??t[s.category]},children:s.category})," ",s.item||s.location||"Transaction"," - ",xe(s.amount),A.jsxs("span",{children:[" (",s.person,")"]})]},`${s.category}-${s.amount}-${u}`))})})]},n)})})]})})}function lG([e],[t]){const r=Number(e),n=Number(t);return Number.isFinite(r)&&Number.isFinite(n)?r-n:Number.isFinite(r)?-1:Number.isFinite(n)?1:e.localeCompare(t)}function sG(e,t){return t==="all"?e:e.filter(r=>Xk(r)===t)}function Xk(e){return I9.has(e.category)?"wants":"needs"}function uG(e,t,r){return[...e,...t.map(n=>{const i=Yv(n),o=n.kind==="bill"?n.group==="rent"?"Rent":"Bills & Utilities":"Subscription";return{date:`${r}/${n.day}`,category:o,amount:n.amount,person:n.kind==="bill"?"Need bill":i==="wants"?"Want sub":"Need sub",item:n.label,location:"",categoryColor:i==="wants"?io:no}})]}function cG(e,t){const r=new Map;for(const n of e){const i=dG(n);if(i===null)continue;const o=Xk(n);qk(r,i,o,n.amount)}for(const n of t)qk(r,String(n.day),Yv(n),n.amount);return Array.from(r.entries()).sort(([n],[i])=>pG(n,i)).map(([,n])=>n)}function fG(e,t){return Ce(e.reduce((r,n)=>r+n.amount,0)+t.reduce((r,n)=>r+n.amount,0))}function qk(e,t,r,n){const i=e.get(t)??{label:t,amount:0,needsAmount:0,wantsAmount:0};e.set(t,{...i,amount:Ce(i.amount+n),needsAmount:Ce(i.needsAmount+(r==="needs"?n:0)),wantsAmount:Ce(i.wantsAmount+(r==="wants"?n:0))})}function dG(e){if(!e.date||e.date.trim().toLowerCase()==="no date")return null;const t=e.date.split("/")[1]||e.date;return t.trim().toLowerCase()==="no date"?null:t}function hG(e,t,r){return e.filter(n=>n.kind!=="subscription"&&n.kind!=="bill"||!r&&n.projectedOnly?!1:t==="all"?!0:Yv(n)===t)}function Yv(e){return e.kind==="subscription"&&e.group==="subscriptions_wants"?"wants":"needs"}function pG(e,t){const r=Number(e),n=Number(t);return Number.isFinite(r)&&Number.isFinite(n)?r-n:Number.isFinite(r)?-1:Number.isFinite(n)?1:e.localeCompare(t)}const vG=[{value:"all",label:"All"},{value:"subscription",label:"Subs"}],Dl={subscription:{label:"Sub",color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"},bill:{label:"Bill",color:"#ea580c",background:"rgb(234 88 12 / 0.1)"},income:{label:"Income",color:"#16a34a",background:"rgb(22 163 74 / 0.1)"}};function mG({filter:e,onFilterChange:t}){return A.jsx("div",{className:"bb-tabs-list bb-subscription-tone-control",role:"tablist","aria-label":"Calendar view","data-bb-tooltip-dismiss-trigger":"calendar",children:vG.map(r=>A.jsx("button",{type:"button",className:"bb-tabs-trigger","data-state":e===r.value?"active":"inactive",role:"tab","aria-selected":e===r.value,onClick:()=>t(r.value),children:r.label},r.value))})}function yG({year:e,month:t,monthLabel:r,elapsedDays:n,events:i,filter:o,onFilterChange:s,projected:u,needs:f,wants:d,collapseKey:h}){const v=o==="all"?i:i.filter(w=>w.kind===o),m=u?v:v.filter(w=>!w.projectedOnly),b=m.filter(w=>w.kind!=="income").reduce((w,P)=>w+P.amount,0),S=[...f,...d];return A.jsx("div",{className:"bb-subscription-analytics",children:A.jsx("div",{className:"bb-subscription-tab-content bb-cashflow-calendar-content","data-state":"active","data-bb-calendar-filter":o,children:A.jsxs("div",{className:"bb-subscription-panel bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-subscription-summary bb-chart-page-header",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-subscription-total","data-bb-calendar-static-label":"month",children:WG(r)}),A.jsx("div",{className:"bb-chart-mode-note","data-bb-calendar-summary":"outflow",children:A.jsx(Zk,{value:xe(b)})})]}),A.jsxs("div",{className:"bb-chart-page-header-actions",children:[A.jsx(Ov,{variant:"secondary",children:A.jsx(Zk,{value:`${m.length} total`})}),A.jsx(mG,{filter:o,onFilterChange:s})]})]}),A.jsx("div",{className:"bb-chart-page-body",children:A.jsx(gG,{year:e,month:t,elapsedDays:n,events:i,filter:o})}),A.jsx("div",{className:"bb-chart-page-footer",children:S.length?A.jsx(Hk,{summary:"Details",title:"Calendar details",collapseKey:h,children:A.jsx($G,{items:S,showAll:!0})}):null})]})})})}function Zk({value:e}){const[t,r]=g.useState(e),[n,i]=g.useState(null),o=g.useRef(null);return g.useEffect(()=>{e!==t&&(o.current!==null&&window.clearTimeout(o.current),i(t),r(e),o.current=window.setTimeout(()=>{i(null),o.current=null},220))},[t,e]),g.useEffect(()=>()=>{o.current!==null&&window.clearTimeout(o.current)},[]),A.jsxs("span",{className:"bb-calendar-changing-value","aria-live":"polite","data-bb-calendar-changing-value":!0,children:[n!==null?A.jsx("span",{className:"bb-calendar-changing-value-out","aria-hidden":"true",children:n}):null,A.jsx("span",{className:n!==null?"bb-calendar-changing-value-in":void 0,"aria-label":t,children:t})]})}function gG({year:e,month:t,elapsedDays:r,events:n,filter:i}){const o=new Date(e,t,0).getDate(),s=new Date(e,t-1,1).getDay(),u=Math.ceil((s+o)/7)*7,f=Array.from({length:u},(h,v)=>{const m=v-s+1;return m>=1&&m<=o?m:null}),d=xG(n);return A.jsxs("div",{className:"bb-subscription-calendar","aria-label":"Cashflow calendar",children:[A.jsx("div",{className:"bb-calendar-head","aria-hidden":"true",children:RG.map(h=>A.jsx("span",{children:h},h))}),A.jsx("div",{className:"bb-calendar-grid",children:f.map((h,v)=>{const m=h===null?[]:d.get(h)??[],b=i==="all"?m:m.filter(E=>E.kind==="subscription"),S=h!==null&&UG(e,t,h),P=!(h!==null&&h<=r)||b.every(E=>E.projectedOnly);return A.jsx("div",{className:["bb-calendar-day",h===null?"bb-calendar-day-muted":"",b.length?"bb-calendar-day-has-items":"",S?"bb-calendar-day-today":""].filter(Boolean).join(" "),"aria-hidden":h===null,children:h===null?null:A.jsxs(A.Fragment,{children:[A.jsx("div",{className:"bb-calendar-day-number",children:h}),A.jsx("div",{className:"bb-calendar-marker-stack",children:b.length===1?(()=>{const E=b[0],j=Qk(E);return A.jsxs("button",{type:"button",className:["bb-subscription-marker","bb-calendar-marker-transition",P?"bb-subscription-marker-pending":""].filter(Boolean).join(" "),"data-calendar-event-kind":E.kind,style:{color:j.color,backgroundColor:j.background,borderColor:j.color},"aria-label":wG(E),children:[A.jsx("span",{className:"bb-subscription-marker-dot"}),A.jsx("span",{className:"bb-subscription-marker-name",children:E.label}),A.jsx("span",{className:"bb-subscription-marker-amount",children:xe(E.amount)}),A.jsx(SG,{event:E})]},bG(E,0))})():b.length>1?(()=>{const E=Qk(b[0]),j=b.reduce((O,C)=>O+C.amount,0);return A.jsxs("button",{type:"button",className:["bb-subscription-marker","bb-subscription-marker-more","bb-calendar-marker-transition",P?"bb-subscription-marker-pending":""].filter(Boolean).join(" "),style:{color:E.color,backgroundColor:E.background,borderColor:E.color},"aria-label":`${b.length} events on day ${h}`,children:[A.jsx("span",{className:"bb-subscription-marker-dot"}),A.jsxs("span",{className:"bb-calendar-marker-count","aria-hidden":"true",children:["+",b.length-1]}),A.jsxs("span",{className:"bb-subscription-marker-name",children:[b.length," events"]}),A.jsx("span",{className:"bb-subscription-marker-amount",children:xe(j)}),A.jsx(AG,{events:b,day:h})]},`events-${i}-${h}`)})():null})]})},`${h??"blank"}-${v}`)})})]})}function bG(e,t){return[e.kind,e.group,e.day,e.label,e.amount,e.projectedOnly?"projected":"actual",t].join("-")}function xG(e){const t=new Map;for(const r of e)t.set(r.day,[...t.get(r.day)??[],r]);return t}function Qk(e){return e.group==="static_bills_subscriptions_needs"?{...Dl.subscription,color:"#2563eb",background:"rgb(37 99 235 / 0.1)"}:e.group==="subscriptions_wants"?{...Dl.subscription,color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"}:e.group==="rent"?{...Dl.bill,color:"#dc2626",background:"rgb(220 38 38 / 0.1)"}:Dl[e.kind]}function wG(e){return`${e.label} - ${Gv(e)} - ${xe(e.amount)}`}function SG({event:e}){return A.jsxs("span",{className:"bb-subscription-tooltip",role:"tooltip",children:[A.jsx("strong",{children:e.label}),A.jsx("span",{children:Gv(e)}),A.jsx("span",{className:"bb-subscription-tooltip-amount",children:xe(e.amount)})]})}function AG({events:e,day:t}){return A.jsxs("span",{className:"bb-subscription-tooltip bb-subscription-tooltip-wide",role:"tooltip",children:[A.jsxs("strong",{children:["More on day ",t]}),e.map((r,n)=>A.jsxs("span",{children:[r.label," - ",Gv(r)," - ",xe(r.amount)]},`${r.kind}-${r.label}-${r.amount}-${n}`))]})}function Gv(e){return e.kind==="subscription"?e.group==="subscriptions_wants"?"Want sub":"Need sub":Dl[e.kind].label}function PG({items:e,events:t,year:r,month:n,projected:i,collapseKey:o}){const s=kG(t),u=OG(e,s,i);return A.jsxs("div",{className:"bb-bills-analytics bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-bills-analytics-head bb-chart-page-header",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-chart-kicker",children:"Bills & Utilities"}),A.jsx("div",{className:"bb-chart-total",children:xe(u)}),A.jsx("div",{className:"bb-chart-mode-note",children:i?"Projected":"Current"})]}),A.jsxs(Ov,{variant:"secondary",children:[e.length," tracked"]})]}),e.length?A.jsx(EG,{items:e,billEvents:s,year:r,month:n}):A.jsx("div",{className:"bb-empty bb-chart-page-body",children:"No bill history found."}),A.jsx("div",{className:"bb-chart-page-footer",children:e.length?A.jsx(Hv,{summary:"Details",collapseKey:o,children:A.jsx(MG,{items:e})}):null})]})}function EG({items:e,billEvents:t,year:r,month:n}){const i=TG(e),o=CG(t);return A.jsx(eo,{config:NG(e),className:"bb-bills-chart-box bb-chart-page-body",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(EE,{data:i,margin:{top:12,right:20,left:0,bottom:6},children:[A.jsx(Ya,{vertical:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{dataKey:"label",tickLine:!1,axisLine:!1}),A.jsx(qa,{tickFormatter:s=>`$${s}`,tickLine:!1,axisLine:!1,width:54}),A.jsx(to,{content:A.jsx(jG,{eventByLabel:o,year:r,month:n})}),e.map((s,u)=>A.jsx(ov,{type:"monotone",dataKey:s.key,name:s.label,stroke:Xv(u),strokeWidth:2.5,connectNulls:!0,dot:{r:3},activeDot:{r:5}},s.key))]})})})}function kG(e){return e.filter(t=>t.kind==="bill"&&t.group==="bills_utilities")}function OG(e,t,r){return t.length?Ce(t.filter(n=>r||!n.projectedOnly).reduce((n,i)=>n+i.amount,0)):Ce(e.reduce((n,i)=>n+i.currentAmount,0))}function CG(e){return new Map(e.map(t=>[Jk(t.label),t]))}function jG({active:e,payload:t,eventByLabel:r,year:n,month:i}){const o=(t??[]).filter(u=>u.value!==null&&u.value!==void 0);if(!e||!o.length)return null;const s=String(o[0]?.payload?.label??"Bills");return A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:s}),o.map((u,f)=>{const d=String(u.name??""),h=r.get(Jk(d));return A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:u.color}}),A.jsxs("span",{children:[A.jsx("span",{children:d}),h?A.jsx("small",{children:IG(h,n,i)}):null]}),A.jsx("strong",{children:xe(Number(u.value||0))})]},`${d}-${u.value}-${f}`)})]})}function IG(e,t,r){const n=new Date(t,r-1,e.day),i=new Intl.DateTimeFormat("en-US",{weekday:"long"}).format(n);return`${e.projectedOnly?"Upcoming":"Hit"} ${i} ${_G(e.day)}`}function _G(e){const t=e%10,r=e%100;return t===1&&r!==11?`${e}st`:t===2&&r!==12?`${e}nd`:t===3&&r!==13?`${e}rd`:`${e}th`}function Jk(e){return e.toLowerCase().replace(/[^a-z0-9]+/g,"")}function TG(e){const t=new Map;for(const r of e)for(const n of r.history){const i=t.get(n.month)??{label:n.label,month:n.month};i[r.key]=n.amount,t.set(n.month,i)}return Array.from(t.entries()).sort(([r],[n])=>r-n).map(([,r])=>r)}function NG(e){return Object.fromEntries(e.map((t,r)=>[t.key,{label:t.label,color:Xv(r)}]))}function Xv(e){return`hsl(var(--chart-${e%5+1}))`}function MG({items:e}){return A.jsx("div",{className:"bb-bill-history-list",children:e.map((t,r)=>{const n=Xv(r),i=t.averageAmount>0,o=i&&t.deltaAmount>0?"bb-negative":i&&t.deltaAmount<0?"bb-positive":"";return A.jsxs("div",{className:"bb-bill-history-row",children:[A.jsxs("span",{children:[A.jsxs("strong",{className:"bb-bill-history-name",children:[A.jsx("span",{className:"bb-bill-history-dot",style:{background:n}}),A.jsx("span",{children:t.label})]}),A.jsx("small",{children:i?`Avg ${xe(t.averageAmount)}`:"No prior average"})]}),A.jsxs("span",{children:[A.jsx("strong",{children:xe(t.currentAmount)}),A.jsx("small",{className:o,children:i?`${t.deltaAmount>=0?"+":""}${xe(t.deltaAmount)} vs avg`:"Current"})]})]},t.key)})})}const DG={all:{label:"All",color:"hsl(var(--foreground))",background:"hsl(var(--muted) / 0.12)"},needs:{label:"Needs",color:"#2563eb",background:"rgb(37 99 235 / 0.1)"},wants:{label:"Wants",color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"}},RG=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"];function $G({items:e,showAll:t=!1}){const r=e.filter(i=>rO(i)==="needs"),n=e.filter(i=>rO(i)==="wants");return A.jsxs("div",{className:"bb-subscription-all-grid",children:[A.jsx(eO,{title:"Needs",items:r,tone:"needs",showAll:t}),A.jsx(eO,{title:"Wants",items:n,tone:"wants",showAll:t})]})}function eO({title:e,items:t,tone:r,showAll:n=!1}){const[i,o]=g.useState(!1),s=DG[r],u=t.reduce((v,m)=>v+m.amount,0),f=t.slice(0,5),d=n||i?t:f,h=!n&&t.length>f.length;return A.jsxs("section",{className:"bb-subscription-compact-group","aria-label":`${e} subs`,children:[A.jsxs("div",{className:"bb-subscription-compact-heading",children:[A.jsx("span",{style:{color:s.color},children:e}),A.jsx("strong",{children:xe(u)})]}),t.length?A.jsxs(A.Fragment,{children:[A.jsx(LG,{items:d,compact:!0,dividerBeforeIndex:i&&h?f.length:void 0}),h?A.jsx(Yk,{expanded:i,total:t.length,onToggle:()=>o(v=>!v)}):null]}):A.jsx("div",{className:"bb-empty",children:"No matching subs found."})]})}function LG({items:e,compact:t=!1,dividerBeforeIndex:r}){return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{className:t?"bb-subscription-compact-table":void 0,children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Name"}),A.jsx("th",{children:"Cadence"}),A.jsx("th",{children:"Pull"}),A.jsx("th",{children:"Amount"})]})}),A.jsx("tbody",{children:e.map((n,i)=>A.jsxs("tr",{className:r!==void 0&&i===r?"bb-table-row-divider":void 0,children:[A.jsx("td",{children:n.name}),A.jsxs("td",{children:[A.jsx("span",{className:"bb-cadence-full",children:BG(n.cadence)}),A.jsx("span",{className:"bb-cadence-short",children:FG(n.cadence)})]}),A.jsx("td",{children:zG(n)}),A.jsx("td",{className:"bb-amount",children:xe(n.amount)})]},`${n.name}-${n.amount}-${i}`))})]})})}function tO(e,t,r){if(!e.pullDay||e.cadence==="yearly"&&e.pullMonth!==r)return null;const n=new Date(t,r,0).getDate();return Math.min(e.pullDay,n)}function zG(e){return e.pullDay?e.cadence==="yearly"&&e.pullMonth?`${e.pullMonth}/${e.pullDay}`:String(e.pullDay):"-"}function BG(e){return e||"-"}function FG(e){const t=e.trim().toLowerCase();return t.startsWith("month")?"M":t.startsWith("year")?"Y":e?e.slice(0,1).toUpperCase():"-"}function rO(e){const t=e.kind.trim().toLowerCase();return t==="want"||t==="wants"?"wants":"needs"}function WG(e){return e.split(/\s+/)[0]||e}function UG(e,t,r){const n=new Date;return n.getFullYear()===e&&n.getMonth()+1===t&&n.getDate()===r}function KG(e){return Object.fromEntries(e.map((t,r)=>["key"in t?t.key:t.label,{label:t.label,color:"color"in t?t.color:`hsl(var(--chart-${r+1}))`}]))}function VG(){const e=document.getElementById("bookiebot-expense-report-data");if(!e?.textContent)throw new Error("Missing expense report data");return JSON.parse(e.textContent)}const nO=document.getElementById("bookiebot-expense-report-root");nO&&rI.createRoot(nO).render(A.jsx(Vy.StrictMode,{children:A.jsx(G9,{report:VG()})}))})();
+`," ").length*7,o=Math.ceil(i+PY);return Fk.set(r,o),o}const CY=520,jY=80;function IY(e,t){const r=g.useRef(null),n=g.useRef(0),[i,o]=g.useState({phase:"idle",offsetX:0,offsetY:0,travelX:0,travelY:0,revision:0});return g.useLayoutEffect(()=>{const s=r.current;if(r.current={filter:t,cx:e.cx,cy:e.cy},!s)return;const u=s.cx-e.cx,f=s.cy-e.cy;if(Math.abs(u)<.1&&Math.abs(f)<.1){o(b=>b.phase==="idle"?b:{...b,phase:"idle",offsetX:0,offsetY:0});return}n.current+=1;const d=n.current;o({phase:"primed",offsetX:u,offsetY:f,travelX:u,travelY:f,revision:d});let h=0,v=0,m=0;return h=window.requestAnimationFrame(()=>{v=window.requestAnimationFrame(()=>{o({phase:"active",offsetX:0,offsetY:0,travelX:u,travelY:f,revision:d}),m=window.setTimeout(()=>{o(b=>b.revision===d?{phase:"idle",offsetX:0,offsetY:0,travelX:u,travelY:f,revision:d}:b)},CY+jY)})}),()=>{window.cancelAnimationFrame(h),window.cancelAnimationFrame(v),window.clearTimeout(m)}},[t]),g.useLayoutEffect(()=>{r.current?.filter===t&&(r.current={filter:t,cx:e.cx,cy:e.cy})},[t,e.cx,e.cy]),i}function _Y(e,t){const r=Object.keys(e.labelDeltas),n=Object.keys(t.labelDeltas);return e.fallbackWidth===t.fallbackWidth&&e.fallbackHeight===t.fallbackHeight&&e.minOuterRadius===t.minOuterRadius&&e.maxOuterRadius===t.maxOuterRadius&&e.innerRadiusRatio===t.innerRadiusRatio&&e.labelOffset===t.labelOffset&&e.labelGap===t.labelGap&&e.containerPadding===t.containerPadding&&e.compactLabel===t.compactLabel&&e.showLabels===t.showLabels&&e.cx===t.cx&&e.cy===t.cy&&e.innerRadius===t.innerRadius&&e.outerRadius===t.outerRadius&&e.margin.top===t.margin.top&&e.margin.right===t.margin.right&&e.margin.bottom===t.margin.bottom&&e.margin.left===t.margin.left&&r.length===n.length&&r.every(i=>e.labelDeltas[i]?.x===t.labelDeltas[i]?.x&&e.labelDeltas[i]?.y===t.labelDeltas[i]?.y)}function TY(e,t,r){const n=typeof e=="number"?e:typeof e=="string"&&e.trim()?Number(e):Number.NaN;return Number.isFinite(n)?t==="start"?n+r:t==="end"?n-r:e:e}function NY(e,t){const{name:r,value:n,payload:i,fill:o,index:s}=e,u=DY(e,t),f=i?.label??r??"",d=i?.amount??Number(n??0),h=TY(u.x,u.textAnchor,t.labelGap),v=xe(d);return A.jsx("text",{x:h,y:u.y,textAnchor:u.textAnchor,dominantBaseline:"central",className:"bb-pie-metric-label",style:{animationDelay:$k(s),fill:Lk(i,o)},children:t.compactLabel?A.jsxs(A.Fragment,{children:[A.jsx("tspan",{x:h,dy:"-0.35em",children:f}),A.jsx("tspan",{x:h,dy:"1.25em",children:v})]}):`${f} ${v}`})}function MY(e,t){const{payload:r,stroke:n,index:i}=e,o=RY(e,t);return o?A.jsx("path",{className:"bb-pie-metric-label-line",d:`M${o.start.x},${o.start.y}L${o.end.x},${o.end.y}`,fill:"none",pathLength:1,stroke:Lk(r,n),strokeLinecap:"round",strokeWidth:1.5,style:{animationDelay:$k(i)}}):A.jsx("path",{className:"bb-pie-metric-label-line",d:"",fill:"none",opacity:0})}function DY(e,t){const{x:r,y:n,textAnchor:i}=e,o=Kk(e,t),s=Vv(e,t.outerRadius+t.labelOffset);return s?{x:s.x+o.x,y:s.y+o.y,textAnchor:s.x>s.cx?"start":"end"}:{x:r,y:n,textAnchor:i}}function RY(e,t){const r=Kk(e,t),n=Vv(e,t.outerRadius),i=Vv(e,t.outerRadius+t.labelOffset);if(n&&i)return{start:n,end:{...i,x:i.x+r.x,y:i.y+r.y}};const{points:o}=e,[s,u]=o??[];return s?.x===void 0||s?.y===void 0||u?.x===void 0||u?.y===void 0?null:{start:s,end:u}}function Kk(e,t){const{payload:r}=e;return r?t.labelDeltas[r.key]??{x:0,y:0}:{x:0,y:0}}function Vv(e,t){const{cx:r,cy:n,midAngle:i}=e;if(r===void 0||n===void 0||i===void 0)return null;const o=-i*Math.PI/180;return{cx:r,x:r+Math.cos(o)*t,y:n+Math.sin(o)*t}}function $Y({data:e,total:t,elapsedDays:r,filter:n,defaultDetailsOpen:i}){const o=e.reduce((v,m)=>!v||m.amount>v.amount?m:v,null),s=r?t/r:0,u=LY(e),f=BY(e,u),d=n==="all",h=n==="needs"?no:n==="wants"?io:"hsl(var(--chart-1))";return A.jsxs("div",{className:"bb-chart-layout",children:[A.jsx(eo,{config:d?{chartNeedsAmount:{label:"Needs",color:no},chartWantsAmount:{label:"Wants",color:io}}:{chartAmount:{label:"Amount",color:h}},className:"bb-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:f,margin:{top:12,right:16,left:0,bottom:0},children:[A.jsx(Ya,{className:"bb-daily-spending-grid",vertical:!1,stroke:_k,strokeDasharray:"3 3"}),A.jsx(Xa,{dataKey:"label",tick:{className:"bb-daily-spending-x-axis-label",fill:N9},tickLine:!1,axisLine:!1}),A.jsx(qa,{domain:u.domain,ticks:u.ticks,scale:u.compressed?"linear":"sqrt",tick:{fill:_k},tickFormatter:v=>UY(Number(v),u),tickLine:!1,axisLine:!1,width:58}),A.jsx(to,{content:A.jsx(GY,{filter:n}),cursor:{fill:YY(n)}}),d?A.jsxs(A.Fragment,{children:[A.jsx(Ga,{dataKey:"chartNeedsAmount",name:"Needs",stackId:"daily",fill:no,radius:zv}),A.jsx(Ga,{dataKey:"chartWantsAmount",name:"Wants",stackId:"daily",fill:io,radius:zv})]}):A.jsx(Ga,{dataKey:"chartAmount",name:"Daily spending",fill:h,radius:zv})]})})}),A.jsxs("div",{className:"bb-chart-side",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-chart-kicker",children:"Total Spent"}),A.jsx("div",{className:"bb-chart-total",children:xe(t)})]}),A.jsx(Hv,{summary:"Details",defaultOpen:i,children:A.jsx(Vk,{rows:[["Tracked days",String(e.length)],["Avg/day",xe(s)],["Days counted",String(r)],["Highest day",o?`${o.label} - ${xe(o.amount)}`:"N/A"]]})})]})]})}function LY(e){const t=e.map(f=>f.amount).filter(f=>f>0).sort((f,d)=>d-f),r=t[0]??0,n=t[1]??0,i=KY(e);if(!(r>=500&&n>0&&r>=n*2.5))return{compressed:!1,breakAt:0,peak:r,visualMax:i[1],domain:i,ticks:VY(i)};const s=zY(n),u=s*1.1;return{compressed:!0,breakAt:s,peak:r,visualMax:u,domain:[0,u*1.04],ticks:[0,s*.25,s*.5,s*.75,s,u]}}function zY(e){const t=e>=1e3?100:e>=250?50:e>=100?25:e>=50?10:5;return Math.max(t,Math.ceil(e/t)*t)}function BY(e,t){return e.map(r=>{const n=FY(r.amount,t),i=r.amount>0?n/r.amount:0;return{...r,chartAmount:n,chartNeedsAmount:r.needsAmount*i,chartWantsAmount:r.wantsAmount*i}})}function FY(e,t){if(!t.compressed||e<=t.breakAt||t.peak<=t.breakAt)return e;const r=(e-t.breakAt)/(t.peak-t.breakAt);return t.breakAt+r*(t.visualMax-t.breakAt)}function WY(e,t){if(!t.compressed||e<=t.breakAt||t.visualMax<=t.breakAt)return e;const r=(e-t.breakAt)/(t.visualMax-t.breakAt);return t.breakAt+r*(t.peak-t.breakAt)}function UY(e,t){const r=WY(e,t);if(r>=1e3){const n=r%1e3===0?0:1;return`$${(r/1e3).toFixed(n)}k`}return`$${Math.round(r)}`}function KY(e){const t=Math.max(0,...e.map(n=>n.amount));if(t<=0)return[0,1];const r=t*1.06;return[0,Math.max(1,Math.ceil(r/10)*10)]}function VY([,e]){if(e<=0)return[0];if(e<=160){const r=e<=60?10:20;return HY(r,e)}const t=[0,25,50,75,100];for(let r=200;r<e;r+=100)t.push(r);return t.filter(r=>r<e)}function HY(e,t){const r=[];for(let n=0;n<t;n+=e)r.push(n);return r}function YY(e){return e==="needs"?"rgb(37 99 235 / 0.14)":e==="wants"?"rgb(124 58 237 / 0.14)":"hsl(var(--foreground) / 0.08)"}function GY({active:e,payload:t,filter:r}){const n=(t??[]).find(o=>o.payload)?.payload;if(!e||!n)return null;const i=r==="all"?[{label:"Needs",amount:n.needsAmount,color:no},{label:"Wants",amount:n.wantsAmount,color:io}].filter(o=>o.amount>0):[{label:r==="needs"?"Needs":"Wants",amount:n.amount,color:r==="needs"?no:io}];return A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsxs("div",{className:"bb-chart-tooltip-title",children:["Day ",n.label]}),i.map((o,s)=>A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:o.color}}),A.jsx("span",{children:o.label}),A.jsx("strong",{children:xe(o.amount)})]},`${o.label}-${o.amount}-${s}`)),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Total"}),A.jsx("strong",{children:xe(n.amount)})]})]})}function XY({entries:e}){const t=!_l("(max-width: 640px)"),r=e.slice(0,10),n=r.map((i,o)=>({label:Ml(i),amount:i.amount,color:ZY(o,r.length)}));return A.jsx(eo,{config:{amount:{label:"Amount",color:"hsl(var(--chart-2))"}},className:"bb-insight-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:n,layout:"vertical",margin:{top:12,right:22,left:t?20:0,bottom:12},children:[A.jsx(Ya,{horizontal:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{type:"number",tickFormatter:i=>`$${i}`,tickLine:!1,axisLine:!1}),A.jsx(qa,{dataKey:"label",type:"category",width:t?148:0,tick:t,tickFormatter:i=>QY(i,22),tickLine:!1,axisLine:!1}),A.jsx(to,{content:A.jsx(qY,{}),cursor:{fill:"hsl(var(--foreground) / 0.08)"}}),A.jsx(Ga,{dataKey:"amount",name:"Expense amount",fill:"hsl(var(--chart-2))",radius:[0,6,6,0],children:n.map((i,o)=>A.jsx(Ua,{fill:i.color},`${i.label}-${o}`))})]})})})}function qY({active:e,payload:t}){const r=t?.find(n=>n.payload)?.payload;return!e||!r?null:A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:r.label}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:r.color}}),A.jsx("span",{children:"Expense amount"}),A.jsx("strong",{children:xe(r.amount)})]})]})}function ZY(e,t){if(t<=1)return Ic[0];const r=Math.round(e/(t-1)*(Ic.length-1));return Ic[Math.min(Math.max(r,0),Ic.length-1)]}function QY(e,t){const r=String(e??"");return r.length<=t?r:`${r.slice(0,Math.max(t-3,0))}...`}function JY({data:e}){const t=!_l("(max-width: 640px)"),r=e.slice(0,10);return A.jsx(eo,{config:{count:{label:"Occurrences",color:Bv}},className:"bb-insight-chart-box",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(wv,{data:r,layout:"vertical",margin:{top:12,right:22,left:t?20:0,bottom:12},children:[A.jsx(Ya,{horizontal:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{type:"number",tickFormatter:n=>String(n),tickLine:!1,axisLine:!1,allowDecimals:!1}),A.jsx(qa,{dataKey:"label",type:"category",width:t?148:0,tick:t,tickLine:!1,axisLine:!1}),A.jsx(to,{content:A.jsx(eG,{}),cursor:{fill:"rgb(8 145 178 / 0.14)"}}),A.jsx(Ga,{dataKey:"count",name:"Occurrences",fill:Bv,radius:[0,6,6,0]})]})})})}function eG({active:e,payload:t}){const r=t?.find(n=>n.payload)?.payload;return!e||!r?null:A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:r.label}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:Bv}}),A.jsx("span",{children:"Occurrences"}),A.jsx("strong",{children:r.count})]}),A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{}),A.jsx("span",{children:"Total"}),A.jsx("strong",{children:xe(r.amount)})]})]})}function tG({topEntries:e,merchantOccurrences:t,onViewChange:r}){const[n,i]=g.useState("largest"),o=e.filter(u=>u.category.trim().toLowerCase()!=="rent"&&Ml(u).trim().toLowerCase()!=="rent").sort((u,f)=>f.amount-u.amount||f.date.localeCompare(u.date)||Ml(u).localeCompare(Ml(f))),s=u=>{const f=u;f!==n&&(r(),i(f))};return A.jsx(jl,{children:A.jsxs(y9,{value:n,onValueChange:s,className:"bb-card-tabs",children:[A.jsx(Cv,{children:A.jsxs("div",{className:"bb-card-title-row bb-inline-toggle-row",children:[A.jsx(jv,{children:"Expense Highlights"}),A.jsxs(Ok,{"data-bb-tooltip-dismiss-trigger":"expense-highlights",children:[A.jsx($v,{value:"largest",children:"Largest"}),A.jsx($v,{value:"merchants",children:"Most Frequent"})]})]})}),A.jsxs(Ja,{className:"bb-expense-insights-content",children:[A.jsx(Lv,{value:"largest",children:A.jsxs("div",{className:"bb-insight-panel",children:[A.jsx(XY,{entries:o}),A.jsx(Gk,{total:o.length,children:A.jsx(nG,{entries:o})})]})}),A.jsx(Lv,{value:"merchants",children:A.jsxs("div",{className:"bb-insight-panel",children:[A.jsx(JY,{data:t}),A.jsx(Gk,{total:t.length,children:A.jsx(aG,{rows:t})})]})})]})]})})}function Vk({rows:e}){return A.jsx("div",{className:"bb-stat-list",children:e.map(([t,r])=>A.jsxs("div",{className:"bb-stat-row",children:[A.jsx("span",{children:t}),A.jsx("strong",{children:r})]},t))})}function Hv({summary:e,children:t,collapseKey:r=0,defaultOpen:n=!1}){const[i,o]=g.useState(n);return g.useEffect(()=>{o(n)},[r,n]),A.jsxs("div",{className:"bb-details-panel","data-state":i?"open":"closed",children:[A.jsx("button",{type:"button",className:"bb-details-toggle","aria-expanded":i,onClick:()=>o(s=>!s),children:e}),A.jsx("div",{className:"bb-details-content","aria-hidden":!i,children:A.jsx("div",{className:"bb-details-content-inner",children:t})})]})}function rG(e){g.useLayoutEffect(()=>{if(!e)return;const t=document.body,r=document.documentElement,n=window.scrollY,i={bodyPosition:t.style.position,bodyTop:t.style.top,bodyWidth:t.style.width,bodyOverflow:t.style.overflow,bodyPaddingRight:t.style.paddingRight,rootOverflow:r.style.overflow},o=Math.max(window.innerWidth-r.clientWidth,0);return t.style.position="fixed",t.style.top=`-${n}px`,t.style.width="100%",t.style.overflow="hidden",t.style.paddingRight=o>0?`${o}px`:i.bodyPaddingRight,r.style.overflow="hidden",()=>{t.style.position=i.bodyPosition,t.style.top=i.bodyTop,t.style.width=i.bodyWidth,t.style.overflow=i.bodyOverflow,t.style.paddingRight=i.bodyPaddingRight,r.style.overflow=i.rootOverflow,r.style.setProperty("--bb-viewport-scrollbar-width",`${Math.max(window.innerWidth-r.clientWidth,0)}px`),window.scrollTo(0,n)}},[e])}function Hk({summary:e,title:t,children:r,collapseKey:n=0}){const[i,o]=g.useState(!1),s=g.useRef(null);rG(i),g.useEffect(()=>{o(!1)},[n]),g.useEffect(()=>{const d=s.current;d&&(i&&!d.open?d.showModal():!i&&d.open&&d.close())},[i]);const u=()=>o(!1),f=typeof document>"u"?null:Hf.createPortal(A.jsx("dialog",{ref:s,className:"bb-details-dialog","aria-label":t,onCancel:u,onClose:u,onTouchStart:d=>d.stopPropagation(),onTouchMove:d=>d.stopPropagation(),onTouchEnd:d=>d.stopPropagation(),onTouchCancel:d=>d.stopPropagation(),onClick:d=>{d.target===d.currentTarget&&u()},children:A.jsxs("div",{className:"bb-details-dialog-surface",children:[A.jsxs("div",{className:"bb-details-dialog-header",children:[A.jsx("strong",{children:t}),A.jsx("button",{type:"button",className:"bb-details-dialog-close","aria-label":`Close ${t}`,onClick:u,children:A.jsx("span",{"aria-hidden":"true",children:"×"})})]}),A.jsx("div",{className:"bb-details-dialog-body",children:r})]})}),document.body);return A.jsxs("div",{className:"bb-modal-details",children:[A.jsx("button",{type:"button",className:"bb-details-toggle","aria-haspopup":"dialog","aria-expanded":i,onClick:()=>o(!0),children:e}),f]})}function Yk({expanded:e,total:t,onToggle:r}){return A.jsx("button",{type:"button",className:"bb-expand-toggle","aria-expanded":e,onClick:r,children:e?"Collapse":`View all ${t}`})}function Gk({children:e,total:t}){const[r,n]=g.useState(!1);return A.jsxs("div",{className:"bb-hidden-list-panel",children:[A.jsx("div",{className:"bb-details-content","data-state":r?"open":"closed","aria-hidden":!r,children:A.jsx("div",{className:"bb-details-content-inner",children:e})}),A.jsx(Yk,{expanded:r,total:t,onToggle:()=>n(i=>!i)})]})}function Ml(e){return e.item||e.location||"Transaction"}function nG({entries:e}){return e.length?A.jsx(iG,{entries:e}):A.jsx("div",{className:"bb-empty",children:"No shared expense entries found."})}function iG({entries:e,hideHeader:t=!1}){return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[t?null:A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Item"}),A.jsx("th",{children:"Category"}),A.jsx("th",{children:"Amount"})]})}),A.jsx("tbody",{children:e.map((r,n)=>A.jsxs("tr",{children:[A.jsx("td",{children:Ml(r)}),A.jsx("td",{children:r.category}),A.jsx("td",{className:"bb-amount",children:xe(r.amount)})]},`${r.date}-${r.category}-${r.amount}-${n}`))})]})})}function aG({rows:e}){return e.length?A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Location"}),A.jsx("th",{children:"Count"}),A.jsx("th",{children:"Total"})]})}),A.jsx("tbody",{children:e.map(t=>A.jsxs("tr",{children:[A.jsx("td",{children:t.label}),A.jsx("td",{children:t.count}),A.jsx("td",{className:"bb-amount",children:xe(t.amount)})]},t.label))})]})}):A.jsx("div",{className:"bb-empty",children:"No merchant activity found."})}function oG({entries:e,categoryColors:t}){if(!e.length)return A.jsx("div",{className:"bb-empty",children:"No shared expense entries found."});const r=new Map;for(const n of e){const i=n.date?n.date.split("/")[1]||n.date:"No date";r.set(i,[...r.get(i)||[],n])}return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Day"}),A.jsx("th",{children:"Total"}),A.jsx("th",{children:"Transactions"})]})}),A.jsx("tbody",{children:Array.from(r.entries()).sort(lG).map(([n,i])=>{const o=i.reduce((s,u)=>s+u.amount,0);return A.jsxs("tr",{children:[A.jsx("td",{children:n}),A.jsx("td",{className:"bb-amount",children:xe(o)}),A.jsx("td",{children:A.jsx("div",{className:"bb-transaction-list",children:i.map((s,u)=>A.jsxs("div",{children:[A.jsx("strong",{className:"bb-transaction-category",style:{color:s.categoryColor??t[s.category]},children:s.category})," ",s.item||s.location||"Transaction"," - ",xe(s.amount),A.jsxs("span",{children:[" (",s.person,")"]})]},`${s.category}-${s.amount}-${u}`))})})]},n)})})]})})}function lG([e],[t]){const r=Number(e),n=Number(t);return Number.isFinite(r)&&Number.isFinite(n)?r-n:Number.isFinite(r)?-1:Number.isFinite(n)?1:e.localeCompare(t)}function sG(e,t){return t==="all"?e:e.filter(r=>Xk(r)===t)}function Xk(e){return I9.has(e.category)?"wants":"needs"}function uG(e,t,r){return[...e,...t.map(n=>{const i=Yv(n),o=n.kind==="bill"?n.group==="rent"?"Rent":"Bills & Utilities":"Subscription";return{date:`${r}/${n.day}`,category:o,amount:n.amount,person:n.kind==="bill"?"Need bill":i==="wants"?"Want sub":"Need sub",item:n.label,location:"",categoryColor:i==="wants"?io:no}})]}function cG(e,t){const r=new Map;for(const n of e){const i=dG(n);if(i===null)continue;const o=Xk(n);qk(r,i,o,n.amount)}for(const n of t)qk(r,String(n.day),Yv(n),n.amount);return Array.from(r.entries()).sort(([n],[i])=>pG(n,i)).map(([,n])=>n)}function fG(e,t){return Ce(e.reduce((r,n)=>r+n.amount,0)+t.reduce((r,n)=>r+n.amount,0))}function qk(e,t,r,n){const i=e.get(t)??{label:t,amount:0,needsAmount:0,wantsAmount:0};e.set(t,{...i,amount:Ce(i.amount+n),needsAmount:Ce(i.needsAmount+(r==="needs"?n:0)),wantsAmount:Ce(i.wantsAmount+(r==="wants"?n:0))})}function dG(e){if(!e.date||e.date.trim().toLowerCase()==="no date")return null;const t=e.date.split("/")[1]||e.date;return t.trim().toLowerCase()==="no date"?null:t}function hG(e,t,r){return e.filter(n=>n.kind!=="subscription"&&n.kind!=="bill"||!r&&n.projectedOnly?!1:t==="all"?!0:Yv(n)===t)}function Yv(e){return e.kind==="subscription"&&e.group==="subscriptions_wants"?"wants":"needs"}function pG(e,t){const r=Number(e),n=Number(t);return Number.isFinite(r)&&Number.isFinite(n)?r-n:Number.isFinite(r)?-1:Number.isFinite(n)?1:e.localeCompare(t)}const vG=[{value:"all",label:"All"},{value:"subscription",label:"Subs"}],Dl={subscription:{label:"Sub",color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"},bill:{label:"Bill",color:"#ea580c",background:"rgb(234 88 12 / 0.1)"},income:{label:"Income",color:"#16a34a",background:"rgb(22 163 74 / 0.1)"}};function mG({filter:e,onFilterChange:t}){return A.jsx("div",{className:"bb-tabs-list bb-subscription-tone-control",role:"tablist","aria-label":"Calendar view","data-bb-tooltip-dismiss-trigger":"calendar",children:vG.map(r=>A.jsx("button",{type:"button",className:"bb-tabs-trigger","data-state":e===r.value?"active":"inactive",role:"tab","aria-selected":e===r.value,onClick:()=>t(r.value),children:r.label},r.value))})}function yG({year:e,month:t,monthLabel:r,elapsedDays:n,events:i,filter:o,onFilterChange:s,projected:u,needs:f,wants:d,collapseKey:h}){const v=o==="all"?i:i.filter(w=>w.kind===o),m=u?v:v.filter(w=>!w.projectedOnly),b=m.filter(w=>w.kind!=="income").reduce((w,P)=>w+P.amount,0),S=[...f,...d];return A.jsx("div",{className:"bb-subscription-analytics",children:A.jsx("div",{className:"bb-subscription-tab-content bb-cashflow-calendar-content","data-state":"active","data-bb-calendar-filter":o,children:A.jsxs("div",{className:"bb-subscription-panel bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-subscription-summary bb-chart-page-header",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-subscription-total","data-bb-calendar-static-label":"month",children:WG(r)}),A.jsx("div",{className:"bb-chart-mode-note","data-bb-calendar-summary":"outflow",children:A.jsx(Zk,{value:xe(b)})})]}),A.jsxs("div",{className:"bb-chart-page-header-actions",children:[A.jsx(Ov,{variant:"secondary",children:A.jsx(Zk,{value:`${m.length} total`})}),A.jsx(mG,{filter:o,onFilterChange:s})]})]}),A.jsx("div",{className:"bb-chart-page-body",children:A.jsx(gG,{year:e,month:t,elapsedDays:n,events:i,filter:o})}),A.jsx("div",{className:"bb-chart-page-footer",children:S.length?A.jsx(Hk,{summary:"Details",title:"Calendar details",collapseKey:h,children:A.jsx($G,{items:S,showAll:!0})}):null})]})})})}function Zk({value:e}){const[t,r]=g.useState(e),[n,i]=g.useState(null),o=g.useRef(null);return g.useEffect(()=>{e!==t&&(o.current!==null&&window.clearTimeout(o.current),i(t),r(e),o.current=window.setTimeout(()=>{i(null),o.current=null},220))},[t,e]),g.useEffect(()=>()=>{o.current!==null&&window.clearTimeout(o.current)},[]),A.jsxs("span",{className:"bb-calendar-changing-value","aria-live":"polite","data-bb-calendar-changing-value":!0,children:[n!==null?A.jsx("span",{className:"bb-calendar-changing-value-out","aria-hidden":"true",children:n}):null,A.jsx("span",{className:n!==null?"bb-calendar-changing-value-in":void 0,"aria-label":t,children:t})]})}function gG({year:e,month:t,elapsedDays:r,events:n,filter:i}){const o=new Date(e,t,0).getDate(),s=new Date(e,t-1,1).getDay(),u=Math.ceil((s+o)/7)*7,f=Array.from({length:u},(h,v)=>{const m=v-s+1;return m>=1&&m<=o?m:null}),d=xG(n);return A.jsxs("div",{className:"bb-subscription-calendar","aria-label":"Cashflow calendar",children:[A.jsx("div",{className:"bb-calendar-head","aria-hidden":"true",children:RG.map(h=>A.jsx("span",{children:h},h))}),A.jsx("div",{className:"bb-calendar-grid",children:f.map((h,v)=>{const m=h===null?[]:d.get(h)??[],b=i==="all"?m:m.filter(E=>E.kind==="subscription"),S=h!==null&&UG(e,t,h),P=!(h!==null&&h<=r)||b.every(E=>E.projectedOnly);return A.jsx("div",{className:["bb-calendar-day",h===null?"bb-calendar-day-muted":"",b.length?"bb-calendar-day-has-items":"",S?"bb-calendar-day-today":""].filter(Boolean).join(" "),"aria-hidden":h===null,children:h===null?null:A.jsxs(A.Fragment,{children:[A.jsx("div",{className:"bb-calendar-day-number",children:h}),A.jsx("div",{className:"bb-calendar-marker-stack",children:b.length===1?(()=>{const E=b[0],j=Qk(E);return A.jsxs("button",{type:"button",className:["bb-subscription-marker","bb-calendar-marker-transition",P?"bb-subscription-marker-pending":""].filter(Boolean).join(" "),"data-calendar-event-kind":E.kind,style:{color:j.color,backgroundColor:j.background,borderColor:j.color},"aria-label":wG(E),children:[A.jsx("span",{className:"bb-subscription-marker-dot"}),A.jsx("span",{className:"bb-subscription-marker-name",children:E.label}),A.jsx("span",{className:"bb-subscription-marker-amount",children:xe(E.amount)}),A.jsx(SG,{event:E})]},bG(E,0))})():b.length>1?(()=>{const E=Qk(b[0]),j=b.reduce((O,C)=>O+C.amount,0);return A.jsxs("button",{type:"button",className:["bb-subscription-marker","bb-subscription-marker-more","bb-calendar-marker-transition",P?"bb-subscription-marker-pending":""].filter(Boolean).join(" "),style:{color:E.color,backgroundColor:E.background,borderColor:E.color},"aria-label":`${b.length} events on day ${h}`,children:[A.jsx("span",{className:"bb-subscription-marker-dot"}),A.jsxs("span",{className:"bb-calendar-marker-count","aria-hidden":"true",children:["+",b.length-1]}),A.jsxs("span",{className:"bb-subscription-marker-name",children:[b.length," events"]}),A.jsx("span",{className:"bb-subscription-marker-amount",children:xe(j)}),A.jsx(AG,{events:b,day:h})]},`events-${i}-${h}`)})():null})]})},`${h??"blank"}-${v}`)})})]})}function bG(e,t){return[e.kind,e.group,e.day,e.label,e.amount,e.projectedOnly?"projected":"actual",t].join("-")}function xG(e){const t=new Map;for(const r of e)t.set(r.day,[...t.get(r.day)??[],r]);return t}function Qk(e){return e.group==="static_bills_subscriptions_needs"?{...Dl.subscription,color:"#2563eb",background:"rgb(37 99 235 / 0.1)"}:e.group==="subscriptions_wants"?{...Dl.subscription,color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"}:e.group==="rent"?{...Dl.bill,color:"#dc2626",background:"rgb(220 38 38 / 0.1)"}:Dl[e.kind]}function wG(e){return`${e.label} - ${Gv(e)} - ${xe(e.amount)}`}function SG({event:e}){return A.jsxs("span",{className:"bb-subscription-tooltip",role:"tooltip",children:[A.jsx("strong",{children:e.label}),A.jsx("span",{children:Gv(e)}),A.jsx("span",{className:"bb-subscription-tooltip-amount",children:xe(e.amount)})]})}function AG({events:e,day:t}){return A.jsxs("span",{className:"bb-subscription-tooltip bb-subscription-tooltip-wide",role:"tooltip",children:[A.jsxs("strong",{children:["More on day ",t]}),e.map((r,n)=>A.jsxs("span",{children:[r.label," - ",Gv(r)," - ",xe(r.amount)]},`${r.kind}-${r.label}-${r.amount}-${n}`))]})}function Gv(e){return e.kind==="subscription"?e.group==="subscriptions_wants"?"Want sub":"Need sub":Dl[e.kind].label}function PG({items:e,events:t,year:r,month:n,projected:i,collapseKey:o}){const s=kG(t),u=OG(e,s,i);return A.jsxs("div",{className:"bb-bills-analytics bb-chart-page",children:[A.jsxs("div",{className:"bb-panel-head bb-bills-analytics-head bb-chart-page-header",children:[A.jsxs("div",{children:[A.jsx("div",{className:"bb-chart-kicker",children:"Bills & Utilities"}),A.jsx("div",{className:"bb-chart-total",children:xe(u)}),A.jsx("div",{className:"bb-chart-mode-note",children:i?"Projected":"Current"})]}),A.jsxs(Ov,{variant:"secondary",children:[e.length," tracked"]})]}),e.length?A.jsx(EG,{items:e,billEvents:s,year:r,month:n}):A.jsx("div",{className:"bb-empty bb-chart-page-body",children:"No bill history found."}),A.jsx("div",{className:"bb-chart-page-footer",children:e.length?A.jsx(Hv,{summary:"Details",collapseKey:o,children:A.jsx(MG,{items:e})}):null})]})}function EG({items:e,billEvents:t,year:r,month:n}){const i=TG(e),o=CG(t);return A.jsx(eo,{config:NG(e),className:"bb-bills-chart-box bb-chart-page-body",children:A.jsx(wa,{width:"100%",height:"100%",children:A.jsxs(EE,{data:i,margin:{top:12,right:20,left:0,bottom:6},children:[A.jsx(Ya,{vertical:!1,strokeDasharray:"3 3"}),A.jsx(Xa,{dataKey:"label",tickLine:!1,axisLine:!1}),A.jsx(qa,{tickFormatter:s=>`$${s}`,tickLine:!1,axisLine:!1,width:54}),A.jsx(to,{content:A.jsx(jG,{eventByLabel:o,year:r,month:n})}),e.map((s,u)=>A.jsx(ov,{type:"monotone",dataKey:s.key,name:s.label,stroke:Xv(u),strokeWidth:2.5,connectNulls:!0,dot:{r:3},activeDot:{r:5}},s.key))]})})})}function kG(e){return e.filter(t=>t.kind==="bill"&&t.group==="bills_utilities")}function OG(e,t,r){return t.length?Ce(t.filter(n=>r||!n.projectedOnly).reduce((n,i)=>n+i.amount,0)):Ce(e.reduce((n,i)=>n+i.currentAmount,0))}function CG(e){return new Map(e.map(t=>[Jk(t.label),t]))}function jG({active:e,payload:t,eventByLabel:r,year:n,month:i}){const o=(t??[]).filter(u=>u.value!==null&&u.value!==void 0);if(!e||!o.length)return null;const s=String(o[0]?.payload?.label??"Bills");return A.jsxs("div",{className:"bb-chart-tooltip bb-touch-tooltip-content",children:[A.jsx("div",{className:"bb-chart-tooltip-title",children:s}),o.map((u,f)=>{const d=String(u.name??""),h=r.get(Jk(d));return A.jsxs("div",{className:"bb-chart-tooltip-row",children:[A.jsx("span",{className:"bb-chart-tooltip-dot",style:{background:u.color}}),A.jsxs("span",{children:[A.jsx("span",{children:d}),h?A.jsx("small",{children:IG(h,n,i)}):null]}),A.jsx("strong",{children:xe(Number(u.value||0))})]},`${d}-${u.value}-${f}`)})]})}function IG(e,t,r){const n=new Date(t,r-1,e.day),i=new Intl.DateTimeFormat("en-US",{weekday:"long"}).format(n);return`${e.projectedOnly?"Upcoming":"Hit"} ${i} ${_G(e.day)}`}function _G(e){const t=e%10,r=e%100;return t===1&&r!==11?`${e}st`:t===2&&r!==12?`${e}nd`:t===3&&r!==13?`${e}rd`:`${e}th`}function Jk(e){return e.toLowerCase().replace(/[^a-z0-9]+/g,"")}function TG(e){const t=new Map;for(const r of e)for(const n of r.history){const i=t.get(n.month)??{label:n.label,month:n.month};i[r.key]=n.amount,t.set(n.month,i)}return Array.from(t.entries()).sort(([r],[n])=>r-n).map(([,r])=>r)}function NG(e){return Object.fromEntries(e.map((t,r)=>[t.key,{label:t.label,color:Xv(r)}]))}function Xv(e){return`hsl(var(--chart-${e%5+1}))`}function MG({items:e}){return A.jsx("div",{className:"bb-bill-history-list",children:e.map((t,r)=>{const n=Xv(r),i=t.averageAmount>0,o=i&&t.deltaAmount>0?"bb-negative":i&&t.deltaAmount<0?"bb-positive":"";return A.jsxs("div",{className:"bb-bill-history-row",children:[A.jsxs("span",{children:[A.jsxs("strong",{className:"bb-bill-history-name",children:[A.jsx("span",{className:"bb-bill-history-dot",style:{background:n}}),A.jsx("span",{children:t.label})]}),A.jsx("small",{children:i?`Avg ${xe(t.averageAmount)}`:"No prior average"})]}),A.jsxs("span",{children:[A.jsx("strong",{children:xe(t.currentAmount)}),A.jsx("small",{className:o,children:i?`${t.deltaAmount>=0?"+":""}${xe(t.deltaAmount)} vs avg`:"Current"})]})]},t.key)})})}const DG={all:{label:"All",color:"hsl(var(--foreground))",background:"hsl(var(--muted) / 0.12)"},needs:{label:"Needs",color:"#2563eb",background:"rgb(37 99 235 / 0.1)"},wants:{label:"Wants",color:"#7c3aed",background:"rgb(124 58 237 / 0.1)"}},RG=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"];function $G({items:e,showAll:t=!1}){const r=e.filter(i=>rO(i)==="needs"),n=e.filter(i=>rO(i)==="wants");return A.jsxs("div",{className:"bb-subscription-all-grid",children:[A.jsx(eO,{title:"Needs",items:r,tone:"needs",showAll:t}),A.jsx(eO,{title:"Wants",items:n,tone:"wants",showAll:t})]})}function eO({title:e,items:t,tone:r,showAll:n=!1}){const[i,o]=g.useState(!1),s=DG[r],u=t.reduce((v,m)=>v+m.amount,0),f=t.slice(0,5),d=n||i?t:f,h=!n&&t.length>f.length;return A.jsxs("section",{className:"bb-subscription-compact-group","aria-label":`${e} subs`,children:[A.jsxs("div",{className:"bb-subscription-compact-heading",children:[A.jsx("span",{style:{color:s.color},children:e}),A.jsx("strong",{children:xe(u)})]}),t.length?A.jsxs(A.Fragment,{children:[A.jsx(LG,{items:d,compact:!0,dividerBeforeIndex:i&&h?f.length:void 0}),h?A.jsx(Yk,{expanded:i,total:t.length,onToggle:()=>o(v=>!v)}):null]}):A.jsx("div",{className:"bb-empty",children:"No matching subs found."})]})}function LG({items:e,compact:t=!1,dividerBeforeIndex:r}){return A.jsx("div",{className:"bb-table-wrap",children:A.jsxs("table",{className:t?"bb-subscription-compact-table":void 0,children:[A.jsx("thead",{children:A.jsxs("tr",{children:[A.jsx("th",{children:"Name"}),A.jsx("th",{children:"Cadence"}),A.jsx("th",{children:"Pull"}),A.jsx("th",{children:"Amount"})]})}),A.jsx("tbody",{children:e.map((n,i)=>A.jsxs("tr",{className:r!==void 0&&i===r?"bb-table-row-divider":void 0,children:[A.jsx("td",{children:n.name}),A.jsxs("td",{children:[A.jsx("span",{className:"bb-cadence-full",children:BG(n.cadence)}),A.jsx("span",{className:"bb-cadence-short",children:FG(n.cadence)})]}),A.jsx("td",{children:zG(n)}),A.jsx("td",{className:"bb-amount",children:xe(n.amount)})]},`${n.name}-${n.amount}-${i}`))})]})})}function tO(e,t,r){if(!e.pullDay||e.cadence==="yearly"&&e.pullMonth!==r)return null;const n=new Date(t,r,0).getDate();return Math.min(e.pullDay,n)}function zG(e){return e.pullDay?e.cadence==="yearly"&&e.pullMonth?`${e.pullMonth}/${e.pullDay}`:String(e.pullDay):"-"}function BG(e){return e||"-"}function FG(e){const t=e.trim().toLowerCase();return t.startsWith("month")?"M":t.startsWith("year")?"Y":e?e.slice(0,1).toUpperCase():"-"}function rO(e){const t=e.kind.trim().toLowerCase();return t==="want"||t==="wants"?"wants":"needs"}function WG(e){return e.split(/\s+/)[0]||e}function UG(e,t,r){const n=new Date;return n.getFullYear()===e&&n.getMonth()+1===t&&n.getDate()===r}function KG(e){return Object.fromEntries(e.map((t,r)=>["key"in t?t.key:t.label,{label:t.label,color:"color"in t?t.color:`hsl(var(--chart-${r+1}))`}]))}function VG(){const e=document.getElementById("bookiebot-expense-report-data");if(!e?.textContent)throw new Error("Missing expense report data");return JSON.parse(e.textContent)}function Cw9(e){const t=Object.keys(e??{}),r=t.length?e[t[0]].length:0;return Array.from({length:r},(n,o)=>Object.fromEntries(t.map(a=>[a,e[a][o]])))}async function Dw9(e){const t=new URLSearchParams(window.location.search).get("token");if(!e.details||!t)return null;const r=new URL(e.details.path,window.location.href);r.searchParams.set("token",t),r.searchParams.set("source",e.details.source);const n=await fetch(r,{credentials:"same-origin"});if(!n.ok)throw new Error(`Could not load expense report details (${n.status})`);const o=await n.json();return{topEntries:Cw9(o.topEntries),dailyEntries:Cw9(o.dailyEntries),merchantOccurrences:Cw9(o.merchantOccurrences)}}const nO=document.getElementById("bookiebot-expense-report-root");if(nO){const e=rI.createRoot(nO),t=VG(),r=n=>e.render(A.jsx(Vy.StrictMode,{children:A.jsx(G9,{report:n})}));r(t),Dw9(t).then(n=>n&&r({...t,...n})).catch(n=>console.error(n))}})();
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import calendar
 import html
 import json
+import os
 from pathlib import Path
 import re
 import secrets
@@ -13,6 +15,8 @@ from typing import Any
 
 from openpyxl.utils import column_index_from_string
 
+from bookiebot.reports.snapshot_index import record_report_snapshot, report_details_path, report_owner_slug
+from bookiebot.reports.static_assets import compress_body, report_asset_url, supported_encodings
 from bookiebot.sheets.config import get_category_columns
 from bookiebot.sheets.collaboration import SharedAllocation, allocations_from_rows, split_method_label
 from bookiebot.sheets.repo import get_sheets_repo
@@ -44,7 +48,7 @@ class ReportWorksheets:
     shared_reimbursements: Any | None = None
     subscriptions: Any | None = None
     bill_schedule: Any | None = None
-    budget_history: tuple[BudgetHistoryRows, ...] = ()
+    budget_history: tuple[BudgetHistoryRows | BudgetHistoryDigest, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -114,6 +118,16 @@ class IncomeProjectionConfig:
     anchor_date: datetime | None = None
 
 
+@dataclass(frozen=True)
+class BudgetHistoryDigest:
+    """The parts of one month's budget tab that later months' reports read back."""
+
+    month: BudgetMonth
+    labeled_amounts: tuple[tuple[str, float], ...] = ()
+    income_entries: tuple[PaymentItem, ...] = ()
+    income_projection_config: IncomeProjectionConfig = field(default_factory=IncomeProjectionConfig)
+
+
 @dataclass(frozen=True)
 class SavingsDeposit:
     number: int
@@ -130,6 +144,78 @@ class _IncomeTableLayout:
     date_column: int | None = None
 
 
+@dataclass(frozen=True)
+class _SheetIndex:
+    """A budget tab normalized in one pass so extractors look cells up instead of rescanning them.
+
+    ``money`` holds the parsed amount of every cell containing a digit (``None`` otherwise) and
+    ``dates`` the parsed date of every date-shaped cell; ``positions`` maps each normalized label
+    to its cells in sheet order.
+    """
+
+    rows: list[list[str]]
+    labels: list[list[str]]
+    row_texts: list[str]
+    money: list[list[float | None]]
+    dates: list[list[datetime | None]]
+    positions: dict[str, tuple[tuple[int, int], ...]]
+
+    def cells(self) -> Iterator[tuple[int, int, str]]:
+        for row_index, labels in enumerate(self.labels):
+            for column, label in enumerate(labels):
+                if label:
+                    yield row_index, column, label
+
+    def cells_matching(self, predicate: Callable[[str], bool]) -> list[tuple[int, int, str]]:
+        """Cells whose label satisfies ``predicate``, tested once per distinct label."""
+        return sorted(
+            (row_index, column, label)
+            for label, positions in self.positions.items()
+            if predicate(label)
+            for row_index, column in positions
+        )
+
+    def cells_containing(self, text: str) -> list[tuple[int, int, str]]:
+        return self.cells_matching(lambda label: text in label)
+
+    def amount(self, row_index: int, column: int) -> float:
+        money = self.money[row_index]
+        if column >= len(money):
+            return 0.0
+        return money[column] or 0.0
+
+    def next_money(self, row_index: int, start: int, *, window: int = 4) -> float:
+        for amount in self.money[row_index][start : start + window]:
+            if amount:
+                return amount
+        return 0.0
+
+    def next_money_value(self, row_index: int, start: int, *, window: int = 4) -> float | None:
+        for amount in self.money[row_index][start : start + window]:
+            if amount is not None:
+                return amount
+        return None
+
+    def amounts_after(self, row_index: int, start: int) -> list[float]:
+        """Every numeric cell from ``start`` to the end of the row, zeros included."""
+        return [round(amount, 2) for amount in self.money[row_index][start:] if amount is not None]
+
+    def next_text(self, row_index: int, start: int, *, window: int = 4) -> str | None:
+        row = self.rows[row_index]
+        for column in range(start, min(start + window, len(row))):
+            text = str(row[column]).strip()
+            if not text or self.dates[row_index][column] is not None or self.amount(row_index, column):
+                continue
+            return text
+        return None
+
+    def next_date(self, row_index: int, start: int, *, window: int = 4) -> datetime | None:
+        for parsed in self.dates[row_index][start : start + window]:
+            if parsed is not None:
+                return parsed
+        return None
+
+
 @dataclass
 class ExpenseBreakdownReport:
     actor_key: str
@@ -165,6 +251,8 @@ class ExpenseBreakdownReport:
     income_projection_reference: PaymentItem | None = None
     shared_reimbursements: list[SharedAllocation] = field(default_factory=list)
     raw_sheets: list[RawSheet] = field(default_factory=list)
+    # Client payload fields computed so far; see expense_breakdown_payload_fields.
+    _payload_memo: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 
 @dataclass(frozen=True)
@@ -241,6 +329,14 @@ FIXED_COMMITMENT_KEYS = (
     "subscriptions_wants",
 )
 SAVINGS_AMOUNT_COLUMN_INDEX = 4
+EXPENSE_REPORT_DETAILS_PATH = "/reports/expense-breakdown/details"
+EXPENSE_REPORT_DETAIL_FIELDS = ("topEntries", "dailyEntries", "merchantOccurrences")
+_DETAILS_PAYLOAD_VERSION = 1
+# An error string from web/expense-report/src/main.tsx that survives minification; its presence
+# in the built bundle means the bundle fetches detail tables itself.
+_DIGIT_PATTERN = re.compile(r"\d")
+_MONEY_PATTERN = re.compile(r"-?\$?\s*\d[\d,]*(?:\.\d+)?")
+_LABEL_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9&]+")
 MONTHLY_SAVINGS_LABEL_PHRASES = (
     "enter monthly savings contribution",
     "monthly savings contribution",
@@ -378,7 +474,7 @@ def load_report_worksheets(actor_key: str, month: BudgetMonth) -> ReportWorkshee
     context = resolve_sheet_context(actor_key, gc, month.as_datetime())
     personal_spreadsheet = _optional_spreadsheet_by_key(gc, context.personal_budget_spreadsheet_id)
     budget_history = (
-        _budget_history_from_spreadsheet(personal_spreadsheet, month)
+        _budget_history_before(actor_key, month, lambda: personal_spreadsheet)
         if personal_spreadsheet is not None
         else ()
     )
@@ -412,14 +508,16 @@ def build_expense_breakdown_report(
         if allocation.expense_date and _date_belongs_to_month(allocation.expense_date, month)
     ]
 
+    personal_sheet = _sheet_index(personal_rows)
+
     entries = _shared_expense_entries(shared_rows, persons, month)
-    payments = _payment_items(personal_rows, bill_schedule_rows, month)
+    payments = _payment_items(personal_sheet, bill_schedule_rows, month)
     subscriptions = _subscription_items(subscription_rows)
     current_month_subscriptions = _current_month_subscription_items(subscriptions, month)
-    income_entries, income_total = _income_entries(personal_rows)
-    budget_history = selected.budget_history or (BudgetHistoryRows(month, personal_rows),)
+    income_entries, income_total = _income_entries(personal_sheet)
+    budget_history = _budget_history_digests(selected.budget_history, month, personal_sheet)
     income_projection_config = _income_projection_config_with_prior_month(
-        _income_projection_config(personal_rows),
+        _income_projection_config(personal_sheet),
         budget_history,
         month,
     )
@@ -428,19 +526,19 @@ def build_expense_breakdown_report(
         month,
         income_projection_config,
     )
-    needs_rollover, wants_rollover = _category_rollover_amounts(personal_rows)
-    savings_deposits = _savings_deposits(personal_rows)
-    amount_saved = _amount_saved(personal_rows, deposits=savings_deposits)
-    savings_goal = _savings_goal(personal_rows)
+    needs_rollover, wants_rollover = _category_rollover_amounts(personal_sheet)
+    savings_deposits = _savings_deposits(personal_sheet)
+    amount_saved = _amount_saved(personal_sheet, deposits=savings_deposits)
+    savings_goal = _savings_goal(personal_sheet)
     shared_need_entries = _entries_for_category(entries, "need_expenses")
-    legacy_need_expenses = _need_expense_items(personal_rows)
+    legacy_need_expenses = _need_expense_items(personal_sheet)
     need_expenses = (
         _need_expense_items_from_entries(shared_need_entries)
         if shared_need_entries
         else legacy_need_expenses
     )
     static_needs_total, wants_total = _subscription_breakdown_totals(
-        personal_rows,
+        personal_sheet,
         subscriptions,
         current_month_subscriptions,
         month,
@@ -451,7 +549,7 @@ def build_expense_breakdown_report(
         )
     else:
         budget_static_needs_total, budget_wants_total = _subscription_bucket_totals(
-            personal_rows,
+            personal_sheet,
             current_month_subscriptions,
         )
     payment_totals = _payment_totals_by_group(payments)
@@ -471,7 +569,7 @@ def build_expense_breakdown_report(
         utility_history=utility_history,
         bill_schedule_rows=bill_schedule_rows,
     )
-    budget_shared_totals = _budget_shared_category_totals(personal_rows)
+    budget_shared_totals = _budget_shared_category_totals(personal_sheet)
     itemized_shared_totals = _entry_totals_by_category(entries)
 
     breakdown_amounts = _ordered_breakdown_amounts()
@@ -495,11 +593,11 @@ def build_expense_breakdown_report(
     budget_breakdown = _breakdown_from_amounts(budget_breakdown_amounts)
 
     shared_total = round(sum(entry.amount for entry in entries), 2)
-    personal_expense_total = _personal_expense_subtotal_total(personal_rows)
+    personal_expense_total = _personal_expense_subtotal_total(personal_sheet)
     personal_total = grand_total if grand_total > 0 else (personal_expense_total or 0.0)
-    category_budgets = _category_budget_amounts(personal_rows, income_total)
+    category_budgets = _category_budget_amounts(personal_sheet, income_total)
     category_spending = _category_spending_amounts(
-        personal_rows,
+        personal_sheet,
         breakdown,
         amount_saved=amount_saved,
         use_sheet_subtotals=not subscriptions,
@@ -568,14 +666,31 @@ def _breakdown_from_amounts(amounts: dict[str, float]) -> dict[str, dict[str, An
     }
 
 
-def write_expense_breakdown_report(report: ExpenseBreakdownReport, *, report_dir: Path | None = None) -> ExpenseReportPage:
+def write_expense_breakdown_report(
+    report: ExpenseBreakdownReport,
+    *,
+    report_dir: Path | None = None,
+) -> ExpenseReportPage:
     from bookiebot.reports.web import create_expense_report_token, public_expense_report_url, reports_dir
 
     directory = report_dir or reports_dir()
     directory.mkdir(parents=True, exist_ok=True)
     filename = _report_filename(report)
     path = directory / filename
-    path.write_text(render_expense_breakdown_html(report), encoding="utf-8")
+    details_path = report_details_path(path)
+    details = expense_breakdown_details_json(report)
+    details_path.write_bytes(details)
+    _write_precompressed_sidecars(details_path, details)
+    body = render_expense_breakdown_html(report, details_source=filename).encode("utf-8")
+    path.write_bytes(body)
+    _write_precompressed_sidecars(path, body)
+    record_report_snapshot(
+        directory,
+        path,
+        owner_name=report.owner_name,
+        year=report.month.year,
+        month=report.month.month,
+    )
     token = create_expense_report_token(
         actor_key=report.actor_key,
         owner_name=report.owner_name,
@@ -587,8 +702,20 @@ def write_expense_breakdown_report(report: ExpenseBreakdownReport, *, report_dir
     return ExpenseReportPage(path=path, url=public_expense_report_url(token))
 
 
-def render_expense_breakdown_html(report: ExpenseBreakdownReport) -> str:
-    payload = expense_breakdown_client_payload(report)
+def _write_precompressed_sidecars(path: Path, body: bytes) -> None:
+    """Write ``.gz``/``.br`` next to a snapshot; aiohttp's FileResponse serves them to clients that accept them."""
+    for encoding in supported_encodings():
+        suffix = ".br" if encoding == "br" else ".gz"
+        path.with_name(f"{path.name}{suffix}").write_bytes(compress_body(body, encoding))
+
+
+def render_expense_breakdown_html(report: ExpenseBreakdownReport, *, details_source: str = "live") -> str:
+    """Render the report page with its overview payload inline.
+
+    ``details_source`` tells the page where to fetch the detail tables from: ``"live"`` for a
+    report built on request, or the snapshot filename whose details sidecar was written with it.
+    """
+    payload = expense_breakdown_page_payload(report, details_source=details_source)
 
     return f"""<!doctype html>
 <html lang="en">
@@ -597,51 +724,109 @@ def render_expense_breakdown_html(report: ExpenseBreakdownReport) -> str:
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>Expense Breakdown - {_escape(report.month.label)}</title>
   <script>{_theme_bootstrap_script()}</script>
-  <style>{_report_asset_text("expense-report-app.css")}</style>
+  <link rel="stylesheet" href="{report_asset_url("expense-report-app.css")}">
 </head>
 <body>
   <div id="bookiebot-expense-report-root"></div>
   <noscript>This report requires JavaScript to render the React expense dashboard.</noscript>
   <script id="bookiebot-expense-report-data" type="application/json">{_json_script_payload(payload)}</script>
   <script>window.process = window.process || {{ env: {{ NODE_ENV: "production" }} }}; window.process.env = window.process.env || {{ NODE_ENV: "production" }};</script>
-  <script>{_report_asset_text("expense-report-app.js")}</script>
+  <script src="{report_asset_url("expense-report-app.js")}"></script>
 </body>
 </html>
 """
 
 
 def expense_breakdown_client_payload(report: ExpenseBreakdownReport) -> dict[str, Any]:
-    """Return the canonical data payload consumed by the web report and read-only agent."""
-    non_zero_breakdown = [
-        (key, info)
-        for key, info in report.breakdown.items()
-        if float(info.get("amount") or 0.0) > 0
-    ]
-    activity_entries = _report_activity_entries(report)
-    top_entries = _report_highlight_entries(report, activity_entries)
-    person_totals = _person_totals(activity_entries)
-    merchant_totals = _merchant_totals(activity_entries)
-    merchant_occurrences = _merchant_occurrences(activity_entries)
-    daily_totals = _daily_totals(activity_entries)
-    budget_group_totals = {
-        "Needs": round(report.category_spending.get("needs", 0.0), 2),
-        "Wants": round(report.category_spending.get("wants", 0.0), 2),
+    """Return the canonical data payload consumed by the web report and read-only agent.
+
+    The payload is assembled once per report from the memoized fields and shared between
+    callers, so it must be treated as read-only.
+    """
+    return _memoized(report, "payload", lambda: dict(expense_breakdown_payload_fields(report)))
+
+
+def expense_breakdown_page_payload(report: ExpenseBreakdownReport, *, details_source: str = "live") -> dict[str, Any]:
+    """The client payload embedded in the report page, with the detail tables left empty.
+
+    The page renders from this straight away and fills ``topEntries``, ``dailyEntries``, and
+    ``merchantOccurrences`` from the details endpoint named under ``details``.
+    """
+    payload = {
+        key: [] if key in EXPENSE_REPORT_DETAIL_FIELDS else value
+        for key, value in expense_breakdown_client_payload(report).items()
     }
-    balance_after_expenses = report.net_total
-    return _report_client_payload(
-        report=report,
-        activity_entries=activity_entries,
-        breakdown_items=non_zero_breakdown,
-        daily_totals=daily_totals,
-        budget_group_totals=budget_group_totals,
-        person_totals=person_totals,
-        merchant_totals=merchant_totals,
-        merchant_occurrences=merchant_occurrences,
-        top_entries=top_entries,
-        balance_after_expenses=balance_after_expenses,
+    payload["details"] = {"path": EXPENSE_REPORT_DETAILS_PATH, "source": details_source}
+    return payload
+
+
+def expense_breakdown_details_payload(report: ExpenseBreakdownReport) -> dict[str, Any]:
+    """The detail tables as columnar arrays, ``{field: {column: [value, ...]}}``.
+
+    Row lists repeat every key per entry; one list per column keeps the JSON a fraction of the
+    size before compression and lets the page rebuild rows with a single pass.
+    """
+    fields = expense_breakdown_payload_fields(report)
+    return _memoized(
+        report,
+        "details",
+        lambda: {
+            "version": _DETAILS_PAYLOAD_VERSION,
+            **{name: _columnar_rows(fields[name]) for name in EXPENSE_REPORT_DETAIL_FIELDS},
+        },
     )
 
 
+def expense_breakdown_details_json(report: ExpenseBreakdownReport) -> bytes:
+    return _memoized(
+        report,
+        "details_json",
+        lambda: json.dumps(
+            expense_breakdown_details_payload(report), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"),
+    )
+
+
+def _columnar_rows(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    columns: dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return {column: [row.get(column) for row in rows] for column in columns}
+
+
+def expense_breakdown_payload_fields(report: ExpenseBreakdownReport) -> Mapping[str, Any]:
+    """Read-only view of the client payload that computes each field on first access.
+
+    Mode views and agent sections read only the fields they need; whatever they compute is
+    reused by later reads and by :func:`expense_breakdown_client_payload`.
+    """
+    return _ReportPayloadFields(report)
+
+
+class _ReportPayloadFields(Mapping[str, Any]):
+    def __init__(self, report: ExpenseBreakdownReport) -> None:
+        self._report = report
+
+    def __getitem__(self, name: str) -> Any:
+        build = _CLIENT_PAYLOAD_FIELDS[name]
+        return _memoized(self._report, f"field:{name}", lambda: build(self._report))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CLIENT_PAYLOAD_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_CLIENT_PAYLOAD_FIELDS)
+
+
+def _memoized(report: ExpenseBreakdownReport, key: str, build: Callable[[], Any]) -> Any:
+    memo = report._payload_memo
+    try:
+        return memo[key]
+    except KeyError:
+        value = memo[key] = build()
+        return value
+
+
 def _is_current_month(month: BudgetMonth) -> bool:
     current = now_pacific()
     return current.year == month.year and current.month == month.month
@@ -668,15 +853,18 @@ def _optional_spreadsheet_by_key(gc: Any, spreadsheet_id: str) -> Any | None:
         return None
 
 
-def _optional_budget_history(actor_key: str, month: BudgetMonth) -> tuple[BudgetHistoryRows, ...]:
-    history: tuple[BudgetHistoryRows, ...] = ()
+def _optional_budget_history(actor_key: str, month: BudgetMonth) -> tuple[BudgetHistoryDigest, ...]:
+    history: tuple[BudgetHistoryDigest, ...] = ()
     try:
         from bookiebot.sheets.auth import get_gspread_client
         from bookiebot.sheets.routing import get_budget_spreadsheet_id_for_user
 
         spreadsheet_id = get_budget_spreadsheet_id_for_user(actor_key, month.year)
-        spreadsheet = get_gspread_client().open_by_key(spreadsheet_id)
-        history = _budget_history_from_spreadsheet(spreadsheet, month)
+        history = _budget_history_before(
+            actor_key,
+            month,
+            lambda: get_gspread_client().open_by_key(spreadsheet_id),
+        )
     except Exception:
         pass
     return _optional_previous_year_budget_history(actor_key, month) + history
@@ -685,7 +873,7 @@ def _optional_budget_history(actor_key: str, month: BudgetMonth) -> tuple[Budget
 def _optional_previous_year_budget_history(
     actor_key: str,
     month: BudgetMonth,
-) -> tuple[BudgetHistoryRows, ...]:
+) -> tuple[BudgetHistoryDigest, ...]:
     previous_month = _previous_budget_month(month)
     if previous_month.year == month.year:
         return ()
@@ -693,26 +881,88 @@ def _optional_previous_year_budget_history(
         from bookiebot.sheets.auth import get_gspread_client
         from bookiebot.sheets.routing import get_budget_spreadsheet_id_for_user
 
-        spreadsheet_id = get_budget_spreadsheet_id_for_user(actor_key, previous_month.year)
-        spreadsheet = get_gspread_client().open_by_key(spreadsheet_id)
-        worksheet = _worksheet_by_name(spreadsheet, previous_month.name)
-        if worksheet is None:
-            return ()
-        return (BudgetHistoryRows(previous_month, _rows(worksheet)),)
+        digest = _budget_history_digest_for_month(
+            actor_key,
+            previous_month,
+            lambda: get_gspread_client().open_by_key(get_budget_spreadsheet_id_for_user(actor_key, previous_month.year)),
+        )
+        return (digest,) if digest is not None else ()
     except Exception:
         return ()
 
 
-def _budget_history_from_spreadsheet(spreadsheet: Any, month: BudgetMonth) -> tuple[BudgetHistoryRows, ...]:
-    history: list[BudgetHistoryRows] = []
-    for month_number in range(1, month.month + 1):
-        worksheet = _worksheet_by_name(spreadsheet, calendar.month_name[month_number])
-        if worksheet is None:
-            continue
-        history.append(BudgetHistoryRows(BudgetMonth(month.year, month_number), _rows(worksheet)))
+def _budget_history_before(
+    actor_key: str,
+    month: BudgetMonth,
+    open_spreadsheet: Callable[[], Any],
+) -> tuple[BudgetHistoryDigest, ...]:
+    """Digests for January up to the month before ``month``; the report month comes from its own tab.
+
+    The spreadsheet is only opened when some month has no cached digest yet.
+    """
+    spreadsheet: Any | None = None
+
+    def spreadsheet_once() -> Any:
+        nonlocal spreadsheet
+        if spreadsheet is None:
+            spreadsheet = open_spreadsheet()
+        return spreadsheet
+
+    history: list[BudgetHistoryDigest] = []
+    for month_number in range(1, month.month):
+        digest = _budget_history_digest_for_month(actor_key, BudgetMonth(month.year, month_number), spreadsheet_once)
+        if digest is not None:
+            history.append(digest)
     return tuple(history)
 
 
+def _budget_history_digest_for_month(
+    actor_key: str,
+    month: BudgetMonth,
+    open_spreadsheet: Callable[[], Any],
+) -> BudgetHistoryDigest | None:
+    from bookiebot.reports.report_cache import load_budget_history_digest, save_budget_history_digest
+
+    settled = _is_settled_month(month)
+    digest = load_budget_history_digest(actor_key, month) if settled else None
+    if digest is not None:
+        return digest
+    worksheet = _worksheet_by_name(open_spreadsheet(), month.name)
+    if worksheet is None:
+        return None
+    digest = budget_history_digest(BudgetHistoryRows(month, _rows(worksheet)))
+    if settled:
+        save_budget_history_digest(actor_key, digest)
+    return digest
+
+
+def budget_history_digest(history: BudgetHistoryRows | BudgetHistoryDigest) -> BudgetHistoryDigest:
+    if isinstance(history, BudgetHistoryDigest):
+        return history
+    return _budget_history_digest_from_sheet(history.month, _sheet_index(history.rows))
+
+
+def _budget_history_digest_from_sheet(month: BudgetMonth, sheet: _SheetIndex) -> BudgetHistoryDigest:
+    income_entries, _income_total = _income_entries(sheet)
+    return BudgetHistoryDigest(
+        month=month,
+        labeled_amounts=tuple(_labeled_amounts(sheet)),
+        income_entries=tuple(income_entries),
+        income_projection_config=_income_projection_config(sheet),
+    )
+
+
+def _budget_history_digests(
+    budget_history: tuple[BudgetHistoryRows | BudgetHistoryDigest, ...],
+    month: BudgetMonth,
+    personal_sheet: _SheetIndex,
+) -> tuple[BudgetHistoryDigest, ...]:
+    digests = tuple(budget_history_digest(item) for item in budget_history)
+    if any(item.month == month for item in digests):
+        return digests
+    return digests + (_budget_history_digest_from_sheet(month, personal_sheet),)
+
+
 def _previous_budget_month(month: BudgetMonth) -> BudgetMonth:
     if month.month == 1:
         return BudgetMonth(month.year - 1, 12)
@@ -726,6 +976,39 @@ def _rows(ws: Any) -> list[list[str]]:
     return [[str(value) for value in row] for row in rows]
 
 
+def _sheet_index(rows: list[list[str]]) -> _SheetIndex:
+    labels: list[list[str]] = []
+    row_texts: list[str] = []
+    money: list[list[float | None]] = []
+    dates: list[list[datetime | None]] = []
+    positions: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for row_index, row in enumerate(rows):
+        row_labels: list[str] = []
+        row_money: list[float | None] = []
+        row_dates: list[datetime | None] = []
+        for column, value in enumerate(row):
+            text = str(value).strip()
+            label = _normalize_label(text) if text else ""
+            has_digit = _DIGIT_PATTERN.search(text) is not None
+            row_labels.append(label)
+            row_money.append(_cell_money(text) if has_digit else None)
+            row_dates.append(_parse_date(text) if has_digit and ("/" in text or "-" in text) else None)
+            if label:
+                positions[label].append((row_index, column))
+        labels.append(row_labels)
+        row_texts.append(" ".join(label for label in row_labels if label))
+        money.append(row_money)
+        dates.append(row_dates)
+    return _SheetIndex(
+        rows=rows,
+        labels=labels,
+        row_texts=row_texts,
+        money=money,
+        dates=dates,
+        positions={label: tuple(cells) for label, cells in positions.items()},
+    )
+
+
 def _ordered_breakdown_amounts() -> dict[str, float]:
     return {key: 0.0 for key in CATEGORY_LABELS}
 
@@ -773,28 +1056,40 @@ def _entries_for_category(entries: list[ExpenseEntry], category: str) -> list[Ex
     return [entry for entry in entries if entry.category == category]
 
 
-def _payment_items(rows: list[list[str]], bill_schedule_rows: list[list[str]], month: BudgetMonth) -> list[PaymentItem]:
+def _labeled_amounts(sheet: _SheetIndex) -> list[tuple[str, float]]:
+    """Every labeled cell followed by a positive amount, in sheet order."""
+    labeled: list[tuple[str, float]] = []
+    for row_index, column, label_text in sheet.cells():
+        amount = sheet.next_money(row_index, column + 1)
+        if amount > 0:
+            labeled.append((label_text, round(amount, 2)))
+    return labeled
+
+
+def _payment_items_from_labeled_amounts(
+    labeled_amounts: tuple[tuple[str, float], ...],
+    bill_schedule_rows: list[list[str]],
+    month: BudgetMonth,
+) -> list[PaymentItem]:
     items_by_label: dict[str, PaymentItem] = {}
     labels = dict(PAYMENT_GROUPS)
     labels.update(_bill_schedule_labels(bill_schedule_rows, month))
-
-    for row in rows:
-        for index, value in enumerate(row):
-            label_text = _normalize_label(value)
-            if not label_text:
-                continue
-            matched = _matched_payment_label(label_text, labels)
-            if matched is None:
-                continue
-            group, display_label = matched
-            amount = _next_money(row, index + 1)
-            if amount <= 0:
-                continue
-            key = _normalize_label(display_label)
-            items_by_label[key] = PaymentItem(display_label, round(amount, 2), group)
+    matches: dict[str, tuple[str, str] | None] = {}
+    for label_text, amount in labeled_amounts:
+        if label_text not in matches:
+            matches[label_text] = _matched_payment_label(label_text, labels)
+        matched = matches[label_text]
+        if matched is None:
+            continue
+        group, display_label = matched
+        items_by_label[_normalize_label(display_label)] = PaymentItem(display_label, amount, group)
     return sorted(items_by_label.values(), key=lambda item: (item.group, item.label.lower()))
 
 
+def _payment_items(sheet: _SheetIndex, bill_schedule_rows: list[list[str]], month: BudgetMonth) -> list[PaymentItem]:
+    return _payment_items_from_labeled_amounts(tuple(_labeled_amounts(sheet)), bill_schedule_rows, month)
+
+
 def _bill_schedule_labels(rows: list[list[str]], month: BudgetMonth) -> dict[str, tuple[str, str]]:
     if not rows:
         return {}
@@ -839,11 +1134,11 @@ def _quarterly_bill_months_by_label(rows: list[list[str]]) -> dict[str, frozense
 
 
 def _subscription_bucket_totals(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
     subscriptions: list[SubscriptionItem],
 ) -> tuple[float, float]:
-    static_needs_found, static_needs_total = _amount_for_any_label(rows, ("Static Bills & Subscriptions (Needs)",))
-    wants_found, wants_total = _amount_for_any_label(rows, ("Subscriptions (Wants)",))
+    static_needs_found, static_needs_total = _amount_for_any_label(sheet, ("Static Bills & Subscriptions (Needs)",))
+    wants_found, wants_total = _amount_for_any_label(sheet, ("Subscriptions (Wants)",))
 
     if not static_needs_found:
         static_needs_total = round(
@@ -860,7 +1155,7 @@ def _subscription_bucket_totals(
 
 
 def _subscription_breakdown_totals(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
     all_subscriptions: list[SubscriptionItem],
     current_month_subscriptions: list[SubscriptionItem],
     month: BudgetMonth,
@@ -870,7 +1165,7 @@ def _subscription_breakdown_totals(
         if not _is_completed_month(month):
             selected_items = _subscriptions_hit_so_far(selected_items, month)
         return _subscription_item_totals(selected_items)
-    return _subscription_bucket_totals(rows, current_month_subscriptions)
+    return _subscription_bucket_totals(sheet, current_month_subscriptions)
 
 
 def _subscription_item_totals(items: list[SubscriptionItem]) -> tuple[float, float]:
@@ -910,6 +1205,25 @@ def _is_completed_month(month: BudgetMonth) -> bool:
     return now_pacific().date() > last_day
 
 
+def _is_settled_month(month: BudgetMonth) -> bool:
+    """A completed month past the grace period for late edits; only these are frozen to disk.
+
+    Sheets does not say which monthly tab an edit touched, so late corrections are picked
+    up by treating a just-finished month like the current one for a few days.
+    """
+    days_in_month = calendar.monthrange(month.year, month.month)[1]
+    last_day = datetime(month.year, month.month, days_in_month, tzinfo=PACIFIC_TZ).date()
+    return now_pacific().date() > last_day + timedelta(days=_closed_month_grace_days())
+
+
+def _closed_month_grace_days() -> int:
+    raw = os.getenv("BOOKIEBOT_CLOSED_MONTH_GRACE_DAYS", "7").strip()
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        return 7
+
+
 def _calendar_events(
     *,
     month: BudgetMonth,
@@ -1166,7 +1480,7 @@ def _configured_income_source(
 
 
 def _prior_month_paycheck_reference(
-    budget_history: tuple[BudgetHistoryRows, ...],
+    budget_history: tuple[BudgetHistoryDigest, ...],
     month: BudgetMonth,
     projection_config: IncomeProjectionConfig | None = None,
 ) -> PaymentItem | None:
@@ -1175,8 +1489,7 @@ def _prior_month_paycheck_reference(
     for history_item in budget_history:
         if history_item.month != previous_month:
             continue
-        income_entries, _income_total = _income_entries(history_item.rows)
-        for item in _paycheck_income_entries(income_entries, projection_config):
+        for item in _paycheck_income_entries(list(history_item.income_entries), projection_config):
             parsed_date = _parse_date(item.date)
             if (
                 parsed_date is None
@@ -1192,7 +1505,7 @@ def _prior_month_paycheck_reference(
 
 def _income_projection_config_with_prior_month(
     current_config: IncomeProjectionConfig,
-    budget_history: tuple[BudgetHistoryRows, ...],
+    budget_history: tuple[BudgetHistoryDigest, ...],
     month: BudgetMonth,
 ) -> IncomeProjectionConfig:
     if current_config.source_label is not None and current_config.anchor_date is not None:
@@ -1200,7 +1513,7 @@ def _income_projection_config_with_prior_month(
     previous_month = _previous_budget_month(month)
     previous_config = next(
         (
-            _income_projection_config(history_item.rows)
+            history_item.income_projection_config
             for history_item in budget_history
             if history_item.month == previous_month
         ),
@@ -1303,8 +1616,8 @@ def _payment_totals_by_group(payments: list[PaymentItem]) -> dict[str, float]:
     return {group: round(amount, 2) for group, amount in totals.items()}
 
 
-def _personal_expense_subtotal_total(rows: list[list[str]]) -> float | None:
-    totals = _personal_expense_subtotals(rows)
+def _personal_expense_subtotal_total(sheet: _SheetIndex) -> float | None:
+    totals = _personal_expense_subtotals(sheet)
     expense_totals = {
         bucket: amount
         for bucket, amount in totals.items()
@@ -1317,39 +1630,28 @@ def _personal_expense_subtotal_total(rows: list[list[str]]) -> float | None:
     return None
 
 
-def _personal_expense_subtotals(rows: list[list[str]]) -> dict[str, float]:
+def _personal_expense_subtotals(sheet: _SheetIndex) -> dict[str, float]:
     totals: dict[str, float] = {}
-    for row in rows:
-        for index, value in enumerate(row):
-            normalized = _normalize_label(value)
-            if "subtotal" not in normalized:
-                continue
-            bucket = _outflow_subtotal_bucket(normalized)
-            if bucket not in {"needs", "wants", "savings"}:
-                continue
-            amount = _next_money_value(row, index + 1, window=8)
-            if amount is not None:
-                totals[bucket] = round(amount, 2)
+    for row_index, column, normalized in sheet.cells_containing("subtotal"):
+        bucket = _outflow_subtotal_bucket(normalized)
+        if bucket not in {"needs", "wants", "savings"}:
+            continue
+        amount = sheet.next_money_value(row_index, column + 1, window=8)
+        if amount is not None:
+            totals[bucket] = round(amount, 2)
     return totals
 
 
-def _category_budget_amounts(rows: list[list[str]], income_total: float) -> dict[str, float]:
-    for row in rows:
-        for index, value in enumerate(row):
-            normalized = _normalize_label(value)
-            if normalized != "budget" and not normalized.startswith("budget "):
-                continue
-            amounts = [
-                round(_cell_money(cell), 2)
-                for cell in row[index + 1 :]
-                if re.search(r"\d", str(cell))
-            ]
-            if len(amounts) >= 3:
-                return {
-                    "needs": amounts[0],
-                    "wants": amounts[1],
-                    "savings": amounts[2],
-                }
+def _category_budget_amounts(sheet: _SheetIndex, income_total: float) -> dict[str, float]:
+    budget_cells = sheet.cells_matching(lambda label: label == "budget" or label.startswith("budget "))
+    for row_index, column, _label in budget_cells:
+        amounts = sheet.amounts_after(row_index, column + 1)
+        if len(amounts) >= 3:
+            return {
+                "needs": amounts[0],
+                "wants": amounts[1],
+                "savings": amounts[2],
+            }
 
     needs = round(income_total * 0.5, 2)
     savings = round(income_total * 0.2, 2)
@@ -1358,14 +1660,14 @@ def _category_budget_amounts(rows: list[list[str]], income_total: float) -> dict
 
 
 def _category_spending_amounts(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
     breakdown: dict[str, dict[str, Any]],
     *,
     amount_saved: float | None,
     use_sheet_subtotals: bool,
 ) -> dict[str, float]:
     budget_groups = _budget_group_totals(breakdown)
-    subtotals = _personal_expense_subtotals(rows) if use_sheet_subtotals else {}
+    subtotals = _personal_expense_subtotals(sheet) if use_sheet_subtotals else {}
     return {
         "needs": round(
             budget_groups["Needs"]
@@ -1393,21 +1695,10 @@ def _outflow_subtotal_bucket(label: str) -> str | None:
     return None
 
 
-def _next_money_value(row: list[str], start_index: int, *, window: int = 4) -> float | None:
-    for value in row[start_index : start_index + window]:
-        text = str(value).strip()
-        if not text or not re.search(r"\d", text):
-            continue
-        match = re.search(r"-?\$?\s*\d[\d,]*(?:\.\d+)?", text)
-        if match is not None:
-            return clean_money(match.group(0).replace(" ", ""))
-    return None
-
-
-def _budget_shared_category_totals(rows: list[list[str]]) -> dict[str, float]:
+def _budget_shared_category_totals(sheet: _SheetIndex) -> dict[str, float]:
     totals: dict[str, float] = {}
     for category, labels in BUDGET_SHARED_CATEGORY_LABELS.items():
-        found, amount = _amount_for_any_label(rows, labels)
+        found, amount = _amount_for_any_label(sheet, labels)
         if found:
             totals[category] = amount
     return totals
@@ -1422,21 +1713,18 @@ def _entry_totals_by_category(entries: list[ExpenseEntry]) -> dict[str, float]:
     return {category: round(amount, 2) for category, amount in totals.items()}
 
 
-def _amount_for_label(rows: list[list[str]], label: str) -> float:
-    _found, amount = _amount_for_any_label(rows, (label,))
+def _amount_for_label(sheet: _SheetIndex, label: str) -> float:
+    _found, amount = _amount_for_any_label(sheet, (label,))
     return amount
 
 
-def _amount_for_any_label(rows: list[list[str]], labels: tuple[str, ...]) -> tuple[bool, float]:
+def _amount_for_any_label(sheet: _SheetIndex, labels: tuple[str, ...]) -> tuple[bool, float]:
     targets = tuple(_normalize_label(label) for label in labels)
-    for row in rows:
-        for index, value in enumerate(row):
-            normalized = _normalize_label(value)
-            if not normalized:
-                continue
-            if any(_labels_match(normalized, target) for target in targets):
-                return True, round(_next_money(row, index + 1), 2)
-    return False, 0.0
+    matches = sheet.cells_matching(lambda normalized: any(_labels_match(normalized, target) for target in targets))
+    if not matches:
+        return False, 0.0
+    row_index, column, _label = matches[0]
+    return True, round(sheet.next_money(row_index, column + 1), 2)
 
 
 def _subscription_bucket(item: SubscriptionItem) -> str:
@@ -1475,29 +1763,24 @@ def _current_month_subscription_items(items: list[SubscriptionItem], month: Budg
     return [item for item in items if _subscription_day_in_month(item, month) is not None]
 
 
-def _income_entries(rows: list[list[str]]) -> tuple[list[PaymentItem], float]:
-    summary_total = _monthly_income_summary(rows)
-    marker_index = _monthly_income_marker_index(rows)
+def _income_entries(sheet: _SheetIndex) -> tuple[list[PaymentItem], float]:
+    summary_total = _monthly_income_summary(sheet)
+    marker_index = _monthly_income_marker_index(sheet)
     items: list[PaymentItem] = []
-    layout = _income_table_layout(rows, marker_index)
+    layout = _income_table_layout(sheet, marker_index)
 
     if marker_index is not None and layout is not None:
-        for row in rows[layout.header_row_index + 1 : marker_index]:
-            item = _income_entry_from_layout(row, layout)
-            if item:
-                items.append(item)
-    elif marker_index is not None:
-        for row in rows[:marker_index]:
-            if _is_income_projection_config_row(row):
-                continue
-            item = _income_entry_from_row(row)
+        for row_index in range(layout.header_row_index + 1, marker_index):
+            item = _income_entry_from_layout(sheet, row_index, layout)
             if item:
                 items.append(item)
     else:
-        for row in rows:
-            if _is_income_projection_config_row(row):
+        config_rows = _income_projection_config_rows(sheet)
+        scan_end = marker_index if marker_index is not None else len(sheet.rows)
+        for row_index in range(scan_end):
+            if row_index in config_rows:
                 continue
-            item = _income_entry_from_row(row, require_income_like_label=True)
+            item = _income_entry_from_row(sheet, row_index, require_income_like_label=marker_index is None)
             if item:
                 items.append(item)
 
@@ -1506,16 +1789,15 @@ def _income_entries(rows: list[list[str]]) -> tuple[list[PaymentItem], float]:
 
 
 def _income_table_layout(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
     marker_index: int | None,
 ) -> _IncomeTableLayout | None:
-    scan_rows = rows[:marker_index] if marker_index is not None else rows
-    for row_index, row in enumerate(scan_rows):
+    scan_rows = sheet.labels[:marker_index] if marker_index is not None else sheet.labels
+    for row_index, row_labels in enumerate(scan_rows):
         source_column: int | None = None
         amount_column: int | None = None
         date_column: int | None = None
-        for column, value in enumerate(row):
-            normalized = _normalize_label(value)
+        for column, normalized in enumerate(row_labels):
             if normalized == "date":
                 date_column = column
             elif normalized in {"source", "employer"}:
@@ -1532,109 +1814,95 @@ def _income_table_layout(
     return None
 
 
-def _income_entry_from_layout(row: list[str], layout: _IncomeTableLayout) -> PaymentItem | None:
+def _income_entry_from_layout(sheet: _SheetIndex, row_index: int, layout: _IncomeTableLayout) -> PaymentItem | None:
+    row = sheet.rows[row_index]
     if layout.source_column >= len(row) or layout.amount_column >= len(row):
         return None
     label = str(row[layout.source_column]).strip()
-    amount = _cell_money(row[layout.amount_column])
+    amount = sheet.amount(row_index, layout.amount_column)
     if amount <= 0 or not label or label.startswith("<") or _is_non_income_label(label):
         return None
     date = ""
     if layout.date_column is not None and layout.date_column < len(row):
-        candidate = str(row[layout.date_column]).strip()
-        if _parse_date(candidate) is not None:
-            date = candidate
+        if sheet.dates[row_index][layout.date_column] is not None:
+            date = str(row[layout.date_column]).strip()
     return PaymentItem(label=label, amount=round(amount, 2), group="income", date=date)
 
 
-def _income_projection_config(rows: list[list[str]]) -> IncomeProjectionConfig:
+def _income_projection_config(sheet: _SheetIndex) -> IncomeProjectionConfig:
     source_label: str | None = None
     anchor_date: datetime | None = None
 
-    for row in rows:
-        normalized_cells = [_normalize_label(value) for value in row]
-        for index, normalized in enumerate(normalized_cells):
-            if not normalized:
-                continue
-            if source_label is None and any(_matches_income_projection_config_label(normalized, label) for label in INCOME_PROJECTION_SOURCE_LABELS):
-                source_label = _next_text_value(row, index + 1, window=6)
-            if anchor_date is None and any(_matches_income_projection_config_label(normalized, label) for label in INCOME_PROJECTION_START_LABELS):
-                anchor_date = _next_date_value(row, index + 1, window=6)
+    source_cells = sheet.cells_matching(
+        lambda normalized: any(_matches_income_projection_config_label(normalized, label) for label in INCOME_PROJECTION_SOURCE_LABELS)
+    )
+    for row_index, column, _label in source_cells:
+        source_label = sheet.next_text(row_index, column + 1, window=6)
+        if source_label is not None:
+            break
+    start_cells = sheet.cells_matching(
+        lambda normalized: any(_matches_income_projection_config_label(normalized, label) for label in INCOME_PROJECTION_START_LABELS)
+    )
+    for row_index, column, _label in start_cells:
+        anchor_date = sheet.next_date(row_index, column + 1, window=6)
+        if anchor_date is not None:
+            break
 
     return IncomeProjectionConfig(source_label=source_label, anchor_date=anchor_date)
 
 
-def _is_income_projection_config_row(row: list[str]) -> bool:
-    normalized_cells = [_normalize_label(value) for value in row]
+def _income_projection_config_rows(sheet: _SheetIndex) -> set[int]:
     labels = INCOME_PROJECTION_SOURCE_LABELS + INCOME_PROJECTION_START_LABELS
-    return any(
-        any(_matches_income_projection_config_label(normalized, label) for label in labels)
-        for normalized in normalized_cells
-        if normalized
+    config_cells = sheet.cells_matching(
+        lambda normalized: any(_matches_income_projection_config_label(normalized, label) for label in labels)
     )
+    return {row_index for row_index, _column, _label in config_cells}
 
 
 def _matches_income_projection_config_label(normalized: str, label: str) -> bool:
     return normalized == label or _contains_normalized_phrase(normalized, label)
 
 
-def _monthly_income_summary(rows: list[list[str]]) -> float:
+def _monthly_income_summary(sheet: _SheetIndex) -> float:
     summary_total = 0.0
-    for row in rows:
-        for index, value in enumerate(row):
-            normalized = _normalize_label(value)
-            if "monthly income" not in normalized:
-                continue
-            amount = _next_money(row, index + 1)
-            if amount > 0:
-                summary_total = max(summary_total, amount)
+    for row_index, column, _label in sheet.cells_containing("monthly income"):
+        amount = sheet.next_money(row_index, column + 1)
+        if amount > 0:
+            summary_total = max(summary_total, amount)
     return round(summary_total, 2)
 
 
-def _monthly_income_marker_index(rows: list[list[str]]) -> int | None:
-    for row_index, row in enumerate(rows):
-        if any(str(value).strip().lower() == "monthly income:" for value in row):
+def _monthly_income_marker_index(sheet: _SheetIndex) -> int | None:
+    for row_index, column in sheet.positions.get("monthly income", ()):
+        if str(sheet.rows[row_index][column]).strip().lower() == "monthly income:":
             return row_index
     return None
 
 
-def _income_entry_from_row(row: list[str], *, require_income_like_label: bool = False) -> PaymentItem | None:
-    for amount_index, value in enumerate(row):
-        amount = _cell_money(value)
-        if amount <= 0:
+def _income_entry_from_row(
+    sheet: _SheetIndex,
+    row_index: int,
+    *,
+    require_income_like_label: bool = False,
+) -> PaymentItem | None:
+    row = sheet.rows[row_index]
+    for amount_index, amount in enumerate(sheet.money[row_index]):
+        if not amount or amount <= 0:
             continue
         label = _nearest_left_label(row, amount_index)
         if not label or _is_non_income_label(label):
             continue
         if require_income_like_label and not _looks_like_income_label(label):
             continue
-        return PaymentItem(label=label, amount=round(amount, 2), group="income", date=_row_date_text(row))
-    return None
-
-
-def _row_date_text(row: list[str]) -> str:
-    for value in row:
-        text = str(value).strip()
-        if _parse_date(text) is not None:
-            return text
-    return ""
-
-
-def _next_text_value(row: list[str], start_index: int, *, window: int = 4) -> str | None:
-    for value in row[start_index : start_index + window]:
-        text = str(value).strip()
-        if not text or _parse_date(text) is not None or _cell_money(text):
-            continue
-        return text
+        return PaymentItem(label=label, amount=round(amount, 2), group="income", date=_row_date_text(sheet, row_index))
     return None
 
 
-def _next_date_value(row: list[str], start_index: int, *, window: int = 4) -> datetime | None:
-    for value in row[start_index : start_index + window]:
-        parsed = _parse_date(str(value).strip())
+def _row_date_text(sheet: _SheetIndex, row_index: int) -> str:
+    for column, parsed in enumerate(sheet.dates[row_index]):
         if parsed is not None:
-            return parsed
-    return None
+            return str(sheet.rows[row_index][column]).strip()
+    return ""
 
 
 def _nearest_left_label(row: list[str], index: int) -> str:
@@ -1656,35 +1924,29 @@ def _is_non_income_label(label: str) -> bool:
     return False
 
 
-def _remaining_budget(rows: list[list[str]]) -> float | None:
-    remaining_needs_budget, _remaining_wants_budget = _margin_amounts(rows)
+def _remaining_budget(sheet: _SheetIndex) -> float | None:
+    remaining_needs_budget, _remaining_wants_budget = _margin_amounts(sheet)
     return remaining_needs_budget
 
 
-def _category_rollover_amounts(rows: list[list[str]]) -> tuple[float | None, float | None]:
-    rollover_column: int | None = None
-    for row in rows:
-        for index, value in enumerate(row):
-            if "rollover" in _normalize_label(value):
-                rollover_column = index
-                break
-        if rollover_column is not None:
-            break
+def _category_rollover_amounts(sheet: _SheetIndex) -> tuple[float | None, float | None]:
+    rollover_cells = sheet.cells_containing("rollover")
+    rollover_column = rollover_cells[0][1] if rollover_cells else None
 
-    margin_needs, margin_wants = _margin_amounts(rows)
+    margin_needs, margin_wants = _margin_amounts(sheet)
     if rollover_column is None:
         return margin_needs, margin_wants
 
     rollover_needs: float | None = None
     rollover_wants: float | None = None
-    for row in rows:
-        normalized_row = " ".join(_normalize_label(value) for value in row if str(value).strip())
+    for row_index, normalized_row in enumerate(sheet.row_texts):
         if "subtotal" not in normalized_row:
             continue
-        rollover_cell = _cell(row, rollover_column)
-        if not re.search(r"\d", str(rollover_cell)):
+        row_money = sheet.money[row_index]
+        value = row_money[rollover_column] if rollover_column < len(row_money) else None
+        if value is None:
             continue
-        amount = round(_cell_money(rollover_cell), 2)
+        amount = round(value, 2)
         if "need" in normalized_row:
             rollover_needs = amount
         elif "want" in normalized_row:
@@ -1696,28 +1958,23 @@ def _category_rollover_amounts(rows: list[list[str]]) -> tuple[float | None, flo
     )
 
 
-def _margin_amounts(rows: list[list[str]]) -> tuple[float | None, float | None]:
-    needs_budget, wants_budget, _savings_budget = _category_margin_amounts(rows)
+def _margin_amounts(sheet: _SheetIndex) -> tuple[float | None, float | None]:
+    needs_budget, wants_budget, _savings_budget = _category_margin_amounts(sheet)
     return needs_budget, wants_budget
 
 
 def _category_margin_amounts(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
 ) -> tuple[float | None, float | None, float | None]:
-    for row in rows:
-        for index, value in enumerate(row):
-            if "margins" not in str(value).strip().lower():
-                continue
-            amounts = [
-                round(_cell_money(cell), 2)
-                for cell in row[index + 1 :]
-                if re.search(r"\d", str(cell))
-            ]
-            needs_budget = amounts[0] if amounts else None
-            wants_budget = amounts[1] if len(amounts) > 1 else None
-            savings_budget = amounts[2] if len(amounts) > 2 else None
-            return needs_budget, wants_budget, savings_budget
-    return None, None, None
+    margin_cells = sheet.cells_containing("margins")
+    if not margin_cells:
+        return None, None, None
+    row_index, column, _label = margin_cells[0]
+    amounts = sheet.amounts_after(row_index, column + 1)
+    needs_budget = amounts[0] if amounts else None
+    wants_budget = amounts[1] if len(amounts) > 1 else None
+    savings_budget = amounts[2] if len(amounts) > 2 else None
+    return needs_budget, wants_budget, savings_budget
 
 
 CATEGORY_BALANCE_PRIORITIES = (
@@ -1791,18 +2048,21 @@ def _category_balance_payload(report: ExpenseBreakdownReport) -> dict[str, Any]:
     )
 
 
-def _savings_deposits(rows: list[list[str]]) -> list[SavingsDeposit]:
-    for row in rows:
-        normalized_cells = [_normalize_label(value) for value in row]
+def _savings_deposits(sheet: _SheetIndex) -> list[SavingsDeposit]:
+    rows = sheet.rows
+    for row_index, row_text in enumerate(sheet.row_texts):
+        if not any(_contains_normalized_phrase(row_text, phrase) for phrase in MONTHLY_SAVINGS_LABEL_PHRASES):
+            continue
+        normalized_cells = sheet.labels[row_index]
         for index in range(len(normalized_cells)):
             if not _is_monthly_savings_label(normalized_cells, index):
                 continue
-            _ideal_found, ideal = _savings_target_amount(row, "ideal")
-            _minimum_found, minimum = _savings_target_amount(row, "minimum")
+            _ideal_found, ideal = _savings_target_amount(sheet, row_index, "ideal")
+            _minimum_found, minimum = _savings_target_amount(sheet, row_index, "minimum")
             return [
                 SavingsDeposit(
                     number=1,
-                    actual=round(_savings_deposit_amount(row, index), 2),
+                    actual=round(_savings_deposit_amount(rows[row_index], index), 2),
                     ideal=round(ideal, 2),
                     minimum=round(minimum, 2),
                 )
@@ -1812,32 +2072,31 @@ def _savings_deposits(rows: list[list[str]]) -> list[SavingsDeposit]:
     # all new/current sheets use the single monthly contribution row above.
     deposits: list[SavingsDeposit] = []
     found_checks: set[int] = set()
-    for row_index, row in enumerate(rows):
-        normalized_cells = [_normalize_label(value) for value in row]
-        row_text = " ".join(cell for cell in normalized_cells if cell)
+    for row_index, row_text in enumerate(sheet.row_texts):
         if "deposit" not in row_text:
             continue
+        normalized_cells = sheet.labels[row_index]
         for check_number in sorted(SAVINGS_DEPOSIT_LABEL_PHRASES):
             if check_number in found_checks:
                 continue
             for index in range(len(normalized_cells)):
                 if not _is_check_deposit_label(normalized_cells, index, check_number):
                     continue
-                _ideal_found, ideal = _savings_target_amount(row, "ideal")
-                _minimum_found, minimum = _savings_target_amount(row, "minimum")
+                _ideal_found, ideal = _savings_target_amount(sheet, row_index, "ideal")
+                _minimum_found, minimum = _savings_target_amount(sheet, row_index, "minimum")
 
                 # Legacy two-paycheck sheets put the shared Ideal label on the
                 # first row and Minimum label on the second row. New sheets put
                 # both targets on every numbered deposit row.
                 if not _ideal_found and check_number == 2 and row_index > 0:
-                    _ideal_found, ideal = _savings_target_amount(rows[row_index - 1], "ideal")
+                    _ideal_found, ideal = _savings_target_amount(sheet, row_index - 1, "ideal")
                 if not _minimum_found and check_number == 1 and row_index + 1 < len(rows):
-                    _minimum_found, minimum = _savings_target_amount(rows[row_index + 1], "minimum")
+                    _minimum_found, minimum = _savings_target_amount(sheet, row_index + 1, "minimum")
 
                 deposits.append(
                     SavingsDeposit(
                         number=check_number,
-                        actual=round(_savings_deposit_amount(row, index), 2),
+                        actual=round(_savings_deposit_amount(rows[row_index], index), 2),
                         ideal=round(ideal, 2),
                         minimum=round(minimum, 2),
                     )
@@ -1847,30 +2106,29 @@ def _savings_deposits(rows: list[list[str]]) -> list[SavingsDeposit]:
     return sorted(deposits, key=lambda item: item.number)
 
 
-def _savings_target_amount(row: list[str], target: str) -> tuple[bool, float]:
-    for value in row:
-        normalized = _normalize_label(value)
+def _savings_target_amount(sheet: _SheetIndex, row_index: int, target: str) -> tuple[bool, float]:
+    for column, normalized in enumerate(sheet.labels[row_index]):
         if normalized.startswith(target):
-            return True, _cell_money(value)
+            return True, sheet.amount(row_index, column)
     return False, 0.0
 
 
 def _amount_saved(
-    rows: list[list[str]],
+    sheet: _SheetIndex,
     *,
     deposits: list[SavingsDeposit] | None = None,
 ) -> float | None:
-    parsed = deposits if deposits is not None else _savings_deposits(rows)
+    parsed = deposits if deposits is not None else _savings_deposits(sheet)
     if not parsed:
         return None
     return round(sum(item.actual for item in parsed), 2)
 
 
-def _savings_goal(rows: list[list[str]]) -> float | None:
-    for row in rows:
-        if not any("budget" in _normalize_label(value) for value in row):
+def _savings_goal(sheet: _SheetIndex) -> float | None:
+    for row_index, row_text in enumerate(sheet.row_texts):
+        if "budget" not in row_text:
             continue
-        amounts = _money_values(row, 0)
+        amounts = [amount for amount in sheet.amounts_after(row_index, 0) if amount]
         if len(amounts) >= 4:
             return amounts[3]
         if len(amounts) >= 3:
@@ -1878,9 +2136,8 @@ def _savings_goal(rows: list[list[str]]) -> float | None:
 
     total = 0.0
     found = False
-    for row in rows:
-        normalized_cells = [_normalize_label(value) for value in row]
-        row_text = " ".join(cell for cell in normalized_cells if cell)
+    for row_index, row_text in enumerate(sheet.row_texts):
+        normalized_cells = sheet.labels[row_index]
         if not any(
             phrase in row_text
             for phrase in ("monthly savings contribution", "paycheck deposit")
@@ -1888,7 +2145,7 @@ def _savings_goal(rows: list[list[str]]) -> float | None:
             continue
         for index, cell in enumerate(normalized_cells):
             if cell.startswith("ideal"):
-                amount = _cell_money(_cell(row, index))
+                amount = sheet.amount(row_index, index)
                 if amount:
                     total += amount
                     found = True
@@ -1896,19 +2153,18 @@ def _savings_goal(rows: list[list[str]]) -> float | None:
     return round(total, 2) if found else None
 
 
-def _need_expense_items(rows: list[list[str]]) -> list[PaymentItem]:
+def _need_expense_items(sheet: _SheetIndex) -> list[PaymentItem]:
     items: list[PaymentItem] = []
     in_needs_section = False
 
-    for row in rows:
-        row_text = " ".join(_normalize_label(value) for value in row if str(value).strip())
+    for row_index, row_text in enumerate(sheet.row_texts):
         if not in_needs_section:
             if "needs" in row_text and "wants" in row_text and "savings" in row_text:
                 in_needs_section = True
             continue
         if "needs subtotal" in row_text:
             break
-        item = _need_expense_item_from_row(row)
+        item = _need_expense_item_from_row(sheet, row_index)
         if item is not None:
             items.append(item)
 
@@ -1927,10 +2183,10 @@ def _need_expense_items_from_entries(entries: list[ExpenseEntry]) -> list[Paymen
     ]
 
 
-def _need_expense_item_from_row(row: list[str]) -> PaymentItem | None:
-    for amount_index, value in enumerate(row):
-        amount = _cell_money(value)
-        if amount <= 0:
+def _need_expense_item_from_row(sheet: _SheetIndex, row_index: int) -> PaymentItem | None:
+    row = sheet.rows[row_index]
+    for amount_index, amount in enumerate(sheet.money[row_index]):
+        if not amount or amount <= 0:
             continue
         label = _nearest_left_label(row, amount_index)
         if not label or _is_excluded_need_expense_label(label):
@@ -1955,7 +2211,7 @@ def _is_excluded_need_expense_label(label: str) -> bool:
 
 
 def _utility_history_items(
-    budget_history: tuple[BudgetHistoryRows, ...],
+    budget_history: tuple[BudgetHistoryDigest, ...],
     bill_schedule_rows: list[list[str]],
     selected_month: BudgetMonth,
 ) -> list[UtilityHistoryItem]:
@@ -1969,7 +2225,7 @@ def _utility_history_items(
     quarterly_months_by_label = _quarterly_bill_months_by_label(bill_schedule_rows)
     by_label: dict[str, dict[str, Any]] = {}
     for history_item in history:
-        monthly_items = _payment_items(history_item.rows, bill_schedule_rows, history_item.month)
+        monthly_items = _payment_items_from_labeled_amounts(history_item.labeled_amounts, bill_schedule_rows, history_item.month)
         monthly_amounts = {
             _normalize_label(item.label): item
             for item in monthly_items
@@ -2039,23 +2295,11 @@ def _is_monthly_savings_label(normalized_cells: list[str], index: int) -> bool:
     )
 
 
-def _money_values(row: list[str], start_index: int) -> list[float]:
-    values: list[float] = []
-    for value in row[start_index:]:
-        text = str(value).strip()
-        if not text or not re.search(r"\d", text):
-            continue
-        amount = _cell_money(text)
-        if amount:
-            values.append(round(amount, 2))
-    return values
-
-
 def _cell_money(value: Any) -> float:
     text = str(value).strip()
-    if not text or not re.search(r"\d", text):
+    if not text or not _DIGIT_PATTERN.search(text):
         return 0.0
-    match = re.search(r"-?\$?\s*\d[\d,]*(?:\.\d+)?", text)
+    match = _MONEY_PATTERN.search(text)
     if match is None:
         return 0.0
     return clean_money(match.group(0).replace(" ", ""))
@@ -2095,19 +2339,13 @@ def _labels_match(label_text: str, label: str) -> bool:
 
 
 def _contains_normalized_phrase(text: str, phrase: str) -> bool:
-    return re.search(rf"(?:^| ){re.escape(phrase)}(?: |$)", text) is not None
-
-
-def _next_money(row: list[str], start_index: int, *, window: int = 4) -> float:
-    for value in row[start_index : start_index + window]:
-        amount = _cell_money(value)
-        if amount:
-            return amount
-    return 0.0
+    # Normalized labels are single-space separated words, so a padded substring
+    # test is the same whole-word match as anchoring the phrase on spaces.
+    return f" {phrase} " in f" {text} "
 
 
 def _normalize_label(value: str) -> str:
-    return re.sub(r"[^a-z0-9&]+", " ", str(value).strip().lower()).strip()
+    return _LABEL_SEPARATOR_PATTERN.sub(" ", str(value).strip().lower()).strip()
 
 
 def _cell(row: list[str], index: int | None) -> str:
@@ -2248,7 +2486,7 @@ def _need_expense_entries(report: ExpenseBreakdownReport) -> list[ExpenseEntry]:
 
 
 def _report_filename(report: ExpenseBreakdownReport) -> str:
-    owner = re.sub(r"[^a-z0-9]+", "-", report.owner_name.lower()).strip("-") or "budget"
+    owner = report_owner_slug(report.owner_name)
     suffix = secrets.token_urlsafe(12)
     return f"expense-breakdown-{owner}-{report.month.year}-{report.month.month:02d}-{suffix}.html"
 
@@ -2277,108 +2515,114 @@ def _metric_card(label: str, value: float | None, note: str = "") -> str:
 </div>"""
 
 
-def _report_client_payload(
-    *,
-    report: ExpenseBreakdownReport,
-    activity_entries: list[ExpenseEntry],
-    breakdown_items: list[tuple[str, dict[str, Any]]],
-    daily_totals: list[tuple[str, float]],
-    budget_group_totals: dict[str, float],
-    person_totals: list[tuple[str, float]],
-    merchant_totals: list[tuple[str, float]],
-    merchant_occurrences: list[dict[str, Any]],
-    top_entries: list[ExpenseEntry],
-    balance_after_expenses: float | None,
-) -> dict[str, Any]:
-    days_in_month = calendar.monthrange(report.month.year, report.month.month)[1]
-    elapsed_days = _elapsed_days_for_month(report.month)
-    selected_month_subscriptions = _current_month_subscription_items(
-        report.subscriptions,
-        report.month,
-    )
+def _report_activity_entries_memo(report: ExpenseBreakdownReport) -> list[ExpenseEntry]:
+    return _memoized(report, "activity_entries", lambda: _report_activity_entries(report))
 
-    payload: dict[str, Any] = {
-        "ownerName": report.owner_name,
-        "monthLabel": report.month.label,
-        "year": report.month.year,
-        "month": report.month.month,
-        "daysInMonth": days_in_month,
-        "elapsedDays": elapsed_days,
-        "generatedAt": report.generated_at.strftime("%b %-d, %Y %-I:%M %p %Z"),
-        "metrics": {
-            "totalExpenses": report.personal_total,
-            "sharedExpenses": report.shared_total,
-            "personalOutflows": report.personal_total,
-            "fixedCommitments": _fixed_commitments_total(report.breakdown),
-            "monthlyIncome": report.income_total,
-            "remainingBudget": report.remaining_budget,
-            "remainingNeedsBudget": report.remaining_budget,
-            "remainingWantsBudget": report.remaining_wants_budget,
-            "remainingSavingsBudget": report.remaining_savings_budget,
-            "needsRollover": report.needs_rollover,
-            "wantsRollover": report.wants_rollover,
-            "amountSaved": report.amount_saved,
-            "savingsGoal": report.savings_goal,
-            "incomeAfterExpenses": balance_after_expenses,
-        },
-        "categoryBalances": _category_balance_payload(report),
-        "categoryBudgets": report.category_budgets,
-        "categorySpending": report.category_spending,
-        "incomeProjection": _income_projection_payload(report),
-        "savingsProjection": _savings_projection_payload(report),
-        "burnRate": _burn_rate_payload(report),
-        "breakdown": [
-            {
-                "key": key,
-                "label": str(info.get("label") or key),
-                "amount": round(float(info.get("amount") or 0.0), 2),
-                "percentage": round(float(info.get("percentage") or 0.0), 2),
-                "color": CATEGORY_COLORS.get(key, "#64748b"),
-            }
-            for key, info in breakdown_items
-        ],
-        "budgetBreakdown": [
-            {
-                "key": key,
-                "label": str(info.get("label") or key),
-                "amount": round(float(info.get("amount") or 0.0), 2),
-                "percentage": round(float(info.get("percentage") or 0.0), 2),
-                "color": CATEGORY_COLORS.get(key, "#64748b"),
-            }
-            for key, info in report.budget_breakdown.items()
-            if float(info.get("amount") or 0.0) > 0
-        ],
-        "dailyTotals": [_amount_row(label, amount) for label, amount in daily_totals],
-        "budgetGroups": [_amount_row(label, amount) for label, amount in budget_group_totals.items()],
-        "personTotals": [_amount_row(label, amount) for label, amount in person_totals],
-        "merchantTotals": [_amount_row(label, amount) for label, amount in merchant_totals],
-        "merchantOccurrences": merchant_occurrences,
-        "topEntries": [_expense_entry_payload(entry) for entry in top_entries],
-        "dailyEntries": [_expense_entry_payload(entry) for entry in activity_entries],
-        "needExpenses": [_payment_payload(item) for item in report.need_expenses],
-        "calendarEvents": [_calendar_event_payload(item) for item in report.calendar_events],
-        "utilityHistory": [_utility_history_payload(item) for item in report.utility_history],
-        "sharedReimbursements": [_shared_reimbursement_payload(item) for item in report.shared_reimbursements],
-        "subscriptionsNeeds": [
-            _subscription_payload(item)
-            for item in _subscriptions_for_bucket(
-                selected_month_subscriptions,
-                "static_bills_subscriptions_needs",
-            )
-        ],
-        "subscriptionsWants": [
-            _subscription_payload(item)
-            for item in _subscriptions_for_bucket(
-                selected_month_subscriptions,
-                "subscriptions_wants",
-            )
-        ],
+
+def _metrics_payload(report: ExpenseBreakdownReport) -> dict[str, Any]:
+    return {
+        "totalExpenses": report.personal_total,
+        "sharedExpenses": report.shared_total,
+        "personalOutflows": report.personal_total,
+        "fixedCommitments": _fixed_commitments_total(report.breakdown),
+        "monthlyIncome": report.income_total,
+        "remainingBudget": report.remaining_budget,
+        "remainingNeedsBudget": report.remaining_budget,
+        "remainingWantsBudget": report.remaining_wants_budget,
+        "remainingSavingsBudget": report.remaining_savings_budget,
+        "needsRollover": report.needs_rollover,
+        "wantsRollover": report.wants_rollover,
+        "amountSaved": report.amount_saved,
+        "savingsGoal": report.savings_goal,
+        "incomeAfterExpenses": report.net_total,
     }
-    payload["modeViews"] = {
-        "current": _report_mode_view_from_payload(payload, projected=False),
-        "projected": _report_mode_view_from_payload(payload, projected=True),
+
+
+def _breakdown_rows_payload(breakdown: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "key": key,
+            "label": str(info.get("label") or key),
+            "amount": round(float(info.get("amount") or 0.0), 2),
+            "percentage": round(float(info.get("percentage") or 0.0), 2),
+            "color": CATEGORY_COLORS.get(key, "#64748b"),
+        }
+        for key, info in breakdown.items()
+        if float(info.get("amount") or 0.0) > 0
+    ]
+
+
+def _budget_groups_payload(report: ExpenseBreakdownReport) -> list[dict[str, Any]]:
+    budget_group_totals = {
+        "Needs": round(report.category_spending.get("needs", 0.0), 2),
+        "Wants": round(report.category_spending.get("wants", 0.0), 2),
     }
-    return payload
+    return [_amount_row(label, amount) for label, amount in budget_group_totals.items()]
+
+
+def _subscription_bucket_payload(report: ExpenseBreakdownReport, bucket: str) -> list[dict[str, Any]]:
+    selected_month_subscriptions = _memoized(
+        report,
+        "selected_month_subscriptions",
+        lambda: _current_month_subscription_items(report.subscriptions, report.month),
+    )
+    return [_subscription_payload(item) for item in _subscriptions_for_bucket(selected_month_subscriptions, bucket)]
+
+
+def _report_mode_view(report: ExpenseBreakdownReport, mode: str) -> dict[str, Any]:
+    return _memoized(
+        report,
+        f"mode_view:{mode}",
+        lambda: _report_mode_view_from_payload(expense_breakdown_payload_fields(report), projected=mode == "projected"),
+    )
+
+
+# Client payload keys, in the order the web report has always received them. Each builder
+# runs at most once per report; see expense_breakdown_payload_fields.
+_CLIENT_PAYLOAD_FIELDS: dict[str, Callable[[ExpenseBreakdownReport], Any]] = {
+    "ownerName": lambda report: report.owner_name,
+    "monthLabel": lambda report: report.month.label,
+    "year": lambda report: report.month.year,
+    "month": lambda report: report.month.month,
+    "daysInMonth": lambda report: calendar.monthrange(report.month.year, report.month.month)[1],
+    "elapsedDays": lambda report: _elapsed_days_for_month(report.month),
+    "generatedAt": lambda report: report.generated_at.strftime("%b %-d, %Y %-I:%M %p %Z"),
+    "metrics": lambda report: _metrics_payload(report),
+    "categoryBalances": lambda report: _category_balance_payload(report),
+    "categoryBudgets": lambda report: report.category_budgets,
+    "categorySpending": lambda report: report.category_spending,
+    "incomeProjection": lambda report: _income_projection_payload(report),
+    "savingsProjection": lambda report: _savings_projection_payload(report),
+    "burnRate": lambda report: _burn_rate_payload(report),
+    "breakdown": lambda report: _breakdown_rows_payload(report.breakdown),
+    "budgetBreakdown": lambda report: _breakdown_rows_payload(report.budget_breakdown),
+    "dailyTotals": lambda report: [
+        _amount_row(label, amount) for label, amount in _daily_totals(_report_activity_entries_memo(report))
+    ],
+    "budgetGroups": lambda report: _budget_groups_payload(report),
+    "personTotals": lambda report: [
+        _amount_row(label, amount) for label, amount in _person_totals(_report_activity_entries_memo(report))
+    ],
+    "merchantTotals": lambda report: [
+        _amount_row(label, amount) for label, amount in _merchant_totals(_report_activity_entries_memo(report))
+    ],
+    "merchantOccurrences": lambda report: _merchant_occurrences(_report_activity_entries_memo(report)),
+    "topEntries": lambda report: [
+        _expense_entry_payload(entry)
+        for entry in _report_highlight_entries(report, _report_activity_entries_memo(report))
+    ],
+    "dailyEntries": lambda report: [_expense_entry_payload(entry) for entry in _report_activity_entries_memo(report)],
+    "needExpenses": lambda report: [_payment_payload(item) for item in report.need_expenses],
+    "calendarEvents": lambda report: [_calendar_event_payload(item) for item in report.calendar_events],
+    "utilityHistory": lambda report: [_utility_history_payload(item) for item in report.utility_history],
+    "sharedReimbursements": lambda report: [_shared_reimbursement_payload(item) for item in report.shared_reimbursements],
+    "subscriptionsNeeds": lambda report: _subscription_bucket_payload(report, "static_bills_subscriptions_needs"),
+    "subscriptionsWants": lambda report: _subscription_bucket_payload(report, "subscriptions_wants"),
+    "modeViews": lambda report: {
+        "current": _report_mode_view(report, "current"),
+        "projected": _report_mode_view(report, "projected"),
+    },
+}
 
 
 def expense_breakdown_mode_view(
@@ -2389,12 +2633,11 @@ def expense_breakdown_mode_view(
     normalized = mode.strip().lower()
     if normalized not in {"current", "projected"}:
         raise ValueError("Mode must be 'current' or 'projected'.")
-    payload = expense_breakdown_client_payload(report)
-    return dict(payload["modeViews"][normalized])
+    return dict(_report_mode_view(report, normalized))
 
 
 def _report_mode_view_from_payload(
-    payload: dict[str, Any],
+    payload: Mapping[str, Any],
     *,
     projected: bool,
 ) -> dict[str, Any]:
@@ -2469,7 +2712,7 @@ def _report_mode_view_from_payload(
     }
 
 
-def _projected_breakdown_from_payload(payload: dict[str, Any]) -> list[dict[str, Any]]:
+def _projected_breakdown_from_payload(payload: Mapping[str, Any]) -> list[dict[str, Any]]:
     subscription_needs = round(
         sum(float(item.get("amount") or 0.0) for item in payload["subscriptionsNeeds"]),
         2,
@@ -2728,17 +2971,6 @@ def _theme_bootstrap_script() -> str:
 })();"""
 
 
-def _report_asset_text(filename: str) -> str:
-    path = Path(__file__).resolve().parent / "assets" / filename
-    try:
-        return path.read_text(encoding="utf-8")
-    except FileNotFoundError as exc:
-        raise RuntimeError(
-            f"Expense report frontend asset '{filename}' is missing. "
-            "Run `npm install && npm run build` in web/expense-report."
-        ) from exc
-
-
 def _analytics_section(
     breakdown_items: list[tuple[str, dict[str, Any]]],
     daily_totals: list[tuple[str, float]],
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any
+
+from bookiebot.reports.expense_breakdown import (
+    BudgetHistoryDigest,
+    BudgetMonth,
+    ExpenseBreakdownReport,
+    IncomeProjectionConfig,
+    PaymentItem,
+    ReportWorksheets,
+    _is_settled_month,
+    _rows,
+    budget_history_digest,
+    build_expense_breakdown_report,
+    expense_breakdown_client_payload,
+    expense_breakdown_payload_fields,
+    load_report_worksheets,
+)
+from bookiebot.reports.web import reports_dir
+from bookiebot.sheets.routing import now_pacific
+from bookiebot.sheets.undo import on_sheet_write, sheet_write_version
+
+
+_REPORT_CACHE: dict[tuple[Any, ...], _CacheEntry] = {}
+_REPORT_CACHE_LOCK = threading.Lock()
+_REPORT_BUILD_LOCKS: dict[tuple[Any, ...], threading.Lock] = {}
+_CLOSED_MONTH_FORMAT_VERSION = 2
+_HISTORY_DIGESTS: dict[tuple[str, int, int], BudgetHistoryDigest] = {}
+_SAVED_MONTH_NAME_RE = re.compile(r"^(?P<actor>.+)-(?P<year>\d{4})-(?P<month>\d{2})(?:\.history)?\.json\.gz$")
+_CLOSED_MONTH_SHEETS = ("shared_expenses", "personal_budget", "shared_reimbursements", "subscriptions", "bill_schedule")
+
+
+@dataclass(frozen=True)
+class CachedExpenseReport:
+    """A built report, versioned by the sheet rows it was computed from.
+
+    Its client payload is computed lazily and memoized on the report, so it is shared between
+    callers and must be treated as read-only.
+    """
+
+    report: ExpenseBreakdownReport
+    fingerprint: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return expense_breakdown_client_payload(self.report)
+
+    @property
+    def fields(self) -> Mapping[str, Any]:
+        """Payload fields computed on demand, for callers that only read a few of them."""
+        return expense_breakdown_payload_fields(self.report)
+
+
+@dataclass
+class _CacheEntry:
+    cached: CachedExpenseReport
+    checked_at: float
+    write_version: int
+    day: date
+
+
+@dataclass(frozen=True)
+class _SheetRows:
+    """Worksheet stand-in holding rows that were already read, so a build never reads twice."""
+
+    rows: list[list[str]]
+
+    def get_all_values(self) -> list[list[str]]:
+        return self.rows
+
+
+def cached_expense_report(
+    *,
+    actor_key: str,
+    owner_name: str,
+    persons: list[str],
+    month: BudgetMonth,
+    refresh: bool = False,
+) -> CachedExpenseReport:
+    """Return the expense report for an actor/month/persons, rebuilding only when its sheets changed.
+
+    Within ``BOOKIEBOT_REPORT_CACHE_SECONDS`` of the last check the cached report is served
+    without touching Sheets, unless the bot has written to a sheet since. After that the
+    source rows are re-read and fingerprinted; an unchanged fingerprint keeps the cached
+    report and payload instead of recomputing them. Months past the closed-month grace period
+    are built from rows persisted the first time they were read; those rows are dropped when
+    the bot edits that month, and ``refresh`` re-reads Sheets for the month and for every
+    earlier month's history digest. Reports are rebuilt once a day, since elapsed-day figures
+    move with the date; the first store on a new day drops every entry from earlier days.
+    Callers must already be inside ``sheet_user_context`` for the actor.
+    """
+    closed = _is_settled_month(month)
+    today = now_pacific().date()
+    key = (
+        str(actor_key),
+        str(owner_name),
+        month.year,
+        month.month,
+        tuple(str(person) for person in persons),
+    )
+    if refresh:
+        if closed:
+            invalidate_closed_month_report(actor_key, month)
+        invalidate_budget_history_before(actor_key, month)
+    entry = None if refresh else _fresh_entry(key, closed=closed, today=today)
+    if entry is not None:
+        return entry.cached
+
+    with _build_lock(key):
+        entry = None if refresh else _fresh_entry(key, closed=closed, today=today)
+        if entry is not None:
+            return entry.cached
+
+        write_version = sheet_write_version()
+        worksheets = _source_worksheets(actor_key, month, closed=closed, refresh=refresh)
+        fingerprint = report_worksheets_fingerprint(worksheets)
+        with _REPORT_CACHE_LOCK:
+            entry = _REPORT_CACHE.get(key)
+        if entry is None or entry.day != today or entry.cached.fingerprint != fingerprint:
+            report = build_expense_breakdown_report(
+                actor_key=actor_key,
+                owner_name=owner_name,
+                persons=list(persons),
+                month=month,
+                worksheets=worksheets,
+            )
+            cached = CachedExpenseReport(report=report, fingerprint=fingerprint)
+        else:
+            cached = entry.cached
+        _store_entry(key, _CacheEntry(cached=cached, checked_at=time.monotonic(), write_version=write_version, day=today))
+        return cached
+
+
+def report_worksheets_fingerprint(worksheets: ReportWorksheets) -> str:
+    digest = hashlib.sha1()
+    for name, rows in _worksheet_rows(worksheets):
+        digest.update(name.encode("utf-8"))
+        digest.update(json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def clear_report_cache() -> None:
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE.clear()
+        _REPORT_BUILD_LOCKS.clear()
+        _HISTORY_DIGESTS.clear()
+
+
+def closed_month_reports_dir() -> Path:
+    return reports_dir() / "closed-months"
+
+
+def load_closed_month_worksheets(actor_key: str, month: BudgetMonth) -> ReportWorksheets | None:
+    """Return the persisted source rows for a completed month, or None when none were saved."""
+    path = _closed_month_path(actor_key, month)
+    try:
+        data = json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != _CLOSED_MONTH_FORMAT_VERSION:
+        return None
+    sheets = data.get("sheets") or {}
+    return ReportWorksheets(
+        **{name: _SheetRows(sheets[name]) if sheets.get(name) is not None else None for name in _CLOSED_MONTH_SHEETS},
+        budget_history=tuple(_history_digest_from_dict(item) for item in data.get("budget_history") or []),
+    )
+
+
+def save_closed_month_worksheets(actor_key: str, month: BudgetMonth, worksheets: ReportWorksheets) -> None:
+    payload = {
+        "version": _CLOSED_MONTH_FORMAT_VERSION,
+        "actor_key": str(actor_key),
+        "year": month.year,
+        "month": month.month,
+        "saved_at": now_pacific().isoformat(timespec="seconds"),
+        "sheets": {
+            name: _rows(getattr(worksheets, name)) if getattr(worksheets, name) is not None else None
+            for name in _CLOSED_MONTH_SHEETS
+        },
+        "budget_history": [
+            _history_digest_to_dict(budget_history_digest(history))
+            for history in worksheets.budget_history
+        ],
+    }
+    _write_gzip_json(_closed_month_path(actor_key, month), payload)
+
+
+def load_budget_history_digest(actor_key: str, month: BudgetMonth) -> BudgetHistoryDigest | None:
+    """Return the saved history digest for a completed month, from memory or disk."""
+    key = (str(actor_key), month.year, month.month)
+    with _REPORT_CACHE_LOCK:
+        digest = _HISTORY_DIGESTS.get(key)
+    if digest is not None:
+        return digest
+    try:
+        data = json.loads(gzip.decompress(_history_digest_path(actor_key, month).read_bytes()).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != _CLOSED_MONTH_FORMAT_VERSION:
+        return None
+    digest = _history_digest_from_dict(data)
+    with _REPORT_CACHE_LOCK:
+        _HISTORY_DIGESTS[key] = digest
+    return digest
+
+
+def save_budget_history_digest(actor_key: str, digest: BudgetHistoryDigest) -> None:
+    with _REPORT_CACHE_LOCK:
+        _HISTORY_DIGESTS[(str(actor_key), digest.month.year, digest.month.month)] = digest
+    _write_gzip_json(
+        _history_digest_path(actor_key, digest.month),
+        {"version": _CLOSED_MONTH_FORMAT_VERSION, **_history_digest_to_dict(digest)},
+    )
+
+
+def invalidate_closed_month_report(actor_key: str, month: BudgetMonth) -> None:
+    """Drop a completed month's persisted rows, history digest and cached reports so the next request re-reads Sheets."""
+    _closed_month_path(actor_key, month).unlink(missing_ok=True)
+    _history_digest_path(actor_key, month).unlink(missing_ok=True)
+    with _REPORT_CACHE_LOCK:
+        _HISTORY_DIGESTS.pop((str(actor_key), month.year, month.month), None)
+        for key in [key for key in _REPORT_CACHE if key[0] == str(actor_key) and key[2:4] == (month.year, month.month)]:
+            del _REPORT_CACHE[key]
+
+
+def invalidate_budget_history_before(actor_key: str, month: BudgetMonth) -> None:
+    """Drop an actor's saved history digests for months before ``month`` so they are re-read from Sheets."""
+    slug = _actor_slug(actor_key)
+    for path, (actor, year, month_number) in _saved_month_files():
+        if actor == slug and (year, month_number) < (month.year, month.month) and path.name.endswith(".history.json.gz"):
+            path.unlink(missing_ok=True)
+    with _REPORT_CACHE_LOCK:
+        for key in [key for key in _HISTORY_DIGESTS if key[0] == str(actor_key) and key[1:] < (month.year, month.month)]:
+            del _HISTORY_DIGESTS[key]
+
+
+def _forget_written_month(year: int, month: int) -> None:
+    """Drop what every actor has frozen for a month the bot just edited; unsettled months have nothing frozen."""
+    if not _is_settled_month(BudgetMonth(year, month)):
+        return
+    for path, (_actor, saved_year, saved_month) in _saved_month_files():
+        if (saved_year, saved_month) == (year, month):
+            path.unlink(missing_ok=True)
+    with _REPORT_CACHE_LOCK:
+        for key in [key for key in _HISTORY_DIGESTS if key[1:] == (year, month)]:
+            del _HISTORY_DIGESTS[key]
+        for key in [key for key in _REPORT_CACHE if key[2:4] == (year, month)]:
+            del _REPORT_CACHE[key]
+
+
+def _saved_month_files() -> list[tuple[Path, tuple[str, int, int]]]:
+    directory = closed_month_reports_dir()
+    if not directory.is_dir():
+        return []
+    saved = []
+    for path in directory.glob("*.json.gz"):
+        match = _SAVED_MONTH_NAME_RE.fullmatch(path.name)
+        if match is not None:
+            saved.append((path, (match["actor"], int(match["year"]), int(match["month"]))))
+    return saved
+
+
+def _closed_month_path(actor_key: str, month: BudgetMonth) -> Path:
+    return closed_month_reports_dir() / f"{_actor_slug(actor_key)}-{month.year}-{month.month:02d}.json.gz"
+
+
+def _history_digest_path(actor_key: str, month: BudgetMonth) -> Path:
+    return closed_month_reports_dir() / f"{_actor_slug(actor_key)}-{month.year}-{month.month:02d}.history.json.gz"
+
+
+def _actor_slug(actor_key: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "-", str(actor_key)).strip("-") or "actor"
+
+
+def _write_gzip_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp")
+    temporary.write_bytes(gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), mtime=0))
+    os.replace(temporary, path)
+
+
+def _history_digest_to_dict(digest: BudgetHistoryDigest) -> dict[str, Any]:
+    anchor_date = digest.income_projection_config.anchor_date
+    return {
+        "year": digest.month.year,
+        "month": digest.month.month,
+        "labeled_amounts": [[label, amount] for label, amount in digest.labeled_amounts],
+        "income_entries": [asdict(item) for item in digest.income_entries],
+        "income_source_label": digest.income_projection_config.source_label,
+        "income_anchor_date": anchor_date.isoformat() if anchor_date is not None else None,
+    }
+
+
+def _history_digest_from_dict(data: dict[str, Any]) -> BudgetHistoryDigest:
+    anchor_date = data.get("income_anchor_date")
+    return BudgetHistoryDigest(
+        month=BudgetMonth(int(data["year"]), int(data["month"])),
+        labeled_amounts=tuple((str(label), float(amount)) for label, amount in data.get("labeled_amounts") or []),
+        income_entries=tuple(PaymentItem(**item) for item in data.get("income_entries") or []),
+        income_projection_config=IncomeProjectionConfig(
+            source_label=data.get("income_source_label"),
+            anchor_date=datetime.fromisoformat(anchor_date) if anchor_date else None,
+        ),
+    )
+
+
+def _source_worksheets(actor_key: str, month: BudgetMonth, *, closed: bool, refresh: bool) -> ReportWorksheets:
+    if closed and not refresh:
+        stored = load_closed_month_worksheets(actor_key, month)
+        if stored is not None:
+            return stored
+    worksheets = _read_worksheets(load_report_worksheets(actor_key, month))
+    if closed:
+        save_closed_month_worksheets(actor_key, month, worksheets)
+    return worksheets
+
+
+def _fresh_entry(key: tuple[Any, ...], *, closed: bool, today: date) -> _CacheEntry | None:
+    with _REPORT_CACHE_LOCK:
+        entry = _REPORT_CACHE.get(key)
+    if entry is None or entry.day != today:
+        return None
+    if entry.write_version != sheet_write_version():
+        return None
+    if closed:
+        return entry
+    if time.monotonic() - entry.checked_at > _report_cache_seconds():
+        return None
+    return entry
+
+
+def _store_entry(key: tuple[Any, ...], entry: _CacheEntry) -> None:
+    with _REPORT_CACHE_LOCK:
+        for stale_key in [stale_key for stale_key, stale in _REPORT_CACHE.items() if stale.day != entry.day]:
+            del _REPORT_CACHE[stale_key]
+        _REPORT_CACHE[key] = entry
+        for idle_key in [
+            idle_key
+            for idle_key, lock in _REPORT_BUILD_LOCKS.items()
+            if idle_key not in _REPORT_CACHE and not lock.locked()
+        ]:
+            del _REPORT_BUILD_LOCKS[idle_key]
+
+
+def _build_lock(key: tuple[Any, ...]) -> threading.Lock:
+    with _REPORT_CACHE_LOCK:
+        return _REPORT_BUILD_LOCKS.setdefault(key, threading.Lock())
+
+
+def _read_worksheets(worksheets: ReportWorksheets) -> ReportWorksheets:
+    def read(ws: Any) -> _SheetRows | None:
+        return _SheetRows(_rows(ws)) if ws is not None else None
+
+    return ReportWorksheets(
+        shared_expenses=read(worksheets.shared_expenses),
+        personal_budget=read(worksheets.personal_budget),
+        shared_reimbursements=read(worksheets.shared_reimbursements),
+        subscriptions=read(worksheets.subscriptions),
+        bill_schedule=read(worksheets.bill_schedule),
+        budget_history=tuple(budget_history_digest(history) for history in worksheets.budget_history),
+    )
+
+
+def _worksheet_rows(worksheets: ReportWorksheets) -> list[tuple[str, Any]]:
+    sheets = [
+        ("shared_expenses", worksheets.shared_expenses),
+        ("personal_budget", worksheets.personal_budget),
+        ("shared_reimbursements", worksheets.shared_reimbursements),
+        ("subscriptions", worksheets.subscriptions),
+        ("bill_schedule", worksheets.bill_schedule),
+    ]
+    named_rows: list[tuple[str, Any]] = [(name, _rows(ws)) for name, ws in sheets]
+    named_rows.extend(
+        (
+            f"budget_history:{history.month.year}-{history.month.month:02d}",
+            _history_digest_to_dict(budget_history_digest(history)),
+        )
+        for history in worksheets.budget_history
+    )
+    return named_rows
+
+
+def _report_cache_seconds() -> float:
+    raw = os.getenv("BOOKIEBOT_REPORT_CACHE_SECONDS", "60").strip()
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 60.0
+
+
+on_sheet_write(_forget_written_month)
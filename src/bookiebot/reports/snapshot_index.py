@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import re
+import threading
+
+
+_MANIFEST_NAME = "snapshots.json"
+_MANIFEST_VERSION = 1
+_SNAPSHOT_NAME_RE = re.compile(
+    r"^expense-breakdown-(?P<owner>[a-z0-9-]+?)-(?P<year>\d{4})-(?P<month>\d{2})-[A-Za-z0-9_-]+\.html$"
+)
+_SIDECAR_SUFFIXES = (".gz", ".br")
+_INDEXES: dict[Path, dict[tuple[str, int, int], list[ReportSnapshot]]] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    owner: str
+    year: int
+    month: int
+    filename: str
+    mtime: float
+    size: int
+
+    @property
+    def key(self) -> tuple[str, int, int]:
+        return (self.owner, self.year, self.month)
+
+
+def report_owner_slug(owner_name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", owner_name.lower()).strip("-") or "budget"
+
+
+def report_details_path(path: Path) -> Path:
+    """Where a snapshot's detail tables live, fetched by the page after its first render."""
+    return path.with_name(f"{path.stem}.details.json")
+
+
+def record_report_snapshot(directory: Path, path: Path, *, owner_name: str, year: int, month: int) -> ReportSnapshot:
+    """Add a freshly written snapshot to the directory's manifest; pruning happens separately."""
+    stat = path.stat()
+    snapshot = ReportSnapshot(
+        owner=report_owner_slug(owner_name),
+        year=int(year),
+        month=int(month),
+        filename=path.name,
+        mtime=stat.st_mtime,
+        size=stat.st_size,
+    )
+    with _INDEX_LOCK:
+        index = _index(directory)
+        entries = [entry for entry in index.get(snapshot.key, []) if entry.filename != snapshot.filename]
+        entries.append(snapshot)
+        index[snapshot.key] = _newest_first(entries)
+        _write_manifest(directory, index)
+    return snapshot
+
+
+def latest_report_snapshot(directory: Path, *, owner_name: str, year: int, month: int) -> ReportSnapshot | None:
+    """Newest indexed snapshot for an owner-month whose file still exists."""
+    key = (report_owner_slug(owner_name), int(year), int(month))
+    with _INDEX_LOCK:
+        index = _index(directory)
+        entries = index.get(key, [])
+        missing = 0
+        while missing < len(entries) and not (directory / entries[missing].filename).is_file():
+            missing += 1
+        if missing:
+            entries = index[key] = entries[missing:]
+            _write_manifest(directory, index)
+        return entries[0] if entries else None
+
+
+def prune_report_snapshots(directory: Path, *, keep: int | None = None) -> list[str]:
+    """Delete all but the newest ``keep`` snapshots per owner-month, with their details and compressed sidecars."""
+    keep = report_snapshot_keep() if keep is None else max(int(keep), 1)
+    with _INDEX_LOCK:
+        index = _index(directory)
+        stale: list[ReportSnapshot] = []
+        for key, entries in index.items():
+            if len(entries) > keep:
+                stale.extend(entries[keep:])
+                index[key] = entries[:keep]
+        if stale:
+            _write_manifest(directory, index)
+    for snapshot in stale:
+        html_path = directory / snapshot.filename
+        for path in (html_path, report_details_path(html_path)):
+            path.unlink(missing_ok=True)
+            for suffix in _SIDECAR_SUFFIXES:
+                path.with_name(f"{path.name}{suffix}").unlink(missing_ok=True)
+    return [snapshot.filename for snapshot in stale]
+
+
+def report_snapshot_keep() -> int:
+    raw = os.getenv("BOOKIEBOT_REPORT_SNAPSHOTS_KEEP", "5").strip()
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return 5
+
+
+def clear_report_snapshot_index() -> None:
+    with _INDEX_LOCK:
+        _INDEXES.clear()
+
+
+def _index(directory: Path) -> dict[tuple[str, int, int], list[ReportSnapshot]]:
+    """The in-memory index for a directory, loaded from its manifest or rebuilt from one scan."""
+    root = directory.resolve()
+    index = _INDEXES.get(root)
+    if index is None:
+        index = _load_manifest(root)
+        if index is None:
+            index = _scan_snapshots(root)
+            if index:
+                _write_manifest(root, index)
+        _INDEXES[root] = index
+    return index
+
+
+def _load_manifest(directory: Path) -> dict[tuple[str, int, int], list[ReportSnapshot]] | None:
+    try:
+        data = json.loads((directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != _MANIFEST_VERSION:
+        return None
+    index: dict[tuple[str, int, int], list[ReportSnapshot]] = {}
+    for item in data.get("snapshots") or []:
+        try:
+            snapshot = ReportSnapshot(**item)
+        except TypeError:
+            continue
+        index.setdefault(snapshot.key, []).append(snapshot)
+    return {key: _newest_first(entries) for key, entries in index.items()}
+
+
+def _scan_snapshots(directory: Path) -> dict[tuple[str, int, int], list[ReportSnapshot]]:
+    # Volumes written before the manifest existed are indexed once, then never globbed again.
+    index: dict[tuple[str, int, int], list[ReportSnapshot]] = {}
+    if not directory.is_dir():
+        return index
+    for path in directory.glob("expense-breakdown-*.html"):
+        match = _SNAPSHOT_NAME_RE.fullmatch(path.name)
+        if match is None or not path.is_file():
+            continue
+        stat = path.stat()
+        snapshot = ReportSnapshot(
+            owner=match["owner"],
+            year=int(match["year"]),
+            month=int(match["month"]),
+            filename=path.name,
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+        )
+        index.setdefault(snapshot.key, []).append(snapshot)
+    return {key: _newest_first(entries) for key, entries in index.items()}
+
+
+def _write_manifest(directory: Path, index: dict[tuple[str, int, int], list[ReportSnapshot]]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / _MANIFEST_NAME
+    temporary = path.with_name(f"{path.name}.tmp")
+    snapshots = [asdict(snapshot) for entries in index.values() for snapshot in entries]
+    temporary.write_text(json.dumps({"version": _MANIFEST_VERSION, "snapshots": snapshots}), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _newest_first(entries: list[ReportSnapshot]) -> list[ReportSnapshot]:
+    return sorted(entries, key=lambda entry: (entry.mtime, entry.filename), reverse=True)
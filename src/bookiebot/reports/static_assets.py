@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import hashlib
+from pathlib import Path
+import re
+import threading
+
+try:  # Optional dependency for brotli-encoded asset responses.
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+
+ASSET_ROUTE_PREFIX = "/reports/assets"
+_ASSET_DIR = Path(__file__).resolve().parent / "assets"
+_CONTENT_TYPES = {".js": "application/javascript", ".css": "text/css"}
+_HASHED_NAME_RE = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{16}\.(?P<suffix>[A-Za-z0-9]+)$")
+_ASSETS: dict[str, ReportAsset] = {}
+_HASHED_ASSETS: dict[str, ReportAsset] | None = None
+_ASSETS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ReportAsset:
+    """A built frontend file held in memory with its precompressed variants."""
+
+    filename: str
+    content_type: str
+    digest: str
+    body: bytes
+    gzip_body: bytes
+    brotli_body: bytes | None = None
+
+    @property
+    def hashed_name(self) -> str:
+        stem, _dot, suffix = self.filename.rpartition(".")
+        return f"{stem}.{self.digest}.{suffix}"
+
+    @property
+    def url(self) -> str:
+        return f"{ASSET_ROUTE_PREFIX}/{self.hashed_name}"
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    def encoded_body(self, accepted_encodings: set[str]) -> tuple[bytes, str | None]:
+        if self.brotli_body is not None and "br" in accepted_encodings:
+            return self.brotli_body, "br"
+        if "gzip" in accepted_encodings:
+            return self.gzip_body, "gzip"
+        return self.body, None
+
+
+def report_asset(filename: str) -> ReportAsset:
+    """Load, hash, and compress a frontend asset once per process."""
+    asset = _ASSETS.get(filename)
+    if asset is not None:
+        return asset
+    with _ASSETS_LOCK:
+        asset = _ASSETS.get(filename)
+        if asset is None:
+            asset = _ASSETS[filename] = _load_report_asset(filename)
+    return asset
+
+
+def report_asset_url(filename: str) -> str:
+    return report_asset(filename).url
+
+
+def report_asset_for_hashed_name(name: str) -> ReportAsset | None:
+    """The asset a hashed URL names, falling back to the current build of the same file.
+
+    Snapshots keep the asset URLs of the build they were written with, so a hash from an earlier
+    build still gets a bundle; callers compare ``hashed_name`` to tell the two cases apart.
+    """
+    hashed_assets = _hashed_assets()
+    asset = hashed_assets.get(name)
+    if asset is not None:
+        return asset
+    match = _HASHED_NAME_RE.fullmatch(name)
+    if match is None:
+        return None
+    filename = f"{match['stem']}.{match['suffix']}"
+    return next((asset for asset in hashed_assets.values() if asset.filename == filename), None)
+
+
+def clear_report_asset_cache() -> None:
+    global _HASHED_ASSETS
+    with _ASSETS_LOCK:
+        _ASSETS.clear()
+        _HASHED_ASSETS = None
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, most compact first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress_body(body: bytes, encoding: str, *, dynamic: bool = False) -> bytes:
+    """Compress a response body; ``dynamic`` trades ratio for speed on per-request bodies."""
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=5 if dynamic else 11)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6 if dynamic else 9, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _hashed_assets() -> dict[str, ReportAsset]:
+    global _HASHED_ASSETS
+    hashed_assets = _HASHED_ASSETS
+    if hashed_assets is None:
+        filenames = sorted(path.name for path in _ASSET_DIR.glob("*") if path.suffix in _CONTENT_TYPES)
+        hashed_assets = {asset.hashed_name: asset for asset in map(report_asset, filenames)}
+        _HASHED_ASSETS = hashed_assets
+    return hashed_assets
+
+
+def _load_report_asset(filename: str) -> ReportAsset:
+    path = _ASSET_DIR / filename
+    try:
+        body = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise RuntimeError(
+            f"Expense report frontend asset '{filename}' is missing. "
+            "Run `npm install && npm run build` in web/expense-report."
+        ) from exc
+    return ReportAsset(
+        filename=filename,
+        content_type=_CONTENT_TYPES.get(path.suffix, "application/octet-stream"),
+        digest=hashlib.sha256(body).hexdigest()[:16],
+        body=body,
+        gzip_body=compress_body(body, "gzip"),
+        brotli_body=compress_body(body, "br") if brotli is not None else None,
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -13,9 +14,22 @@ from urllib.parse import quote
 
 from aiohttp import web
 
+from bookiebot.reports.snapshot_index import latest_report_snapshot, report_details_path, report_owner_slug
+from bookiebot.reports.static_assets import (
+    ASSET_ROUTE_PREFIX,
+    compress_body,
+    report_asset_for_hashed_name,
+    supported_encodings,
+)
+
 
 _REPORT_NAME_RE = re.compile(r"^[A-Za-z0-9._-]+\.html$")
 _EPHEMERAL_REPORT_SECRET = base64.urlsafe_b64encode(os.urandom(32)).decode("ascii")
+_LIVE_REPORT_BUILDS: dict[tuple[Any, ...], asyncio.Future[str]] = {}
+_LIVE_REPORT_CACHE: dict[tuple[Any, ...], tuple[float, str]] = {}
+_COMPRESSIBLE_CONTENT_TYPES = {"application/javascript", "application/json", "image/svg+xml"}
+_MIN_COMPRESSED_BYTES = 1024
+_COMPRESS_IN_THREAD_BYTES = 64 * 1024
 
 
 def reports_dir() -> Path:
@@ -75,7 +89,9 @@ def create_expense_report_token(
 
 
 def register_report_routes(app: web.Application) -> None:
+    app.router.add_get(f"{ASSET_ROUTE_PREFIX}/{{name}}", _serve_report_asset)
     app.router.add_get("/reports/expense-breakdown", _serve_expense_breakdown_report)
+    app.router.add_get("/reports/expense-breakdown/details", _serve_expense_breakdown_details)
     app.router.add_get("/reports/{name}", _serve_report)
 
 
@@ -91,18 +107,8 @@ async def _serve_expense_breakdown_report(request: web.Request) -> web.StreamRes
         return _report_file_response(snapshot_path)
 
     try:
-        from bookiebot.reports.expense_breakdown import BudgetMonth, build_expense_breakdown_report, render_expense_breakdown_html
-        from bookiebot.sheets.routing import sheet_user_context
-
-        actor_key = str(payload["actor_key"])
-        with sheet_user_context(actor_key):
-            report = build_expense_breakdown_report(
-                actor_key=actor_key,
-                owner_name=str(payload["owner_name"]),
-                persons=[str(person) for person in payload["persons"]],
-                month=BudgetMonth(int(payload["year"]), int(payload["month"])),
-            )
-        return web.Response(text=render_expense_breakdown_html(report), content_type="text/html")
+        html = await _live_report_html(payload, refresh=_live_expense_report_requested(request.query))
+        return web.Response(text=html, content_type="text/html", headers={"Cache-Control": "private, no-cache"})
     except web.HTTPException:
         raise
     except Exception as exc:
@@ -112,6 +118,114 @@ async def _serve_expense_breakdown_report(request: web.Request) -> web.StreamRes
         raise web.HTTPInternalServerError(text=f"Could not render expense report: {type(exc).__name__}: {exc}") from exc
 
 
+async def _serve_expense_breakdown_details(request: web.Request) -> web.StreamResponse:
+    """Detail tables for a report page, fetched by the page after its overview has rendered.
+
+    ``source`` is ``live`` or the snapshot filename the page was written as; snapshots serve the
+    details sidecar written alongside them, live pages read the same cached report they rendered.
+    """
+    token = request.query.get("token", "").strip()
+    try:
+        payload = _verify_expense_report_token(token)
+    except ValueError as exc:
+        raise web.HTTPNotFound(text=str(exc)) from exc
+
+    source = request.query.get("source", "live").strip() or "live"
+    if source != "live":
+        details_path = _snapshot_details_path(payload, source)
+        if details_path is None:
+            raise web.HTTPNotFound()
+        return _report_file_response(details_path)
+
+    try:
+        body = await asyncio.to_thread(_build_live_report_details, payload)
+    except Exception as exc:
+        raise web.HTTPInternalServerError(text=f"Could not load expense report details: {type(exc).__name__}: {exc}") from exc
+    return web.Response(body=body, content_type="application/json", headers={"Cache-Control": "private, no-cache"})
+
+
+async def _live_report_html(payload: dict, *, refresh: bool = False) -> str:
+    """Render a live report in a worker thread; concurrent requests for the same report share one build.
+
+    ``refresh`` re-reads Sheets for a completed month instead of using its persisted rows, so it
+    skips the short-lived HTML cache and never joins a build that is not refreshing.
+    """
+    key = _live_report_key(payload)
+    cached = _LIVE_REPORT_CACHE.get(key)
+    if not refresh and cached and time.monotonic() - cached[0] <= _live_report_cache_seconds():
+        return cached[1]
+
+    build_key = (*key, refresh)
+    build = _LIVE_REPORT_BUILDS.get(build_key)
+    if build is None:
+        build = asyncio.ensure_future(asyncio.to_thread(_build_live_report_html, payload, refresh))
+        _LIVE_REPORT_BUILDS[build_key] = build
+        build.add_done_callback(lambda finished: _finish_live_report_build(key, build_key, finished))
+    return await asyncio.shield(build)
+
+
+def _finish_live_report_build(key: tuple[Any, ...], build_key: tuple[Any, ...], build: asyncio.Future[str]) -> None:
+    if _LIVE_REPORT_BUILDS.get(build_key) is build:
+        del _LIVE_REPORT_BUILDS[build_key]
+    if build.cancelled() or build.exception() is not None:
+        return
+    now = time.monotonic()
+    ttl = _live_report_cache_seconds()
+    for stale_key in [stale_key for stale_key, (built_at, _html) in _LIVE_REPORT_CACHE.items() if now - built_at > ttl]:
+        del _LIVE_REPORT_CACHE[stale_key]
+    _LIVE_REPORT_CACHE[key] = (now, build.result())
+
+
+def _build_live_report_html(payload: dict, refresh: bool = False) -> str:
+    from bookiebot.reports.expense_breakdown import render_expense_breakdown_html
+
+    return render_expense_breakdown_html(_live_cached_report(payload, refresh).report)
+
+
+def _build_live_report_details(payload: dict) -> bytes:
+    from bookiebot.reports.expense_breakdown import expense_breakdown_details_json
+
+    return expense_breakdown_details_json(_live_cached_report(payload).report)
+
+
+def _live_cached_report(payload: dict, refresh: bool = False) -> Any:
+    from bookiebot.reports.expense_breakdown import BudgetMonth
+    from bookiebot.reports.report_cache import cached_expense_report
+    from bookiebot.sheets.routing import sheet_user_context
+
+    actor_key = str(payload["actor_key"])
+    with sheet_user_context(actor_key):
+        return cached_expense_report(
+            actor_key=actor_key,
+            owner_name=str(payload["owner_name"]),
+            persons=[str(person) for person in payload["persons"]],
+            month=BudgetMonth(int(payload["year"]), int(payload["month"])),
+            refresh=refresh,
+        )
+
+
+def _live_report_key(payload: dict) -> tuple[Any, ...]:
+    return (
+        str(payload["actor_key"]),
+        int(payload["year"]),
+        int(payload["month"]),
+        tuple(str(person) for person in payload["persons"]),
+        str(payload["owner_name"]),
+    )
+
+
+def _live_report_cache_seconds() -> float:
+    raw = os.getenv("BOOKIEBOT_REPORT_LIVE_CACHE_SECONDS", "30").strip()
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 30.0
+
+
+def clear_live_report_cache() -> None:
+    _LIVE_REPORT_CACHE.clear()
+
+
 async def _serve_report(request: web.Request) -> web.StreamResponse:
     name = request.match_info.get("name", "")
     if not _REPORT_NAME_RE.fullmatch(name):
@@ -129,10 +243,84 @@ async def _serve_report(request: web.Request) -> web.StreamResponse:
     return _report_file_response(path)
 
 
+async def _serve_report_asset(request: web.Request) -> web.StreamResponse:
+    name = request.match_info.get("name", "")
+    asset = report_asset_for_hashed_name(name)
+    if asset is None:
+        raise web.HTTPNotFound()
+
+    # A superseded hash from an older snapshot gets today's build, which must not be cached as that URL forever.
+    headers = {
+        "Cache-Control": "public, max-age=31536000, immutable" if asset.hashed_name == name else "public, no-cache",
+        "ETag": asset.etag,
+        "Vary": "Accept-Encoding",
+    }
+    if asset.etag in _if_none_match_tags(request.headers.get("If-None-Match", "")):
+        return web.Response(status=304, headers=headers)
+    body, encoding = asset.encoded_body(_accepted_encodings(request.headers.get("Accept-Encoding", "")))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return web.Response(body=body, content_type=asset.content_type, charset="utf-8", headers=headers)
+
+
+@web.middleware
+async def compression_middleware(request: web.Request, handler: Any) -> web.StreamResponse:
+    """Compress and tag in-memory text responses; file responses negotiate their own sidecars.
+
+    GET responses get a weak ``ETag`` over the uncompressed body, so a matching
+    ``If-None-Match`` is answered with a bodyless 304 whichever encoding the client took.
+    """
+    response = await handler(request)
+    if not isinstance(response, web.Response) or not isinstance(response.body, bytes):
+        return response
+    if response.status != 200 or "Content-Encoding" in response.headers:
+        return response
+    body = response.body
+    if request.method == "GET" and "ETag" not in response.headers:
+        etag = f'W/"{hashlib.sha256(body).hexdigest()[:16]}"'
+        response.headers["ETag"] = etag
+        if etag.removeprefix("W/") in _if_none_match_tags(request.headers.get("If-None-Match", "")):
+            headers = {name: response.headers[name] for name in ("ETag", "Cache-Control") if name in response.headers}
+            return web.Response(status=304, headers={**headers, "Vary": "Accept-Encoding"})
+    if len(body) < _MIN_COMPRESSED_BYTES or not _is_compressible(response.content_type):
+        return response
+
+    accepted = _accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    encoding = next((coding for coding in supported_encodings() if coding in accepted), None)
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding is None:
+        return response
+    if len(body) >= _COMPRESS_IN_THREAD_BYTES:
+        compressed = await asyncio.to_thread(compress_body, body, encoding, dynamic=True)
+    else:
+        compressed = compress_body(body, encoding, dynamic=True)
+    response.body = compressed
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _is_compressible(content_type: str) -> bool:
+    return content_type.startswith("text/") or content_type in _COMPRESSIBLE_CONTENT_TYPES
+
+
+def _if_none_match_tags(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted: set[str] = set()
+    for part in header.split(","):
+        coding, _sep, params = part.strip().partition(";")
+        quality = params.strip().lower().replace(" ", "")
+        if coding and quality not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
 def _report_file_response(path: Path) -> web.FileResponse:
     return web.FileResponse(
         path,
-        headers={"Cache-Control": "private, max-age=86400"},
+        headers={"Cache-Control": "private, max-age=86400", "Vary": "Accept-Encoding"},
     )
 
 
@@ -217,6 +405,21 @@ def _safe_report_path(filename: str) -> Path | None:
     return path
 
 
+def _snapshot_details_path(payload: dict, filename: str) -> Path | None:
+    """The details sidecar of a snapshot, if it belongs to the token's owner and month."""
+    path = _safe_report_path(filename)
+    if path is None:
+        return None
+    try:
+        prefix = f"expense-breakdown-{report_owner_slug(str(payload['owner_name']))}-{int(payload['year'])}-{int(payload['month']):02d}-"
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not filename.startswith(prefix):
+        return None
+    details_path = report_details_path(path)
+    return details_path if details_path.is_file() else None
+
+
 def _latest_matching_expense_report_path(payload: dict) -> Path | None:
     try:
         year = int(payload["year"])
@@ -224,20 +427,16 @@ def _latest_matching_expense_report_path(payload: dict) -> Path | None:
     except (KeyError, TypeError, ValueError):
         return None
 
-    owner = _expense_report_owner_slug(str(payload.get("owner_name") or ""))
-    prefix = f"expense-breakdown-{owner}-{year}-{month:02d}-"
-    matches = [
-        path
-        for path in reports_dir().glob(f"{prefix}*.html")
-        if _REPORT_NAME_RE.fullmatch(path.name) and path.is_file()
-    ]
-    if not matches:
+    root = reports_dir()
+    snapshot = latest_report_snapshot(
+        root,
+        owner_name=str(payload.get("owner_name") or ""),
+        year=year,
+        month=month,
+    )
+    if snapshot is None or not _REPORT_NAME_RE.fullmatch(snapshot.filename):
         return None
-    return max(matches, key=lambda path: path.stat().st_mtime)
-
-
-def _expense_report_owner_slug(owner_name: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", owner_name.lower()).strip("-") or "budget"
+    return root / snapshot.filename
 
 
 def _report_secret() -> str:
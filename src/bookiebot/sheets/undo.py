@@ -6,7 +6,7 @@ from datetime import datetime
 import json
 import logging
 import time
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 import weakref
 from uuid import uuid4
 
@@ -49,6 +49,8 @@ class UndoAction:
 
 _LAST_ACTION_BY_USER: dict[str, UndoAction] = {}
 _GLOBAL_LAST_ACTION: UndoAction | None = None
+_SHEET_WRITE_VERSION = 0
+_SHEET_WRITE_LISTENERS: list[Callable[[int, int], None]] = []
 _PENDING_ACTION_TTL_SECONDS = 300
 _PENDING_SELECTION_EXPIRED_MESSAGE = "That recent transaction selection expired. Please choose the transaction again."
 _RECENT_ACTION_OFFSET_BY_USER: dict[str, int] = {}
@@ -605,9 +607,33 @@ def _worksheet(name: WorksheetName):
     raise ValueError(f"Unsupported worksheet: {name}")
 
 
+def sheet_write_version() -> int:
+    """Counter bumped whenever the bot records or undoes a sheet edit; cached reports compare against it."""
+    return _SHEET_WRITE_VERSION
+
+
+def on_sheet_write(listener: Callable[[int, int], None]) -> None:
+    """Call ``listener(year, month)`` with the monthly tab each recorded or undone edit lands in."""
+    if listener not in _SHEET_WRITE_LISTENERS:
+        _SHEET_WRITE_LISTENERS.append(listener)
+
+
+def _note_sheet_write() -> None:
+    global _SHEET_WRITE_VERSION
+    _SHEET_WRITE_VERSION += 1
+    # The bot only edits the current month's tab, so that is the month every write touches.
+    current = now_pacific()
+    for listener in list(_SHEET_WRITE_LISTENERS):
+        try:
+            listener(current.year, current.month)
+        except Exception:
+            logger.exception("Sheet write listener failed")
+
+
 def record_undo_action(user_key: str | None, action: UndoAction) -> str | None:
     global _GLOBAL_LAST_ACTION
     _GLOBAL_LAST_ACTION = action
+    _note_sheet_write()
     if user_key:
         _LAST_ACTION_BY_USER[str(user_key)] = action
     try:
@@ -2398,6 +2424,7 @@ def _latest_logged_action(
 
 
 def _apply_undo_action(action: UndoAction, log_data: _ActionLogData | None = None) -> tuple[bool, str]:
+    _note_sheet_write()
     ws = _worksheet(action.worksheet)
     if action.kind == "move_expense":
         if "source_category_snapshot" in action.metadata:
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 from langchain_core.utils.function_calling import convert_to_openai_tool
@@ -105,8 +106,7 @@ async def test_category_tool_normalizes_needs_without_accepting_an_owner(monkeyp
 
 @pytest.mark.asyncio
 async def test_financial_report_tool_uses_canonical_mode_views_and_trusted_actor(monkeypatch):
-    report = object()
-    build_report = MagicMock(return_value=report)
+    build_report = MagicMock()
     payload = {
         "ownerName": "Brian",
         "monthLabel": "August 2026",
@@ -151,8 +151,8 @@ async def test_financial_report_tool_uses_canonical_mode_views_and_trusted_actor
             },
         },
     }
-    monkeypatch.setattr(agent_tools, "build_expense_breakdown_report", build_report)
-    monkeypatch.setattr(agent_tools, "expense_breakdown_client_payload", MagicMock(return_value=payload))
+    build_report.return_value = SimpleNamespace(report=object(), payload=payload, fields=payload, fingerprint="rows")
+    monkeypatch.setattr(agent_tools, "cached_expense_report", build_report)
 
     result = await agent_tools.load_financial_report(
         _context(),
@@ -177,7 +177,7 @@ async def test_financial_report_tool_uses_canonical_mode_views_and_trusted_actor
 @pytest.mark.asyncio
 async def test_unknown_actor_cannot_build_canonical_financial_report(monkeypatch):
     build_report = MagicMock()
-    monkeypatch.setattr(agent_tools, "build_expense_breakdown_report", build_report)
+    monkeypatch.setattr(agent_tools, "cached_expense_report", build_report)
 
     result = await agent_tools.load_financial_report(
         _context("unknown-user"),
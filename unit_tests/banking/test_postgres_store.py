@@ -40,3 +40,23 @@ def test_postgres_connection_executemany_uses_cursor_and_converts_placeholders()
             [("now", "txn-1")],
         )
     ]
+
+
+def test_plaid_webhook_notifications_carry_their_source_process():
+    from bookiebot.banking import postgres_store
+
+    executed = []
+
+    class _RecordingConnection:
+        def execute(self, sql, params=()):
+            executed.append(params)
+
+    postgres_store.PostgresBankStore.__new__(postgres_store.PostgresBankStore)._notify_plaid_webhook(
+        _RecordingConnection(), "item-1"
+    )
+
+    channel, payload = executed[0]
+    assert channel == postgres_store.PLAID_WEBHOOK_CHANNEL
+    assert postgres_store._parse_plaid_webhook_notification(payload) == (postgres_store._NOTIFY_SOURCE, "item-1")
+    assert postgres_store._parse_plaid_webhook_notification("other-1:") == ("other-1", None)
+    assert postgres_store._parse_plaid_webhook_notification("item-2") == (None, "item-2")
@@ -0,0 +1,222 @@
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from bookiebot.banking.crypto import TokenCipher
+from bookiebot.banking.store import BankStore
+
+
+ROW_COUNT = 100_000
+OWNER_COUNT = 20
+INDEXED_TABLES = {
+    "bank_transactions",
+    "bank_reconciliation_items",
+    "bank_reconciliation_matches",
+    "bank_webhook_events",
+}
+SQLITE_ALIASES = {"t": "bank_transactions", "r": "bank_reconciliation_items", "m": "bank_reconciliation_matches"}
+SCHEMA_QUERIES = ("information_schema", "sqlite_master", "to_regclass")
+
+
+class _RecordingConnection:
+    def __init__(self, conn, statements):
+        self.conn = conn
+        self.statements = statements
+
+    def execute(self, sql, params=()):
+        if sql.lstrip().upper().startswith("SELECT") and not any(marker in sql for marker in SCHEMA_QUERIES):
+            self.statements.append((sql, params))
+        return self.conn.execute(sql, params)
+
+    def executemany(self, sql, params_seq):
+        return self.conn.executemany(sql, params_seq)
+
+    def executescript(self, sql_script):
+        return self.conn.executescript(sql_script)
+
+
+def _record_hot_queries(store):
+    statements = []
+    original_connect = store.connect
+
+    @contextmanager
+    def recording_connect():
+        with original_connect() as conn:
+            yield _RecordingConnection(conn, statements)
+
+    store.connect = recording_connect
+    try:
+        start_date = (date.today() - timedelta(days=60)).isoformat()
+        store.unreconciled_transactions("owner-3", limit=100, start_date=start_date)
+        store.recent_transactions("owner-3", limit=25, start_date=start_date)
+        store.reconciliation_cache_buckets("owner-3", start_date=start_date)
+        store.unresolved_reconciliation_items("owner-3", limit=100, start_date=start_date)
+        store.matched_reconciliation_items("owner-3", limit=100, start_date=start_date)
+        store.matched_action_log_ids("owner-3")
+        store.matched_action_log_ids("owner-3", {"action-3", "action-23"})
+        store.pending_plaid_webhook_events(limit=25)
+    finally:
+        store.connect = original_connect
+    assert len(statements) == 8
+    return statements
+
+
+def _seed_rows():
+    today = date.today()
+    transactions = []
+    reconciliation_items = []
+    reconciliation_matches = []
+    for index in range(1, ROW_COUNT + 1):
+        owner_key = f"owner-{index % OWNER_COUNT}"
+        txn_date = (today - timedelta(days=index % 1000)).isoformat()
+        transactions.append(
+            (
+                index,
+                f"txn-{index}",
+                owner_key,
+                txn_date,
+                txn_date,
+                f"Merchant {index % 500}",
+                float(index % 9000) / 100,
+                0,
+                "{}",
+                "2026-01-01T00:00:00+00:00",
+                "2026-01-01T00:00:00+00:00",
+                txn_date,
+            )
+        )
+        status = "needs_review" if index % 50 == 0 else "confirmed"
+        reconciliation_items.append(
+            (
+                owner_key,
+                index,
+                "expense",
+                status,
+                f"action-{index}" if status == "confirmed" else None,
+                0.9,
+                "2026-01-01T00:00:00+00:00",
+                "2026-01-01T00:00:00+00:00",
+            )
+        )
+        if status == "confirmed":
+            reconciliation_matches.append((index, f"action-{index}", f"expense!row {index}"))
+    webhook_events = [
+        (
+            f"item-{index % OWNER_COUNT}",
+            "TRANSACTIONS",
+            "SYNC_UPDATES_AVAILABLE",
+            "{}",
+            "pending" if index % 1000 == 0 else "processed",
+            f"2026-01-01T00:00:{index % 60:02d}+00:00",
+        )
+        for index in range(ROW_COUNT // 10)
+    ]
+    return transactions, reconciliation_items, reconciliation_matches, webhook_events
+
+
+def _load_rows(conn):
+    transactions, reconciliation_items, reconciliation_matches, webhook_events = _seed_rows()
+    conn.executemany(
+        """
+        INSERT INTO bank_transactions (
+            id, provider_transaction_id, owner_key, date, authorized_date, name, amount, pending,
+            raw_json, created_at, updated_at, effective_date
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        transactions,
+    )
+    conn.executemany(
+        """
+        INSERT INTO bank_reconciliation_items (
+            owner_key, bank_transaction_id, classification, status, matched_action_log_id,
+            confidence, first_seen_at, last_seen_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        reconciliation_items,
+    )
+    conn.executemany(
+        "INSERT INTO bank_reconciliation_matches (reconciliation_id, action_log_id, sheet_ref) VALUES (?, ?, ?)",
+        reconciliation_matches,
+    )
+    conn.executemany(
+        """
+        INSERT INTO bank_webhook_events (provider, item_id, webhook_type, webhook_code, payload, status, received_at)
+        VALUES ('plaid', ?, ?, ?, ?, ?, ?)
+        """,
+        webhook_events,
+    )
+
+
+def test_sqlite_hot_queries_use_indexes_at_100k_rows(tmp_path):
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    with store.connect() as conn:
+        _load_rows(conn)
+        conn.execute("ANALYZE")
+
+    statements = _record_hot_queries(store)
+
+    with store.connect() as conn:
+        for sql, params in statements:
+            plan = [str(row["detail"]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+            for detail in plan:
+                match = re.match(r"(SCAN|SEARCH) (\w+)", detail)
+                if match is None:
+                    continue
+                table = SQLITE_ALIASES.get(match.group(2), match.group(2))
+                if table in INDEXED_TABLES:
+                    assert "INDEX" in detail or "PRIMARY KEY" in detail, f"{table} not indexed in plan {plan} for {sql}"
+
+
+def _postgres_scan_nodes(plan):
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_postgres_scan_nodes(child))
+    return nodes
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("BOOKIEBOT_TEST_DATABASE_URL"),
+    reason="BOOKIEBOT_TEST_DATABASE_URL is not set",
+)
+def test_postgres_hot_queries_use_indexes_at_100k_rows():
+    psycopg = pytest.importorskip("psycopg")
+    from psycopg.conninfo import make_conninfo
+
+    from bookiebot.banking.postgres_store import PostgresBankStore
+
+    base_url = os.environ["BOOKIEBOT_TEST_DATABASE_URL"]
+    schema = f"bookiebot_plan_{uuid4().hex[:10]}"
+    with psycopg.connect(base_url, autocommit=True) as admin:
+        admin.execute(f"CREATE SCHEMA {schema}")
+    try:
+        store = PostgresBankStore(
+            make_conninfo(base_url, options=f"-c search_path={schema}"),
+            TokenCipher("test-secret-key"),
+        )
+        store.initialize()
+        with store.connect() as conn:
+            _load_rows(conn)
+            conn.execute("ANALYZE")
+
+        statements = _record_hot_queries(store)
+
+        with store.connect() as conn:
+            for sql, params in statements:
+                row = conn.execute(f"EXPLAIN (FORMAT JSON) {sql}", params).fetchone()
+                raw_plan = row["QUERY PLAN"]
+                plan = (json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan)[0]["Plan"]
+                for node in _postgres_scan_nodes(plan):
+                    if node.get("Relation Name") in INDEXED_TABLES:
+                        assert node["Node Type"] != "Seq Scan", f"{node['Relation Name']} seq scan for {sql}"
+    finally:
+        with psycopg.connect(base_url, autocommit=True) as admin:
+            admin.execute(f"DROP SCHEMA {schema} CASCADE")
@@ -1,6 +1,7 @@
 from contextlib import nullcontext
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
+import random
 from typing import cast
 
 import pytest
@@ -10,7 +11,11 @@ from bookiebot.banking.crypto import TokenCipher
 from bookiebot.banking.models import BankAccount, BankTransaction
 from bookiebot.banking.plaid_client import PlaidClient
 import bookiebot.banking.service as banking_service
+import bookiebot.banking.reconciliation as reconciliation
 from bookiebot.banking.reconciliation import (
+    CandidateIndex,
+    ClassificationPatterns,
+    TransactionClassifier,
     ScheduledPullCandidate,
     action_log_bank_transaction,
     classify_transaction,
@@ -18,6 +23,7 @@ from bookiebot.banking.reconciliation import (
     find_action_log_candidate_groups,
     find_action_log_candidates,
     reconcile_transaction,
+    reconcile_transactions,
 )
 from bookiebot.banking.service import BankingService
 from bookiebot.banking.store import BankStore
@@ -106,6 +112,40 @@ def test_classify_pending_as_needs_review():
     assert notes == "pending transaction"
 
 
+def test_transaction_classifier_matches_every_substring_category():
+    patterns = ClassificationPatterns()
+    classifier = TransactionClassifier(patterns)
+    texts = [
+        "online transfer to sav xxxxx1234",
+        "sonic payroll direct dep",
+        "interest earned intrst pymt",
+        "apple.com/bill icloud",
+        "cd deposit .initial",
+        "cd deposit xinitial",
+        "payment thank you pg&e",
+        "corner bakery",
+    ]
+
+    for text in texts:
+        expected = {
+            category for category in ("transfer", "payroll", "interest", "subscription")
+            if any(pattern in text for pattern in getattr(patterns, category))
+        }
+        assert classifier.categories(text) == expected, text
+
+
+def test_classify_transaction_uses_owner_configured_patterns(monkeypatch):
+    deposit = _transaction("ACME WIDGETS DES:DIRDEP", -2500.0)
+
+    assert classify_transaction(deposit)[0:2] == ("refund_or_credit", "needs_review")
+
+    monkeypatch.setenv("BRIAN_BANK_PAYROLL_PATTERNS", "acme widgets, Globex")
+
+    assert classify_transaction(deposit)[0] == "income"
+    assert ClassificationPatterns.for_owner("brian").payroll[-2:] == ("acme widgets", "globex")
+    assert ClassificationPatterns.for_owner("hannah") == ClassificationPatterns()
+
+
 def test_reconcile_matches_logged_expense_by_amount_and_date():
     action = LoggedAction(
         id="abc123",
@@ -340,6 +380,204 @@ def test_find_action_log_candidate_groups_matches_exact_aggregate_total():
     assert [candidate.action_id for candidate in groups[0].candidates] == ["minted123", "zazzle123"]
 
 
+def _expense_action(action_id: str, day: int, amount: str, merchant: str) -> LoggedAction:
+    return LoggedAction(
+        id=action_id,
+        created_at=f"2026-05-{day:02d}T12:00:00",
+        user_key="676638528590970917",
+        action=UndoAction(
+            worksheet="expense",
+            kind="clear_cells",
+            row=day,
+            columns=[14, 15, 16, 17, 18],
+            previous_values=["", "", "", "", ""],
+            new_values=[f"5/{day}/2026", "misc", amount, merchant, "Brian (BofA)"],
+            metadata={"type": "expense", "category": "shopping", "person": "Brian (BofA)"},
+            description=f"shopping expense ${amount} for Brian (BofA)",
+        ),
+    )
+
+
+def test_candidate_index_matches_raw_action_log_results():
+    actions = [
+        _expense_action("far", 1, "4.33", "Starbucks"),
+        _expense_action("near", 15, "4.33", "Starbucks"),
+        _expense_action("exact", 17, "4.33", "Starbucks"),
+        _expense_action("fuzzy", 18, "5.10", "Starbucks"),
+        _expense_action("part-a", 16, "2.00", "Peets"),
+        _expense_action("part-b", 16, "2.33", "Blue Bottle"),
+    ]
+    index = CandidateIndex.from_action_log(actions)
+    transaction = _transaction("Starbucks", 4.33)
+
+    assert len(index) == 6
+    assert reconcile_transaction(transaction, index) == reconcile_transaction(transaction, actions)
+    assert find_action_log_candidates(transaction, index, classification="expense") == find_action_log_candidates(
+        transaction, actions, classification="expense"
+    )
+    assert find_action_log_candidate_groups(transaction, index, classification="expense") == (
+        find_action_log_candidate_groups(transaction, actions, classification="expense")
+    )
+    assert "far" not in {candidate.action_id for candidate in find_action_log_candidates(transaction, index)}
+    assert reconcile_transaction(transaction, index).matched_action_log_id == "exact"
+
+
+def test_candidate_index_parses_each_action_once(monkeypatch):
+    calls = []
+    original = reconciliation._action_candidate
+
+    def counting_action_candidate(logged):
+        calls.append(logged.id)
+        return original(logged)
+
+    monkeypatch.setattr(reconciliation, "_action_candidate", counting_action_candidate)
+    actions = [_expense_action(f"action-{day}", day, f"{day}.00", "Target") for day in range(1, 29)]
+    index = CandidateIndex.from_action_log(actions)
+    for day in range(1, 29):
+        transaction = BankTransaction(**{**_transaction("Target", float(day)).__dict__, "date": f"2026-05-{day:02d}"})
+        decision = reconcile_transaction(transaction, index)
+        find_action_log_candidates(transaction, index, classification="expense")
+        find_action_log_candidate_groups(transaction, index, classification="expense")
+        assert decision.matched_action_log_id == f"action-{day}"
+
+    assert len(calls) == len(actions)
+
+
+def _dated_transaction(transaction_id: int, day: str, name: str, amount: float) -> BankTransaction:
+    return BankTransaction(
+        **{
+            **_transaction(name, amount).__dict__,
+            "id": transaction_id,
+            "provider_transaction_id": f"txn-{transaction_id}",
+            "date": day,
+        }
+    )
+
+
+def test_reconcile_transactions_does_not_let_early_transaction_steal_match():
+    actions = [
+        _expense_action("shared", 18, "4.33", "Starbucks"),
+        _expense_action("early-only", 12, "4.33", "Starbucks"),
+    ]
+    early = _dated_transaction(1, "2026-05-17", "Starbucks", 4.33)
+    late = _dated_transaction(2, "2026-05-20", "Starbucks", 4.33)
+
+    greedy_first = reconcile_transaction(early, actions)
+    decisions = reconcile_transactions([early, late], actions)
+
+    assert greedy_first.matched_action_log_id == "shared"
+    assert [decision.matched_action_log_id for decision in decisions] == ["early-only", "shared"]
+    assert all(decision.status == "matched" for decision in decisions)
+
+
+def test_reconcile_transactions_prefers_action_match_and_falls_back_to_schedule():
+    actions = [_expense_action("netflix-action", 17, "15.49", "Netflix")]
+    pulls = [
+        ScheduledPullCandidate(
+            source_type="subscription",
+            name="Netflix",
+            amount=15.49,
+            pull_date=date(2026, 5, 17),
+            source_ref="subscription:Netflix",
+        )
+    ]
+    first = _dated_transaction(1, "2026-05-17", "Netflix", 15.49)
+    second = _dated_transaction(2, "2026-05-17", "Netflix", 15.49)
+
+    decisions = reconcile_transactions([first, second], actions, pulls)
+
+    assert decisions[0].matched_action_log_id == "netflix-action"
+    assert decisions[1].matched_action_log_id is None
+    assert decisions[1].matched_sheet_ref == "subscription:Netflix"
+
+
+def test_reconcile_transactions_beats_greedy_at_500_by_2000():
+    rng = random.Random(7)
+    merchants = ["Starbucks", "Safeway", "Target", "Shell", "Costco", "Uber"]
+    amounts = ["4.33", "12.50", "25.00", "9.99"]
+    start = date(2026, 1, 1)
+    actions = []
+    for index in range(2000):
+        day = start + timedelta(days=rng.randrange(120))
+        actions.append(
+            LoggedAction(
+                id=f"action-{index}",
+                created_at=f"{day.isoformat()}T12:00:00",
+                user_key="676638528590970917",
+                action=UndoAction(
+                    worksheet="expense",
+                    kind="clear_cells",
+                    row=index,
+                    columns=[14, 15, 16, 17, 18],
+                    previous_values=["", "", "", "", ""],
+                    new_values=[
+                        f"{day.month}/{day.day}/{day.year}",
+                        "misc",
+                        rng.choice(amounts),
+                        rng.choice(merchants),
+                        "Brian (BofA)",
+                    ],
+                    metadata={"type": "expense", "category": "shopping"},
+                    description="shopping expense",
+                ),
+            )
+        )
+    transactions = [
+        _dated_transaction(
+            index,
+            (start + timedelta(days=rng.randrange(120))).isoformat(),
+            rng.choice(merchants),
+            float(rng.choice(amounts)),
+        )
+        for index in range(500)
+    ]
+    index = CandidateIndex.from_action_log(actions)
+
+    decisions = reconcile_transactions(transactions, index)
+    used: set[str] = set()
+    greedy = []
+    for transaction in transactions:
+        decision = reconcile_transaction(transaction, index, excluded_action_ids=used)
+        if decision.matched_action_log_id:
+            used.add(decision.matched_action_log_id)
+        greedy.append(decision)
+
+    matched_ids = [decision.matched_action_log_id for decision in decisions if decision.matched_action_log_id]
+    assert len(matched_ids) == len(set(matched_ids))
+    assert len(matched_ids) >= len(used)
+    assert sum(decision.confidence for decision in decisions if decision.matched_action_log_id) >= sum(
+        decision.confidence for decision in greedy if decision.matched_action_log_id
+    ) - 1e-9
+    assert reconcile_transactions(transactions, index) == decisions
+
+
+def test_find_action_log_candidate_groups_supports_large_split_receipts():
+    rng = random.Random(11)
+    noise = [
+        _expense_action(f"noise-{index}", 10 + index % 8, f"{rng.randrange(5000, 9000) / 100:.2f}", "Other")
+        for index in range(34)
+    ]
+    receipt = [
+        _expense_action(f"costco-{index}", 16, amount, "Costco")
+        for index, amount in enumerate(["12.10", "20.25", "31.40", "8.05", "15.00", "13.20"])
+    ]
+    transaction = _dated_transaction(1, "2026-05-17", "Costco Wholesale", 100.00)
+
+    groups = find_action_log_candidate_groups(
+        transaction,
+        [*noise, *receipt],
+        classification="expense",
+        max_group_size=6,
+        max_candidates=40,
+        limit=3,
+    )
+
+    assert groups
+    assert [candidate.action_id for candidate in groups[0].candidates] == [f"costco-{index}" for index in range(6)]
+    assert groups[0].total_amount == 100.00
+    assert [group.confidence for group in groups] == sorted((group.confidence for group in groups), reverse=True)
+
+
 def test_reconcile_income_requires_name_overlap():
     action = LoggedAction(
         id="income123",
@@ -838,6 +1076,62 @@ def test_reconciliation_preview_does_not_reuse_action_log_match(monkeypatch, tmp
     assert len([item for item in preview.items if item.status == "needs_review"]) == 1
 
 
+def test_reconciliation_preview_rescores_only_changed_transactions(monkeypatch, tmp_path):
+    action_log: list[LoggedAction] = []
+    monkeypatch.setattr(banking_service, "read_active_logged_actions", lambda _actor_key: list(action_log))
+    monkeypatch.setattr(banking_service, "_scheduled_pulls_for_transactions", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(banking_service, "_schedule_revision", lambda _actor_key: "schedules-v1")
+
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    transactions = [
+        {"transaction_id": f"txn-{day}", "date": f"2026-05-{day:02d}", "name": name, "amount": amount, "pending": False}
+        for day, name, amount in ((1, "Shell", 17.0), (13, "Target", 20.0), (25, "Safeway", 30.0))
+    ]
+    store.upsert_transactions(transactions, owner_key="brian")
+    config = BankingConfig(
+        plaid_client_id="client",
+        plaid_secret="secret",
+        plaid_env="sandbox",
+        token_encryption_key="test-secret-key",
+        sqlite_path=Path("unused.sqlite3"),
+    )
+    service = BankingService(config=config, store=store, plaid=PlaidClient(config))
+    scored: list[str] = []
+    original_upsert = store.upsert_reconciliation_item
+
+    def recording_upsert(**kwargs):
+        scored.append(kwargs["transaction"].provider_transaction_id)
+        return original_upsert(**kwargs)
+
+    monkeypatch.setattr(store, "upsert_reconciliation_item", recording_upsert)
+
+    first = service.reconciliation_preview("brian", actor_key="676638528590970917")
+    assert sorted(scored) == ["txn-1", "txn-13", "txn-25"]
+
+    scored.clear()
+    unchanged = service.reconciliation_preview("brian", actor_key="676638528590970917")
+    assert scored == []
+    assert [item.id for item in unchanged.items] == [item.id for item in first.items]
+
+    action_log.append(_expense_action("target-action", 12, "20.00", "Target"))
+    with_action = service.reconciliation_preview("brian", actor_key="676638528590970917")
+    assert scored == ["txn-13"]
+    by_transaction = {item.transaction.provider_transaction_id: item for item in with_action.items}
+    assert by_transaction["txn-13"].matched_action_log_id == "target-action"
+    assert by_transaction["txn-1"].status == "needs_review"
+
+    scored.clear()
+    store.upsert_transactions([{**transactions[2], "name": "Safeway Fuel"}], owner_key="brian")
+    service.reconciliation_preview("brian", actor_key="676638528590970917")
+    assert scored == ["txn-25"]
+
+    scored.clear()
+    monkeypatch.setattr(banking_service, "_schedule_revision", lambda _actor_key: "schedules-v2")
+    service.reconciliation_preview("brian", actor_key="676638528590970917")
+    assert sorted(scored) == ["txn-1", "txn-25"]
+
+
 def test_reconciliation_preview_excludes_ignored_accounts(tmp_path):
     store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
     store.initialize()
@@ -934,8 +1228,15 @@ class _SandboxPlaidStub:
     def __init__(self):
         self.sync_cursors = []
         self.removed_tokens = []
+        self.account_fetches = 0
+        self.webhook_updates = []
+
+    async def update_item_webhook(self, _access_token, webhook):
+        self.webhook_updates.append(webhook)
+        return {"webhook": webhook}
 
     async def get_accounts(self, _access_token):
+        self.account_fetches += 1
         return [
             {
                 "account_id": "account-1",
@@ -1069,6 +1370,123 @@ async def test_seed_sandbox_resets_cursor_when_cache_is_empty(tmp_path):
     assert store.transaction_count("brian") == 1
 
 
+@pytest.mark.asyncio
+async def test_sync_item_skips_current_webhook_and_fresh_accounts(tmp_path):
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    item = store.upsert_item(
+        owner_key="brian",
+        provider="plaid",
+        item_id="item-1",
+        access_token="access-sandbox-123",
+        institution_name="Plaid Sandbox",
+    )
+    plaid = _SandboxPlaidStub()
+    service = BankingService(
+        config=BankingConfig(
+            plaid_client_id="client",
+            plaid_secret="secret",
+            plaid_env="sandbox",
+            token_encryption_key="test-secret-key",
+            sqlite_path=Path("unused.sqlite3"),
+            plaid_webhook_url="https://example.test/bank/plaid-webhook",
+        ),
+        store=store,
+        plaid=cast(PlaidClient, plaid),
+    )
+
+    first = await service.sync_item(item)
+    second = await service.sync_item(item)
+
+    assert plaid.webhook_updates == ["https://example.test/bank/plaid-webhook"]
+    assert plaid.account_fetches == 1
+    assert plaid.sync_cursors == [None, "cursor-refreshed"]
+    assert first.accounts == 1
+    assert second.accounts == 1
+    assert store.registered_webhook_url(item.id) == "https://example.test/bank/plaid-webhook"
+
+    await service.sync_item(item, refresh_accounts=True)
+
+    assert plaid.account_fetches == 2
+    assert len(plaid.webhook_updates) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_item_refreshes_accounts_for_unknown_transaction_account(tmp_path):
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    item = store.upsert_item(
+        owner_key="brian",
+        provider="plaid",
+        item_id="item-1",
+        access_token="access-sandbox-123",
+        institution_name="Plaid Sandbox",
+    )
+    store.mark_accounts_refreshed(item.id)
+    plaid = _SandboxPlaidStub()
+    service = BankingService(
+        config=BankingConfig(
+            plaid_client_id="client",
+            plaid_secret="secret",
+            plaid_env="sandbox",
+            token_encryption_key="test-secret-key",
+            sqlite_path=Path("unused.sqlite3"),
+        ),
+        store=store,
+        plaid=cast(PlaidClient, plaid),
+    )
+
+    result = await service.sync_item(item)
+
+    assert plaid.webhook_updates == []
+    assert plaid.account_fetches == 1
+    assert result.accounts == 1
+    assert store.recent_transactions("brian")[0].account_name == "Plaid Checking"
+
+
+@pytest.mark.asyncio
+async def test_process_plaid_webhook_inbox_syncs_each_item_once_per_drain(tmp_path):
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    store.upsert_item(
+        owner_key="brian",
+        provider="plaid",
+        item_id="item-1",
+        access_token="access-sandbox-123",
+        institution_name="Plaid Sandbox",
+    )
+    for code in ("SYNC_UPDATES_AVAILABLE", "DEFAULT_UPDATE", "SYNC_UPDATES_AVAILABLE"):
+        store.enqueue_plaid_webhook({"webhook_type": "TRANSACTIONS", "webhook_code": code, "item_id": "item-1"})
+    store.enqueue_plaid_webhook({"webhook_type": "ITEM", "webhook_code": "WEBHOOK_UPDATE_ACKNOWLEDGED", "item_id": "item-1"})
+    processed_groups = []
+    original_mark_processed = store.mark_plaid_webhooks_processed
+
+    def record_processed(event_ids, item_id=None):
+        processed_groups.append(list(event_ids))
+        original_mark_processed(event_ids, item_id)
+
+    store.mark_plaid_webhooks_processed = record_processed
+    plaid = _SandboxPlaidStub()
+    service = BankingService(
+        config=BankingConfig(
+            plaid_client_id="client",
+            plaid_secret="secret",
+            plaid_env="sandbox",
+            token_encryption_key="test-secret-key",
+            sqlite_path=Path("unused.sqlite3"),
+        ),
+        store=store,
+        plaid=cast(PlaidClient, plaid),
+    )
+
+    result = await service.process_plaid_webhook_inbox()
+
+    assert result == {"processed": 3, "failed": 0, "skipped": 1}
+    assert plaid.sync_cursors == [None]
+    assert [len(group) for group in processed_groups] == [1, 3]
+    assert store.pending_plaid_webhook_events() == []
+
+
 def test_seed_cached_transactions_from_action_log_then_matches(monkeypatch, tmp_path):
     action = LoggedAction(
         id="abc123",
@@ -1295,6 +1713,77 @@ def test_reconciliation_match_candidates_includes_schedule_matches(monkeypatch,
     assert candidates[0].sheet_ref == "Subscriptions!B10:D10"
 
 
+def test_reconciliation_match_candidates_are_stored_until_inputs_change(monkeypatch, tmp_path):
+    action_log = [
+        _expense_action("first", 12, "12.34", "Coffee"),
+        _expense_action("second", 13, "12.34", "Coffee"),
+        _expense_action("part-a", 12, "5.00", "Coffee"),
+        _expense_action("part-b", 12, "7.34", "Coffee"),
+    ]
+    monkeypatch.setattr(banking_service, "read_active_logged_actions", lambda _actor_key: list(action_log))
+    monkeypatch.setattr(banking_service, "_scheduled_pulls_for_transactions", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(banking_service, "_schedule_revision", lambda _actor_key: "schedules-v1")
+    searches: list[int] = []
+    original_find = banking_service.find_action_log_candidates
+
+    def counting_find(*args, **kwargs):
+        searches.append(1)
+        return original_find(*args, **kwargs)
+
+    monkeypatch.setattr(banking_service, "find_action_log_candidates", counting_find)
+
+    store = BankStore(tmp_path / "banking.sqlite3", TokenCipher("test-secret-key"))
+    store.initialize()
+    store.upsert_transactions(
+        [
+            {"transaction_id": f"txn-{day}", "date": f"2026-05-{day:02d}", "name": "Coffee", "amount": 12.34, "pending": False}
+            for day in (13, 14)
+        ],
+        owner_key="brian",
+    )
+    config = BankingConfig(
+        plaid_client_id="client",
+        plaid_secret="secret",
+        plaid_env="sandbox",
+        token_encryption_key="test-secret-key",
+        sqlite_path=Path("unused.sqlite3"),
+    )
+    service = BankingService(config=config, store=store, plaid=PlaidClient(config))
+    items = {item.transaction.provider_transaction_id: item for item in service.reconciliation_preview("brian", force=True).items}
+    detail_id, other_id = items["txn-13"].id, items["txn-14"].id
+    store.reopen_reconciliation_item("brian", other_id)
+
+    _item, candidates, groups = service.reconciliation_match_candidates("brian", detail_id, actor_key="676638528590970917")
+    _item, cached_candidates, cached_groups = service.reconciliation_match_candidates(
+        "brian", detail_id, actor_key="676638528590970917"
+    )
+
+    assert len(searches) == 1
+    assert cached_candidates == candidates
+    assert cached_groups == groups
+    assert {candidate.action_id for candidate in groups[0].candidates} == {"part-a", "part-b"}
+
+    store.confirm_reconciliation_item("brian", other_id, matched_action_log_id="second", matched_sheet_ref="expense!row 13")
+    _item, refreshed, _groups = service.reconciliation_match_candidates("brian", detail_id, actor_key="676638528590970917")
+
+    assert len(searches) == 2
+    assert "second" not in {candidate.action_id for candidate in refreshed}
+
+    action_log.append(_expense_action("third", 14, "12.34", "Coffee"))
+    _item, refreshed, _groups = service.reconciliation_match_candidates("brian", detail_id, actor_key="676638528590970917")
+
+    assert len(searches) == 3
+    assert "third" in {candidate.action_id for candidate in refreshed}
+
+    store.ignore_reconciliation_item("brian", detail_id)
+    with store.connect() as conn:
+        stored = conn.execute(
+            "SELECT COUNT(*) AS count FROM bank_reconciliation_candidates WHERE reconciliation_id = ?",
+            (detail_id,),
+        ).fetchone()
+    assert stored["count"] == 0
+
+
 def test_confirm_reconciliation_schedule_match_marks_schedule_row(monkeypatch, tmp_path):
     monkeypatch.setattr(
         banking_service,
@@ -1380,6 +1869,41 @@ def test_scheduled_pulls_falls_back_to_visible_subscriptions(monkeypatch):
     assert candidates[0].source_ref == "Subscriptions!J8:L8"
 
 
+def test_scheduled_pulls_reuse_calendar_until_schedules_change(monkeypatch):
+    banking_service.clear_schedule_source_cache()
+    subscriptions = [Subscription(name="Netflix", amount=15.49, cadence="monthly", pull_day=16)]
+    monkeypatch.setattr(banking_service, "sheet_user_context", lambda _actor_key: nullcontext())
+    monkeypatch.setattr(banking_service, "list_normalized_subscription_schedules", lambda: list(subscriptions))
+    monkeypatch.setattr(banking_service, "list_bill_schedules", lambda: [])
+    expansions = []
+    original_next_pull_date = banking_service.next_pull_date
+
+    def counting_next_pull_date(subscription, start):
+        expansions.append(subscription.name)
+        return original_next_pull_date(subscription, start)
+
+    monkeypatch.setattr(banking_service, "next_pull_date", counting_next_pull_date)
+    may = BankTransaction(**{**_transaction("Netflix", 15.49).__dict__, "date": "2026-05-17"})
+    june = BankTransaction(**{**_transaction("Netflix", 15.49).__dict__, "date": "2026-06-15"})
+
+    first = banking_service._scheduled_pulls_for_transactions([may], actor_key="brian")
+    built = len(expansions)
+    second = banking_service._scheduled_pulls_for_transactions([june], actor_key="brian")
+
+    assert [pull.pull_date for pull in first] == [date(2026, 5, 16)]
+    assert [pull.pull_date for pull in second] == [date(2026, 6, 16)]
+    assert built > 0
+    assert len(expansions) == built
+
+    banking_service._SCHEDULE_SOURCE_CACHE.clear()
+    subscriptions[0] = Subscription(name="Netflix", amount=17.99, cadence="monthly", pull_day=16)
+    changed = banking_service._scheduled_pulls_for_transactions([may], actor_key="brian")
+
+    assert [pull.amount for pull in changed] == [17.99]
+    assert len(expansions) > built
+    banking_service.clear_schedule_source_cache()
+
+
 def test_scheduled_pulls_still_loads_bills_when_subscriptions_fail(monkeypatch):
     banking_service._SCHEDULE_SOURCE_CACHE.clear()
     monkeypatch.setattr(banking_service, "sheet_user_context", lambda _actor_key: nullcontext())
@@ -0,0 +1,45 @@
+import pytest
+
+from unit_tests.support.reconciliation_bench import (
+    generate_scenario,
+    load_baseline,
+    regressions,
+    run_benchmark,
+)
+
+
+def test_synthetic_scenario_is_deterministic_and_covers_each_workload():
+    first = generate_scenario(seed=11, transactions=120, noise_actions=50)
+    second = generate_scenario(seed=11, transactions=120, noise_actions=50)
+
+    assert first.plaid_transactions == second.plaid_transactions
+    assert [logged.id for logged in first.action_log] == [logged.id for logged in second.action_log]
+    assert first.expected_groups and first.expected_schedules and first.subscriptions
+    assert any(transaction.pending for transaction in first.transactions)
+    assert any(transaction.pending_transaction_id for transaction in first.transactions)
+    assert any(transaction.amount < 0 for transaction in first.transactions)
+
+
+def test_regressions_flag_quality_drops_and_slow_latency():
+    baseline = {"preview_cold_ms": 100.0, "preview_quality": {"precision": 1.0, "recall": 0.9}}
+
+    assert regressions({"preview_cold_ms": 150.0, "preview_quality": {"precision": 0.99, "recall": 0.9}}, baseline, tolerance=2) == []
+    assert regressions({"preview_cold_ms": 250.0, "preview_quality": {"precision": 0.8, "recall": 0.9}}, baseline, tolerance=2) == [
+        "preview_cold_ms 250.0ms > 2x baseline 100.0ms",
+        "preview_quality.precision 0.8 < baseline 1.0",
+    ]
+
+
+def test_reconciliation_benchmark_matches_baseline_quality():
+    baseline = {key: value for key, value in load_baseline().items() if not key.endswith("_ms")}
+    results = run_benchmark(generate_scenario())
+
+    assert results["expected_matches"] > 0
+    assert regressions(results, baseline) == []
+
+
+@pytest.mark.benchmark
+def test_reconciliation_benchmark_matches_baseline_latency():
+    baseline = {key: value for key, value in load_baseline().items() if key.endswith("_ms")}
+
+    assert regressions(run_benchmark(generate_scenario()), baseline) == []
@@ -83,6 +83,29 @@ def test_store_tracks_accounts_transactions_and_removed_state(tmp_path):
     assert status.transaction_count == 0
 
 
+def test_store_persists_effective_date_for_transactions(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_transactions(
+        [
+            {"transaction_id": "txn-posted", "date": "2026-05-16", "authorized_date": "2026-05-15", "name": "A", "amount": 1},
+            {"transaction_id": "txn-authorized", "date": None, "authorized_date": "2026-05-14", "name": "B", "amount": 1},
+            {"transaction_id": "txn-undated", "name": "C", "amount": 1},
+        ],
+        owner_key="brian",
+    )
+
+    with store.connect() as conn:
+        rows = conn.execute(
+            "SELECT provider_transaction_id, effective_date FROM bank_transactions ORDER BY id"
+        ).fetchall()
+
+    assert [(row["provider_transaction_id"], row["effective_date"]) for row in rows] == [
+        ("txn-posted", "2026-05-16"),
+        ("txn-authorized", "2026-05-14"),
+        ("txn-undated", ""),
+    ]
+
+
 def test_store_persists_sync_cursor_and_error(tmp_path):
     store = _store(tmp_path)
     item = store.upsert_item(
@@ -101,6 +124,41 @@ def test_store_persists_sync_cursor_and_error(tmp_path):
     assert status.last_error == "boom"
 
 
+def test_store_persists_webhook_registration_and_account_refresh(tmp_path):
+    store = _store(tmp_path)
+    item = store.upsert_item(
+        owner_key="brian",
+        provider="plaid",
+        item_id="item-1",
+        access_token="access-sandbox-123",
+        institution_name="Plaid Sandbox",
+    )
+
+    assert store.registered_webhook_url(item.id) is None
+    assert store.accounts_refreshed_at(item.id) is None
+
+    store.mark_webhook_registered(item.id, "https://example.test/bank/plaid-webhook")
+    store.mark_accounts_refreshed(item.id)
+    store.mark_sync_success(item.id, "cursor-1")
+
+    assert store.registered_webhook_url(item.id) == "https://example.test/bank/plaid-webhook"
+    assert store.accounts_refreshed_at(item.id) is not None
+    assert store.get_cursor(item.id) == "cursor-1"
+
+
+def test_store_round_trips_reconciliation_watermark(tmp_path):
+    store = _store(tmp_path)
+
+    assert store.reconciliation_watermark("brian", "actor-1") is None
+
+    store.save_reconciliation_watermark("brian", "actor-1", {"actions": {"abc123": ["digest", 739000]}})
+    store.save_reconciliation_watermark("brian", None, {"actions": {}})
+    store.save_reconciliation_watermark("brian", "actor-1", {"actions": {"def456": ["digest", 739001]}})
+
+    assert store.reconciliation_watermark("brian", "actor-1") == {"actions": {"def456": ["digest", 739001]}}
+    assert store.reconciliation_watermark("brian", None) == {"actions": {}}
+
+
 def test_store_resets_owner_sync_cursors(tmp_path):
     store = _store(tmp_path)
     brian_item = store.upsert_item(
@@ -274,6 +332,39 @@ def test_store_queues_plaid_webhook_events(tmp_path):
     assert store.pending_plaid_webhook_events() == []
 
 
+def test_store_marks_plaid_webhook_groups_and_clears_pending_flag(tmp_path):
+    store = _store(tmp_path)
+    item = store.upsert_item(
+        owner_key="brian",
+        provider="plaid",
+        item_id="plaid-item-1",
+        access_token="access-sandbox-brian",
+        institution_name="Plaid Sandbox",
+    )
+    events = [
+        store.enqueue_plaid_webhook(
+            {"webhook_type": "TRANSACTIONS", "webhook_code": "SYNC_UPDATES_AVAILABLE", "item_id": "plaid-item-1"}
+        )
+        for _ in range(3)
+    ]
+
+    def webhook_pending():
+        with store.connect() as conn:
+            row = conn.execute("SELECT webhook_pending FROM bank_sync_state WHERE item_id = ?", (item.id,)).fetchone()
+        return int(row["webhook_pending"])
+
+    store.mark_plaid_webhooks_processing([event.id for event in events])
+    store.mark_plaid_webhooks_processed([events[0].id, events[1].id], "plaid-item-1")
+    assert webhook_pending() == 1
+
+    store.mark_plaid_webhooks_failed([events[2].id], "boom")
+    assert [event.id for event, _payload in store.pending_plaid_webhook_events()] == [events[2].id]
+
+    store.mark_plaid_webhooks_processed([events[2].id], "plaid-item-1")
+    assert store.pending_plaid_webhook_events() == []
+    assert webhook_pending() == 0
+
+
 def test_store_purges_transactions_before_cutoff_without_touching_accounts(tmp_path):
     store = _store(tmp_path)
     item = store.upsert_item(
@@ -837,6 +928,73 @@ def test_unreconciled_transactions_skip_pending_items(tmp_path):
     assert [transaction.name for transaction in transactions] == ["Posted Coffee"]
 
 
+def test_upsert_transactions_carries_pending_reconciliation_to_posted_twin(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_transactions(
+        [
+            {"transaction_id": f"pending-{name}", "date": "2026-05-18", "name": name, "amount": 5.55, "pending": True}
+            for name in ("Coffee", "Bagel", "Lunch")
+        ],
+        owner_key="brian",
+    )
+    pending = {transaction.provider_transaction_id: transaction for transaction in store.recent_transactions("brian")}
+    confirmed = store.upsert_reconciliation_item(
+        owner_key="brian",
+        transaction=pending["pending-Coffee"],
+        classification="expense",
+        status="needs_review",
+        confidence=0.5,
+    )
+    store.confirm_reconciliation_item(
+        "brian",
+        confirmed.id,
+        matched_action_log_id="coffee-action",
+        matched_sheet_ref="expense!row 9",
+    )
+    open_item = store.upsert_reconciliation_item(
+        owner_key="brian",
+        transaction=pending["pending-Bagel"],
+        classification="pending",
+        status="needs_review",
+        confidence=0.0,
+    )
+    store.upsert_transactions(
+        [{"transaction_id": "posted-Lunch", "date": "2026-05-19", "name": "Lunch", "amount": 6.0, "pending": False, "pending_transaction_id": "pending-Lunch"}],
+        owner_key="brian",
+    )
+    lunch_item = store.upsert_reconciliation_item(
+        owner_key="brian",
+        transaction=pending["pending-Lunch"],
+        classification="pending",
+        status="ignored",
+        confidence=0.0,
+    )
+
+    store.upsert_transactions(
+        [
+            {"transaction_id": f"posted-{name}", "date": "2026-05-19", "name": name, "amount": 5.55, "pending": False, "pending_transaction_id": f"pending-{name}"}
+            for name in ("Coffee", "Bagel")
+        ]
+        + [{"transaction_id": "pending-Lunch", "date": "2026-05-18", "name": "Lunch", "amount": 5.55, "pending": True}],
+        owner_key="brian",
+    )
+    posted = {transaction.provider_transaction_id: transaction for transaction in store.recent_transactions("brian")}
+    items = store.reconciliation_items_for_transactions(
+        "brian",
+        [posted[f"posted-{name}"].id for name in ("Coffee", "Bagel", "Lunch")],
+    )
+
+    assert items[posted["posted-Coffee"].id].id == confirmed.id
+    assert items[posted["posted-Coffee"].id].status == "confirmed"
+    assert items[posted["posted-Coffee"].id].scored_at is not None
+    assert store.matched_action_log_ids("brian") == {"coffee-action"}
+    assert items[posted["posted-Bagel"].id].id == open_item.id
+    assert items[posted["posted-Bagel"].id].scored_at is None
+    assert items[posted["posted-Lunch"].id].id == lunch_item.id
+    assert items[posted["posted-Lunch"].id].status == "ignored"
+    assert store.reconciliation_items_for_transactions("brian", [pending["pending-Coffee"].id]) == {}
+
+
 def test_reconciliation_cache_buckets_counts_transaction_states(tmp_path):
     store = _store(tmp_path)
     item = store.upsert_item(
@@ -1170,6 +1328,8 @@ def test_reopen_reconciliation_item_returns_confirmed_item_to_review(tmp_path):
     assert reopened.resolved_at is None
     assert reopened.matched_action_log_id is None
     assert reopened.matched_sheet_ref is None
+    assert reopened.scored_at is None
+    assert open_item.scored_at is not None
     assert store.matched_action_log_ids("brian") == set()
     assert [item.id for item in store.unresolved_reconciliation_items("brian")] == [open_item.id]
 
@@ -1295,3 +1455,40 @@ def test_matched_action_log_ids_splits_group_matches(tmp_path):
     )
 
     assert store.matched_action_log_ids("brian") == {"minted123", "zazzle123"}
+    assert store.matched_action_log_ids("brian", {"zazzle123", "other"}) == {"zazzle123"}
+    assert store.matched_sheet_refs("brian") == {"expense!row 12", "expense!row 13"}
+    with store.connect() as conn:
+        rows = conn.execute(
+            "SELECT action_log_id, sheet_ref FROM bank_reconciliation_matches WHERE reconciliation_id = ? ORDER BY action_log_id",
+            (open_item.id,),
+        ).fetchall()
+    assert [(row["action_log_id"], row["sheet_ref"]) for row in rows] == [
+        ("minted123", "expense!row 12"),
+        ("zazzle123", "expense!row 13"),
+    ]
+
+
+def test_initialize_backfills_reconciliation_matches_from_joined_columns(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_transactions(
+        [{"transaction_id": "txn-legacy", "date": "2026-05-17", "name": "Legacy", "amount": 12.5}],
+        owner_key="brian",
+    )
+    transaction = store.recent_transactions("brian", limit=1)[0]
+    item = store.upsert_reconciliation_item(
+        owner_key="brian",
+        transaction=transaction,
+        classification="expense",
+        status="matched",
+        confidence=0.9,
+        matched_action_log_id="abc123+def456",
+        matched_sheet_ref="expense!row 5 + expense!row 6",
+    )
+    with store.connect() as conn:
+        conn.execute("DROP TABLE bank_reconciliation_matches")
+
+    store.initialize()
+
+    assert store.matched_action_log_ids("brian") == {"abc123", "def456"}
+    assert store.matched_sheet_refs("brian", {"expense!row 6"}) == {"expense!row 6"}
+    assert [reopened.id for reopened in store.reopen_reconciliation_items_for_action_ids("brian", {"abc123"})] == [item.id]
@@ -1,6 +1,7 @@
 import asyncio
 from dataclasses import replace
 from datetime import date, datetime
+import threading
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 import pytest
@@ -876,6 +877,41 @@ async def test_bank_digest_records_sent_event_only_after_discord_send(monkeypatc
     ]
 
 
+@pytest.mark.asyncio
+async def test_bank_digest_sends_each_user_as_soon_as_their_digest_is_ready(monkeypatch):
+    fast_sent = threading.Event()
+
+    class SignallingUser(FakeUser):
+        async def send(self, content, **kwargs):
+            await super().send(content, **kwargs)
+            if content.startswith("fast"):
+                fast_sent.set()
+
+    def prepare(actor_key, _mention, _current, **_kwargs):
+        if actor_key == "111":
+            assert fast_sent.wait(timeout=5)
+            return bank_reconciliation.PreparedBankReconciliationDigest(public_message="slow", detail_message="")
+        if actor_key == "333":
+            raise RuntimeError("sheet unavailable")
+        return bank_reconciliation.PreparedBankReconciliationDigest(public_message="fast", detail_message="")
+
+    user = SignallingUser()
+    client = FakeClient(FakeChannel(), user=user)
+    monkeypatch.setenv("CHANNEL_ID", "123")
+    monkeypatch.setattr(
+        bank_reconciliation,
+        "_notification_users",
+        lambda: [("111", "<@111>"), ("222", "<@222>"), ("333", "<@333>")],
+    )
+    monkeypatch.setattr(bank_reconciliation, "prepare_bank_reconciliation_digest_messages", prepare)
+    monkeypatch.setattr(bank_reconciliation, "record_system_event", lambda *_args: True)
+
+    sent = await bank_reconciliation.send_due_bank_reconciliation_digest(client, today=datetime(2026, 5, 20).date())
+
+    assert sent == 2
+    assert [content for content, _kwargs in user.messages] == ["fast\n\u200b", "slow\n\u200b"]
+
+
 @pytest.mark.asyncio
 async def test_bank_digest_does_not_send_after_morning_window_when_new_items_exist(monkeypatch):
     channel = FakeChannel()
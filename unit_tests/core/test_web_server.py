@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+import bookiebot.core.bank_link as bank_link
+from bookiebot.core import web_server
+
+
+@pytest.mark.asyncio
+async def test_webhook_signals_are_debounced_into_one_wake(monkeypatch):
+    monkeypatch.setattr(bank_link, "_PLAID_WEBHOOK_SIGNALS", None)
+    monkeypatch.setenv("BOOKIEBOT_PLAID_WEBHOOK_DEBOUNCE_SECONDS", "0.05")
+    signals = bank_link.plaid_webhook_signals()
+
+    bank_link.signal_plaid_webhook("item-1")
+    bank_link.signal_plaid_webhook("item-1")
+    bank_link.signal_plaid_webhook("item-2")
+
+    item_ids = await web_server._wait_for_plaid_webhook_signals(signals)
+
+    assert item_ids == {"item-1", "item-2"}
+    assert signals.empty()
+
+
+@pytest.mark.asyncio
+async def test_webhook_worker_drains_immediately_when_signalled(monkeypatch):
+    monkeypatch.setattr(bank_link, "_PLAID_WEBHOOK_SIGNALS", None)
+    monkeypatch.setenv("BOOKIEBOT_PLAID_WEBHOOK_POLL_SECONDS", "300")
+    monkeypatch.setenv("BOOKIEBOT_PLAID_WEBHOOK_DEBOUNCE_SECONDS", "0")
+    drains = []
+    drained = asyncio.Event()
+
+    class FakeService:
+        async def process_plaid_webhook_inbox(self, limit=25):
+            drains.append(limit)
+            if len(drains) == 2:
+                drained.set()
+            return {"processed": 0, "failed": 0, "skipped": 0}
+
+    builds = []
+
+    def fake_build():
+        builds.append(True)
+        return FakeService()
+
+    monkeypatch.setattr(web_server, "build_banking_service", fake_build)
+    worker = asyncio.create_task(web_server.run_plaid_webhook_worker())
+    try:
+        await asyncio.sleep(0)
+        bank_link.signal_plaid_webhook("item-1")
+        await asyncio.wait_for(drained.wait(), timeout=1)
+    finally:
+        worker.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await worker
+
+    assert len(drains) == 2
+    assert len(builds) == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_worker_keeps_draining_while_batches_come_back_full(monkeypatch):
+    monkeypatch.setattr(bank_link, "_PLAID_WEBHOOK_SIGNALS", None)
+    monkeypatch.setenv("BOOKIEBOT_PLAID_WEBHOOK_POLL_SECONDS", "300")
+    batches = [web_server._WEBHOOK_DRAIN_LIMIT, web_server._WEBHOOK_DRAIN_LIMIT, 3]
+    drains = []
+    drained = asyncio.Event()
+
+    class FakeService:
+        async def process_plaid_webhook_inbox(self, limit=25):
+            drains.append(limit)
+            if len(drains) == len(batches):
+                drained.set()
+            return {"processed": batches[min(len(drains), len(batches)) - 1], "failed": 0, "skipped": 0}
+
+    monkeypatch.setattr(web_server, "build_banking_service", FakeService)
+    worker = asyncio.create_task(web_server.run_plaid_webhook_worker())
+    try:
+        await asyncio.wait_for(drained.wait(), timeout=1)
+        await asyncio.sleep(0.05)
+    finally:
+        worker.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await worker
+
+    assert len(drains) == 3
@@ -2406,7 +2406,7 @@ async def test_query_expense_breakdown(monkeypatch, message):
         breakdown={},
         grand_total=0.0,
     )
-    monkeypatch.setattr(ih, "build_expense_breakdown_report", MagicMock(return_value=report))
+    monkeypatch.setattr(ih, "cached_expense_report", MagicMock(return_value=SimpleNamespace(report=report, payload={})))
     monkeypatch.setattr(ih, "write_expense_breakdown_report", MagicMock(return_value=SimpleNamespace(url="https://example.test/report.html")))
 
     await ih.handle_intent("query_expense_breakdown_percentages", {}, message)
@@ -2418,7 +2418,7 @@ async def test_query_expense_breakdown(monkeypatch, message):
 async def test_query_expense_breakdown_reports_sheet_access_errors(monkeypatch, message):
     monkeypatch.setattr(
         ih,
-        "build_expense_breakdown_report",
+        "cached_expense_report",
         MagicMock(side_effect=SpreadsheetAccessError("Could not open spreadsheet 'abc'.")),
     )
 
@@ -2440,8 +2440,8 @@ async def test_query_expense_breakdown_sends_chart(monkeypatch, message):
             "shopping": {"amount": 0.0, "percentage": 0.0, "label": "Shopping"},
         },
     )
-    build_report = MagicMock(return_value=report)
-    monkeypatch.setattr(ih, "build_expense_breakdown_report", build_report)
+    build_report = MagicMock(return_value=SimpleNamespace(report=report, payload={}))
+    monkeypatch.setattr(ih, "cached_expense_report", build_report)
     monkeypatch.setattr(ih, "write_expense_breakdown_report", MagicMock(return_value=SimpleNamespace(url="https://example.test/report.html")))
     chart_file = MagicMock(filename="expense_breakdown.png")
     build_fig = MagicMock(return_value=object())
@@ -2477,7 +2477,7 @@ async def test_query_expense_breakdown_handles_zero_categories(monkeypatch, mess
             "gas": {"amount": 0.0, "percentage": 0.0, "label": "Gas"},
         },
     )
-    monkeypatch.setattr(ih, "build_expense_breakdown_report", MagicMock(return_value=report))
+    monkeypatch.setattr(ih, "cached_expense_report", MagicMock(return_value=SimpleNamespace(report=report, payload={})))
     monkeypatch.setattr(ih, "write_expense_breakdown_report", MagicMock(return_value=SimpleNamespace(url="https://example.test/report.html")))
 
     await ih.handle_intent("query_expense_breakdown_percentages", {"persons": ["Hannah"]}, message)
@@ -1,22 +1,29 @@
+import asyncio
 from datetime import datetime
 import json
 import os
 from pathlib import Path
 import re
+import threading
 
 import pytest
 
 import bookiebot.reports.expense_breakdown as expense_breakdown
 from bookiebot.reports.expense_breakdown import (
+    EXPENSE_REPORT_DETAIL_FIELDS,
+    EXPENSE_REPORT_DETAILS_PATH,
     BudgetHistoryRows,
     BudgetMonth,
     ReportWorksheets,
     build_expense_breakdown_report,
     expense_breakdown_client_payload,
+    expense_breakdown_details_json,
+    expense_breakdown_mode_view,
     parse_budget_month,
     render_expense_breakdown_html,
     write_expense_breakdown_report,
 )
+from bookiebot.reports.static_assets import report_asset, report_asset_for_hashed_name
 from bookiebot.reports.web import _static_report_path_for_payload, _static_report_path_for_request, _verify_expense_report_token
 from bookiebot.sheets import routing
 from bookiebot.sheets.bills import BILL_SCHEDULE_HEADERS
@@ -24,6 +31,29 @@ from bookiebot.sheets.collaboration import SHARED_REIMBURSEMENT_HEADERS
 from unit_tests.support.sheets_repo_stub import InMemoryWorksheet
 
 
+def _delivered_report_html(report) -> str:
+    """Report HTML followed by the static bundle files it links to, as a browser receives them."""
+    html = render_expense_breakdown_html(report)
+    linked = re.findall(r'(?:src|href)="/reports/assets/([^"]+)"', html)
+    return "\n".join([html, *(report_asset_for_hashed_name(name).body.decode("utf-8") for name in linked)])
+
+
+def _delivered_report_payload(html: str, report) -> dict:
+    """The page's inline payload, with the detail tables it fetches after rendering decoded back in."""
+    payload_match = re.search(
+        r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
+        html,
+    )
+    assert payload_match is not None
+    payload = json.loads(payload_match.group(1))
+    assert payload.pop("details")["path"] == EXPENSE_REPORT_DETAILS_PATH
+    details = json.loads(expense_breakdown_details_json(report))
+    for name in EXPENSE_REPORT_DETAIL_FIELDS:
+        assert payload[name] == []
+        payload[name] = [dict(zip(details[name], values)) for values in zip(*details[name].values())]
+    return payload
+
+
 def _row(values: dict[str, str], width: int = 28) -> list[str]:
     row = [""] * width
     for column, value in values.items():
@@ -261,7 +291,8 @@ def test_load_report_worksheets_uses_resolved_month_tabs_when_optional_workbook_
     assert worksheets.budget_history == ()
 
 
-def test_previous_year_budget_history_loads_prior_december_for_january(monkeypatch):
+def test_previous_year_budget_history_loads_prior_december_for_january(monkeypatch, tmp_path):
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
     december = InMemoryWorksheet([["12/31/2026", "xAI", "$3,774.11"]], title="December")
     spreadsheet = FakeSpreadsheet({"December": december})
 
@@ -282,7 +313,9 @@ def test_previous_year_budget_history_loads_prior_december_for_january(monkeypat
     )
 
     assert history == (
-        BudgetHistoryRows(BudgetMonth(2026, 12), [["12/31/2026", "xAI", "$3,774.11"]]),
+        expense_breakdown.budget_history_digest(
+            BudgetHistoryRows(BudgetMonth(2026, 12), [["12/31/2026", "xAI", "$3,774.11"]])
+        ),
     )
 
 
@@ -387,7 +420,7 @@ def test_build_expense_breakdown_report_aggregates_shared_and_personal_data():
         ("Paycheck", 3000.0),
         ("Side Gig", 500.0),
     ]
-    html = render_expense_breakdown_html(report)
+    html = _delivered_report_html(report)
     assert "Expense Breakdown" in html
     assert "Budget Charts" not in html
     assert "Burn Rate" in html
@@ -411,12 +444,7 @@ def test_build_expense_breakdown_report_aggregates_shared_and_personal_data():
     assert "bb-burn-rate-summary" in html
     assert "bb-signal-strip" not in html
     assert "bb-details-panel" in html
-    payload_match = re.search(
-        r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
-        html,
-    )
-    assert payload_match is not None
-    payload = json.loads(payload_match.group(1))
+    payload = _delivered_report_payload(html, report)
     assert expense_breakdown_client_payload(report) == payload
     assert [item["label"] for item in payload["breakdown"]][:3] == [
         "Rent",
@@ -749,8 +777,8 @@ def test_income_entries_parse_shifted_dated_header_layout():
         ["", "", "Monthly Income:", "$3,924.59"],
     ]
 
-    entries, total = expense_breakdown._income_entries(rows)
-    config = expense_breakdown._income_projection_config(rows)
+    entries, total = expense_breakdown._income_entries(expense_breakdown._sheet_index(rows))
+    config = expense_breakdown._income_projection_config(expense_breakdown._sheet_index(rows))
 
     assert total == 3924.59
     assert [(entry.label, entry.amount, entry.date) for entry in entries] == [
@@ -830,12 +858,7 @@ def test_shared_need_expense_section_feeds_need_category_and_daily_activity():
     )
 
     html = render_expense_breakdown_html(report)
-    payload_match = re.search(
-        r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
-        html,
-    )
-    assert payload_match is not None
-    payload = json.loads(payload_match.group(1))
+    payload = _delivered_report_payload(html, report)
 
     assert payload["dailyTotals"] == [{"label": "6", "amount": 184.0}]
     assert payload["needExpenses"] == [
@@ -1038,13 +1061,8 @@ def test_report_payload_tracks_merchant_occurrences_by_location_count():
         ),
     )
 
-    html = render_expense_breakdown_html(report)
-    payload_match = re.search(
-        r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
-        html,
-    )
-    assert payload_match is not None
-    payload = json.loads(payload_match.group(1))
+    html = _delivered_report_html(report)
+    payload = _delivered_report_payload(html, report)
 
     assert payload["merchantTotals"][0] == {"label": "Costco", "amount": 100.0}
     assert payload["merchantOccurrences"][0] == {"label": "Starbucks", "count": 2, "amount": 11.0}
@@ -1099,7 +1117,7 @@ def test_current_month_calendar_events_include_projected_income_subscriptions_an
         ),
     )
 
-    html = render_expense_breakdown_html(report)
+    html = _delivered_report_html(report)
     payload_match = re.search(
         r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
         html,
@@ -1774,13 +1792,15 @@ def test_current_month_paycheck_supersedes_prior_month_projection_reference():
 )
 def test_prior_month_projection_reference_requires_dated_configured_paycheck(prior_row):
     history = (
-        BudgetHistoryRows(
-            BudgetMonth(2026, 7),
-            [
-                ["", "Date:", "Source:", "Amount:"],
-                prior_row,
-                ["", "Monthly Income:", "", "$3,774.11"],
-            ],
+        expense_breakdown.budget_history_digest(
+            BudgetHistoryRows(
+                BudgetMonth(2026, 7),
+                [
+                    ["", "Date:", "Source:", "Amount:"],
+                    prior_row,
+                    ["", "Monthly Income:", "", "$3,774.11"],
+                ],
+            )
         ),
     )
 
@@ -1963,12 +1983,7 @@ def test_largest_expenses_payload_keeps_all_transactions_in_descending_order():
         ),
     )
 
-    payload_match = re.search(
-        r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
-        render_expense_breakdown_html(report),
-    )
-    assert payload_match is not None
-    top_entries = json.loads(payload_match.group(1))["topEntries"]
+    top_entries = _delivered_report_payload(render_expense_breakdown_html(report), report)["topEntries"]
 
     assert len(top_entries) == 12
     assert [entry["amount"] for entry in top_entries] == list(range(120, 0, -10))
@@ -2100,6 +2115,10 @@ def test_write_expense_breakdown_report_returns_public_url(tmp_path, monkeypatch
 
     assert page.path.exists()
     assert page.path.parent == tmp_path
+    snapshot = page.path.read_text(encoding="utf-8")
+    assert report_asset("expense-report-app.js").url in snapshot
+    assert report_asset("expense-report-app.css").url in snapshot
+    assert len(snapshot) < len(report_asset("expense-report-app.js").body) // 10
     assert page.url.startswith("https://bookiebot.example/reports/expense-breakdown?token=")
 
     token = page.url.split("token=", 1)[1]
@@ -2196,3 +2215,579 @@ def test_expense_report_payload_falls_back_to_latest_matching_snapshot(tmp_path,
     }
 
     assert _static_report_path_for_payload(payload) == newer
+
+
+def test_snapshot_index_serves_latest_without_globbing_and_prunes_old_snapshots(tmp_path, monkeypatch):
+    from bookiebot.reports import snapshot_index
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    paths = []
+    for index, name in enumerate(("first", "second", "third")):
+        path = tmp_path / f"expense-breakdown-brian-2026-06-{name}.html"
+        path.write_text(f"<html>{name}</html>", encoding="utf-8")
+        (tmp_path / f"{path.name}.gz").write_bytes(b"gz")
+        os.utime(path, (100 + index, 100 + index))
+        snapshot_index.record_report_snapshot(tmp_path, path, owner_name="Brian", year=2026, month=6)
+        paths.append(path)
+    payload = {"actor_key": "brian", "owner_name": "Brian", "persons": ["Brian"], "year": 2026, "month": 6}
+
+    snapshot_index.clear_report_snapshot_index()
+    monkeypatch.setattr(Path, "glob", lambda *_args, **_kwargs: pytest.fail("snapshot lookup globbed reports_dir"))
+    assert _static_report_path_for_payload(payload) == paths[2]
+
+    assert snapshot_index.prune_report_snapshots(tmp_path, keep=2) == [paths[0].name]
+    assert not paths[0].exists() and not (tmp_path / f"{paths[0].name}.gz").exists()
+    assert paths[1].exists() and paths[2].exists()
+
+    paths[2].unlink()
+    assert _static_report_path_for_payload(payload) == paths[1]
+    snapshot_index.clear_report_snapshot_index()
+    manifest = json.loads((tmp_path / "snapshots.json").read_text(encoding="utf-8"))
+    assert [item["filename"] for item in manifest["snapshots"]] == [paths[1].name]
+
+
+@pytest.mark.asyncio
+async def test_report_assets_are_served_hashed_compressed_and_revalidated():
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from bookiebot.reports.web import register_report_routes
+
+    asset = report_asset("expense-report-app.js")
+    app = web.Application()
+    register_report_routes(app)
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get(asset.url, headers={"Accept-Encoding": "gzip"}, auto_decompress=False)
+        body = await response.read()
+        revalidated = await client.get(asset.url, headers={"If-None-Match": asset.etag})
+        identity = await client.get(asset.url, headers={"Accept-Encoding": "gzip;q=0"}, auto_decompress=False)
+        identity_body = await identity.read()
+        stale = await client.get("/reports/assets/expense-report-app.0000000000000000.js")
+        stale_body = await stale.read()
+        unknown = await client.get("/reports/assets/missing-app.0000000000000000.js")
+
+    assert response.status == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == asset.etag
+    assert "immutable" in response.headers["Cache-Control"]
+    assert body == asset.gzip_body
+    assert revalidated.status == 304
+    assert "Content-Encoding" not in identity.headers
+    assert identity_body == asset.body
+    assert stale.status == 200
+    assert stale.headers["Cache-Control"] == "public, no-cache"
+    assert stale_body == asset.body
+    assert unknown.status == 404
+
+
+@pytest.mark.asyncio
+async def test_live_report_requests_share_one_build_and_reuse_it_briefly(tmp_path, monkeypatch):
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    import bookiebot.reports.web as report_web
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("BOOKIEBOT_REPORT_SIGNING_SECRET", "test-secret")
+    monkeypatch.setenv("BOOKIEBOT_REPORT_LIVE_CACHE_SECONDS", "60")
+    report_web.clear_live_report_cache()
+    release = threading.Event()
+    builds = []
+
+    def slow_build(payload, refresh=False):
+        builds.append((payload["month"], refresh))
+        assert release.wait(timeout=5)
+        return f"<html>report {len(builds)}</html>"
+
+    monkeypatch.setattr(report_web, "_build_live_report_html", slow_build)
+    token = report_web.create_expense_report_token(
+        actor_key="brian",
+        owner_name="Brian",
+        persons=["Brian (BofA)"],
+        year=2026,
+        month=6,
+    )
+    url = f"/reports/expense-breakdown?token={token}"
+    app = web.Application()
+    report_web.register_report_routes(app)
+    async with TestClient(TestServer(app)) as client:
+        first = asyncio.ensure_future(client.get(url))
+        second = asyncio.ensure_future(client.get(url))
+        while not builds:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        release.set()
+        bodies = [await (await request).text() for request in (first, second)]
+        cached = await (await client.get(url)).text()
+        refreshed = await (await client.get(f"{url}&live=1")).text()
+        after_refresh = await (await client.get(url)).text()
+        monkeypatch.setenv("BOOKIEBOT_REPORT_LIVE_CACHE_SECONDS", "0")
+        rebuilt = await (await client.get(url)).text()
+
+    report_web.clear_live_report_cache()
+    assert bodies == ["<html>report 1</html>", "<html>report 1</html>"]
+    assert cached == "<html>report 1</html>"
+    assert refreshed == after_refresh == "<html>report 2</html>"
+    assert rebuilt == "<html>report 3</html>"
+    assert builds == [(6, False), (6, True), (6, False)]
+    assert not report_web._LIVE_REPORT_BUILDS
+
+
+def test_mode_views_compute_only_the_payload_fields_they_read(monkeypatch):
+    activity_builds = []
+    original_activity_entries = expense_breakdown._report_activity_entries
+
+    def counting_activity_entries(report):
+        activity_builds.append(report)
+        return original_activity_entries(report)
+
+    monkeypatch.setattr(expense_breakdown, "_report_activity_entries", counting_activity_entries)
+    report = build_expense_breakdown_report(
+        actor_key="hannah",
+        owner_name="Hannah",
+        persons=["Hannah"],
+        month=BudgetMonth(2026, 5),
+        worksheets=ReportWorksheets(
+            shared_expenses=InMemoryWorksheet([["hdr"] * 28, ["hdr"] * 28]),
+            personal_budget=InMemoryWorksheet([["", "Monthly Income:", "", "$3,000.00"], ["Rent", "$1,200.00"]]),
+        ),
+    )
+
+    current = expense_breakdown_mode_view(report, "current")
+    projected = expense_breakdown_mode_view(report, "projected")
+    assert activity_builds == []
+
+    fields = expense_breakdown.expense_breakdown_payload_fields(report)
+    assert fields["merchantTotals"] is fields["merchantTotals"]
+    payload = expense_breakdown_client_payload(report)
+    assert len(activity_builds) == 1
+    assert payload is expense_breakdown_client_payload(report)
+    assert list(payload) == list(fields)
+    assert payload["modeViews"] == {"current": current, "projected": projected}
+
+
+def test_cached_expense_report_reuses_payload_until_source_rows_change(monkeypatch):
+    import bookiebot.reports.report_cache as report_cache
+    from bookiebot.sheets import undo
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_CACHE_SECONDS", "60")
+    monkeypatch.setattr(report_cache, "_is_settled_month", lambda month: False)
+    report_cache.clear_report_cache()
+    shared_sheet = InMemoryWorksheet(
+        [
+            ["hdr"] * 28,
+            ["hdr"] * 28,
+            _row({"A": "05/01/2026", "B": "50", "C": "Trader Joe's", "D": "Hannah"}),
+        ]
+    )
+    loads = []
+    builds = []
+    real_build = report_cache.build_expense_breakdown_report
+
+    def load_worksheets(actor_key, month):
+        loads.append(month)
+        return ReportWorksheets(shared_expenses=shared_sheet, personal_budget=InMemoryWorksheet([]))
+
+    def counting_build(**kwargs):
+        builds.append(kwargs["month"])
+        return real_build(**kwargs)
+
+    monkeypatch.setattr(report_cache, "load_report_worksheets", load_worksheets)
+    monkeypatch.setattr(report_cache, "build_expense_breakdown_report", counting_build)
+
+    def load():
+        return report_cache.cached_expense_report(
+            actor_key="hannah",
+            owner_name="Hannah",
+            persons=["Hannah"],
+            month=BudgetMonth(2026, 5),
+        )
+
+    first = load()
+    within_ttl = load()
+    undo._note_sheet_write()
+    unchanged_rows = load()
+    shared_sheet.update_cell(3, 2, "75")
+    undo._note_sheet_write()
+    changed_rows = load()
+    report_cache.clear_report_cache()
+
+    assert within_ttl is first
+    assert unchanged_rows.payload is first.payload
+    assert changed_rows.fingerprint != first.fingerprint
+    assert first.report.breakdown["grocery"]["amount"] == 50.0
+    assert changed_rows.report.breakdown["grocery"]["amount"] == 75.0
+    assert len(loads) == 3
+    assert len(builds) == 2
+
+
+def test_cached_expense_reports_are_rebuilt_daily_and_earlier_days_evicted(monkeypatch):
+    import bookiebot.reports.report_cache as report_cache
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_CACHE_SECONDS", "60")
+    monkeypatch.setattr(report_cache, "_is_settled_month", lambda month: False)
+    monkeypatch.setattr(
+        report_cache,
+        "load_report_worksheets",
+        lambda actor_key, month: ReportWorksheets(
+            shared_expenses=InMemoryWorksheet([["hdr"] * 28, ["hdr"] * 28]),
+            personal_budget=InMemoryWorksheet([]),
+        ),
+    )
+    report_cache.clear_report_cache()
+    today = datetime(2026, 5, 10, 9, 0)
+    monkeypatch.setattr(report_cache, "now_pacific", lambda: today)
+
+    def load(actor_key):
+        return report_cache.cached_expense_report(
+            actor_key=actor_key,
+            owner_name=actor_key.title(),
+            persons=[actor_key.title()],
+            month=BudgetMonth(2026, 5),
+        )
+
+    first = load("hannah")
+    load("brian")
+    assert load("hannah") is first
+    today = datetime(2026, 5, 11, 9, 0)
+    next_day = load("hannah")
+    cached_keys = set(report_cache._REPORT_CACHE)
+    lock_keys = set(report_cache._REPORT_BUILD_LOCKS)
+    report_cache.clear_report_cache()
+
+    assert next_day is not first
+    assert next_day.fingerprint == first.fingerprint
+    assert [key[0] for key in cached_keys] == ["hannah"]
+    assert lock_keys == cached_keys
+
+
+def test_closed_month_reports_are_served_from_persisted_rows(monkeypatch, tmp_path):
+    import bookiebot.reports.report_cache as report_cache
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(report_cache, "_is_settled_month", lambda month: True)
+    report_cache.clear_report_cache()
+    shared_sheet = InMemoryWorksheet(
+        [
+            ["hdr"] * 28,
+            ["hdr"] * 28,
+            _row({"A": "04/01/2026", "B": "40", "C": "Trader Joe's", "D": "Hannah"}),
+        ]
+    )
+    loads = []
+
+    def load_worksheets(actor_key, month):
+        loads.append(month)
+        return ReportWorksheets(
+            shared_expenses=shared_sheet,
+            personal_budget=InMemoryWorksheet([]),
+            budget_history=(BudgetHistoryRows(BudgetMonth(2026, 3), [["Rent", "$1,750.00"]]),),
+        )
+
+    monkeypatch.setattr(report_cache, "load_report_worksheets", load_worksheets)
+
+    def load(persons, refresh=False):
+        return report_cache.cached_expense_report(
+            actor_key="hannah",
+            owner_name="Hannah",
+            persons=persons,
+            month=BudgetMonth(2026, 4),
+            refresh=refresh,
+        )
+
+    first = load(["Hannah"])
+    report_cache.clear_report_cache()
+    shared_sheet.update_cell(3, 2, "90")
+    restarted = load(["Hannah"])
+    other_persons = load(["Hannah", "Brian (BofA)"])
+    report_cache.save_budget_history_digest(
+        "hannah", expense_breakdown.budget_history_digest(BudgetHistoryRows(BudgetMonth(2026, 4), [["Rent", "$1.00"]]))
+    )
+    refreshed = load(["Hannah"], refresh=True)
+    stale_digest = report_cache.load_budget_history_digest("hannah", BudgetMonth(2026, 4))
+    stored = report_cache.load_closed_month_worksheets("hannah", BudgetMonth(2026, 4))
+    report_cache.invalidate_closed_month_report("hannah", BudgetMonth(2026, 4))
+    report_cache.clear_report_cache()
+
+    assert len(loads) == 2
+    assert restarted.fingerprint == first.fingerprint
+    assert restarted.report.breakdown["grocery"]["amount"] == 40.0
+    assert other_persons.fingerprint == first.fingerprint
+    assert refreshed.report.breakdown["grocery"]["amount"] == 90.0
+    assert stale_digest is None
+    assert stored.budget_history == (
+        expense_breakdown.budget_history_digest(BudgetHistoryRows(BudgetMonth(2026, 3), [["Rent", "$1,750.00"]])),
+    )
+    assert not list((tmp_path / "closed-months").iterdir())
+
+
+def test_closed_month_rows_are_frozen_only_after_the_grace_period(monkeypatch):
+    monkeypatch.setenv("BOOKIEBOT_CLOSED_MONTH_GRACE_DAYS", "7")
+    monkeypatch.setattr(expense_breakdown, "now_pacific", lambda: datetime(2026, 5, 7, 9, 0, tzinfo=routing.PACIFIC_TZ))
+    assert expense_breakdown._is_completed_month(BudgetMonth(2026, 4))
+    assert not expense_breakdown._is_settled_month(BudgetMonth(2026, 4))
+
+    monkeypatch.setattr(expense_breakdown, "now_pacific", lambda: datetime(2026, 5, 8, 9, 0, tzinfo=routing.PACIFIC_TZ))
+    assert expense_breakdown._is_settled_month(BudgetMonth(2026, 4))
+    assert not expense_breakdown._is_settled_month(BudgetMonth(2026, 5))
+
+
+def test_sheet_writes_and_refresh_drop_frozen_months(monkeypatch, tmp_path):
+    import bookiebot.reports.report_cache as report_cache
+    from bookiebot.sheets import undo
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(report_cache, "_is_settled_month", lambda month: month.month < 5)
+    report_cache.clear_report_cache()
+    loads = []
+
+    def load_worksheets(actor_key, month):
+        loads.append(month)
+        return ReportWorksheets(
+            shared_expenses=InMemoryWorksheet([["hdr"] * 28, ["hdr"] * 28]),
+            personal_budget=InMemoryWorksheet([]),
+        )
+
+    monkeypatch.setattr(report_cache, "load_report_worksheets", load_worksheets)
+
+    def load(month, refresh=False):
+        return report_cache.cached_expense_report(
+            actor_key="hannah",
+            owner_name="Hannah",
+            persons=["Hannah"],
+            month=month,
+            refresh=refresh,
+        )
+
+    load(BudgetMonth(2026, 4))
+    load(BudgetMonth(2026, 4))
+    monkeypatch.setattr(undo, "now_pacific", lambda: datetime(2026, 4, 20, 9, 0, tzinfo=routing.PACIFIC_TZ))
+    undo._note_sheet_write()
+    load(BudgetMonth(2026, 4))
+    for number in (3, 5):
+        report_cache.save_budget_history_digest(
+            "hannah",
+            expense_breakdown.budget_history_digest(BudgetHistoryRows(BudgetMonth(2026, number), [["Rent", "$1.00"]])),
+        )
+    load(BudgetMonth(2026, 5), refresh=True)
+    march_digest = report_cache.load_budget_history_digest("hannah", BudgetMonth(2026, 3))
+    may_digest = report_cache.load_budget_history_digest("hannah", BudgetMonth(2026, 5))
+    report_cache.invalidate_closed_month_report("hannah", BudgetMonth(2026, 4))
+    report_cache.invalidate_closed_month_report("hannah", BudgetMonth(2026, 5))
+    report_cache.clear_report_cache()
+
+    assert loads == [BudgetMonth(2026, 4), BudgetMonth(2026, 4), BudgetMonth(2026, 5)]
+    assert march_digest is None
+    assert may_digest is not None
+
+
+def test_budget_history_reads_each_closed_month_tab_once(monkeypatch, tmp_path):
+    import bookiebot.reports.report_cache as report_cache
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(expense_breakdown, "_is_settled_month", lambda month: month.month < 4)
+    report_cache.clear_report_cache()
+    tabs = {
+        name: InMemoryWorksheet(
+            [
+                ["", "Date:", "Source:", "Amount:"],
+                ["", f"{number}/2/2026", "xAI", "$3,774.11"],
+                ["", "Monthly Income:", "", "$3,774.11"],
+                ["PG&E", f"${100 + number}.00"],
+            ],
+            title=name,
+        )
+        for number, name in enumerate(["January", "February", "March", "April"], start=1)
+    }
+    reads = []
+
+    class CountingSpreadsheet(FakeSpreadsheet):
+        def worksheet(self, title: str):
+            reads.append(title)
+            return super().worksheet(title)
+
+    opens = []
+
+    class CountingGC:
+        def open_by_key(self, key: str):
+            opens.append(key)
+            return CountingSpreadsheet(tabs)
+
+    monkeypatch.setattr("bookiebot.sheets.auth.get_gspread_client", lambda: CountingGC())
+    monkeypatch.setattr(
+        "bookiebot.sheets.routing.get_budget_spreadsheet_id_for_user",
+        lambda actor_key, year: f"budget-{year}",
+    )
+
+    first = expense_breakdown._optional_budget_history("brian", BudgetMonth(2026, 4))
+    first_reads = list(reads)
+    second = expense_breakdown._optional_budget_history("brian", BudgetMonth(2026, 4))
+    report_cache.clear_report_cache()
+    after_restart = expense_breakdown._optional_budget_history("brian", BudgetMonth(2026, 4))
+    report_cache.clear_report_cache()
+
+    assert first_reads == ["January", "February", "March"]
+    assert reads == first_reads
+    assert opens == ["budget-2026"]
+    assert second == first
+    assert after_restart == first
+    assert [digest.labeled_amounts[-1] for digest in first] == [("pg&e", 101.0), ("pg&e", 102.0), ("pg&e", 103.0)]
+    assert first[-1].income_entries[0].date == "3/2/2026"
+
+
+@pytest.mark.asyncio
+async def test_report_snapshots_and_live_pages_are_compressed_and_revalidated(tmp_path, monkeypatch):
+    import gzip
+
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    import bookiebot.reports.web as report_web
+
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("BOOKIEBOT_REPORT_SIGNING_SECRET", "test-secret")
+    report_web.clear_live_report_cache()
+    report = build_expense_breakdown_report(
+        actor_key="hannah",
+        owner_name="Hannah",
+        persons=["Hannah"],
+        month=BudgetMonth(2026, 5),
+        worksheets=ReportWorksheets(
+            shared_expenses=InMemoryWorksheet([["hdr"] * 28, ["hdr"] * 28]),
+            personal_budget=InMemoryWorksheet([["Monthly Income", "$5,000.00"]]),
+            subscriptions=InMemoryWorksheet([]),
+        ),
+    )
+    page = write_expense_breakdown_report(report, report_dir=tmp_path)
+    live_html = "<html>" + "live report " * 500 + "</html>"
+    monkeypatch.setattr(report_web, "_build_live_report_html", lambda payload, refresh=False: live_html)
+    token = report_web.create_expense_report_token(
+        actor_key="hannah",
+        owner_name="Hannah",
+        persons=["Hannah"],
+        year=2026,
+        month=5,
+    )
+    app = web.Application(middlewares=[report_web.compression_middleware])
+    report_web.register_report_routes(app)
+    gzip_headers = {"Accept-Encoding": "gzip"}
+
+    async with TestClient(TestServer(app), auto_decompress=False) as client:
+        snapshot = await client.get(f"/reports/{page.path.name}", headers=gzip_headers)
+        snapshot_body = await snapshot.read()
+        snapshot_repeat = await client.get(
+            f"/reports/{page.path.name}",
+            headers={**gzip_headers, "If-None-Match": snapshot.headers["ETag"]},
+        )
+        live = await client.get(f"/reports/expense-breakdown?token={token}&live=1", headers=gzip_headers)
+        live_body = await live.read()
+        live_repeat = await client.get(
+            f"/reports/expense-breakdown?token={token}&live=1",
+            headers={**gzip_headers, "If-None-Match": live.headers["ETag"]},
+        )
+        live_identity = await client.get(
+            f"/reports/expense-breakdown?token={token}&live=1",
+            headers={"Accept-Encoding": "identity"},
+        )
+        live_identity_body = await live_identity.text()
+
+    report_web.clear_live_report_cache()
+    assert page.path.with_name(f"{page.path.name}.gz").is_file()
+    assert snapshot.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(snapshot_body) == page.path.read_bytes()
+    assert snapshot_repeat.status == 304
+    assert live.headers["Content-Encoding"] == "gzip"
+    assert live.headers["Cache-Control"] == "private, no-cache"
+    assert gzip.decompress(live_body).decode("utf-8") == live_html
+    assert len(live_body) < len(live_html) // 10
+    assert live_repeat.status == 304
+    assert await live_repeat.read() == b""
+    assert "Content-Encoding" not in live_identity.headers
+    assert live_identity_body == live_html
+    assert live_identity.headers["ETag"] == live.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_report_pages_fetch_detail_tables_separately_as_columns(tmp_path, monkeypatch):
+    import gzip
+    from types import SimpleNamespace
+
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from bookiebot.reports import snapshot_index
+    import bookiebot.reports.web as report_web
+
+    main_source = Path(__file__).resolve().parents[2] / "web" / "expense-report" / "src" / "main.tsx"
+    fetch_error = "Could not load expense report details"
+    assert fetch_error in main_source.read_text(encoding="utf-8")
+    assert fetch_error.encode("utf-8") in report_asset("expense-report-app.js").body
+    monkeypatch.setenv("BOOKIEBOT_REPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("BOOKIEBOT_REPORT_SIGNING_SECRET", "test-secret")
+    shared_rows = [
+        ["hdr"] * 28,
+        ["hdr"] * 28,
+        *[
+            _row({"A": f"05/{day:02d}/2026", "B": str(day * 10), "C": f"Merchant {day}", "D": "Hannah"})
+            for day in range(1, 41)
+        ],
+    ]
+    report = build_expense_breakdown_report(
+        actor_key="hannah",
+        owner_name="Hannah",
+        persons=["Hannah"],
+        month=BudgetMonth(2026, 5),
+        worksheets=ReportWorksheets(
+            shared_expenses=InMemoryWorksheet(shared_rows),
+            personal_budget=InMemoryWorksheet([]),
+            subscriptions=InMemoryWorksheet([]),
+        ),
+    )
+    older = write_expense_breakdown_report(report, report_dir=tmp_path)
+    page = write_expense_breakdown_report(report, report_dir=tmp_path)
+    details_path = page.path.with_name(f"{page.path.stem}.details.json")
+    monkeypatch.setattr(report_web, "_live_cached_report", lambda payload, refresh=False: SimpleNamespace(report=report))
+    token = report_web.create_expense_report_token(
+        actor_key="hannah", owner_name="Hannah", persons=["Hannah"], year=2026, month=5
+    )
+    other_token = report_web.create_expense_report_token(
+        actor_key="brian", owner_name="Brian", persons=["Brian"], year=2026, month=5
+    )
+    app = web.Application(middlewares=[report_web.compression_middleware])
+    report_web.register_report_routes(app)
+    details_url = "/reports/expense-breakdown/details"
+
+    async with TestClient(TestServer(app), auto_decompress=False) as client:
+        snapshot = await client.get(
+            f"{details_url}?token={token}&source={page.path.name}", headers={"Accept-Encoding": "gzip"}
+        )
+        snapshot_body = gzip.decompress(await snapshot.read())
+        live = await client.get(f"{details_url}?token={token}&source=live", headers={"Accept-Encoding": "identity"})
+        live_body = await live.read()
+        foreign = await client.get(f"{details_url}?token={other_token}&source={page.path.name}")
+        unsigned = await client.get(f"{details_url}?source=live")
+
+    full = expense_breakdown_client_payload(report)
+    inline = json.loads(
+        re.search(
+            r'<script id="bookiebot-expense-report-data" type="application/json">(.*?)</script>',
+            page.path.read_text(encoding="utf-8"),
+        ).group(1)
+    )
+    assert inline["details"] == {"path": details_url, "source": page.path.name}
+    assert all(inline[name] == [] for name in EXPENSE_REPORT_DETAIL_FIELDS)
+    assert _delivered_report_payload(page.path.read_text(encoding="utf-8"), report) == full
+    assert snapshot.status == 200
+    assert snapshot.headers["Content-Encoding"] == "gzip"
+    assert snapshot_body == details_path.read_bytes() == expense_breakdown_details_json(report)
+    assert live.status == 200
+    assert live.headers["Content-Type"].startswith("application/json")
+    assert live_body == snapshot_body
+    assert len(snapshot_body) < len(json.dumps([full[name] for name in EXPENSE_REPORT_DETAIL_FIELDS]))
+    assert foreign.status == 404
+    assert unsigned.status == 404
+
+    snapshot_index.prune_report_snapshots(tmp_path, keep=1)
+    assert not older.path.exists()
+    assert not older.path.with_name(f"{older.path.stem}.details.json").exists()
+    assert details_path.is_file()
@@ -0,0 +1,60 @@
+import pytest
+
+from bookiebot.reports import expense_breakdown
+from unit_tests.support.report_bench import (
+    benchmark_worksheets,
+    generate_personal_rows,
+    load_baseline,
+    regressions,
+    run_benchmark,
+)
+
+
+def test_synthetic_budget_sheet_is_deterministic_and_full_size():
+    first = generate_personal_rows(seed=11)
+    second = generate_personal_rows(seed=11)
+
+    assert first == second
+    assert len(first) == 300
+    assert {len(row) for row in first} == {40}
+
+
+def test_sheet_index_normalizes_each_cell_once_for_lookups():
+    sheet = expense_breakdown._sheet_index(
+        [
+            ["Monthly Income:", "", "$1,200.50"],
+            ["(Needs) Subtotal:", "note", "12/3/2026"],
+        ]
+    )
+
+    assert sheet.positions["monthly income"] == ((0, 0),)
+    assert sheet.row_texts[1] == "needs subtotal note 12 3 2026"
+    assert sheet.next_money(0, 1) == 1200.5
+    assert sheet.amounts_after(1, 0) == [12.0]
+    assert sheet.dates[1][2] is not None and sheet.dates[0][2] is None
+    assert [cell[:2] for cell in sheet.cells_containing("subtotal")] == [(1, 0)]
+
+
+def test_regressions_flag_slow_builds_and_changed_totals():
+    baseline = {"build_ms": 10.0, "income_total": 100.0}
+
+    assert regressions({"build_ms": 15.0, "income_total": 100.0}, baseline, tolerance=2) == []
+    assert regressions({"build_ms": 25.0, "income_total": 90.0}, baseline, tolerance=2) == [
+        "build_ms 25.0ms > 2x baseline 10.0ms",
+        "income_total 90.0 != baseline 100.0",
+    ]
+
+
+def test_report_build_benchmark_matches_baseline_totals():
+    baseline = {key: value for key, value in load_baseline().items() if not key.endswith("_ms")}
+    results = run_benchmark(benchmark_worksheets(), repeats=1)
+
+    assert results["income_total"] > 0
+    assert regressions(results, baseline) == []
+
+
+@pytest.mark.benchmark
+def test_report_build_benchmark_matches_baseline_latency():
+    baseline = {key: value for key, value in load_baseline().items() if key.endswith("_ms")}
+
+    assert regressions(run_benchmark(benchmark_worksheets()), baseline) == []
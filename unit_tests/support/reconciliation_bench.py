@@ -0,0 +1,433 @@
+"""Synthetic bank/action-log workloads and a latency + match-quality harness for reconciliation.
+
+Runs offline against a temporary SQLite bank store with the Sheets loaders patched out.
+
+    PYTHONPATH=src python -m unit_tests.support.reconciliation_bench
+    PYTHONPATH=src python -m unit_tests.support.reconciliation_bench --update-baseline
+
+``unit_tests/banking/test_reconciliation_bench.py`` runs the same harness under pytest and fails
+when match quality drops below the recorded baseline. Its latency check, which fails when a timing
+exceeds the baseline by the tolerance factor, is marked ``benchmark`` and only runs under
+``pytest -m benchmark``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import json
+import os
+from pathlib import Path
+import random
+import tempfile
+import time
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+from bookiebot.banking.config import BankingConfig
+from bookiebot.banking.crypto import TokenCipher
+from bookiebot.banking.models import BankTransaction
+from bookiebot.banking.plaid_client import PlaidClient
+import bookiebot.banking.service as banking_service
+from bookiebot.banking.reconciliation import (
+    CandidateIndex,
+    find_action_log_candidate_groups,
+    reconcile_transaction,
+    reconcile_transactions,
+)
+from bookiebot.banking.service import BankingService
+from bookiebot.banking.store import BankStore
+from bookiebot.sheets.subscriptions import Subscription
+from bookiebot.sheets.undo import LoggedAction, UndoAction
+
+
+BASELINE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "benchmarks" / "reconciliation_baseline.json"
+DEFAULT_LATENCY_TOLERANCE = 4.0
+QUALITY_SLACK = 0.02
+
+MERCHANTS = (
+    "Starbucks",
+    "Safeway",
+    "Target",
+    "Chevron",
+    "Trader Joes",
+    "Walgreens",
+    "Chipotle",
+    "Home Depot",
+    "Blue Bottle",
+    "Whole Foods",
+)
+SCENARIO_WEIGHTS = {
+    "expense": 45,
+    "split_receipt": 10,
+    "subscription": 10,
+    "refund": 8,
+    "pending_pair": 7,
+    "unlogged": 20,
+}
+
+
+@dataclass
+class ReconciliationScenario:
+    owner_key: str
+    actor_key: str
+    plaid_transactions: list[dict[str, Any]] = field(default_factory=list)
+    transactions: list[BankTransaction] = field(default_factory=list)
+    action_log: list[LoggedAction] = field(default_factory=list)
+    subscriptions: list[Subscription] = field(default_factory=list)
+    expected_actions: dict[str, str] = field(default_factory=dict)
+    expected_groups: dict[str, frozenset[str]] = field(default_factory=dict)
+    expected_schedules: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def posted_transactions(self) -> list[BankTransaction]:
+        """The stream the service reconciles; pending rows wait for their posted replacement."""
+        return [transaction for transaction in self.transactions if not transaction.pending]
+
+    @property
+    def expected_matches(self) -> int:
+        return len(self.expected_actions) + len(self.expected_schedules)
+
+
+def generate_scenario(
+    *,
+    seed: int = 7,
+    transactions: int = 300,
+    noise_actions: int = 600,
+    start: date = date(2026, 1, 1),
+    days: int = 90,
+    owner_key: str = "bench",
+    actor_key: str = "bench-actor",
+) -> ReconciliationScenario:
+    """Build a deterministic mix of logged expenses, split receipts, subscriptions, refunds,
+    pending-to-posted pairs, unlogged charges, and unrelated action-log rows."""
+    rng = random.Random(seed)
+    scenario = ReconciliationScenario(owner_key=owner_key, actor_key=actor_key)
+    kinds = list(SCENARIO_WEIGHTS)
+    weights = list(SCENARIO_WEIGHTS.values())
+    used_cents: set[int] = set()
+
+    def unique_amount(low: float, high: float) -> float:
+        while True:
+            cents = rng.randrange(int(low * 100), int(high * 100))
+            if cents not in used_cents:
+                used_cents.add(cents)
+                return cents / 100
+
+    def add_transaction(day: date, name: str, amount: float, *, pending: bool = False, pending_id: str | None = None) -> str:
+        index = len(scenario.plaid_transactions) + 1
+        provider_id = f"bench-txn-{index}"
+        raw = {
+            "transaction_id": provider_id,
+            "date": day.isoformat(),
+            "name": name,
+            "merchant_name": None,
+            "amount": amount,
+            "pending": pending,
+            "pending_transaction_id": pending_id,
+            "payment_channel": "in store",
+        }
+        scenario.plaid_transactions.append(raw)
+        scenario.transactions.append(_bank_transaction(index, owner_key, raw))
+        return provider_id
+
+    def add_action(day: date, merchant: str, amount: float, action_type: str = "expense") -> str:
+        action_id = f"bench-{len(scenario.action_log) + 1:05d}"
+        scenario.action_log.append(_logged_action(action_id, day, merchant, amount, action_type, actor_key))
+        return action_id
+
+    for index in range(transactions):
+        kind = rng.choices(kinds, weights)[0]
+        day = start + timedelta(days=rng.randrange(days))
+        merchant = rng.choice(MERCHANTS)
+        if kind == "expense":
+            amount = unique_amount(3, 250)
+            action_id = add_action(day - timedelta(days=rng.randrange(4)), merchant, amount)
+            provider_id = add_transaction(day, f"{merchant.upper()} #{rng.randrange(100, 999)}", amount)
+            scenario.expected_actions[provider_id] = action_id
+        elif kind == "split_receipt":
+            parts = [unique_amount(5, 90) for _ in range(rng.randrange(2, 5))]
+            action_ids = [add_action(day - timedelta(days=1), "Costco", part) for part in parts]
+            provider_id = add_transaction(day, "COSTCO WHSE #0144", round(sum(parts), 2))
+            scenario.expected_groups[provider_id] = frozenset(action_ids)
+        elif kind == "subscription":
+            amount = unique_amount(4, 80)
+            name = f"Streamco{index}"
+            row = len(scenario.subscriptions) + 8
+            source_ref = f"Subscriptions!J{row}:L{row}"
+            scenario.subscriptions.append(
+                Subscription(name=name, amount=amount, cadence="monthly", pull_day=day.day, source_range=source_ref)
+            )
+            provider_id = add_transaction(day + timedelta(days=rng.randrange(2)), f"{name.upper()}.COM", amount)
+            scenario.expected_schedules[provider_id] = source_ref
+        elif kind == "refund":
+            add_transaction(day, f"{merchant.upper()} REFUND", -unique_amount(3, 120))
+        elif kind == "pending_pair":
+            amount = unique_amount(3, 250)
+            action_id = add_action(day - timedelta(days=1), merchant, amount)
+            pending_id = add_transaction(day - timedelta(days=2), merchant.upper(), amount, pending=True)
+            provider_id = add_transaction(day, merchant.upper(), amount, pending_id=pending_id)
+            scenario.expected_actions[provider_id] = action_id
+        else:
+            add_transaction(day, f"{merchant.upper()} #{rng.randrange(100, 999)}", unique_amount(3, 250))
+
+    for _ in range(noise_actions):
+        day = start + timedelta(days=rng.randrange(days))
+        add_action(day, rng.choice(MERCHANTS), unique_amount(3, 400), rng.choice(("expense", "expense", "payment")))
+    rng.shuffle(scenario.action_log)
+    return scenario
+
+
+def _bank_transaction(index: int, owner_key: str, raw: dict[str, Any]) -> BankTransaction:
+    return BankTransaction(
+        id=index,
+        provider_transaction_id=raw["transaction_id"],
+        owner_key=owner_key,
+        account_name="Checking",
+        account_mask="0000",
+        account_type="depository",
+        account_subtype="checking",
+        date=raw["date"],
+        authorized_date=None,
+        name=raw["name"],
+        merchant_name=raw["merchant_name"],
+        amount=float(raw["amount"]),
+        pending=bool(raw["pending"]),
+        payment_channel=raw["payment_channel"],
+        updated_at="2026-01-01T00:00:00+00:00",
+        pending_transaction_id=raw["pending_transaction_id"],
+    )
+
+
+def _logged_action(
+    action_id: str,
+    day: date,
+    merchant: str,
+    amount: float,
+    action_type: str,
+    actor_key: str,
+) -> LoggedAction:
+    if action_type == "payment":
+        new_values = [f"{day.month}/{day.day}/{day.year}", merchant, f"{amount:.2f}"]
+        metadata = {"type": "payment", "category": merchant}
+    else:
+        new_values = [f"{day.month}/{day.day}/{day.year}", "bench item", f"{amount:.2f}", merchant, "Bench (Card)"]
+        metadata = {"type": "expense", "category": "shopping", "person": "Bench (Card)"}
+    return LoggedAction(
+        id=action_id,
+        created_at=f"{day.isoformat()}T12:00:00",
+        user_key=actor_key,
+        action=UndoAction(
+            worksheet=action_type,
+            kind="clear_cells",
+            row=int(action_id.rsplit("-", 1)[1]),
+            columns=list(range(14, 14 + len(new_values))),
+            previous_values=[""] * len(new_values),
+            new_values=new_values,
+            metadata=metadata,
+            description=f"{action_type} ${amount:.2f}",
+        ),
+    )
+
+
+@contextmanager
+def patched_sources(scenario: ReconciliationScenario) -> Iterator[None]:
+    """Serve the scenario's action log and subscriptions in place of the Sheets readers."""
+    banking_service.clear_schedule_source_cache()
+    patches = {
+        "read_active_logged_actions": lambda _actor_key=None: list(scenario.action_log),
+        "sheet_user_context": lambda _actor_key: nullcontext(),
+        "list_normalized_subscription_schedules": lambda: list(scenario.subscriptions),
+        "parse_visible_subscription_schedules": lambda: [],
+        "list_bill_schedules": lambda: [],
+    }
+    with ExitStack() as stack:
+        for name, replacement in patches.items():
+            stack.enter_context(mock.patch.object(banking_service, name, replacement))
+        try:
+            yield
+        finally:
+            banking_service.clear_schedule_source_cache()
+
+
+def _timed(callback: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = callback()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 1.0
+
+
+def _match_quality(scenario: ReconciliationScenario, decisions: dict[str, tuple[str | None, str | None]]) -> dict[str, float]:
+    correct = matched = expected = 0
+    for provider_id, (action_id, sheet_ref) in decisions.items():
+        if action_id or sheet_ref:
+            matched += 1
+        if provider_id in scenario.expected_actions:
+            expected += 1
+            correct += int(action_id == scenario.expected_actions[provider_id])
+        elif provider_id in scenario.expected_schedules:
+            expected += 1
+            correct += int(action_id is None and sheet_ref == scenario.expected_schedules[provider_id])
+    return {"precision": _ratio(correct, matched), "recall": _ratio(correct, expected)}
+
+
+def run_benchmark(scenario: ReconciliationScenario, *, preview_limit: int = 100) -> dict[str, Any]:
+    """Time the engine entry points and the service preview, with match quality for each."""
+    results: dict[str, Any] = {
+        "transactions": len(scenario.posted_transactions),
+        "actions": len(scenario.action_log),
+        "expected_matches": scenario.expected_matches,
+    }
+    transactions = scenario.posted_transactions
+    with patched_sources(scenario):
+        index, results["index_ms"] = _timed(lambda: CandidateIndex.from_action_log(scenario.action_log))
+        pulls = banking_service._scheduled_pulls_for_transactions(transactions, actor_key=scenario.actor_key)
+
+        def greedy() -> list:
+            used: set[str] = set()
+            decisions = []
+            for transaction in transactions:
+                decision = reconcile_transaction(transaction, index, pulls, excluded_action_ids=used)
+                if decision.matched_action_log_id:
+                    used.add(decision.matched_action_log_id)
+                decisions.append(decision)
+            return decisions
+
+        single, results["reconcile_transaction_ms"] = _timed(greedy)
+        batch, results["reconcile_transactions_ms"] = _timed(
+            lambda: reconcile_transactions(transactions, index, pulls)
+        )
+        results["reconcile_transaction_quality"] = _match_quality(
+            scenario,
+            {
+                transaction.provider_transaction_id: (decision.matched_action_log_id, decision.matched_sheet_ref)
+                for transaction, decision in zip(transactions, single)
+            },
+        )
+        results["reconcile_transactions_quality"] = _match_quality(
+            scenario,
+            {
+                transaction.provider_transaction_id: (decision.matched_action_log_id, decision.matched_sheet_ref)
+                for transaction, decision in zip(transactions, batch)
+            },
+        )
+
+        group_transactions = [
+            transaction
+            for transaction in transactions
+            if transaction.provider_transaction_id in scenario.expected_groups
+        ]
+        groups, results["candidate_groups_ms"] = _timed(
+            lambda: [
+                find_action_log_candidate_groups(transaction, index, classification="expense")
+                for transaction in group_transactions
+            ]
+        )
+        hits = sum(
+            1
+            for transaction, found in zip(group_transactions, groups)
+            if found
+            and frozenset(candidate.action_id for candidate in found[0].candidates)
+            == scenario.expected_groups[transaction.provider_transaction_id]
+        )
+        results["candidate_groups_quality"] = {"top_group_hit_rate": _ratio(hits, len(group_transactions))}
+
+        with tempfile.TemporaryDirectory() as directory:
+            service = _bench_service(Path(directory), scenario)
+            preview, results["preview_cold_ms"] = _timed(
+                lambda: service.reconciliation_preview(
+                    scenario.owner_key,
+                    limit=preview_limit,
+                    actor_key=scenario.actor_key,
+                )
+            )
+            _warm, results["preview_warm_ms"] = _timed(
+                lambda: service.reconciliation_preview(
+                    scenario.owner_key,
+                    limit=preview_limit,
+                    actor_key=scenario.actor_key,
+                )
+            )
+        preview_decisions = {
+            item.transaction.provider_transaction_id: (item.matched_action_log_id, item.matched_sheet_ref)
+            for item in preview.items
+        }
+        results["preview_quality"] = _match_quality(scenario, preview_decisions)
+    return {key: round(value, 2) if isinstance(value, float) else value for key, value in results.items()}
+
+
+def _bench_service(directory: Path, scenario: ReconciliationScenario) -> BankingService:
+    config = BankingConfig(
+        plaid_client_id="bench",
+        plaid_secret="bench",
+        plaid_env="sandbox",
+        token_encryption_key="bench-secret-key",
+        sqlite_path=directory / "banking.sqlite3",
+    )
+    store = BankStore(config.sqlite_path, TokenCipher(config.token_encryption_key))
+    store.initialize()
+    store.upsert_transactions(scenario.plaid_transactions, owner_key=scenario.owner_key)
+    return BankingService(config=config, store=store, plaid=PlaidClient(config))
+
+
+def latency_tolerance() -> float:
+    raw = os.getenv("BOOKIEBOT_BENCH_LATENCY_TOLERANCE", "").strip()
+    try:
+        return max(float(raw), 1.0) if raw else DEFAULT_LATENCY_TOLERANCE
+    except ValueError:
+        return DEFAULT_LATENCY_TOLERANCE
+
+
+def regressions(results: dict[str, Any], baseline: dict[str, Any], *, tolerance: float | None = None) -> list[str]:
+    """Quality metrics below baseline (minus slack) and latencies above baseline x tolerance."""
+    factor = tolerance or latency_tolerance()
+    problems = []
+    for key, expected in baseline.items():
+        actual = results.get(key)
+        if actual is None:
+            continue
+        if key.endswith("_quality"):
+            for metric, floor in expected.items():
+                if actual.get(metric, 0.0) < floor - QUALITY_SLACK:
+                    problems.append(f"{key}.{metric} {actual.get(metric)} < baseline {floor}")
+        elif key.endswith("_ms") and actual > max(expected * factor, expected + 5):
+            problems.append(f"{key} {actual}ms > {factor}x baseline {expected}ms")
+    return problems
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--transactions", type=int, default=300)
+    parser.add_argument("--noise-actions", type=int, default=600)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario = generate_scenario(seed=args.seed, transactions=args.transactions, noise_actions=args.noise_actions)
+    results = run_benchmark(scenario)
+    print(json.dumps(results, indent=2, sort_keys=True))
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {key: value for key, value in results.items() if key.endswith(("_ms", "_quality"))}
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return 0
+    problems = regressions(results, load_baseline(args.baseline))
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
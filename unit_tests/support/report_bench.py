@@ -0,0 +1,173 @@
+"""Synthetic personal budget sheets and a build-latency harness for the expense breakdown report.
+
+    PYTHONPATH=src python -m unit_tests.support.report_bench
+    PYTHONPATH=src python -m unit_tests.support.report_bench --update-baseline
+
+``unit_tests/reports/test_report_bench.py`` runs the same harness under pytest and fails when the
+report totals drift from the recorded baseline. Its latency check, which fails when the build exceeds
+the baseline by the tolerance factor, is marked ``benchmark`` and only runs under ``pytest -m benchmark``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import statistics
+import time
+from typing import Any
+
+from bookiebot.reports.expense_breakdown import (
+    BudgetHistoryRows,
+    BudgetMonth,
+    ReportWorksheets,
+    budget_history_digest,
+    build_expense_breakdown_report,
+)
+from unit_tests.support.sheets_repo_stub import InMemoryWorksheet
+
+
+BASELINE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "benchmarks" / "report_build_baseline.json"
+DEFAULT_LATENCY_TOLERANCE = 4.0
+REPORT_MONTH = BudgetMonth(2026, 5)
+
+NEEDS = ("Rent", "PG&E", "Water", "Recology", "Internet", "Groceries", "Auto/Gas", "Car Insurance", "Phone")
+WANTS = ("Eating out", "Shopping", "Entertainment", "Travel", "Gifts", "Hobbies")
+NOTES = ("split w/ roommate", "autopay", "check statement", "paid early", "promo rate", "see receipt")
+
+
+def generate_personal_rows(*, seed: int = 7, rows: int = 300, columns: int = 40) -> list[list[str]]:
+    """A budget tab shaped like the real template, padded with the notes and side tables users add."""
+    rng = random.Random(seed)
+    sheet: list[list[str]] = [
+        _padded(["", "Date:", "Source:", "Amount:", "Biweekly Income Source:", "xAI"], columns),
+        _padded(["", "5/1/2026", "xAI", "$3,774.59", "Biweekly Income Start:", "5/1/2026"], columns),
+        _padded(["", "5/12/2026", "internet stipend", "$150.00"], columns),
+        _padded(["", "5/15/2026", "xAI", "$3,773.63"], columns),
+        _padded(["", "5/29/2026", "xAI", "$3,774.11"], columns),
+        _padded(["", "Monthly Income:", "", "$11,472.33"], columns),
+        _padded(["Name:", "Needs (50%):", "Wants (30%):", "Savings (20%):"], columns),
+    ]
+    for label in NEEDS:
+        sheet.append(_padded([label, _money(rng, 40, 1900)], columns))
+    sheet.append(_padded(["Static Bills & Subscriptions (Needs)", _money(rng, 200, 1500)], columns))
+    sheet.append(_padded(["(Needs) Subtotal:", _money(rng, 2000, 4000)], columns))
+    for label in WANTS:
+        sheet.append(_padded([label, _money(rng, 10, 400)], columns))
+    sheet.append(_padded(["Subscriptions (Wants)", _money(rng, 10, 120)], columns))
+    sheet.append(_padded(["(Wants) Subtotal:", _money(rng, 200, 900)], columns))
+    sheet.append(_padded(["Needs Rollover", _money(rng, 0, 300), "Wants Rollover", _money(rng, 0, 200)], columns))
+    sheet.append(_padded(["Margins:", "", _money(rng, 1000, 3000), "", _money(rng, 300, 900)], columns))
+    sheet.append(_padded(["", "Enter 1st Paycheck Deposit", "Ideal $900.00", "Minimum $250.00", "$250.00"], columns))
+    sheet.append(_padded(["", "Enter 2nd Paycheck Deposit", "Ideal $900.00", "Minimum $250.00", "$350.00"], columns))
+    sheet.append(_padded(["", "Total Savings Deposited", "", "", "$600.00"], columns))
+    sheet.append(_padded(["", "Savings Goal", "$2,300.00"], columns))
+
+    while len(sheet) < rows:
+        row = [""] * columns
+        for column in rng.sample(range(columns), rng.randint(0, 6)):
+            kind = rng.random()
+            if kind < 0.35:
+                row[column] = rng.choice(NOTES)
+            elif kind < 0.7:
+                row[column] = _money(rng, 1, 500)
+            elif kind < 0.85:
+                row[column] = f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/2026"
+            else:
+                row[column] = rng.choice(NEEDS + WANTS) + " note"
+        sheet.append(row)
+    return sheet[:rows]
+
+
+def benchmark_worksheets(*, seed: int = 7, rows: int = 300, columns: int = 40) -> ReportWorksheets:
+    """The report month's tab plus already-digested earlier months, as a current-month build sees them."""
+    personal_rows = generate_personal_rows(seed=seed, rows=rows, columns=columns)
+    history = tuple(
+        budget_history_digest(
+            BudgetHistoryRows(
+                BudgetMonth(REPORT_MONTH.year, month),
+                generate_personal_rows(seed=seed + month, rows=rows, columns=columns),
+            )
+        )
+        for month in range(1, REPORT_MONTH.month)
+    )
+    return ReportWorksheets(
+        shared_expenses=InMemoryWorksheet([["hdr"] * 28, ["hdr"] * 28]),
+        personal_budget=InMemoryWorksheet(personal_rows),
+        subscriptions=InMemoryWorksheet([]),
+        budget_history=history,
+    )
+
+
+def run_benchmark(worksheets: ReportWorksheets, *, repeats: int = 5) -> dict[str, Any]:
+    """Median wall time of a report build over ``repeats`` runs, plus the totals it produced."""
+    build_ms: list[float] = []
+    report = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        report = build_expense_breakdown_report(
+            actor_key="bench",
+            owner_name="Bench",
+            persons=["Bench"],
+            month=REPORT_MONTH,
+            worksheets=worksheets,
+        )
+        build_ms.append((time.perf_counter() - started) * 1000)
+    assert report is not None
+    return {
+        "build_ms": round(statistics.median(build_ms), 2),
+        "income_total": report.income_total,
+        "savings_goal": report.savings_goal,
+        "amount_saved": report.amount_saved,
+    }
+
+
+def regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float = DEFAULT_LATENCY_TOLERANCE) -> list[str]:
+    problems = []
+    for key, value in baseline.items():
+        if key.endswith("_ms"):
+            if results.get(key, 0.0) > value * tolerance:
+                problems.append(f"{key} {results[key]}ms > {tolerance:g}x baseline {value}ms")
+        elif results.get(key) != value:
+            problems.append(f"{key} {results.get(key)!r} != baseline {value!r}")
+    return problems
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--columns", type=int, default=40)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(benchmark_worksheets(seed=args.seed, rows=args.rows, columns=args.columns))
+    print(json.dumps(results, indent=2, sort_keys=True))
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        return 0
+    if not args.baseline.exists():
+        return 0
+    problems = regressions(results, load_baseline(args.baseline))
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+def _padded(values: list[str], columns: int) -> list[str]:
+    return values + [""] * (columns - len(values))
+
+
+def _money(rng: random.Random, low: int, high: int) -> str:
+    return f"${rng.uniform(low, high):,.2f}"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,7 +2,7 @@ import React from "react"
 import { createRoot } from "react-dom/client"
 
 import { ExpenseReportApp } from "./report-app"
-import type { ExpenseReportData } from "./types"
+import type { ColumnarRows, ExpenseReportData, ExpenseReportDetails } from "./types"
 import "./styles.css"
 
 function readReportData(): ExpenseReportData {
@@ -13,12 +13,48 @@ function readReportData(): ExpenseReportData {
   return JSON.parse(script.textContent) as ExpenseReportData
 }
 
+function rowsFromColumns<T>(columns: ColumnarRows | undefined): T[] {
+  const keys = Object.keys(columns ?? {})
+  const length = keys.length ? columns![keys[0]].length : 0
+  return Array.from({ length }, (_, index) =>
+    Object.fromEntries(keys.map((key) => [key, columns![key][index]])) as T,
+  )
+}
+
+async function fetchReportDetails(report: ExpenseReportData): Promise<Partial<ExpenseReportData> | null> {
+  const token = new URLSearchParams(window.location.search).get("token")
+  if (!report.details || !token) {
+    return null
+  }
+  const url = new URL(report.details.path, window.location.href)
+  url.searchParams.set("token", token)
+  url.searchParams.set("source", report.details.source)
+  const response = await fetch(url, { credentials: "same-origin" })
+  if (!response.ok) {
+    throw new Error(`Could not load expense report details (${response.status})`)
+  }
+  const details = (await response.json()) as ExpenseReportDetails
+  return {
+    topEntries: rowsFromColumns(details.topEntries),
+    dailyEntries: rowsFromColumns(details.dailyEntries),
+    merchantOccurrences: rowsFromColumns(details.merchantOccurrences),
+  }
+}
+
 const root = document.getElementById("bookiebot-expense-report-root")
 
 if (root) {
-  createRoot(root).render(
-    <React.StrictMode>
-      <ExpenseReportApp report={readReportData()} />
-    </React.StrictMode>,
-  )
+  const reactRoot = createRoot(root)
+  const report = readReportData()
+  const render = (data: ExpenseReportData) =>
+    reactRoot.render(
+      <React.StrictMode>
+        <ExpenseReportApp report={data} />
+      </React.StrictMode>,
+    )
+
+  render(report)
+  fetchReportDetails(report)
+    .then((details) => details && render({ ...report, ...details }))
+    .catch((error) => console.error(error))
 }
@@ -205,4 +205,19 @@ export interface ExpenseReportData {
     current: ReportModeView
     projected: ReportModeView
   }
+  details?: ExpenseReportDetailsSource
+}
+
+export interface ExpenseReportDetailsSource {
+  path: string
+  source: string
+}
+
+export type ColumnarRows = Record<string, unknown[]>
+
+export interface ExpenseReportDetails {
+  version: number
+  topEntries: ColumnarRows
+  dailyEntries: ColumnarRows
+  merchantOccurrences: ColumnarRows
 }